@@ -1,5 +1,17 @@
-from .board import BitBoard
-from .program import Agent
-from .monte_carlo_tree_search import MonteCarloTreeSearch
+import importlib
 
-__all__ = ['BitBoard', 'Agent', 'MonteCarloTreeSearch']
\ No newline at end of file
+# Submodules are imported on first use, so that importing a light module such
+# as agent.bitmasks does not pull in the board and its move tables
+_EXPORTS = {
+    'BitBoard': '.board',
+    'Agent': '.program',
+    'MonteCarloTreeSearch': '.monte_carlo_tree_search',
+}
+
+__all__ = ['BitBoard', 'Agent', 'MonteCarloTreeSearch']
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
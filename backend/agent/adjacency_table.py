@@ -1,123 +0,0 @@
-adjacency_table = {
-    1329227995784915872903807060280344576: 666561109214408496812602466263630848,
-    664613997892457936451903530140172288: 1661859513284803267856541981371007488,
-    332306998946228968225951765070086144: 830929756642401633928270990685503744,
-    166153499473114484112975882535043072: 415464878321200816964135495342751872,
-    83076749736557242056487941267521536: 207732439160600408482067747671375936,
-    41538374868278621028243970633760768: 103866219580300204241033873835687968,
-    20769187434139310514121985316880384: 51933109790150102120516936917843984,
-    10384593717069655257060992658440192: 25966554895075051060258468458921992,
-    5192296858534827628530496329220096: 12983277447537525530129234229460996,
-    2596148429267413814265248164610048: 6491638723768762765064617114730498,
-    1298074214633706907132624082305024: 1331824778039483400832773056796557313,
-    649037107316853453566312041152512: 1329553465076524470802641338828324864,
-    324518553658426726783156020576256: 665425452732929031797536607279513600,
-    162259276829213363391578010288128: 332712726366464515898768303639756800,
-    81129638414606681695789005144064: 166356363183232257949384151819878400,
-    40564819207303340847894502572032: 83178181591616128974692075909939200,
-    20282409603651670423947251286016: 41589090795808064487346037954969600,
-    10141204801825835211973625643008: 20794545397904032243673018977484800,
-    5070602400912917605986812821504: 10397272698952016121836509488742400,
-    2535301200456458802993406410752: 5198636349476008060918254744371200,
-    1267650600228229401496703205376: 2599318174738004030459127372185600,
-    633825300114114700748351602688: 1948379282035798411445501551443968,
-    316912650057057350374175801344: 649196027869396714259102216224768,
-    158456325028528675187087900672: 324914771842250503807390921523200,
-    79228162514264337593543950336: 162457385921125251903695460761600,
-    39614081257132168796771975168: 81228692960562625951847730380800,
-    19807040628566084398385987584: 40614346480281312975923865190400,
-    9903520314283042199192993792: 20307173240140656487961932595200,
-    4951760157141521099596496896: 10153586620070328243980966297600,
-    2475880078570760549798248448: 5076793310035164121990483148800,
-    1237940039285380274899124224: 2538396655017582060995241574400,
-    618970019642690137449562112: 1269198327508791030497620787200,
-    309485009821345068724781056: 951357071306542193088623804416,
-    154742504910672534362390528: 316990247983103864384327254016,
-    77371252455336267181195264: 158649790938598878812202598400,
-    38685626227668133590597632: 79324895469299439406101299200,
-    19342813113834066795298816: 39662447734649719703050649600,
-    9671406556917033397649408: 19831223867324859851525324800,
-    4835703278458516698824704: 9915611933662429925762662400,
-    2417851639229258349412352: 4957805966831214962881331200,
-    1208925819614629174706176: 2478902983415607481440665600,
-    604462909807314587353088: 1239451491707803740720332800,
-    302231454903657293676544: 619725745853901870360166400,
-    151115727451828646838272: 464529819973897555219054592,
-    75557863725914323419136: 154780394522999933781409792,
-    37778931862957161709568: 77465718231737733795020800,
-    18889465931478580854784: 38732859115868866897510400,
-    9444732965739290427392: 19366429557934433448755200,
-    4722366482869645213696: 9683214778967216724377600,
-    2361183241434822606848: 4841607389483608362188800,
-    1180591620717411303424: 2420803694741804181094400,
-    590295810358705651712: 1210401847370902090547200,
-    295147905179352825856: 605200923685451045273600,
-    147573952589676412928: 302600461842725522636800,
-    73786976294838206464: 226821201159129665634304,
-    36893488147419103232: 75576364513183561416704,
-    18446744073709551616: 37825057730340690329600,
-    9223372036854775808: 18912528865170345164800,
-    4611686018427387904: 9456264432585172582400,
-    2305843009213693952: 4728132216292586291200,
-    1152921504606846976: 2364066108146293145600,
-    576460752303423488: 1182033054073146572800,
-    288230376151711744: 591016527036573286400,
-    144115188075855872: 295508263518286643200,
-    72057594037927936: 147754131759143321600,
-    36028797018963968: 110752539628481282048,
-    18014398509481984: 36902521734952910848,
-    9007199254740992: 18469266469892915200,
-    4503599627370496: 9234633234946457600,
-    2251799813685248: 4617316617473228800,
-    1125899906842624: 2308658308736614400,
-    562949953421312: 1154329154368307200,
-    281474976710656: 577164577184153600,
-    140737488355328: 288582288592076800,
-    70368744177664: 144291144296038400,
-    35184372088832: 72145572148019200,
-    17592186044416: 54078388490469376,
-    8796093022208: 18018809440894976,
-    4398046511104: 9018196518502400,
-    2199023255552: 4509098259251200,
-    1099511627776: 2254549129625600,
-    549755813888: 1127274564812800,
-    274877906944: 563637282406400,
-    137438953472: 281818641203200,
-    68719476736: 140909320601600,
-    34359738368: 70454660300800,
-    17179869184: 35227330150400,
-    8589934592: 26405463130112,
-    4294967296: 8798246797312,
-    2147483648: 4403416268800,
-    1073741824: 2201708134400,
-    536870912: 1100854067200,
-    268435456: 550427033600,
-    134217728: 275213516800,
-    67108864: 137606758400,
-    33554432: 68803379200,
-    16777216: 34401689600,
-    8388608: 17200844800,
-    4194304: 12893292544,
-    2097152: 4296018944,
-    1048576: 2150105600,
-    524288: 1075052800,
-    262144: 537526400,
-    131072: 268763200,
-    65536: 134381600,
-    32768: 67190800,
-    16384: 33595400,
-    8192: 16797700,
-    4096: 8398850,
-    2048: 6295553,
-    1024: 1329227995784915872903807060282442241,
-    512: 664613997892457936451903530141222144,
-    256: 332306998946228968225951765070611072,
-    128: 166153499473114484112975882535305536,
-    64: 83076749736557242056487941267652768,
-    32: 41538374868278621028243970633826384,
-    16: 20769187434139310514121985316913192,
-    8: 10384593717069655257060992658456596,
-    4: 5192296858534827628530496329228298,
-    2: 2596148429267413814265248164614149,
-    1: 1298074214633706907132624082308098,
-}
@@ -0,0 +1,175 @@
+"""
+Monte Carlo tree search over a tree stored in flat NumPy arrays.
+
+MonteCarloTreeSearch keys its statistics by whole BitBoard objects, so every
+node costs a board plus several dict entries. Here a node is one row of a few
+parallel arrays: its visit count, total reward, the index of its first child
+and its number of children, and the placement ID of the move leading to it.
+The children of a node occupy consecutive rows, so UCT over all of them is a
+handful of vectorised operations on a slice instead of a Python call per
+child. Boards are not stored at all: each rollout replays the moves from the
+root on a scratch board.
+
+A node takes 24 bytes, so the same memory holds far larger trees.
+"""
+
+import math
+
+import numpy as np
+
+from .monte_carlo_tree_search import MonteCarloTreeSearch
+from .movegen import PLACEMENT_MASKS
+from .symmetry import unique_up_to_symmetry, worth_folding
+
+_UNEXPANDED = -1  # num_children of a node whose moves have not been listed
+
+
+class ArrayTreeSearch(MonteCarloTreeSearch):
+    """
+    Monte Carlo tree searcher storing its tree in arrays. Node 0 is the root;
+    the tree is rebuilt whenever a search starts from a different position.
+    Q, N and children are left empty, so trees are not carried across turns.
+    """
+
+    def __init__(self, exploration_weight=1.4, capacity=4096, **kwargs):
+        super().__init__(exploration_weight, **kwargs)
+        self.visits = np.zeros(capacity)
+        self.rewards = np.zeros(capacity)
+        self.first_child = np.zeros(capacity, dtype=np.int32)
+        self.num_children = np.full(capacity, _UNEXPANDED, dtype=np.int16)
+        self.move = np.full(capacity, -1, dtype=np.int16)  # Placement ID
+        self.size = 1
+        self.root = None
+
+    def _reset(self, root):
+        self.visits[: self.size] = 0
+        self.rewards[: self.size] = 0
+        self.num_children[: self.size] = _UNEXPANDED
+        self.move[: self.size] = -1
+        self.size = 1
+        self.root = root.copy()
+
+    def _reserve(self, count):
+        # Make room for `count` more nodes, doubling the arrays as needed
+        capacity = len(self.visits)
+        if self.size + count <= capacity:
+            return
+        while self.size + count > capacity:
+            capacity *= 2
+        extra = capacity - len(self.visits)
+        self.visits = np.concatenate((self.visits, np.zeros(extra)))
+        self.rewards = np.concatenate((self.rewards, np.zeros(extra)))
+        self.first_child = np.concatenate(
+            (self.first_child, np.zeros(extra, dtype=np.int32))
+        )
+        self.num_children = np.concatenate(
+            (self.num_children, np.full(extra, _UNEXPANDED, dtype=np.int16))
+        )
+        self.move = np.concatenate((self.move, np.full(extra, -1, dtype=np.int16)))
+
+    def choose(self, node):
+        "Choose the best successor of node. (Choose a move in the game)"
+        if node.is_terminal():
+            raise RuntimeError(f"choose called on terminal node {node}")
+
+        if self.root != node or self.num_children[0] <= 0:
+            return node.find_random_child()
+
+        lo = self.first_child[0]
+        hi = lo + self.num_children[0]
+        visits = self.visits[lo:hi]
+        if not visits.any():
+            return node.find_random_child()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            score = np.where(visits > 0, self.rewards[lo:hi] / visits, -np.inf)
+        best = lo + int(np.argmax(score))
+        return node.make_move(PLACEMENT_MASKS[self.move[best]])
+
+    def root_stats(self, node):
+        """Visit count, total reward and AMAF visit count and total reward
+        (always 0, RAVE is not supported here) of each child of `node`, keyed
+        by move"""
+        if self.root != node or self.num_children[0] <= 0:
+            return {}
+        lo = self.first_child[0]
+        hi = lo + self.num_children[0]
+        return {
+            PLACEMENT_MASKS[self.move[i]]: (
+                float(self.visits[i]),
+                float(self.rewards[i]),
+                0,
+                0,
+            )
+            for i in range(lo, hi)
+        }
+
+    def do_rollout(self, node):
+        """Make the tree one layer better. (Train for one iteration.)
+        Returns the number of playouts run."""
+        if self.root != node:
+            self._reset(node)
+        board = self.root.copy()
+        path = self._select(board)
+        self._expand(path[-1], board)
+        if self.leaf_batch == 1:
+            self._backpropagate(path, self._simulate(board))
+            return 1
+        rewards = self._simulate_leaf(board, self.leaf_batch)
+        self._backpropagate(path, sum(rewards), len(rewards))
+        return len(rewards)
+
+    def _select(self, board):
+        "Find an unexplored descendent of the root, playing its moves on `board`"
+        path = [0]
+        node = 0
+        while self.num_children[node] > 0:
+            lo = self.first_child[node]
+            hi = lo + self.num_children[node]
+            unexplored = np.flatnonzero(self.num_children[lo:hi] == _UNEXPANDED)
+            if len(unexplored):
+                node = lo + int(unexplored[0])
+                board.move_binary(PLACEMENT_MASKS[self.move[node]])
+                path.append(node)
+                return path
+            node = self._uct_select(node)  # descend a layer deeper
+            board.move_binary(PLACEMENT_MASKS[self.move[node]])
+            path.append(node)
+        # node is either unexplored or terminal
+        return path
+
+    def _expand(self, node, board):
+        "Add a row for every move from `node`, whose position is `board`"
+        if self.num_children[node] != _UNEXPANDED:
+            return  # already expanded
+        if node == 0:
+            children = board.find_ordered_children()
+            if worth_folding(board):
+                children = unique_up_to_symmetry(children)
+            moves = [child.last_placement_id for child in children]
+        elif board.terminal:
+            moves = []
+        else:
+            moves = board.legal_placement_ids()
+        self._reserve(len(moves))
+        self.first_child[node] = self.size
+        self.num_children[node] = len(moves)
+        self.move[self.size : self.size + len(moves)] = moves
+        self.size += len(moves)
+
+    def _backpropagate(self, path, reward, visits=1):
+        "Send the total reward of `visits` simulations back up to the ancestors"
+        path = np.array(path)
+        # The leaf gets the reward, its parent visits - reward, and so on
+        from_leaf = np.arange(len(path) - 1, -1, -1)
+        self.visits[path] += visits
+        self.rewards[path] += np.where(from_leaf % 2 == 0, reward, visits - reward)
+
+    def _uct_select(self, node):
+        "Select a child of node, balancing exploration & exploitation"
+        lo = self.first_child[node]
+        hi = lo + self.num_children[node]
+        visits = self.visits[lo:hi]
+        uct = self.rewards[lo:hi] / visits + self.exploration_weight * np.sqrt(
+            math.log(self.visits[node]) / visits
+        )
+        return lo + int(np.argmax(uct))
@@ -0,0 +1,231 @@
+"""
+NumPy engine that plays many Tetress positions forward at once.
+
+Each 121-bit board is split across two uint64 lanes: bits 0-63 in the low
+lane and bits 64-120 in the high lane. A batch of N positions is then a few
+length-N arrays, and moves, line clears and terminal checks are evaluated for
+the whole batch with vectorised operations instead of per-position Python.
+"""
+
+import numpy as np
+
+from .evaluation import evaluate_sides
+from .movegen import NUM_PLACEMENTS, TABLES
+
+_LANE = (1 << 64) - 1
+
+RED, BLUE = 0, 1
+DRAW = -1
+
+
+def split_lanes(masks):
+    # Split 121-bit ints into (low, high) uint64 arrays
+    masks = list(masks)
+    lo = np.array([mask & _LANE for mask in masks], dtype=np.uint64)
+    hi = np.array([mask >> 64 for mask in masks], dtype=np.uint64)
+    return lo, hi
+
+
+def join_lanes(lo, hi):
+    # Inverse of split_lanes for a single position
+    return int(lo) | (int(hi) << 64)
+
+
+def popcount(x):
+    # Per-element popcount of a uint64 array (SWAR, so any NumPy version works)
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + (
+        (x >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((x * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+# Placement cells, the cells around each placement, and the 22 lines, as
+# read-only views of the memory-mapped tables shared by every process
+PLACE_LO, PLACE_HI = TABLES.array("placement_lo"), TABLES.array("placement_hi")
+TOUCH_LO, TOUCH_HI = TABLES.array("touch_lo"), TABLES.array("touch_hi")
+LINE_LO, LINE_HI = TABLES.array("line_lo"), TABLES.array("line_hi")
+
+_ZERO = np.uint64(0)
+
+# Random placements tried per row before testing every placement
+_CANDIDATES = 48
+
+
+class BatchBoard:
+    "A batch of N positions stored as uint64 lanes, advanced in lock-step."
+
+    def __init__(self, red_lo, red_hi, blue_lo, blue_hi, turn_count, player):
+        self.red_lo = red_lo
+        self.red_hi = red_hi
+        self.blue_lo = blue_lo
+        self.blue_hi = blue_hi
+        self.turn_count = turn_count  # int64 turn numbers
+        self.player = player  # int8, RED or BLUE to move
+
+    @classmethod
+    def from_boards(cls, boards):
+        red_lo, red_hi = split_lanes(board.red_board for board in boards)
+        blue_lo, blue_hi = split_lanes(board.blue_board for board in boards)
+        turn_count = np.array([board.turn_count for board in boards], dtype=np.int64)
+        player = np.array(
+            [RED if board.current_player == "r" else BLUE for board in boards],
+            dtype=np.int8,
+        )
+        return cls(red_lo, red_hi, blue_lo, blue_hi, turn_count, player)
+
+    def __len__(self):
+        return len(self.turn_count)
+
+    def legal(self, rows=None, placement_ids=None):
+        # Boolean matrix of which placements are legal in the selected rows:
+        # all 2299 placements (n, 2299), or an (n, k) matrix of candidate IDs
+        rows = slice(None) if rows is None else rows
+        if placement_ids is None:
+            place_lo, place_hi = PLACE_LO, PLACE_HI
+            touch_lo, touch_hi = TOUCH_LO, TOUCH_HI
+        else:
+            place_lo, place_hi = PLACE_LO[placement_ids], PLACE_HI[placement_ids]
+            touch_lo, touch_hi = TOUCH_LO[placement_ids], TOUCH_HI[placement_ids]
+        red_lo, red_hi = self.red_lo[rows], self.red_hi[rows]
+        blue_lo, blue_hi = self.blue_lo[rows], self.blue_hi[rows]
+        is_red = self.player[rows] == RED
+        own_lo = np.where(is_red, red_lo, blue_lo)[:, None]
+        own_hi = np.where(is_red, red_hi, blue_hi)[:, None]
+        occ_lo = (red_lo | blue_lo)[:, None]
+        occ_hi = (red_hi | blue_hi)[:, None]
+
+        empty = ((occ_lo & place_lo) | (occ_hi & place_hi)) == _ZERO
+        touches = ((own_lo & touch_lo) | (own_hi & touch_hi)) != _ZERO
+        # The first move of each player may go anywhere on the board
+        touches |= (self.turn_count[rows] <= 2)[:, None]
+        return empty & touches
+
+    def terminal(self, legal=None, rows=None):
+        # Boolean vector, mirroring BitBoard.terminal
+        rows = slice(None) if rows is None else rows
+        if legal is None:
+            legal = self.legal(rows)
+        turn_count = self.turn_count[rows]
+        stuck = ~legal.any(axis=1) & (turn_count > 2)
+        return (turn_count == 150) | stuck
+
+    def winners(self, rows=None):
+        # RED, BLUE or DRAW for terminal rows, mirroring BitBoard._find_winner
+        rows = slice(None) if rows is None else rows
+        red = popcount(self.red_lo[rows]) + popcount(self.red_hi[rows])
+        blue = popcount(self.blue_lo[rows]) + popcount(self.blue_hi[rows])
+        by_count = np.where(red > blue, RED, np.where(blue > red, BLUE, DRAW))
+        # Otherwise the player to move is stuck and their opponent wins
+        return np.where(
+            self.turn_count[rows] == 150, by_count, 1 - self.player[rows]
+        ).astype(np.int8)
+
+    def apply(self, rows, placement_ids):
+        # Play one placement in each selected row, then clear full lines
+        move_lo = PLACE_LO[placement_ids]
+        move_hi = PLACE_HI[placement_ids]
+        is_red = self.player[rows] == RED
+        self.red_lo[rows] |= np.where(is_red, move_lo, _ZERO)
+        self.red_hi[rows] |= np.where(is_red, move_hi, _ZERO)
+        self.blue_lo[rows] |= np.where(is_red, _ZERO, move_lo)
+        self.blue_hi[rows] |= np.where(is_red, _ZERO, move_hi)
+
+        occ_lo = (self.red_lo[rows] | self.blue_lo[rows])[:, None]
+        occ_hi = (self.red_hi[rows] | self.blue_hi[rows])[:, None]
+        full = ((occ_lo & LINE_LO) == LINE_LO) & ((occ_hi & LINE_HI) == LINE_HI)
+        keep_lo = ~np.bitwise_or.reduce(np.where(full, LINE_LO, _ZERO), axis=1)
+        keep_hi = ~np.bitwise_or.reduce(np.where(full, LINE_HI, _ZERO), axis=1)
+        self.red_lo[rows] &= keep_lo
+        self.red_hi[rows] &= keep_hi
+        self.blue_lo[rows] &= keep_lo
+        self.blue_hi[rows] &= keep_hi
+
+        self.player[rows] = 1 - self.player[rows]
+        self.turn_count[rows] += 1
+
+    def simulate(self, rng=None, depth=None):
+        """
+        Play every position out uniformly at random to the end of the game,
+        or for `depth` plies, after which unfinished positions are scored by
+        evaluation.evaluate as MonteCarloTreeSearch._simulate does.
+
+        Returns, for each starting position, the reward from the point of view
+        of the player who moved into it, the same value
+        MonteCarloTreeSearch._simulate returns and _backpropagate expects.
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        mover = 1 - self.player
+        winner = np.full(len(self), DRAW, dtype=np.int8)
+        # Rewards of the positions cut off at `depth`, NaN for the others
+        evaluated = np.full(len(self), np.nan)
+        active = np.arange(len(self))
+        plies = 0
+
+        while len(active):
+            if plies == depth:
+                # Every row has played `depth` moves: finished rows are scored
+                # by their winner, the rest by the static evaluation
+                legal = self.legal(active)
+                done = self.terminal(legal, active)
+                winner[active[done]] = self.winners(active[done])
+                for row in active[~done]:
+                    evaluated[row] = 1 - self._evaluate_row(row)
+                break
+
+            # The game ends at turn 150 whatever moves remain
+            at_limit = self.turn_count[active] == 150
+            if at_limit.any():
+                winner[active[at_limit]] = self.winners(active[at_limit])
+                active = active[~at_limit]
+                if not len(active):
+                    break
+
+            # Most rows find a legal move among a few random candidates, which
+            # is uniform over the legal moves and far cheaper than testing all
+            # 2299 placements. The rest (including every terminal row) fall
+            # back to the full legality matrix
+            candidates = rng.integers(
+                0, NUM_PLACEMENTS, size=(len(active), _CANDIDATES)
+            )
+            hits = self.legal(active, candidates)
+            found = hits.any(axis=1)
+            moves = candidates[np.arange(len(active)), hits.argmax(axis=1)]
+
+            if not found.all():
+                missed = np.flatnonzero(~found)
+                legal = self.legal(active[missed])
+                done = self.terminal(legal, active[missed])
+                if done.any():
+                    finished = active[missed[done]]
+                    winner[finished] = self.winners(finished)
+                # Pick a legal placement uniformly at random in each row
+                keys = np.where(legal, rng.random(legal.shape), -1.0)
+                moves[missed] = keys.argmax(axis=1)
+                found[missed] = ~done
+
+            active = active[found]
+            if len(active):
+                self.apply(active, moves[found])
+                plies += 1
+
+        rewards = np.where(winner == DRAW, 0.5, (winner == mover).astype(np.float64))
+        return np.where(np.isnan(evaluated), rewards, evaluated)
+
+    def _evaluate_row(self, row):
+        # evaluation.evaluate of one row, for the player to move there
+        red = join_lanes(self.red_lo[row], self.red_hi[row])
+        blue = join_lanes(self.blue_lo[row], self.blue_hi[row])
+        if self.player[row] == RED:
+            return evaluate_sides(red, blue)
+        return evaluate_sides(blue, red)
+
+
+def simulate(boards, rollout_depth=None, rollout_policy="uniform", rng=None):
+    """Random playouts of the given BitBoards, cut off after rollout_depth
+    plies if set, returning a list of rewards. Only uniform playouts are
+    vectorised, so rollout_policy must be "uniform"."""
+    if rollout_policy != "uniform":
+        raise ValueError(f"the NumPy engine cannot play {rollout_policy!r} playouts")
+    return BatchBoard.from_boards(boards).simulate(rng, rollout_depth).tolist()
@@ -0,0 +1,80 @@
+"""
+Whole-board bit operations for the 11x11 toroidal Tetress board.
+
+Cell (r, c) is bit 11 * r + c of a 121-bit integer. Because the board wraps
+in both directions, shifting a mask by one row or column has to move the bits
+that fall off one edge back onto the opposite edge.
+"""
+
+BOARD_SIZE = 11
+NUM_CELLS = BOARD_SIZE * BOARD_SIZE
+
+FULL_MASK = (1 << NUM_CELLS) - 1
+
+# Masks of the first and last column and of the first and last row
+FIRST_COL = sum(1 << (r * BOARD_SIZE) for r in range(BOARD_SIZE))
+LAST_COL = FIRST_COL << (BOARD_SIZE - 1)
+FIRST_ROW = (1 << BOARD_SIZE) - 1
+LAST_ROW = FIRST_ROW << (NUM_CELLS - BOARD_SIZE)
+
+# Every row and every column, the lines that are cleared once full
+ROW_MASKS = tuple(FIRST_ROW << (r * BOARD_SIZE) for r in range(BOARD_SIZE))
+COL_MASKS = tuple(FIRST_COL << c for c in range(BOARD_SIZE))
+LINE_MASKS = ROW_MASKS + COL_MASKS
+
+# CELL_LINES[i] holds the row and the column through cell i
+CELL_LINES = tuple(
+    (ROW_MASKS[i // BOARD_SIZE], COL_MASKS[i % BOARD_SIZE]) for i in range(NUM_CELLS)
+)
+
+_NOT_FIRST_COL = FULL_MASK & ~FIRST_COL
+_NOT_LAST_COL = FULL_MASK & ~LAST_COL
+
+
+def shift_east(mask):
+    # Move every cell from column c to column c + 1, wrapping column 10 to 0
+    return ((mask & _NOT_LAST_COL) << 1) | ((mask & LAST_COL) >> (BOARD_SIZE - 1))
+
+
+def shift_west(mask):
+    # Move every cell from column c to column c - 1, wrapping column 0 to 10
+    return ((mask & _NOT_FIRST_COL) >> 1) | ((mask & FIRST_COL) << (BOARD_SIZE - 1))
+
+
+def shift_south(mask):
+    # Move every cell from row r to row r + 1, wrapping row 10 to 0
+    return ((mask << BOARD_SIZE) & FULL_MASK) | (mask >> (NUM_CELLS - BOARD_SIZE))
+
+
+def shift_north(mask):
+    # Move every cell from row r to row r - 1, wrapping row 0 to 10
+    return (mask >> BOARD_SIZE) | ((mask & FIRST_ROW) << (NUM_CELLS - BOARD_SIZE))
+
+
+def neighbours(mask):
+    # All cells orthogonally adjacent to at least one cell of the mask
+    return shift_east(mask) | shift_west(mask) | shift_south(mask) | shift_north(mask)
+
+
+def frontier(player_board, occupied):
+    # Empty cells adjacent to the player's tokens, i.e. where a placement can
+    # touch the player's existing pieces
+    return neighbours(player_board) & ~occupied
+
+
+def lines_through(mask):
+    # The distinct rows and columns passing through any cell of the mask
+    lines = set()
+    while mask:
+        low = mask & -mask
+        lines.update(CELL_LINES[low.bit_length() - 1])
+        mask ^= low
+    return lines
+
+
+def iter_bits(mask):
+    # Yield each set bit of the mask as its own single-bit integer
+    while mask:
+        low = mask & -mask
+        yield low
+        mask ^= low
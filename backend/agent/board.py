@@ -1,54 +1,179 @@
 from .lookup_table import lookup_table
-from .adjacency_table import adjacency_table
-from random import choice
+from .bitmasks import (
+    FULL_MASK,
+    LINE_MASKS,
+    frontier,
+    iter_bits,
+    lines_through,
+    neighbours,
+)
+from .movegen import (
+    NUM_PLACEMENTS,
+    PLACEMENT_MASKS,
+    count_legal_placements,
+    covering_placements,
+    free_placements,
+    legal_placement_ids,
+    placement_id,
+    touching_placements,
+)
+from .zobrist import (
+    RED_KEYS,
+    BLUE_KEYS,
+    BLUE_TO_MOVE,
+    turn_key,
+    cells_key,
+    position_key,
+)
+from random import choice, random
 from agent_wrapper import PlaceAction, Coord
-import copy
+
+# Marks a cached winner that has not been computed yet (None means a draw)
+_UNKNOWN = object()
+
+# Random placement IDs random_move() tries before listing every legal move
+_RANDOM_MOVE_PROBES = 64
+
+# Random cells random_frontier_move() tries before falling back to random_move()
+_FRONTIER_PROBES = 64
 
 
 class BitBoard:
-    def __init__(self):
+    # Slots keep boards small and make copying a handful of attribute writes
+    __slots__ = (
+        "red_board",
+        "blue_board",
+        "current_player",
+        "turn_count",
+        "last_move",
+        "_hash",
+        "_legal_ids",
+        "_legal_moves",
+        "_terminal",
+        "_winner",
+        "_history",
+        "_placements",
+    )
+
+    def __init__(self, incremental=False):
         self.red_board = 0  # Bitboard for red
         self.blue_board = 0  # Bitboard for blue
         self.current_player = "r"  # Player whose turn it is
         self.turn_count = 1  # Turn count
         self.last_move = None  # Last move made in terms of binary number
+        self._hash = turn_key(self.turn_count)  # Incremental Zobrist hash
+        self._history = None  # Undo records for moves made with push()
+        # Optional (free, touching red, touching blue) placement bitsets,
+        # maintained move by move when incremental move generation is on
+        self._placements = None
+        self._invalidate()
+        if incremental:
+            self.track_placements()
+
+    def __eq__(self, other):
+        # Positions are equal when they have the same value, however reached
+        if not isinstance(other, BitBoard):
+            return NotImplemented
+        return (
+            self._hash == other._hash
+            and self.red_board == other.red_board
+            and self.blue_board == other.blue_board
+            and self.current_player == other.current_player
+            and self.turn_count == other.turn_count
+        )
+
+    def __hash__(self):
+        return self._hash
+
+    def copy(self):
+        # Every field is an immutable value, so a shallow field-by-field copy
+        # is a full copy and avoids deepcopy's memo machinery
+        new_bitboard = BitBoard.__new__(BitBoard)
+        new_bitboard.red_board = self.red_board
+        new_bitboard.blue_board = self.blue_board
+        new_bitboard.current_player = self.current_player
+        new_bitboard.turn_count = self.turn_count
+        new_bitboard.last_move = self.last_move
+        new_bitboard._hash = self._hash
+        new_bitboard._legal_ids = self._legal_ids
+        new_bitboard._legal_moves = self._legal_moves
+        new_bitboard._terminal = self._terminal
+        new_bitboard._winner = self._winner
+        new_bitboard._history = None
+        new_bitboard._placements = self._placements
+        return new_bitboard
+
+    def _invalidate(self):
+        # Forget the state derived from the position; it is recomputed lazily
+        # the first time it is needed after a move
+        self._legal_ids = None
+        self._legal_moves = None
+        self._terminal = None
+        self._winner = _UNKNOWN
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __getstate__(self):
+        # Pickle only the position (e.g. to send it to a search process); the
+        # caches and the _UNKNOWN sentinel do not survive a round trip
+        return (
+            self.red_board,
+            self.blue_board,
+            self.current_player,
+            self.turn_count,
+            self.last_move,
+        )
+
+    def __setstate__(self, state):
+        (
+            self.red_board,
+            self.blue_board,
+            self.current_player,
+            self.turn_count,
+            self.last_move,
+        ) = state
+        self._hash = position_key(
+            self.red_board, self.blue_board, self.current_player, self.turn_count
+        )
+        self._history = None
+        self._placements = None
+        self._invalidate()
+
+    def _switch_turn(self):
+        # Pass the turn to the other player, keeping the hash in step
+        self._hash ^= BLUE_TO_MOVE ^ turn_key(self.turn_count) ^ turn_key(
+            self.turn_count + 1
+        )
+        self.current_player = "b" if self.current_player == "r" else "r"
+        self.turn_count += 1
 
-    def clear_filled(self):
-        # Define winning combinations using bitboards
-        winning_combinations = [
-            0b11111111111,
-            0b1111111111100000000000,
-            0b111111111110000000000000000000000,
-            0b11111111111000000000000000000000000000000000,
-            0b1111111111100000000000000000000000000000000000000000000,
-            0b111111111110000000000000000000000000000000000000000000000000000000,
-            0b11111111111000000000000000000000000000000000000000000000000000000000000000000,
-            0b1111111111100000000000000000000000000000000000000000000000000000000000000000000000000000,
-            0b111111111110000000000000000000000000000000000000000000000000000000000000000000000000000000000000000,
-            0b11111111111000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000,
-            0b1111111111100000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000,
-            0b100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100000000001,
-            0b1000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010,
-            0b10000000000100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100,
-            0b100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100000000001000,
-            0b1000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010000,
-            0b10000000000100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100000,
-            0b100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100000000001000000,
-            0b1000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010000000,
-            0b10000000000100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100000000,
-            0b100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100000000001000000000,
-            0b1000000000010000000000100000000001000000000010000000000100000000001000000000010000000000100000000001000000000010000000000,
-        ]
-
-        # Check if any winning combination matches the entire board
-        all_winning_row_col = 0
-        for combination in winning_combinations:
-            if (self.red_board | self.blue_board) & combination == combination:
-                all_winning_row_col |= combination
+    def clear_filled(self, placed=None):
+        # Clear every full row and column. A placement can only complete the
+        # lines through its own cells, so when `placed` is given only those
+        # lines are tested. Returns the mask of cells that were cleared
+        if placed is None:
+            lines = LINE_MASKS
+        else:
+            lines = lines_through(placed)
+
+        occupied = self.red_board | self.blue_board
+        cleared = 0
+        for line in lines:
+            if occupied & line == line:
+                cleared |= line
+        if not cleared:
+            return 0
 
         # Clear the filled row or column
-        self.red_board &= ~all_winning_row_col
-        self.blue_board &= ~all_winning_row_col
+        self._hash ^= cells_key(RED_KEYS, self.red_board & cleared)
+        self._hash ^= cells_key(BLUE_KEYS, self.blue_board & cleared)
+        self.red_board &= ~cleared
+        self.blue_board &= ~cleared
+        return cleared
 
     def order_moves(self, moves):
         # Order moves based on the heuristic of limiting opponent's moves
@@ -70,39 +195,85 @@ class BitBoard:
         return sorted_moves
 
     def get_num_moves(self):
-        if self.terminal:  # If the game is finished then no moves can be made
+        # Number of legal moves for the player to move (their mobility)
+        if self._legal_ids is not None:
+            return len(self._legal_ids)
+        if self.turn_count == 150:  # The game is over, no moves can be made
             return 0
-        # Otherwise, you can make a move in each of the empty spots
-        for empty in self.generate_empty_spots(self.current_player):
-            valid_moves_count = sum(
-                1 for move in lookup_table[empty] if self.is_valid_move(move)
-            )
-        return valid_moves_count
+        if self._placements is not None:
+            return self._legal_bits().bit_count()
+        # Otherwise count the legal placements without enumerating them
+        player_board = self.red_board if self.current_player == "r" else self.blue_board
+        return count_legal_placements(
+            self.red_board | self.blue_board, player_board, self.turn_count <= 2
+        )
 
     def find_ordered_children(self):
         if self.terminal:  # If the game is finished then no moves can be made
             return set()
-        # Otherwise, you can make a move in each of the empty spots
-        children = set()
-        for empty in self.generate_empty_spots(self.current_player):
-            children.update(list(filter(self.is_valid_move, lookup_table[empty])))
-
-        return self.order_moves(children)
-
-    def generate_empty_spots(self, player):
-        # Generate a list of binary representations of possible moves
-        empty_spots = []
+        # Otherwise, every legal placement is a child
+        return self.order_moves(self.legal_moves())
+
+    def track_placements(self):
+        # Switch on incremental move generation: build the placement bitsets
+        # once, then update them from each move's cells instead of
+        # regenerating every legal move from scratch
+        occupied = self.red_board | self.blue_board
+        self._placements = (
+            free_placements(occupied),
+            touching_placements(self.red_board),
+            touching_placements(self.blue_board),
+        )
+
+    def _update_placements(self, placed, mover_is_red, cleared):
+        if cleared:
+            # Cleared lines free cells and shrink both players' reach; this is
+            # rare, so rebuild rather than patch
+            self.track_placements()
+            return
+        free, touch_red, touch_blue = self._placements
+        free &= ~covering_placements(placed)
+        reach = covering_placements(neighbours(placed))
+        if mover_is_red:
+            touch_red |= reach
+        else:
+            touch_blue |= reach
+        self._placements = (free, touch_red, touch_blue)
 
-        player_board = self.red_board if player == "r" else self.blue_board
+    def _legal_bits(self):
+        # Bitset over placement IDs of the legal moves (incremental mode)
+        free, touch_red, touch_blue = self._placements
+        if self.turn_count <= 2:
+            return free
+        return free & (touch_red if self.current_player == "r" else touch_blue)
+
+    def legal_placement_ids(self):
+        # IDs of every legal placement for the current player, each once.
+        # The first move of each player may go anywhere on the board
+        if self._legal_ids is None and self._placements is not None:
+            self._legal_ids = tuple(
+                low.bit_length() - 1 for low in iter_bits(self._legal_bits())
+            )
+        elif self._legal_ids is None:
+            player_board = (
+                self.red_board if self.current_player == "r" else self.blue_board
+            )
+            self._legal_ids = tuple(
+                legal_placement_ids(
+                    self.red_board | self.blue_board,
+                    player_board,
+                    self.turn_count <= 2,
+                )
+            )
+        return self._legal_ids
 
-        # Iterate through each position on the board
-        for i in range(121):
-            position = 1 << i
-            if not ((self.red_board | self.blue_board) & position):
-                # If the bit is not set in both red and blue boards, it's an empty spot
-                if player_board & adjacency_table[position]:
-                    empty_spots.append(position)
-        return empty_spots
+    def legal_moves(self):
+        # Binary masks of every legal placement for the current player
+        if self._legal_moves is None:
+            self._legal_moves = tuple(
+                PLACEMENT_MASKS[i] for i in self.legal_placement_ids()
+            )
+        return self._legal_moves
 
     def is_valid_move(self, move):
         # Check if all moves in the list of coordinates are valid
@@ -124,6 +295,13 @@ class BitBoard:
                     print("-", end=" ")
             print()
 
+    @property
+    def last_placement_id(self):
+        # The last move as a compact placement ID rather than a 121-bit mask
+        if self.last_move is None:
+            return None
+        return placement_id(self.last_move)
+
     def last_move_to_coordinates(self):
         # Convert the last move stored as a binary number into (x, y) coordinates
         if self.last_move is None:
@@ -138,106 +316,189 @@ class BitBoard:
         return PlaceAction(*piece_coords)
 
     def move_binary(self, binary_position):
+        mover_is_red = self.current_player == "r"
         # Set the bit for the player's board using the binary position
         if self.current_player == "r":
             self.red_board |= binary_position
+            self._hash ^= cells_key(RED_KEYS, binary_position)
         elif self.current_player == "b":
             self.blue_board |= binary_position
+            self._hash ^= cells_key(BLUE_KEYS, binary_position)
 
         # Switch the turn to the other player
-        self.current_player = "b" if self.current_player == "r" else "r"
-        self.turn_count += 1
+        self._switch_turn()
         self.last_move = binary_position
-        self.clear_filled()
+        cleared = self.clear_filled(binary_position)
+        self._invalidate()
+        if self._placements is not None:
+            self._update_placements(binary_position, mover_is_red, cleared)
+        return cleared
+
+    def push(self, move):
+        # Make a move in place, recording what pop() needs to take it back:
+        # the cells removed by any cleared lines and the derived state
+        red_before, blue_before = self.red_board, self.blue_board
+        mover_is_red = self.current_player == "r"
+        record = (
+            move,
+            mover_is_red,
+            self.last_move,
+            self._hash,
+            self._legal_ids,
+            self._legal_moves,
+            self._terminal,
+            self._winner,
+            self._placements,
+        )
+        cleared = self.move_binary(move)
+        if cleared:
+            if mover_is_red:
+                red_before |= move
+            else:
+                blue_before |= move
+            record += (red_before & cleared, blue_before & cleared)
+        if self._history is None:
+            self._history = []
+        self._history.append(record)
+
+    def pop(self):
+        # Undo the most recent push()
+        (
+            move,
+            mover_is_red,
+            self.last_move,
+            self._hash,
+            self._legal_ids,
+            self._legal_moves,
+            self._terminal,
+            self._winner,
+            self._placements,
+            *cleared,
+        ) = self._history.pop()
+        if cleared:
+            self.red_board |= cleared[0]
+            self.blue_board |= cleared[1]
+        if mover_is_red:
+            self.red_board &= ~move
+            self.current_player = "r"
+        else:
+            self.blue_board &= ~move
+            self.current_player = "b"
+        self.turn_count -= 1
+        return move
 
     def move_coordinates(self, place_action):
+        mover_is_red = self.current_player == "r"
+        placed = 0
         for coord in place_action.coords:
             # Calculate the position on the board based on row and column
             position = coord.r * 11 + coord.c
 
             # Calculate the bit to set based on the position
             bit = 1 << position
+            placed |= bit
 
             # Set the bit for the current player's board
             if self.current_player == "r":
                 self.red_board |= bit
+                self._hash ^= RED_KEYS[position]
             elif self.current_player == "b":
                 self.blue_board |= bit
+                self._hash ^= BLUE_KEYS[position]
 
         # Switch the turn to the other player
-        self.turn_count += 1
-        self.current_player = "b" if self.current_player == "r" else "r"
-        self.clear_filled()
+        self._switch_turn()
+        cleared = self.clear_filled(placed)
+        self._invalidate()
+        if self._placements is not None:
+            self._update_placements(placed, mover_is_red, cleared)
 
     @property
     def terminal(self):
-        if self.turn_count <= 2:
-            return False
-        elif self.turn_count == 150:
-            return True
-        elif self.current_player == "r":
-            possible_moves = self.generate_empty_spots("r")
-            for empty in possible_moves:
-                filter_occupied = list(filter(self.is_valid_move, lookup_table[empty]))
-                if (len(filter_occupied)) != 0:
-                    return False
-        elif self.current_player == "b":
-            possible_moves = self.generate_empty_spots("b")
-            for empty in possible_moves:
-                filter_occupied = list(filter(self.is_valid_move, lookup_table[empty]))
-                if (len(filter_occupied)) != 0:
-                    return False
-
-        return True
-
-    def find_children(self):
-        if self.terminal:  # If the game is finished then no moves can be made
-            return set()
-        # Otherwise, you can make a move in each of the empty spots
-        children = set()
-        for empty in self.generate_empty_spots(self.current_player):
-            children.update(list(filter(self.is_valid_move, lookup_table[empty])))
-
-        return {self.make_move(child) for child in children}
+        if self._terminal is None:
+            if self.turn_count <= 2:
+                self._terminal = False
+            elif self.turn_count == 150:
+                self._terminal = True
+            elif self._placements is not None:
+                self._terminal = not self._legal_bits()
+            else:
+                # Generate (and cache) the moves here, since almost every
+                # caller of terminal goes on to ask for them
+                self._terminal = not self.legal_placement_ids()
+        return self._terminal
 
     def find_random_child(self):
         if self.terminal:
             return None  # If the game is finished then no moves can be made
-        possible_moves = []
-        for empty in self.generate_empty_spots(self.current_player):
-            possible_moves += list(filter(self.is_valid_move, lookup_table[empty]))
-
-        return self.make_move(choice(possible_moves))
+        return self.make_move(self.random_move())
+
+    def random_move(self):
+        # A uniformly random legal move. With incremental move generation a
+        # few random IDs are probed against the legal bitset before falling
+        # back to listing every move
+        if self._placements is not None and self._legal_ids is None:
+            legal = self._legal_bits()
+            for _ in range(_RANDOM_MOVE_PROBES):
+                i = int(random() * NUM_PLACEMENTS)
+                if legal >> i & 1:
+                    return PLACEMENT_MASKS[i]
+        return choice(self.legal_moves())
+
+    def random_frontier_move(self):
+        # A cheap, roughly uniform random move for playouts. Any placement
+        # covering an empty cell next to the player's tokens touches them, so
+        # pick uniformly random frontier cells and a random template from
+        # lookup_table for each until one fits on the empty cells. Favours
+        # placements covering several frontier cells, which can be reached
+        # from each of them. Falls back to random_move(), and returns None if
+        # there is no legal move
+        occupied = self.red_board | self.blue_board
+        if self.turn_count <= 2:
+            cells = FULL_MASK & ~occupied  # The first move may go anywhere
+        else:
+            player_board = (
+                self.red_board if self.current_player == "r" else self.blue_board
+            )
+            cells = frontier(player_board, occupied)
+            # A tetromino over a cell also covers an empty neighbour of it
+            cells &= neighbours(FULL_MASK & ~occupied)
+        if cells and self.turn_count < 150:
+            cells = list(iter_bits(cells))
+            for _ in range(_FRONTIER_PROBES):
+                templates = lookup_table[cells[int(random() * len(cells))]]
+                move = templates[int(random() * len(templates))]
+                if not move & occupied:
+                    return move
+        if self.terminal:
+            return None
+        return self.random_move()
 
     def reward(self):
         if not self.terminal:
             raise RuntimeError(f"reward called on nonterminal board {self}")
-        if self._find_winner is self.current_player:
+        winner = self._find_winner
+        if winner == self.current_player:
             return 1
-        if self._find_winner == "b" if self.current_player == "r" else "r":
-            return 0  # Your opponent has just won. Bad.
-        if self._find_winner is None:
+        if winner is None:
             return 0.5  # Board is a tie
-        # The winner is neither True, False, nor None
-        raise RuntimeError(f"board has unknown winner type {self._find_winner}")
+        return 0  # Your opponent has just won. Bad.
 
     def _player_token_count(self, color):
         if color == "r":
-            binary_num = self.red_board
-        elif color == "b":
-            binary_num = self.blue_board
-
-        count = 0
-        while binary_num:
-            count += binary_num & 1
-            binary_num >>= 1
-        return count
+            return self.red_board.bit_count()
+        return self.blue_board.bit_count()
 
     def is_terminal(self):
         return self.terminal
 
     @property
     def _find_winner(self):
+        if self._winner is _UNKNOWN:
+            self._winner = self._compute_winner()
+        return self._winner
+
+    def _compute_winner(self):
         if not self.terminal:
             return None
 
@@ -259,6 +520,6 @@ class BitBoard:
 
     def make_move(self, move):
         # Perform the move  using binary representation
-        new_bitboard = copy.deepcopy(self)
+        new_bitboard = self.copy()
         new_bitboard.move_binary(move)
         return new_bitboard
@@ -0,0 +1,75 @@
+"""
+Static evaluation of Tetress positions, for playouts cut off before the end.
+
+Everything is a popcount over red_board and blue_board, so a position is
+scored in a few microseconds:
+
+    tokens     the player's tokens minus the opponent's, which decides the
+               game if it reaches turn 150
+    frontier   empty cells next to the player's tokens that have an empty
+               neighbour, i.e. cells a new piece could grow from; a player
+               with none left is stuck and loses
+    at risk    the player's tokens in lines one or two cells from full, which
+               the next few moves are likely to clear
+
+The weighted sum is squashed into (0, 1), the same scale as BitBoard.reward.
+Uniformly random playouts are close to a coin flip in every feature, so the
+weights are set by hand rather than fitted to playout results.
+"""
+
+import math
+
+from .bitmasks import BOARD_SIZE, FULL_MASK, LINE_MASKS, frontier, neighbours
+
+TOKEN_WEIGHT = 0.1
+FRONTIER_WEIGHT = 0.05
+AT_RISK_WEIGHT = 0.05
+
+# Lines with at least this many of their 11 cells occupied count as nearly full
+NEAR_FULL = BOARD_SIZE - 2
+
+
+def _sides(board):
+    # (player to move's tokens, their opponent's tokens)
+    if board.current_player == "r":
+        return board.red_board, board.blue_board
+    return board.blue_board, board.red_board
+
+
+def features(board):
+    # (tokens, frontier, at risk), each the player to move's value minus
+    # their opponent's
+    return side_features(*_sides(board))
+
+
+def side_features(own, other):
+    # features for a player with tokens `own` to move against `other`
+    occupied = own | other
+    open_cells = neighbours(FULL_MASK & ~occupied)
+    own_frontier = frontier(own, occupied) & open_cells
+    other_frontier = frontier(other, occupied) & open_cells
+    at_risk = 0
+    for line in LINE_MASKS:
+        if (occupied & line).bit_count() >= NEAR_FULL:
+            at_risk += (own & line).bit_count() - (other & line).bit_count()
+    return (
+        own.bit_count() - other.bit_count(),
+        own_frontier.bit_count() - other_frontier.bit_count(),
+        at_risk,
+    )
+
+
+def evaluate(board):
+    # Estimated reward for the player to move, between 0 and 1
+    return evaluate_sides(*_sides(board))
+
+
+def evaluate_sides(own, other):
+    # evaluate for a player with tokens `own` to move against `other`
+    tokens, frontier_cells, at_risk = side_features(own, other)
+    score = (
+        TOKEN_WEIGHT * tokens
+        + FRONTIER_WEIGHT * frontier_cells
+        - AT_RISK_WEIGHT * at_risk
+    )
+    return 1 / (1 + math.exp(-score))
@@ -106,5 +106,6 @@ def generate_board_with_tetriminos():
     return board
 
 
-board_with_tetriminos = generate_board_with_tetriminos()
-print(board_with_tetriminos)
+if __name__ == "__main__":
+    board_with_tetriminos = generate_board_with_tetriminos()
+    print(board_with_tetriminos)
@@ -1,9440 +1,25 @@
-lookup_table = {
-    1329227995784915872903807060280344576: [
-        2492302492096717261694638238025646080,
-        2327447066838236484488794979572908032,
-        1997736216321274930077108462667431936,
-        1338314515287351821253735428856479744,
-        1329877349959625288325396280859688960,
-        1329877349804882783414723746497299456,
-        1329877032892232726357373372323595264,
-        1329227995784915872903807064577410048,
-        2326148992623602777581662355490604032,
-        1995140067892007516262843214502821889,
-        1333122218428816993625204932527259650,
-        1330363810722720366447548106352361472,
-        1994491347697340719866627276637470720,
-        1329877032892232726357373372321498624,
-        1329227995784915872903807060283491328,
-        1330526704134334703746985501439033344,
-        1329877350114367793236068815222079488,
-        1329877666717532840472074120673100800,
-        1330526069999549579810939684364747776,
-        1993841993677373809355710590421565952,
-        2326311251900431990945053933500891136,
-        1995464586445665942989626370523398144,
-        1333771255536133847078771244568412160,
-        1329227995784915872903807060280345603,
-        2326148992623602777581662355490603264,
-        1995140067892007516262843214502822400,
-        1333122218428816993625204932527260672,
-        1329878934368133068701475617376305152,
-        1329877508261207811943398933585199104,
-        1330201551445891153084156528342074368,
-        1993841993677373809355710590422615040,
-        1330526069999549579810939684362651649,
-        2326798029730919631035228667531755520,
-        1995140701717307630377543962854424576,
-        1333123486079417221854606429230465024,
-        1329227995784915872903807060280346368,
-        1994166670687357264611168933528993792,
-        1331175424019516490321856370579603456,
-        1329877032892232726357373372321498113,
-        1329227995784915872903807060282444800,
-        1994815549338349089536060058482245632,
-        1331175740932166547379206744755404800,
-        1993841993677373809355710590420518400,
-        1330526069999549579810939684362650625,
-        1993841993677373809355710590420517632,
-        1330526069999549579810939684362651136,
-        1994491664609990776923977650813272064,
-        1330527971475449922155041929417457664,
-        1330201709902216181612831715429974016,
-        1994166512231032236082493746441094144,
-        1331175107106866433264505996403802113,
-        1329227995784915872903807060280347649,
-        1329877983630182897529424494848901120,
-        1331175107106866433264505996403803136,
-        1994166512231032236082493746441093632,
-        1329227995784915872903807060282442753,
-        2326148992623602777581662355490603520,
-        1995140067892007516262843214502822912,
-        1330202185271191267198857276693676032,
-        1333122218428816993625204932527259649,
-        2326473511177261204308445511511179264,
-        1995789104999324369716409526543974400,
-        1333122852254117107739905680878862336,
-        1329227995784915872903807060280346113,
-        1330201868358541210141506902517874688,
-        1994491030784690662809276902461670400,
-        1330526703824849693925640432714252289,
-        1329227995784915872903807060282443264,
-        1994328771507861449445885324451381248,
-        1331499625660524859991289152424378368,
-        1993841993677373809355710590420517889,
-        1330526069999549579810939684362649603,
-        1329877667027017850293419189397880832,
-        1330526703824849693925640432714253312,
-        1994491030784690662809276902461669888,
-        1329227995784915872903807060281394688,
-    ],
-    664613997892457936451903530140172288: [
-        1246151246048358630847319119012823040,
-        2492302492096717261694638238025646080,
-        2327447066838236484488794979572908032,
-        1997736216321274930077108462667431936,
-        664938674979812644162698140429844480,
-        664938674902441391707361873248649728,
-        664938516446116363178686686161797632,
-        664613997892457936451903532288705024,
-        1163074496311801388790831177745302016,
-        2326148992623602777581662355490604032,
-        1995140067892007516262843214502821889,
-        665181905361360183223774053176180736,
-        997245673848670359933313638318735360,
-        664938516446116363178686686160749312,
-        664613997892457936451903530141745664,
-        1994491347697340719866627276637470720,
-        664938991815091448764712247424450560,
-        665587553553433216632252998201901568,
-        1993841993677373809355710590421565952,
-        996920996838686904677855295210782976,
-        1163155625950215995472526966750445568,
-        2326311251900431990945053933500891136,
-        1995464586445665942989626370523398144,
-        664613997892457936451903530140173825,
-        1163074496311801388790831177745301632,
-        2326148992623602777581662355490603264,
-        1995140067892007516262843214502822400,
-        665588187378733330746953746553503744,
-        664938754130603905971699466792599552,
-        665100775722945576542078264171037184,
-        996920996838686904677855295211307520,
-        1993841993677373809355710590422615040,
-        1163399014865459815517614333765877760,
-        2326798029730919631035228667531755520,
-        1995140701717307630377543962854424576,
-        664613997892457936451903530140173184,
-        997083335343678632305584466764496896,
-        1994166670687357264611168933528993792,
-        664938516446116363178686686160750080,
-        664613997892457936451903530143318528,
-        997407774669174544768030029241122816,
-        1994815549338349089536060058482245632,
-        996920996838686904677855295210259200,
-        1993841993677373809355710590420518400,
-        996920996838686904677855295210258816,
-        1993841993677373809355710590420517632,
-        997894552499662184858204763271987200,
-        1994491664609990776923977650813272064,
-        665100854951108090806415857714987008,
-        997083256115516118041246873220547072,
-        1994166512231032236082493746441094144,
-        664613997892457936451903530142270976,
-        665587712009758245160928185289801728,
-        1994166512231032236082493746441093632,
-        997083256115516118041246873220546816,
-        664613997892457936451903530141222400,
-        1163074496311801388790831177745301760,
-        2326148992623602777581662355490603520,
-        665749812830262429995644576212189184,
-        1995140067892007516262843214502822912,
-        1163236755588630602154222755755589632,
-        2326473511177261204308445511511179264,
-        1995789104999324369716409526543974400,
-        664613997892457936451903530140174080,
-        665100934179270605070753451258937344,
-        997245515392345331404638451230835200,
-        1994491030784690662809276902461670400,
-        664613997892457936451903530141221632,
-        997164385753930724722942662225690624,
-        1994328771507861449445885324451381248,
-        996920996838686904677855295210259968,
-        1993841993677373809355710590420517889,
-        665587870466083273689603372377702400,
-        1994491030784690662809276902461669888,
-        997245515392345331404638451230834944,
-        664613997892457936451903530140697344,
-    ],
-    332306998946228968225951765070086144: [
-        623075623024179315423659559506411520,
-        1246151246048358630847319119012823040,
-        2492302492096717261694638238025646080,
-        2327447066838236484488794979572908032,
-        332469337489906322081349070214922240,
-        332469337451220695853680936624324864,
-        332469258223058181589343343080898816,
-        332306998946228968225951766144352512,
-        581537248155900694395415588872651008,
-        1163074496311801388790831177745302016,
-        2326148992623602777581662355490604032,
-        332590952680680091611887026588090368,
-        498622836924335179966656819159367680,
-        332469258223058181589343343080374656,
-        332306998946228968225951765070872832,
-        997245673848670359933313638318735360,
-        332469495907545724382356123712225280,
-        332793776776716608316126499100950784,
-        996920996838686904677855295210782976,
-        498460498419343452338927647605391488,
-        581577812975107997736263483375222784,
-        1163155625950215995472526966750445568,
-        2326311251900431990945053933500891136,
-        332306998946228968225951765070087936,
-        581537248155900694395415588872650816,
-        1163074496311801388790831177745301632,
-        2326148992623602777581662355490603264,
-        333442813884033461769692811142103040,
-        332469377065301952985849733396299776,
-        332550387861472788271039132085518592,
-        498460498419343452338927647605653760,
-        996920996838686904677855295211307520,
-        581699507432729907758807166882938880,
-        1163399014865459815517614333765877760,
-        2326798029730919631035228667531755520,
-        332306998946228968225951765070086592,
-        498541667671839316152792233382248448,
-        997083335343678632305584466764496896,
-        332469258223058181589343343080375040,
-        332306998946228968225951765071659264,
-        498703887334587272384015014620561408,
-        997407774669174544768030029241122816,
-        498460498419343452338927647605129600,
-        996920996838686904677855295210259200,
-        498460498419343452338927647605129408,
-        996920996838686904677855295210258816,
-        498947276249831092429102381635993600,
-        997894552499662184858204763271987200,
-        332550427475554045403207928857493504,
-        498541628057758059020623436610273536,
-        997083256115516118041246873220547072,
-        332306998946228968225951765071135488,
-        332793856004879122580464092644900864,
-        997083256115516118041246873220546816,
-        498541628057758059020623436610273408,
-        332306998946228968225951765070611200,
-        581537248155900694395415588872650880,
-        1163074496311801388790831177745301760,
-        332874906415131214997822288106094592,
-        2326148992623602777581662355490603520,
-        581618377794315301077111377877794816,
-        1163236755588630602154222755755589632,
-        2326473511177261204308445511511179264,
-        332306998946228968225951765070087040,
-        332550467089635302535376725629468672,
-        498622757696172665702319225615417600,
-        997245515392345331404638451230835200,
-        332306998946228968225951765070610816,
-        498582192876965362361471331112845312,
-        997164385753930724722942662225690624,
-        498460498419343452338927647605129984,
-        996920996838686904677855295210259968,
-        332793935233041636844801686188851200,
-        997245515392345331404638451230834944,
-        498622757696172665702319225615417472,
-        332306998946228968225951765070348672,
-    ],
-    166153499473114484112975882535043072: [
-        311537811512089657711829779753205760,
-        623075623024179315423659559506411520,
-        1246151246048358630847319119012823040,
-        2492302492096717261694638238025646080,
-        166234668744953161040674535107461120,
-        166234668725610347926840468312162432,
-        166234629111529090794671671540449408,
-        166153499473114484112975883072176256,
-        290768624077950347197707794436325504,
-        581537248155900694395415588872651008,
-        1163074496311801388790831177745302016,
-        166295476340340045805943513294045184,
-        249311418462167589983328409579683840,
-        166234629111529090794671671540187328,
-        166153499473114484112975882535436416,
-        498622836924335179966656819159367680,
-        166234747953772862191178061856112640,
-        166396888388358304158063249550475392,
-        498460498419343452338927647605391488,
-        249230249209671726169463823802695744,
-        290788906487553998868131741687611392,
-        581577812975107997736263483375222784,
-        1163155625950215995472526966750445568,
-        166153499473114484112975882535043968,
-        290768624077950347197707794436325408,
-        581537248155900694395415588872650816,
-        1163074496311801388790831177745301632,
-        166721406942016730884846405571051520,
-        166234688532650976492924866698149888,
-        166275193930736394135519566042759296,
-        249230249209671726169463823802826880,
-        498460498419343452338927647605653760,
-        290849753716364953879403583441469440,
-        581699507432729907758807166882938880,
-        1163399014865459815517614333765877760,
-        166153499473114484112975882535043296,
-        249270833835919658076396116691124224,
-        498541667671839316152792233382248448,
-        166234629111529090794671671540187520,
-        166153499473114484112975882535829632,
-        249351943667293636192007507310280704,
-        498703887334587272384015014620561408,
-        249230249209671726169463823802564800,
-        498460498419343452338927647605129600,
-        249230249209671726169463823802564704,
-        498460498419343452338927647605129408,
-        249473638124915546214551190817996800,
-        498947276249831092429102381635993600,
-        166275213737777022701603964428746752,
-        249270814028879029510311718305136768,
-        498541628057758059020623436610273536,
-        166153499473114484112975882535567744,
-        166396928002439561290232046322450432,
-        498541628057758059020623436610273408,
-        249270814028879029510311718305136704,
-        166153499473114484112975882535305600,
-        290768624077950347197707794436325440,
-        581537248155900694395415588872650880,
-        166437453207565607498911144053047296,
-        1163074496311801388790831177745301760,
-        290809188897157650538555688938897408,
-        581618377794315301077111377877794816,
-        1163236755588630602154222755755589632,
-        166153499473114484112975882535043520,
-        166275233544817651267688362814734336,
-        249311378848086332851159612807708800,
-        498622757696172665702319225615417600,
-        166153499473114484112975882535305408,
-        249291096438482681180735665556422656,
-        498582192876965362361471331112845312,
-        249230249209671726169463823802564992,
-        498460498419343452338927647605129984,
-        166396967616520818422400843094425600,
-        498622757696172665702319225615417472,
-        249311378848086332851159612807708736,
-        166153499473114484112975882535174336,
-    ],
-    83076749736557242056487941267521536: [
-        155768905756044828855914889876602880,
-        311537811512089657711829779753205760,
-        623075623024179315423659559506411520,
-        1246151246048358630847319119012823040,
-        83117334372476580520337267553730560,
-        83117334362805173963420234156081216,
-        83117314555764545397335835770224704,
-        83076749736557242056487941536088128,
-        145384312038975173598853897218162752,
-        290768624077950347197707794436325504,
-        581537248155900694395415588872651008,
-        83147738170170022902971756647022592,
-        124655709231083794991664204789841920,
-        83117314555764545397335835770093664,
-        83076749736557242056487941267718208,
-        249311418462167589983328409579683840,
-        83117373976886431095589030928056320,
-        83198444194179152079031624775237696,
-        249230249209671726169463823802695744,
-        124615124604835863084731911901347872,
-        145394453243776999434065870843805696,
-        290788906487553998868131741687611392,
-        581577812975107997736263483375222784,
-        83076749736557242056487941267521984,
-        145384312038975173598853897218162704,
-        290768624077950347197707794436325408,
-        581537248155900694395415588872650816,
-        83360703471008365442423202785525760,
-        83117344266325488246462433349074944,
-        83137596965368197067759783021379648,
-        124615124604835863084731911901413440,
-        249230249209671726169463823802826880,
-        145424876858182476939701791720734720,
-        290849753716364953879403583441469440,
-        581699507432729907758807166882938880,
-        83076749736557242056487941267521648,
-        124635416917959829038198058345562112,
-        249270833835919658076396116691124224,
-        83117314555764545397335835770093760,
-        83076749736557242056487941267914816,
-        124675971833646818096003753655140352,
-        249351943667293636192007507310280704,
-        124615124604835863084731911901282400,
-        249230249209671726169463823802564800,
-        124615124604835863084731911901282352,
-        249230249209671726169463823802564704,
-        124736819062457773107275595408998400,
-        249473638124915546214551190817996800,
-        83137606868888511350801982214373376,
-        124635407014439514755155859152568384,
-        249270814028879029510311718305136768,
-        83076749736557242056487941267783872,
-        83198464001219780645116023161225216,
-        249270814028879029510311718305136704,
-        124635407014439514755155859152568352,
-        83076749736557242056487941267652800,
-        145384312038975173598853897218162720,
-        290768624077950347197707794436325440,
-        83218726603782803749455572026523648,
-        581537248155900694395415588872650880,
-        145404594448578825269277844469448704,
-        290809188897157650538555688938897408,
-        581618377794315301077111377877794816,
-        83076749736557242056487941267521760,
-        83137616772408825633844181407367168,
-        124655689424043166425579806403854400,
-        249311378848086332851159612807708800,
-        83076749736557242056487941267652704,
-        124645548219241340590367832778211328,
-        249291096438482681180735665556422656,
-        124615124604835863084731911901282496,
-        249230249209671726169463823802564992,
-        83198483808260409211200421547212800,
-        249311378848086332851159612807708736,
-        124655689424043166425579806403854368,
-        83076749736557242056487941267587168,
-    ],
-    41538374868278621028243970633760768: [
-        77884452878022414427957444938301440,
-        155768905756044828855914889876602880,
-        311537811512089657711829779753205760,
-        623075623024179315423659559506411520,
-        41558667186238290260168633776865280,
-        41558667181402586981710117078040608,
-        41558657277882272698667917885112352,
-        41538374868278621028243970768044064,
-        72692156019487586799426948609081376,
-        145384312038975173598853897218162752,
-        290768624077950347197707794436325504,
-        41573869085085011451485878323511296,
-        62327854615541897495832102394920960,
-        41558657277882272698667917885046832,
-        41538374868278621028243970633859104,
-        124655709231083794991664204789841920,
-        41558686988443215547794515464028160,
-        41599222097089576039515812387618848,
-        124615124604835863084731911901347872,
-        62307562302417931542365955950673936,
-        72697226621888499717032935421902848,
-        145394453243776999434065870843805696,
-        290788906487553998868131741687611392,
-        41538374868278621028243970633760992,
-        72692156019487586799426948609081352,
-        145384312038975173598853897218162704,
-        290768624077950347197707794436325408,
-        41680351735504182721211601392762880,
-        41558672133162744123231216674537472,
-        41568798482684098533879891510689824,
-        62307562302417931542365955950706720,
-        124615124604835863084731911901413440,
-        72712438429091238469850895860367360,
-        145424876858182476939701791720734720,
-        290849753716364953879403583441469440,
-        41538374868278621028243970633760824,
-        62317708458979914519099029172781056,
-        124635416917959829038198058345562112,
-        41558657277882272698667917885046880,
-        41538374868278621028243970633957408,
-        62337985916823409048001876827570176,
-        124675971833646818096003753655140352,
-        62307562302417931542365955950641200,
-        124615124604835863084731911901282400,
-        62307562302417931542365955950641176,
-        124615124604835863084731911901282352,
-        62368409531228886553637797704499200,
-        124736819062457773107275595408998400,
-        41568803434444255675400991107186688,
-        62317703507219757377577929576284192,
-        124635407014439514755155859152568384,
-        41538374868278621028243970633891936,
-        41599232000609890322558011580612608,
-        124635407014439514755155859152568352,
-        62317703507219757377577929576284176,
-        41538374868278621028243970633826400,
-        72692156019487586799426948609081360,
-        145384312038975173598853897218162720,
-        41609363301891401874727786013261824,
-        290768624077950347197707794436325440,
-        72702297224289412634638922234724352,
-        145404594448578825269277844469448704,
-        290809188897157650538555688938897408,
-        41538374868278621028243970633760880,
-        41568808386204412816922090703683584,
-        62327844712021583212789903201927200,
-        124655689424043166425579806403854400,
-        41538374868278621028243970633826352,
-        62322774109620670295183916389105664,
-        124645548219241340590367832778211328,
-        62307562302417931542365955950641248,
-        124615124604835863084731911901282496,
-        41599241904130204605600210773606400,
-        124655689424043166425579806403854368,
-        62327844712021583212789903201927184,
-        41538374868278621028243970633793584,
-    ],
-    20769187434139310514121985316880384: [
-        38942226439011207213978722469150720,
-        77884452878022414427957444938301440,
-        155768905756044828855914889876602880,
-        311537811512089657711829779753205760,
-        20779333593119145130084316888432640,
-        20779333590701293490855058539020304,
-        20779328638941136349333958942556176,
-        20769187434139310514121985384022032,
-        36346078009743793399713474304540688,
-        72692156019487586799426948609081376,
-        145384312038975173598853897218162752,
-        20786934542542505725742939161755648,
-        31163927307770948747916051197460480,
-        20779328638941136349333958942523416,
-        20769187434139310514121985316929552,
-        62327854615541897495832102394920960,
-        20779343494221607773897257732014080,
-        20799611048544788019757906193809424,
-        62307562302417931542365955950673936,
-        31153781151208965771182977975336968,
-        36348613310944249858516467710951424,
-        72697226621888499717032935421902848,
-        145394453243776999434065870843805696,
-        20769187434139310514121985316880496,
-        36346078009743793399713474304540676,
-        72692156019487586799426948609081352,
-        145384312038975173598853897218162704,
-        20840175867752091360605800696381440,
-        20779336066581372061615608337268736,
-        20784399241342049266939945755344912,
-        31153781151208965771182977975353360,
-        62307562302417931542365955950706720,
-        36356219214545619234925447930183680,
-        72712438429091238469850895860367360,
-        145424876858182476939701791720734720,
-        20769187434139310514121985316880412,
-        31158854229489957259549514586390528,
-        62317708458979914519099029172781056,
-        20779328638941136349333958942523440,
-        20769187434139310514121985316978704,
-        31168992958411704524000938413785088,
-        62337985916823409048001876827570176,
-        31153781151208965771182977975320600,
-        62307562302417931542365955950641200,
-        31153781151208965771182977975320588,
-        62307562302417931542365955950641176,
-        31184204765614443276818898852249600,
-        62368409531228886553637797704499200,
-        20784401717222127837700495553593344,
-        31158851753609878688788964788142096,
-        62317703507219757377577929576284192,
-        20769187434139310514121985316945968,
-        20799616000304945161279005790306304,
-        62317703507219757377577929576284176,
-        31158851753609878688788964788142088,
-        20769187434139310514121985316913200,
-        36346078009743793399713474304540680,
-        72692156019487586799426948609081360,
-        20804681650945700937363893006630912,
-        145384312038975173598853897218162720,
-        36351148612144706317319461117362176,
-        72702297224289412634638922234724352,
-        145404594448578825269277844469448704,
-        20769187434139310514121985316880440,
-        20784404193102206408461045351841792,
-        31163922356010791606394951600963600,
-        62327844712021583212789903201927200,
-        20769187434139310514121985316913176,
-        31161387054810335147591958194552832,
-        62322774109620670295183916389105664,
-        31153781151208965771182977975320624,
-        62307562302417931542365955950641248,
-        20799620952065102302800105386803200,
-        62327844712021583212789903201927184,
-        31163922356010791606394951600963592,
-        20769187434139310514121985316896792,
-    ],
-    10384593717069655257060992658440192: [
-        19471113219505603606989361234575360,
-        38942226439011207213978722469150720,
-        77884452878022414427957444938301440,
-        155768905756044828855914889876602880,
-        10389666796559572565042158444216320,
-        10389666795350646745427529269510152,
-        10389664319470568174666979471278088,
-        10384593717069655257060992692011016,
-        18173039004871896699856737152270344,
-        36346078009743793399713474304540688,
-        72692156019487586799426948609081376,
-        10393467271271252862871469580877824,
-        15581963653885474373958025598730240,
-        10389664319470568174666979471261708,
-        10384593717069655257060992658464776,
-        31163927307770948747916051197460480,
-        10389671747110803886948628866007040,
-        10399805524272394009878953096904712,
-        31153781151208965771182977975336968,
-        15576890575604482885591488987668484,
-        18174306655472124929258233855475712,
-        36348613310944249858516467710951424,
-        72697226621888499717032935421902848,
-        10384593717069655257060992658440248,
-        18173039004871896699856737152270338,
-        36346078009743793399713474304540676,
-        72692156019487586799426948609081352,
-        10420087933876045680302900348190720,
-        10389668033290686030807804168634368,
-        10392199620671024633469972877672456,
-        15576890575604482885591488987676680,
-        31153781151208965771182977975353360,
-        18178109607272809617462723965091840,
-        36356219214545619234925447930183680,
-        72712438429091238469850895860367360,
-        10384593717069655257060992658440206,
-        15579427114744978629774757293195264,
-        31158854229489957259549514586390528,
-        10389664319470568174666979471261720,
-        10384593717069655257060992658489352,
-        15584496479205852262000469206892544,
-        31168992958411704524000938413785088,
-        15576890575604482885591488987660300,
-        31153781151208965771182977975320600,
-        15576890575604482885591488987660294,
-        31153781151208965771182977975320588,
-        15592102382807221638409449426124800,
-        31184204765614443276818898852249600,
-        10392200858611063918850247776796672,
-        15579425876804939344394482394071048,
-        31158851753609878688788964788142096,
-        10384593717069655257060992658472984,
-        10399808000152472580639502895153152,
-        31158851753609878688788964788142088,
-        15579425876804939344394482394071044,
-        10384593717069655257060992658456600,
-        18173039004871896699856737152270340,
-        36346078009743793399713474304540680,
-        10402340825472850468681946503315456,
-        72692156019487586799426948609081360,
-        18175574306072353158659730558681088,
-        36351148612144706317319461117362176,
-        72702297224289412634638922234724352,
-        10384593717069655257060992658440220,
-        10392202096551103204230522675920896,
-        15581961178005395803197475800481800,
-        31163922356010791606394951600963600,
-        10384593717069655257060992658456588,
-        15580693527405167573795979097276416,
-        31161387054810335147591958194552832,
-        15576890575604482885591488987660312,
-        31153781151208965771182977975320624,
-        10399810476032551151400052693401600,
-        31163922356010791606394951600963592,
-        15581961178005395803197475800481796,
-        10384593717069655257060992658448396,
-    ],
-    5192296858534827628530496329220096: [
-        1338314515287351821253735428856479744,
-        19471113219505603606989361234575360,
-        38942226439011207213978722469150720,
-        77884452878022414427957444938301440,
-        5194833398279786282521079222108160,
-        5194833397675323372713764634755076,
-        5194832159735284087333489735639044,
-        5192296858534827628530496346005508,
-        9086519502435948349928368576135172,
-        18173039004871896699856737152270344,
-        36346078009743793399713474304540688,
-        5196733635635626431435734790438912,
-        7790981826942737186979012799365120,
-        5194832159735284087333489735630854,
-        5192296858534827628530496329232388,
-        15581963653885474373958025598730240,
-        5194835873555401943474314433003520,
-        5199902762136197004939476548452356,
-        15576890575604482885591488987668484,
-        7788445287802241442795744493834242,
-        9087153327736062464629116927737856,
-        18174306655472124929258233855475712,
-        36348613310944249858516467710951424,
-        5192296858534827628530496329220124,
-        9086519502435948349928368576135169,
-        18173039004871896699856737152270338,
-        36346078009743793399713474304540676,
-        5210043966938022840151450174095360,
-        5194834016645343015403902084317184,
-        5196099810335512316734986438836228,
-        7788445287802241442795744493838340,
-        15576890575604482885591488987676680,
-        9089054803636404808731361982545920,
-        18178109607272809617462723965091840,
-        36356219214545619234925447930183680,
-        5192296858534827628530496329220103,
-        7789713557372489314887378646597632,
-        15579427114744978629774757293195264,
-        5194832159735284087333489735630860,
-        5192296858534827628530496329244676,
-        7792248239602926131000234603446272,
-        15584496479205852262000469206892544,
-        7788445287802241442795744493830150,
-        15576890575604482885591488987660300,
-        7788445287802241442795744493830147,
-        15576890575604482885591488987660294,
-        7796051191403610819204724713062400,
-        15592102382807221638409449426124800,
-        5196100429305531959425123888398336,
-        7789712938402469672197241197035524,
-        15579425876804939344394482394071048,
-        5192296858534827628530496329236492,
-        5199904000076236290319751447576576,
-        15579425876804939344394482394071044,
-        7789712938402469672197241197035522,
-        5192296858534827628530496329228300,
-        9086519502435948349928368576135170,
-        18173039004871896699856737152270340,
-        5201170412736425234340973251657728,
-        36346078009743793399713474304540680,
-        9087787153036176579329865279340544,
-        18175574306072353158659730558681088,
-        36351148612144706317319461117362176,
-        5192296858534827628530496329220110,
-        5196101048275551602115261337960448,
-        7790980589002697901598737900240900,
-        15581961178005395803197475800481800,
-        5192296858534827628530496329228294,
-        7790346763702583786897989548638208,
-        15580693527405167573795979097276416,
-        7788445287802241442795744493830156,
-        15576890575604482885591488987660312,
-        5199905238016275575700026346700800,
-        15581961178005395803197475800481796,
-        7790980589002697901598737900240898,
-        5192296858534827628530496329224198,
-    ],
-    2596148429267413814265248164610048: [
-        1997736216321274930077108462667431936,
-        1338314515287351821253735428856479744,
-        19471113219505603606989361234575360,
-        38942226439011207213978722469150720,
-        2597416699139893141260539611054080,
-        2597416698837661686356882317377538,
-        2597416079867642043666744867819522,
-        2596148429267413814265248173002754,
-        1333122218428816993625204932527259650,
-        9086519502435948349928368576135172,
-        18173039004871896699856737152270344,
-        3247087012484609611933805260570624,
-        3895490913471368593489506399682560,
-        2597416079867642043666744867815427,
-        2596148429267413814265248164616194,
-        7790981826942737186979012799365120,
-        2597417936777700971737157216501760,
-        2599951381068098502469738274226178,
-        7788445287802241442795744493834242,
-        3894222643901120721397872246917121,
-        1333771255536133847078771244568412160,
-        9087153327736062464629116927737856,
-        18174306655472124929258233855475712,
-        2596148429267413814265248164610062,
-        1333122218428816993625204932527260672,
-        9086519502435948349928368576135169,
-        18173039004871896699856737152270338,
-        2605021983469011420075725087047680,
-        2597417008322671507701951042158592,
-        2598049905167756158367493219418114,
-        3894222643901120721397872246919170,
-        7788445287802241442795744493838340,
-        1333123486079417221854606429230465024,
-        9089054803636404808731361982545920,
-        18178109607272809617462723965091840,
-        2596148429267413814265248164611075,
-        3894856778686244657443689323298816,
-        7789713557372489314887378646597632,
-        2597416079867642043666744867815430,
-        2596148429267413814265248164622338,
-        3896124119801463065500117301723136,
-        7792248239602926131000234603446272,
-        3894222643901120721397872246915075,
-        7788445287802241442795744493830150,
-        3894222643901120721397872246916097,
-        7788445287802241442795744493830147,
-        3898025595701805409602362356531200,
-        7796051191403610819204724713062400,
-        2598050214652765979712561944199168,
-        3894856469201234836098620598517762,
-        7789712938402469672197241197035524,
-        2596148429267413814265248164618246,
-        2599952000038118145159875723788288,
-        7789712938402469672197241197035522,
-        3894856469201234836098620598517761,
-        2596148429267413814265248164614150,
-        1333122218428816993625204932527259649,
-        9086519502435948349928368576135170,
-        2600585206368212617170486625828864,
-        18173039004871896699856737152270340,
-        1333122852254117107739905680878862336,
-        9087787153036176579329865279340544,
-        18175574306072353158659730558681088,
-        2596148429267413814265248164610055,
-        2598050524137775801057630668980224,
-        3895490294501348950799368950120450,
-        7790980589002697901598737900240900,
-        2596148429267413814265248164614147,
-        4543893576518088289664932639670272,
-        7790346763702583786897989548638208,
-        3894222643901120721397872246915078,
-        7788445287802241442795744493830156,
-        2599952619008137787850013173350400,
-        7790980589002697901598737900240898,
-        3895490294501348950799368950120449,
-        2596148429267413814265248164612099,
-    ],
-    1298074214633706907132624082305024: [
-        2327447066838236484488794979572908032,
-        1997736216321274930077108462667431936,
-        1338314515287351821253735428856479744,
-        19471113219505603606989361234575360,
-        1298708349569946570630269805527040,
-        1298708349418830843178441158688769,
-        1298708039933821021833372433909761,
-        1298074214633706907132624086501377,
-        1995140067892007516262843214502821889,
-        1333122218428816993625204932527259650,
-        9086519502435948349928368576135172,
-        2272263700909101202182840495636480,
-        1330526704134334703746985501439033344,
-        1298708039933821021833372433908737,
-        1298074214633706907132624084404225,
-        3895490913471368593489506399682560,
-        1298708968388850485868578608250880,
-        1299975690534049251234869137113089,
-        3894222643901120721397872246917121,
-        1330526069999549579810939684364747776,
-        1995464586445665942989626370523398144,
-        1333771255536133847078771244568412160,
-        9087153327736062464629116927737856,
-        1298074214633706907132624082305031,
-        1995140067892007516262843214502822400,
-        1333122218428816993625204932527260672,
-        9086519502435948349928368576135169,
-        1302510991734505710037862543523840,
-        1299025262068887900528815334490112,
-        1947745147250674475399684475060225,
-        1330526069999549579810939684362651649,
-        3894222643901120721397872246919170,
-        1995140701717307630377543962854424576,
-        1333123486079417221854606429230465024,
-        9089054803636404808731361982545920,
-        1298074214633706907132624082306561,
-        1331175424019516490321856370579603456,
-        3894856778686244657443689323298816,
-        1298708039933821021833372433907715,
-        1298074214633706907132624082311169,
-        1331175740932166547379206744755404800,
-        3896124119801463065500117301723136,
-        1330526069999549579810939684362650625,
-        3894222643901120721397872246915075,
-        1330526069999549579810939684362651136,
-        3894222643901120721397872246916097,
-        1330527971475449922155041929417457664,
-        3898025595701805409602362356531200,
-        1948062059900731532750058650861568,
-        1331175107106866433264505996403802113,
-        3894856469201234836098620598517762,
-        1298074214633706907132624082309123,
-        1299976000019059072579937861894144,
-        3894856469201234836098620598517761,
-        1331175107106866433264505996403803136,
-        1298074214633706907132624082307075,
-        1995140067892007516262843214502822912,
-        1333122218428816993625204932527259649,
-        1949012797850902704801181178265600,
-        9086519502435948349928368576135170,
-        1995789104999324369716409526543974400,
-        1333122852254117107739905680878862336,
-        9087787153036176579329865279340544,
-        1298074214633706907132624082306051,
-        1947745456735684296744753199841280,
-        1330526703824849693925640432714252289,
-        3895490294501348950799368950120450,
-        1298074214633706907132624082308097,
-        1331499625660524859991289152424378368,
-        4543893576518088289664932639670272,
-        1330526069999549579810939684362649603,
-        3894222643901120721397872246915078,
-        1299976309504068893925006586675200,
-        3895490294501348950799368950120449,
-        1330526703824849693925640432714253312,
-        1298074214633706907132624084403201,
-    ],
-    649037107316853453566312041152512: [
-        1216944576219100225436835077160960,
-        1136448763104607658441794423619584,
-        975457136875622524451713116536832,
-        653473884417652256471550502371328,
-        649354174784973285315134902763520,
-        1329877349959625288325396280859688960,
-        1329877349804882783414723746497299456,
-        1329877032892232726357373372323595264,
-        1330363810722720366447548106352361472,
-        2272263700909101202182840495636480,
-        3247087012484609611933805260570624,
-        649591704454453303929466848804864,
-        973872728367842148372376599920640,
-        1994491347697340719866627276637470720,
-        1329877032892232726357373372321498624,
-        649671242253093117063957764374528,
-        649354174860531149041049226182656,
-        1329877350114367793236068815222079488,
-        1329877666717532840472074120673100800,
-        665587553553433216632252998201901568,
-        1135894165967007808078639615967232,
-        974347942600422823725403501232128,
-        651255495867252855018931271761920,
-        1333771255536133847078771244568412160,
-        333442813884033461769692811142103040,
-        665588187378733330746953746553503744,
-        1329878934368133068701475617376305152,
-        649354948421939974951892391297024,
-        649354252080667876925487760539648,
-        1329877508261207811943398933585199104,
-        1330201551445891153084156528342074368,
-        1947745147250674475399684475060225,
-        1136131850454550601091420247818240,
-        974189795760404116395285138112512,
-        650939202187215440358694545522688,
-        2326798029730919631035228667531755520,
-        973714194671561164360922330824704,
-        649988000009529536289968930947072,
-        1331175424019516490321856370579603456,
-        1329877032892232726357373372321498113,
-        974031029950365766375029325430784,
-        649988154752034446962503293337600,
-        1994815549338349089536060058482245632,
-        1331175740932166547379206744755404800,
-        997894552499662184858204763271987200,
-        1994491664609990776923977650813272064,
-        973872883110347059044910962311168,
-        649671861071997032302266567098368,
-        649512553663191494928140486049792,
-        1330201709902216181612831715429974016,
-        1948062059900731532750058650861568,
-        1331175107106866433264505996403802113,
-        649354484194425242934289304125440,
-        1329877983630182897529424494848901120,
-        665587712009758245160928185289801728,
-        1331175107106866433264505996403803136,
-        665749812830262429995644576212189184,
-        1330202185271191267198857276693676032,
-        649512785776948860936942029635584,
-        1949012797850902704801181178265600,
-        1135973394129522072416233159917568,
-        974506398925451352400590589132800,
-        650938892702205619013625820741632,
-        1995789104999324369716409526543974400,
-        649512631034443950264407667245056,
-        1330201868358541210141506902517874688,
-        1947745456735684296744753199841280,
-        1994491030784690662809276902461670400,
-        973793345462822973362248693579776,
-        650146301592053154292621656457216,
-        1331499625660524859991289152424378368,
-        4543893576518088289664932639670272,
-        649354329603036059713583588573184,
-        1329877667027017850293419189397880832,
-        665587870466083273689603372377702400,
-        1994491030784690662809276902461669888,
-    ],
-    324518553658426726783156020576256: [
-        608472288109550112718417538580480,
-        1216944576219100225436835077160960,
-        1136448763104607658441794423619584,
-        975457136875622524451713116536832,
-        324677087392486642657567451381760,
-        664938674979812644162698140429844480,
-        664938674902441391707361873248649728,
-        664938516446116363178686686161797632,
-        665181905361360183223774053176180736,
-        1330363810722720366447548106352361472,
-        2272263700909101202182840495636480,
-        324795852227226651964733424402432,
-        486936364183921074186188299960320,
-        997245673848670359933313638318735360,
-        664938516446116363178686686160749312,
-        973872728367842148372376599920640,
-        324677242097212621467144652062720,
-        664938991815091448764712247424450560,
-        665587553553433216632252998201901568,
-        332793776776716608316126499100950784,
-        567947082983503904039319807983616,
-        1135894165967007808078639615967232,
-        974347942600422823725403501232128,
-        1995464586445665942989626370523398144,
-        166721406942016730884846405571051520,
-        333442813884033461769692811142103040,
-        665588187378733330746953746553503744,
-        324994232118522134153786009059328,
-        324677126040333938462743880269824,
-        664938754130603905971699466792599552,
-        665100775722945576542078264171037184,
-        1330201551445891153084156528342074368,
-        568065925227275300545710123909120,
-        1136131850454550601091420247818240,
-        974189795760404116395285138112512,
-        1163399014865459815517614333765877760,
-        486857097335780582180461165412352,
-        973714194671561164360922330824704,
-        1994166670687357264611168933528993792,
-        664938516446116363178686686160750080,
-        487015514975182883187514662715392,
-        974031029950365766375029325430784,
-        997407774669174544768030029241122816,
-        1994815549338349089536060058482245632,
-        498947276249831092429102381635993600,
-        997894552499662184858204763271987200,
-        487253199462725676200295294566400,
-        973872883110347059044910962311168,
-        324756276831595747464070243024896,
-        665100854951108090806415857714987008,
-        1330201709902216181612831715429974016,
-        1994166512231032236082493746441094144,
-        324994000004764768144984465473536,
-        665587712009758245160928185289801728,
-        332793856004879122580464092644900864,
-        1994166512231032236082493746441093632,
-        332874906415131214997822288106094592,
-        665749812830262429995644576212189184,
-        325073150796026577146310828228608,
-        1330202185271191267198857276693676032,
-        567986697064761036208116579958784,
-        1135973394129522072416233159917568,
-        974506398925451352400590589132800,
-        2326473511177261204308445511511179264,
-        324756315517221975132203833622528,
-        665100934179270605070753451258937344,
-        1330201868358541210141506902517874688,
-        997245515392345331404638451230835200,
-        486896672731411486681124346789888,
-        973793345462822973362248693579776,
-        1994328771507861449445885324451381248,
-        1331499625660524859991289152424378368,
-        324994077376017223481251646668800,
-        665587870466083273689603372377702400,
-        332793935233041636844801686188851200,
-        997245515392345331404638451230834944,
-    ],
-    162259276829213363391578010288128: [
-        304236144054775056359208769290240,
-        608472288109550112718417538580480,
-        1216944576219100225436835077160960,
-        1136448763104607658441794423619584,
-        162338543696243321328783725690880,
-        332469337489906322081349070214922240,
-        332469337451220695853680936624324864,
-        332469258223058181589343343080898816,
-        332590952680680091611887026588090368,
-        665181905361360183223774053176180736,
-        1330363810722720366447548106352361472,
-        162397926113613325982366712201216,
-        243468182091960537093094149980160,
-        498622836924335179966656819159367680,
-        332469258223058181589343343080374656,
-        486936364183921074186188299960320,
-        162338621048606310733572326031360,
-        332469495907545724382356123712225280,
-        332793776776716608316126499100950784,
-        166396888388358304158063249550475392,
-        283973541491751952019659903991808,
-        567947082983503904039319807983616,
-        1135894165967007808078639615967232,
-        2326311251900431990945053933500891136,
-        83360703471008365442423202785525760,
-        166721406942016730884846405571051520,
-        333442813884033461769692811142103040,
-        162813873966813213754732817940480,
-        162338563020166969231371940134912,
-        332469377065301952985849733396299776,
-        332550387861472788271039132085518592,
-        665100775722945576542078264171037184,
-        284032962613637650272855061954560,
-        568065925227275300545710123909120,
-        1136131850454550601091420247818240,
-        581699507432729907758807166882938880,
-        243428548667890291090230582706176,
-        486857097335780582180461165412352,
-        997083335343678632305584466764496896,
-        332469258223058181589343343080375040,
-        243507757487591441593757331357696,
-        487015514975182883187514662715392,
-        498703887334587272384015014620561408,
-        997407774669174544768030029241122816,
-        249473638124915546214551190817996800,
-        498947276249831092429102381635993600,
-        243626599731362838100147647283200,
-        487253199462725676200295294566400,
-        162378138415797873732035121512448,
-        332550427475554045403207928857493504,
-        665100854951108090806415857714987008,
-        997083256115516118041246873220547072,
-        162497000002382384072492232736768,
-        332793856004879122580464092644900864,
-        166396928002439561290232046322450432,
-        997083256115516118041246873220546816,
-        166437453207565607498911144053047296,
-        332874906415131214997822288106094592,
-        162536575398013288573155414114304,
-        665749812830262429995644576212189184,
-        283993348532380518104058289979392,
-        567986697064761036208116579958784,
-        1135973394129522072416233159917568,
-        1163236755588630602154222755755589632,
-        162378157758610987566101916811264,
-        332550467089635302535376725629468672,
-        665100934179270605070753451258937344,
-        498622757696172665702319225615417600,
-        243448336365705743340562173394944,
-        486896672731411486681124346789888,
-        997164385753930724722942662225690624,
-        1994328771507861449445885324451381248,
-        162497038688008611740625823334400,
-        332793935233041636844801686188851200,
-        166396967616520818422400843094425600,
-        498622757696172665702319225615417472,
-    ],
-    81129638414606681695789005144064: [
-        152118072027387528179604384645120,
-        304236144054775056359208769290240,
-        608472288109550112718417538580480,
-        1216944576219100225436835077160960,
-        81169271848121660664391862845440,
-        166234668744953161040674535107461120,
-        166234668725610347926840468312162432,
-        166234629111529090794671671540449408,
-        166295476340340045805943513294045184,
-        332590952680680091611887026588090368,
-        665181905361360183223774053176180736,
-        81198963056806662991183356100608,
-        121734091045980268546547074990080,
-        249311418462167589983328409579683840,
-        166234629111529090794671671540187328,
-        243468182091960537093094149980160,
-        81169310524303155366786163015680,
-        166234747953772862191178061856112640,
-        166396888388358304158063249550475392,
-        83198444194179152079031624775237696,
-        141986770745875976009829951995904,
-        283973541491751952019659903991808,
-        567947082983503904039319807983616,
-        1163155625950215995472526966750445568,
-        41680351735504182721211601392762880,
-        83360703471008365442423202785525760,
-        166721406942016730884846405571051520,
-        81406936983406606877366408970240,
-        81169281510083484615685970067456,
-        166234688532650976492924866698149888,
-        166275193930736394135519566042759296,
-        332550387861472788271039132085518592,
-        142016481306818825136427530977280,
-        284032962613637650272855061954560,
-        568065925227275300545710123909120,
-        290849753716364953879403583441469440,
-        121714274333945145545115291353088,
-        243428548667890291090230582706176,
-        498541667671839316152792233382248448,
-        166234629111529090794671671540187520,
-        121753878743795720796878665678848,
-        243507757487591441593757331357696,
-        249351943667293636192007507310280704,
-        498703887334587272384015014620561408,
-        124736819062457773107275595408998400,
-        249473638124915546214551190817996800,
-        121813299865681419050073823641600,
-        243626599731362838100147647283200,
-        81189069207898936866017560756224,
-        166275213737777022701603964428746752,
-        332550427475554045403207928857493504,
-        498541628057758059020623436610273536,
-        81248500001191192036246116368384,
-        166396928002439561290232046322450432,
-        83198464001219780645116023161225216,
-        498541628057758059020623436610273408,
-        83218726603782803749455572026523648,
-        166437453207565607498911144053047296,
-        81268287699006644286577707057152,
-        332874906415131214997822288106094592,
-        141996674266190259052029144989696,
-        283993348532380518104058289979392,
-        567986697064761036208116579958784,
-        581618377794315301077111377877794816,
-        81189078879305493783050958405632,
-        166275233544817651267688362814734336,
-        332550467089635302535376725629468672,
-        249311378848086332851159612807708800,
-        121724168182852871670281086697472,
-        243448336365705743340562173394944,
-        498582192876965362361471331112845312,
-        997164385753930724722942662225690624,
-        81248519344004305870312911667200,
-        166396967616520818422400843094425600,
-        83198483808260409211200421547212800,
-        249311378848086332851159612807708736,
-    ],
-    40564819207303340847894502572032: [
-        76059036013693764089802192322560,
-        152118072027387528179604384645120,
-        304236144054775056359208769290240,
-        608472288109550112718417538580480,
-        40584635924060830332195931422720,
-        83117334372476580520337267553730560,
-        83117334362805173963420234156081216,
-        83117314555764545397335835770224704,
-        83147738170170022902971756647022592,
-        166295476340340045805943513294045184,
-        332590952680680091611887026588090368,
-        40599481528403331495591678050304,
-        60867045522990134273273537495040,
-        124655709231083794991664204789841920,
-        83117314555764545397335835770093664,
-        121734091045980268546547074990080,
-        40584655262151577683393081507840,
-        83117373976886431095589030928056320,
-        83198444194179152079031624775237696,
-        41599222097089576039515812387618848,
-        70993385372937988004914975997952,
-        141986770745875976009829951995904,
-        283973541491751952019659903991808,
-        581577812975107997736263483375222784,
-        20840175867752091360605800696381440,
-        41680351735504182721211601392762880,
-        83360703471008365442423202785525760,
-        40703468491703303438683204485120,
-        40584640755041742307842985033728,
-        83117344266325488246462433349074944,
-        83137596965368197067759783021379648,
-        166275193930736394135519566042759296,
-        71008240653409412568213765488640,
-        142016481306818825136427530977280,
-        284032962613637650272855061954560,
-        145424876858182476939701791720734720,
-        60857137166972572772557645676544,
-        121714274333945145545115291353088,
-        249270833835919658076396116691124224,
-        83117314555764545397335835770093760,
-        60876939371897860398439332839424,
-        121753878743795720796878665678848,
-        124675971833646818096003753655140352,
-        249351943667293636192007507310280704,
-        62368409531228886553637797704499200,
-        124736819062457773107275595408998400,
-        60906649932840709525036911820800,
-        121813299865681419050073823641600,
-        40594534603949468433008780378112,
-        83137606868888511350801982214373376,
-        166275213737777022701603964428746752,
-        249270814028879029510311718305136768,
-        40624250000595596018123058184192,
-        83198464001219780645116023161225216,
-        41599232000609890322558011580612608,
-        249270814028879029510311718305136704,
-        41609363301891401874727786013261824,
-        83218726603782803749455572026523648,
-        40634143849503322143288853528576,
-        166437453207565607498911144053047296,
-        70998337133095129526014572494848,
-        141996674266190259052029144989696,
-        283993348532380518104058289979392,
-        290809188897157650538555688938897408,
-        40594539439652746891525479202816,
-        83137616772408825633844181407367168,
-        166275233544817651267688362814734336,
-        124655689424043166425579806403854400,
-        60862084091426435835140543348736,
-        121724168182852871670281086697472,
-        249291096438482681180735665556422656,
-        498582192876965362361471331112845312,
-        40624259672002152935156455833600,
-        83198483808260409211200421547212800,
-        41599241904130204605600210773606400,
-        124655689424043166425579806403854368,
-    ],
-    20282409603651670423947251286016: [
-        38029518006846882044901096161280,
-        76059036013693764089802192322560,
-        152118072027387528179604384645120,
-        304236144054775056359208769290240,
-        20292317962030415166097965711360,
-        41558667186238290260168633776865280,
-        41558667181402586981710117078040608,
-        41558657277882272698667917885112352,
-        41573869085085011451485878323511296,
-        83147738170170022902971756647022592,
-        166295476340340045805943513294045184,
-        20299740764201665747795839025152,
-        30433522761495067136636768747520,
-        62327854615541897495832102394920960,
-        41558657277882272698667917885046832,
-        60867045522990134273273537495040,
-        20292327631075788841696540753920,
-        41558686988443215547794515464028160,
-        41599222097089576039515812387618848,
-        20799611048544788019757906193809424,
-        35496692686468994002457487998976,
-        70993385372937988004914975997952,
-        141986770745875976009829951995904,
-        290788906487553998868131741687611392,
-        10420087933876045680302900348190720,
-        20840175867752091360605800696381440,
-        41680351735504182721211601392762880,
-        20351734245851651719341602242560,
-        20292320377520871153921492516864,
-        41558672133162744123231216674537472,
-        41568798482684098533879891510689824,
-        83137596965368197067759783021379648,
-        35504120326704706284106882744320,
-        71008240653409412568213765488640,
-        142016481306818825136427530977280,
-        72712438429091238469850895860367360,
-        30428568583486286386278822838272,
-        60857137166972572772557645676544,
-        124635416917959829038198058345562112,
-        41558657277882272698667917885046880,
-        30438469685948930199219666419712,
-        60876939371897860398439332839424,
-        62337985916823409048001876827570176,
-        124675971833646818096003753655140352,
-        31184204765614443276818898852249600,
-        62368409531228886553637797704499200,
-        30453324966420354762518455910400,
-        60906649932840709525036911820800,
-        20297267301974734216504390189056,
-        41568803434444255675400991107186688,
-        83137606868888511350801982214373376,
-        124635407014439514755155859152568384,
-        20312125000297798009061529092096,
-        41599232000609890322558011580612608,
-        20799616000304945161279005790306304,
-        124635407014439514755155859152568352,
-        20804681650945700937363893006630912,
-        41609363301891401874727786013261824,
-        20317071924751661071644426764288,
-        83218726603782803749455572026523648,
-        35499168566547564763007286247424,
-        70998337133095129526014572494848,
-        141996674266190259052029144989696,
-        145404594448578825269277844469448704,
-        20297269719826373445762739601408,
-        41568808386204412816922090703683584,
-        83137616772408825633844181407367168,
-        62327844712021583212789903201927200,
-        30431042045713217917570271674368,
-        60862084091426435835140543348736,
-        124645548219241340590367832778211328,
-        249291096438482681180735665556422656,
-        20312129836001076467578227916800,
-        41599241904130204605600210773606400,
-        20799620952065102302800105386803200,
-        62327844712021583212789903201927184,
-    ],
-    10141204801825835211973625643008: [
-        19014759003423441022450548080640,
-        38029518006846882044901096161280,
-        76059036013693764089802192322560,
-        152118072027387528179604384645120,
-        10146158981015207583048982855680,
-        20779333593119145130084316888432640,
-        20779333590701293490855058539020304,
-        20779328638941136349333958942556176,
-        20786934542542505725742939161755648,
-        41573869085085011451485878323511296,
-        83147738170170022902971756647022592,
-        10149870382100832873897919512576,
-        15216761380747533568318384373760,
-        31163927307770948747916051197460480,
-        20779328638941136349333958942523416,
-        30433522761495067136636768747520,
-        10146163815537894420848270376960,
-        20779343494221607773897257732014080,
-        20799611048544788019757906193809424,
-        10399805524272394009878953096904712,
-        17748346343234497001228743999488,
-        35496692686468994002457487998976,
-        70993385372937988004914975997952,
-        145394453243776999434065870843805696,
-        5210043966938022840151450174095360,
-        10420087933876045680302900348190720,
-        20840175867752091360605800696381440,
-        10175867122925825859670801121280,
-        10146160188760435576960746258432,
-        20779336066581372061615608337268736,
-        20784399241342049266939945755344912,
-        41568798482684098533879891510689824,
-        17752060163352353142053441372160,
-        35504120326704706284106882744320,
-        71008240653409412568213765488640,
-        36356219214545619234925447930183680,
-        15214284291743143193139411419136,
-        30428568583486286386278822838272,
-        62317708458979914519099029172781056,
-        20779328638941136349333958942523440,
-        15219234842974465099609833209856,
-        30438469685948930199219666419712,
-        31168992958411704524000938413785088,
-        62337985916823409048001876827570176,
-        15592102382807221638409449426124800,
-        31184204765614443276818898852249600,
-        15226662483210177381259227955200,
-        30453324966420354762518455910400,
-        10148633650987367108252195094528,
-        20784401717222127837700495553593344,
-        41568803434444255675400991107186688,
-        62317703507219757377577929576284192,
-        10156062500148899004530764546048,
-        20799616000304945161279005790306304,
-        10399808000152472580639502895153152,
-        62317703507219757377577929576284176,
-        10402340825472850468681946503315456,
-        20804681650945700937363893006630912,
-        10158535962375830535822213382144,
-        41609363301891401874727786013261824,
-        17749584283273782381503643123712,
-        35499168566547564763007286247424,
-        70998337133095129526014572494848,
-        72702297224289412634638922234724352,
-        10148634859913186722881369800704,
-        20784404193102206408461045351841792,
-        41568808386204412816922090703683584,
-        31163922356010791606394951600963600,
-        15215521022856608958785135837184,
-        30431042045713217917570271674368,
-        62322774109620670295183916389105664,
-        124645548219241340590367832778211328,
-        10156064918000538233789113958400,
-        20799620952065102302800105386803200,
-        10399810476032551151400052693401600,
-        31163922356010791606394951600963592,
-    ],
-    5070602400912917605986812821504: [
-        9507379501711720511225274040320,
-        19014759003423441022450548080640,
-        38029518006846882044901096161280,
-        76059036013693764089802192322560,
-        5073079490507603791524491427840,
-        10389666796559572565042158444216320,
-        10389666795350646745427529269510152,
-        10389664319470568174666979471278088,
-        10393467271271252862871469580877824,
-        20786934542542505725742939161755648,
-        41573869085085011451485878323511296,
-        5074935191050416436948959756288,
-        7608380690373766784159192186880,
-        15581963653885474373958025598730240,
-        10389664319470568174666979471261708,
-        15216761380747533568318384373760,
-        5073081907768947210424135188480,
-        10389671747110803886948628866007040,
-        10399805524272394009878953096904712,
-        5199902762136197004939476548452356,
-        8874173171617248500614371999744,
-        17748346343234497001228743999488,
-        35496692686468994002457487998976,
-        72697226621888499717032935421902848,
-        2605021983469011420075725087047680,
-        5210043966938022840151450174095360,
-        10420087933876045680302900348190720,
-        5087933561462912929835400560640,
-        5073080094380217788480373129216,
-        10389668033290686030807804168634368,
-        10392199620671024633469972877672456,
-        20784399241342049266939945755344912,
-        8876030081676176571026720686080,
-        17752060163352353142053441372160,
-        35504120326704706284106882744320,
-        18178109607272809617462723965091840,
-        7607142145871571596569705709568,
-        15214284291743143193139411419136,
-        31158854229489957259549514586390528,
-        10389664319470568174666979471261720,
-        7609617421487232549804916604928,
-        15219234842974465099609833209856,
-        15584496479205852262000469206892544,
-        31168992958411704524000938413785088,
-        7796051191403610819204724713062400,
-        15592102382807221638409449426124800,
-        7613331241605088690629613977600,
-        15226662483210177381259227955200,
-        5074316825493683554126097547264,
-        10392200858611063918850247776796672,
-        20784401717222127837700495553593344,
-        31158851753609878688788964788142096,
-        5078031250074449502265382273024,
-        10399808000152472580639502895153152,
-        5199904000076236290319751447576576,
-        31158851753609878688788964788142088,
-        5201170412736425234340973251657728,
-        10402340825472850468681946503315456,
-        5079267981187915267911106691072,
-        20804681650945700937363893006630912,
-        8874792141636891190751821561856,
-        17749584283273782381503643123712,
-        35499168566547564763007286247424,
-        36351148612144706317319461117362176,
-        5074317429956593361440684900352,
-        10392202096551103204230522675920896,
-        20784404193102206408461045351841792,
-        15581961178005395803197475800481800,
-        7607760511428304479392567918592,
-        15215521022856608958785135837184,
-        31161387054810335147591958194552832,
-        62322774109620670295183916389105664,
-        5078032459000269116894556979200,
-        10399810476032551151400052693401600,
-        5199905238016275575700026346700800,
-        15581961178005395803197475800481796,
-    ],
-    2535301200456458802993406410752: [
-        653473884417652256471550502371328,
-        9507379501711720511225274040320,
-        19014759003423441022450548080640,
-        38029518006846882044901096161280,
-        2536539745253801895762245713920,
-        5194833398279786282521079222108160,
-        5194833397675323372713764634755076,
-        5194832159735284087333489735639044,
-        5196733635635626431435734790438912,
-        10393467271271252862871469580877824,
-        20786934542542505725742939161755648,
-        2537467595525208218474479878144,
-        3804190345186883392079596093440,
-        7790981826942737186979012799365120,
-        5194832159735284087333489735630854,
-        7608380690373766784159192186880,
-        2536540953884473605212067594240,
-        5194835873555401943474314433003520,
-        5199902762136197004939476548452356,
-        2599951381068098502469738274226178,
-        4437086585808624250307185999872,
-        8874173171617248500614371999744,
-        17748346343234497001228743999488,
-        36348613310944249858516467710951424,
-        1302510991734505710037862543523840,
-        2605021983469011420075725087047680,
-        5210043966938022840151450174095360,
-        2543966780731456464917700280320,
-        2536540047190108894240186564608,
-        5194834016645343015403902084317184,
-        5196099810335512316734986438836228,
-        10392199620671024633469972877672456,
-        4438015040838088285513360343040,
-        8876030081676176571026720686080,
-        17752060163352353142053441372160,
-        9089054803636404808731361982545920,
-        3803571072935785798284852854784,
-        7607142145871571596569705709568,
-        15579427114744978629774757293195264,
-        5194832159735284087333489735630860,
-        3804808710743616274902458302464,
-        7609617421487232549804916604928,
-        7792248239602926131000234603446272,
-        15584496479205852262000469206892544,
-        3898025595701805409602362356531200,
-        7796051191403610819204724713062400,
-        3806665620802544345314806988800,
-        7613331241605088690629613977600,
-        2537158412746841777063048773632,
-        5196100429305531959425123888398336,
-        10392200858611063918850247776796672,
-        15579425876804939344394482394071048,
-        2539015625037224751132691136512,
-        5199904000076236290319751447576576,
-        2599952000038118145159875723788288,
-        15579425876804939344394482394071044,
-        2600585206368212617170486625828864,
-        5201170412736425234340973251657728,
-        2539633990593957633955553345536,
-        10402340825472850468681946503315456,
-        4437396070818445595375910780928,
-        8874792141636891190751821561856,
-        17749584283273782381503643123712,
-        18175574306072353158659730558681088,
-        2537158714978296680720342450176,
-        5196101048275551602115261337960448,
-        10392202096551103204230522675920896,
-        7790980589002697901598737900240900,
-        3803880255714152239696283959296,
-        7607760511428304479392567918592,
-        15580693527405167573795979097276416,
-        31161387054810335147591958194552832,
-        2539016229500134558447278489600,
-        5199905238016275575700026346700800,
-        2599952619008137787850013173350400,
-        7790980589002697901598737900240898,
-    ],
-    1267650600228229401496703205376: [
-        975457136875622524451713116536832,
-        653473884417652256471550502371328,
-        9507379501711720511225274040320,
-        19014759003423441022450548080640,
-        1268269872626900947881122856960,
-        2597416699139893141260539611054080,
-        2597416698837661686356882317377538,
-        2597416079867642043666744867819522,
-        3247087012484609611933805260570624,
-        5196733635635626431435734790438912,
-        10393467271271252862871469580877824,
-        1585491705314750787077053349888,
-        1902095172593441696039798046720,
-        3895490913471368593489506399682560,
-        2597416079867642043666744867815427,
-        3804190345186883392079596093440,
-        1268270476942236802606033797120,
-        2597417936777700971737157216501760,
-        2599951381068098502469738274226178,
-        1299975690534049251234869137113089,
-        651255495867252855018931271761920,
-        4437086585808624250307185999872,
-        8874173171617248500614371999744,
-        18174306655472124929258233855475712,
-        1329878934368133068701475617376305152,
-        1302510991734505710037862543523840,
-        2605021983469011420075725087047680,
-        1271983390365728232458850140160,
-        1268270023595054447120093282304,
-        2597417008322671507701951042158592,
-        2598049905167756158367493219418114,
-        5196099810335512316734986438836228,
-        650939202187215440358694545522688,
-        4438015040838088285513360343040,
-        8876030081676176571026720686080,
-        1333123486079417221854606429230465024,
-        1901785536467892899142426427392,
-        3803571072935785798284852854784,
-        7789713557372489314887378646597632,
-        2597416079867642043666744867815430,
-        1902404355371808137451229151232,
-        3804808710743616274902458302464,
-        3896124119801463065500117301723136,
-        7792248239602926131000234603446272,
-        1330527971475449922155041929417457664,
-        3898025595701805409602362356531200,
-        1903332810401272172657403494400,
-        3806665620802544345314806988800,
-        1268579206373420888531524386816,
-        2598050214652765979712561944199168,
-        5196100429305531959425123888398336,
-        7789712938402469672197241197035524,
-        1269507812518612375566345568256,
-        2599952000038118145159875723788288,
-        1299976000019059072579937861894144,
-        7789712938402469672197241197035522,
-        1949012797850902704801181178265600,
-        2600585206368212617170486625828864,
-        1269816995296978816977776672768,
-        5201170412736425234340973251657728,
-        650938892702205619013625820741632,
-        4437396070818445595375910780928,
-        8874792141636891190751821561856,
-        9087787153036176579329865279340544,
-        1268579357489148340360171225088,
-        2598050524137775801057630668980224,
-        5196101048275551602115261337960448,
-        3895490294501348950799368950120450,
-        2218698035409222797687955390464,
-        3803880255714152239696283959296,
-        7790346763702583786897989548638208,
-        15580693527405167573795979097276416,
-        1269508114750067279223639244800,
-        2599952619008137787850013173350400,
-        1299976309504068893925006586675200,
-        3895490294501348950799368950120449,
-    ],
-    633825300114114700748351602688: [
-        1136448763104607658441794423619584,
-        975457136875622524451713116536832,
-        653473884417652256471550502371328,
-        9507379501711720511225274040320,
-        634134936313450473940561428480,
-        1298708349569946570630269805527040,
-        1298708349418830843178441158688769,
-        1298708039933821021833372433909761,
-        2272263700909101202182840495636480,
-        3247087012484609611933805260570624,
-        5196733635635626431435734790438912,
-        1109503760209522071378340085760,
-        649671242253093117063957764374528,
-        1330526704134334703746985501439033344,
-        1298708039933821021833372433908737,
-        1902095172593441696039798046720,
-        634135238471118401303016898560,
-        1298708968388850485868578608250880,
-        1299975690534049251234869137113089,
-        1329877666717532840472074120673100800,
-        974347942600422823725403501232128,
-        651255495867252855018931271761920,
-        4437086585808624250307185999872,
-        9087153327736062464629116927737856,
-        665588187378733330746953746553503744,
-        1329878934368133068701475617376305152,
-        1302510991734505710037862543523840,
-        635991695182864116229425070080,
-        634289678744574170180085612544,
-        1299025262068887900528815334490112,
-        1947745147250674475399684475060225,
-        2598049905167756158367493219418114,
-        974189795760404116395285138112512,
-        650939202187215440358694545522688,
-        4438015040838088285513360343040,
-        1995140701717307630377543962854424576,
-        649988000009529536289968930947072,
-        1901785536467892899142426427392,
-        3894856778686244657443689323298816,
-        1298708039933821021833372433907715,
-        649988154752034446962503293337600,
-        1902404355371808137451229151232,
-        1331175740932166547379206744755404800,
-        3896124119801463065500117301723136,
-        1994491664609990776923977650813272064,
-        1330527971475449922155041929417457664,
-        649671861071997032302266567098368,
-        1903332810401272172657403494400,
-        951202177685904068725614575616,
-        1948062059900731532750058650861568,
-        2598050214652765979712561944199168,
-        3894856469201234836098620598517762,
-        634753906259306187783172784128,
-        1299976000019059072579937861894144,
-        1329877983630182897529424494848901120,
-        3894856469201234836098620598517761,
-        1330202185271191267198857276693676032,
-        1949012797850902704801181178265600,
-        951666405200636086328701747200,
-        2600585206368212617170486625828864,
-        974506398925451352400590589132800,
-        650938892702205619013625820741632,
-        4437396070818445595375910780928,
-        1333122852254117107739905680878862336,
-        951047586296720848019899023360,
-        1947745456735684296744753199841280,
-        2598050524137775801057630668980224,
-        1330526703824849693925640432714252289,
-        650146301592053154292621656457216,
-        2218698035409222797687955390464,
-        4543893576518088289664932639670272,
-        7790346763702583786897989548638208,
-        634754057375033639611819622400,
-        1299976309504068893925006586675200,
-        1329877667027017850293419189397880832,
-        1330526703824849693925640432714253312,
-    ],
-    316912650057057350374175801344: [
-        594211218856982531951579627520,
-        554906622609671708223532433408,
-        476297430115050060767438045184,
-        319079045125806765855249268736,
-        317067468156725236970280714240,
-        649354174784973285315134902763520,
-        1329877349959625288325396280859688960,
-        1329877349804882783414723746497299456,
-        649591704454453303929466848804864,
-        1109503760209522071378340085760,
-        1585491705314750787077053349888,
-        317183449440651027309309984768,
-        475523793148360424009949511680,
-        973872728367842148372376599920640,
-        1994491347697340719866627276637470720,
-        317222286256393123566385627136,
-        317067468193618725117699817472,
-        649354174860531149041049226182656,
-        1329877350114367793236068815222079488,
-        664938991815091448764712247424450560,
-        554635823226078031288398249984,
-        475755831347862706897169678336,
-        317995847591432058114712535040,
-        651255495867252855018931271761920,
-        162813873966813213754732817940480,
-        324994232118522134153786009059328,
-        649354948421939974951892391297024,
-        317067845909150378394478706688,
-        317067505898763611780023320576,
-        649354252080667876925487760539648,
-        1329877508261207811943398933585199104,
-        1299025262068887900528815334490112,
-        554751880104761035689170042880,
-        475678611211134822458635321344,
-        317841407317976289237643821056,
-        1136131850454550601091420247818240,
-        475446384116973224785606606848,
-        317376953129653093891586392064,
-        649988000009529536289968930947072,
-        1331175424019516490321856370579603456,
-        475601088842952034362807287808,
-        317377028687516819805909811200,
-        974031029950365766375029325430784,
-        649988154752034446962503293337600,
-        487253199462725676200295294566400,
-        973872883110347059044910962311168,
-        475523868706224149924272930816,
-        317222588414061050928841097216,
-        317144801593355222132881096704,
-        649512553663191494928140486049792,
-        951202177685904068725614575616,
-        1948062059900731532750058650861568,
-        317067619235559200651508449280,
-        649354484194425242934289304125440,
-        324994000004764768144984465473536,
-        1329877983630182897529424494848901120,
-        325073150796026577146310828228608,
-        649512785776948860936942029635584,
-        317144914930150811004366225408,
-        951666405200636086328701747200,
-        554674508852305699421988847616,
-        475833202600318043164350873600,
-        317841256202248837408996982784,
-        974506398925451352400590589132800,
-        317144839372287085090042806272,
-        649512631034443950264407667245056,
-        951047586296720848019899023360,
-        1330201868358541210141506902517874688,
-        475485031964269029962035494912,
-        317454248824244704244444168192,
-        650146301592053154292621656457216,
-        2218698035409222797687955390464,
-        317067543751482451032023236608,
-        649354329603036059713583588573184,
-        324994077376017223481251646668800,
-        665587870466083273689603372377702400,
-    ],
-    158456325028528675187087900672: [
-        297105609428491265975789813760,
-        594211218856982531951579627520,
-        554906622609671708223532433408,
-        476297430115050060767438045184,
-        158533734078362618485140357120,
-        324677087392486642657567451381760,
-        664938674979812644162698140429844480,
-        664938674902441391707361873248649728,
-        324795852227226651964733424402432,
-        649591704454453303929466848804864,
-        1109503760209522071378340085760,
-        158591724720325513654654992384,
-        237761896574180212004974755840,
-        486936364183921074186188299960320,
-        997245673848670359933313638318735360,
-        475523793148360424009949511680,
-        158533809617779600325754224640,
-        324677242097212621467144652062720,
-        664938991815091448764712247424450560,
-        332469495907545724382356123712225280,
-        277317911613039015644199124992,
-        554635823226078031288398249984,
-        475755831347862706897169678336,
-        974347942600422823725403501232128,
-        81406936983406606877366408970240,
-        162813873966813213754732817940480,
-        324994232118522134153786009059328,
-        158688589901622135817278324736,
-        158533752949381805890011660288,
-        324677126040333938462743880269824,
-        664938754130603905971699466792599552,
-        1329877508261207811943398933585199104,
-        277375940052380517844585021440,
-        554751880104761035689170042880,
-        475678611211134822458635321344,
-        568065925227275300545710123909120,
-        237723192058486612392803303424,
-        475446384116973224785606606848,
-        973714194671561164360922330824704,
-        1994166670687357264611168933528993792,
-        237800544421476017181403643904,
-        475601088842952034362807287808,
-        487015514975182883187514662715392,
-        974031029950365766375029325430784,
-        243626599731362838100147647283200,
-        487253199462725676200295294566400,
-        237916601300159021582175436800,
-        475523868706224149924272930816,
-        158572400796677611066440548352,
-        324756276831595747464070243024896,
-        649512553663191494928140486049792,
-        1330201709902216181612831715429974016,
-        158688476564826546945793196032,
-        324994000004764768144984465473536,
-        162497000002382384072492232736768,
-        665587712009758245160928185289801728,
-        162536575398013288573155414114304,
-        325073150796026577146310828228608,
-        158727124412122352122222084096,
-        649512785776948860936942029635584,
-        277337254426152849710994423808,
-        554674508852305699421988847616,
-        475833202600318043164350873600,
-        1135973394129522072416233159917568,
-        158572419686143542545021403136,
-        324756315517221975132203833622528,
-        649512631034443950264407667245056,
-        665100934179270605070753451258937344,
-        237742515982134514981017747456,
-        475485031964269029962035494912,
-        973793345462822973362248693579776,
-        650146301592053154292621656457216,
-        158688514343758409902954905600,
-        324994077376017223481251646668800,
-        162497038688008611740625823334400,
-        332793935233041636844801686188851200,
-    ],
-    79228162514264337593543950336: [
-        148552804714245632987894906880,
-        297105609428491265975789813760,
-        594211218856982531951579627520,
-        554906622609671708223532433408,
-        79266867039181309242570178560,
-        162338543696243321328783725690880,
-        332469337489906322081349070214922240,
-        332469337451220695853680936624324864,
-        162397926113613325982366712201216,
-        324795852227226651964733424402432,
-        649591704454453303929466848804864,
-        79295862360162756827327496192,
-        118880948287090106002487377920,
-        243468182091960537093094149980160,
-        498622836924335179966656819159367680,
-        237761896574180212004974755840,
-        79266904808889800162877112320,
-        162338621048606310733572326031360,
-        332469495907545724382356123712225280,
-        166234747953772862191178061856112640,
-        138658955806519507822099562496,
-        277317911613039015644199124992,
-        554635823226078031288398249984,
-        1135894165967007808078639615967232,
-        40703468491703303438683204485120,
-        81406936983406606877366408970240,
-        162813873966813213754732817940480,
-        79498961897858014528678133760,
-        79266876474690902945005830144,
-        162338563020166969231371940134912,
-        332469377065301952985849733396299776,
-        664938754130603905971699466792599552,
-        138687970026190258922292510720,
-        277375940052380517844585021440,
-        554751880104761035689170042880,
-        284032962613637650272855061954560,
-        118861596029243306196401651712,
-        237723192058486612392803303424,
-        486857097335780582180461165412352,
-        997083335343678632305584466764496896,
-        118900272210738008590701821952,
-        237800544421476017181403643904,
-        243507757487591441593757331357696,
-        487015514975182883187514662715392,
-        121813299865681419050073823641600,
-        243626599731362838100147647283200,
-        118958300650079510791087718400,
-        237916601300159021582175436800,
-        79286200398338805533220274176,
-        162378138415797873732035121512448,
-        324756276831595747464070243024896,
-        665100854951108090806415857714987008,
-        79344238282413273472896598016,
-        162497000002382384072492232736768,
-        81248500001191192036246116368384,
-        332793856004879122580464092644900864,
-        81268287699006644286577707057152,
-        162536575398013288573155414114304,
-        79363562206061176061111042048,
-        325073150796026577146310828228608,
-        138668627213076424855497211904,
-        277337254426152849710994423808,
-        554674508852305699421988847616,
-        567986697064761036208116579958784,
-        79286209843071771272510701568,
-        162378157758610987566101916811264,
-        324756315517221975132203833622528,
-        332550467089635302535376725629468672,
-        118871257991067257490508873728,
-        237742515982134514981017747456,
-        486896672731411486681124346789888,
-        973793345462822973362248693579776,
-        79344257171879204951477452800,
-        162497038688008611740625823334400,
-        81248519344004305870312911667200,
-        166396967616520818422400843094425600,
-    ],
-    39614081257132168796771975168: [
-        74276402357122816493947453440,
-        148552804714245632987894906880,
-        297105609428491265975789813760,
-        594211218856982531951579627520,
-        39633433519590654621285089280,
-        81169271848121660664391862845440,
-        166234668744953161040674535107461120,
-        166234668725610347926840468312162432,
-        81198963056806662991183356100608,
-        162397926113613325982366712201216,
-        324795852227226651964733424402432,
-        39647931180081378413663748096,
-        59440474143545053001243688960,
-        121734091045980268546547074990080,
-        249311418462167589983328409579683840,
-        118880948287090106002487377920,
-        39633452404444900081438556160,
-        81169310524303155366786163015680,
-        166234747953772862191178061856112640,
-        83117373976886431095589030928056320,
-        69329477903259753911049781248,
-        138658955806519507822099562496,
-        277317911613039015644199124992,
-        567947082983503904039319807983616,
-        20351734245851651719341602242560,
-        40703468491703303438683204485120,
-        81406936983406606877366408970240,
-        39749480948929007264339066880,
-        39633438237345451472502915072,
-        81169281510083484615685970067456,
-        166234688532650976492924866698149888,
-        332469377065301952985849733396299776,
-        69343985013095129461146255360,
-        138687970026190258922292510720,
-        277375940052380517844585021440,
-        142016481306818825136427530977280,
-        59430798014621653098200825856,
-        118861596029243306196401651712,
-        243428548667890291090230582706176,
-        498541667671839316152792233382248448,
-        59450136105369004295350910976,
-        118900272210738008590701821952,
-        121753878743795720796878665678848,
-        243507757487591441593757331357696,
-        60906649932840709525036911820800,
-        121813299865681419050073823641600,
-        59479150325039755395543859200,
-        118958300650079510791087718400,
-        39643100199169402766610137088,
-        81189069207898936866017560756224,
-        162378138415797873732035121512448,
-        332550427475554045403207928857493504,
-        39672119141206636736448299008,
-        81248500001191192036246116368384,
-        40624250000595596018123058184192,
-        166396928002439561290232046322450432,
-        40634143849503322143288853528576,
-        81268287699006644286577707057152,
-        39681781103030588030555521024,
-        162536575398013288573155414114304,
-        69334313606538212427748605952,
-        138668627213076424855497211904,
-        277337254426152849710994423808,
-        283993348532380518104058289979392,
-        39643104921535885636255350784,
-        81189078879305493783050958405632,
-        162378157758610987566101916811264,
-        166275233544817651267688362814734336,
-        59435628995533628745254436864,
-        118871257991067257490508873728,
-        243448336365705743340562173394944,
-        486896672731411486681124346789888,
-        39672128585939602475738726400,
-        81248519344004305870312911667200,
-        40624259672002152935156455833600,
-        83198483808260409211200421547212800,
-    ],
-    19807040628566084398385987584: [
-        37138201178561408246973726720,
-        74276402357122816493947453440,
-        148552804714245632987894906880,
-        297105609428491265975789813760,
-        19816716759795327310642544640,
-        40584635924060830332195931422720,
-        83117334372476580520337267553730560,
-        83117334362805173963420234156081216,
-        40599481528403331495591678050304,
-        81198963056806662991183356100608,
-        162397926113613325982366712201216,
-        19823965590040689206831874048,
-        29720237071772526500621844480,
-        60867045522990134273273537495040,
-        124655709231083794991664204789841920,
-        59440474143545053001243688960,
-        19816726202222450040719278080,
-        40584655262151577683393081507840,
-        83117373976886431095589030928056320,
-        41558686988443215547794515464028160,
-        34664738951629876955524890624,
-        69329477903259753911049781248,
-        138658955806519507822099562496,
-        283973541491751952019659903991808,
-        10175867122925825859670801121280,
-        20351734245851651719341602242560,
-        40703468491703303438683204485120,
-        19874740474464503632169533440,
-        19816719118672725736251457536,
-        40584640755041742307842985033728,
-        83117344266325488246462433349074944,
-        166234688532650976492924866698149888,
-        34671992506547564730573127680,
-        69343985013095129461146255360,
-        138687970026190258922292510720,
-        71008240653409412568213765488640,
-        29715399007310826549100412928,
-        59430798014621653098200825856,
-        121714274333945145545115291353088,
-        249270833835919658076396116691124224,
-        29725068052684502147675455488,
-        59450136105369004295350910976,
-        60876939371897860398439332839424,
-        121753878743795720796878665678848,
-        30453324966420354762518455910400,
-        60906649932840709525036911820800,
-        29739575162519877697771929600,
-        59479150325039755395543859200,
-        19821550099584701383305068544,
-        40594534603949468433008780378112,
-        81189069207898936866017560756224,
-        166275213737777022701603964428746752,
-        19836059570603318368224149504,
-        40624250000595596018123058184192,
-        20312125000297798009061529092096,
-        83198464001219780645116023161225216,
-        20317071924751661071644426764288,
-        40634143849503322143288853528576,
-        19840890551515294015277760512,
-        81268287699006644286577707057152,
-        34667156803269106213874302976,
-        69334313606538212427748605952,
-        138668627213076424855497211904,
-        141996674266190259052029144989696,
-        19821552460767942818127675392,
-        40594539439652746891525479202816,
-        81189078879305493783050958405632,
-        83137616772408825633844181407367168,
-        29717814497766814372627218432,
-        59435628995533628745254436864,
-        121724168182852871670281086697472,
-        243448336365705743340562173394944,
-        19836064292969801237869363200,
-        40624259672002152935156455833600,
-        20312129836001076467578227916800,
-        41599241904130204605600210773606400,
-    ],
-    9903520314283042199192993792: [
-        18569100589280704123486863360,
-        37138201178561408246973726720,
-        74276402357122816493947453440,
-        148552804714245632987894906880,
-        9908358379897663655321272320,
-        20292317962030415166097965711360,
-        41558667186238290260168633776865280,
-        41558667181402586981710117078040608,
-        20299740764201665747795839025152,
-        40599481528403331495591678050304,
-        81198963056806662991183356100608,
-        9911982795020344603415937024,
-        14860118535886263250310922240,
-        30433522761495067136636768747520,
-        62327854615541897495832102394920960,
-        29720237071772526500621844480,
-        9908363101111225020359639040,
-        20292327631075788841696540753920,
-        41558686988443215547794515464028160,
-        20779343494221607773897257732014080,
-        17332369475814938477762445312,
-        34664738951629876955524890624,
-        69329477903259753911049781248,
-        141986770745875976009829951995904,
-        5087933561462912929835400560640,
-        10175867122925825859670801121280,
-        20351734245851651719341602242560,
-        9937370237232251816084766720,
-        9908359559336362868125728768,
-        20292320377520871153921492516864,
-        41558672133162744123231216674537472,
-        83117344266325488246462433349074944,
-        17335996253273782365286563840,
-        34671992506547564730573127680,
-        69343985013095129461146255360,
-        35504120326704706284106882744320,
-        14857699503655413274550206464,
-        29715399007310826549100412928,
-        60857137166972572772557645676544,
-        124635416917959829038198058345562112,
-        14862534026342251073837727744,
-        29725068052684502147675455488,
-        30438469685948930199219666419712,
-        60876939371897860398439332839424,
-        15226662483210177381259227955200,
-        30453324966420354762518455910400,
-        14869787581259938848885964800,
-        29739575162519877697771929600,
-        9910775049792350691652534272,
-        20297267301974734216504390189056,
-        40594534603949468433008780378112,
-        83137606868888511350801982214373376,
-        9918029785301659184112074752,
-        20312125000297798009061529092096,
-        10156062500148899004530764546048,
-        41599232000609890322558011580612608,
-        10158535962375830535822213382144,
-        20317071924751661071644426764288,
-        9920445275757647007638880256,
-        40634143849503322143288853528576,
-        17333578401634553106937151488,
-        34667156803269106213874302976,
-        69334313606538212427748605952,
-        70998337133095129526014572494848,
-        9910776230383971409063837696,
-        20297269719826373445762739601408,
-        40594539439652746891525479202816,
-        41568808386204412816922090703683584,
-        14858907248883407186313609216,
-        29717814497766814372627218432,
-        60862084091426435835140543348736,
-        121724168182852871670281086697472,
-        9918032146484900618934681600,
-        20312129836001076467578227916800,
-        10156064918000538233789113958400,
-        20799620952065102302800105386803200,
-    ],
-    4951760157141521099596496896: [
-        9284550294640352061743431680,
-        18569100589280704123486863360,
-        37138201178561408246973726720,
-        74276402357122816493947453440,
-        4954179189948831827660636160,
-        10146158981015207583048982855680,
-        20779333593119145130084316888432640,
-        20779333590701293490855058539020304,
-        10149870382100832873897919512576,
-        20299740764201665747795839025152,
-        40599481528403331495591678050304,
-        4955991397510172301707968512,
-        7430059267943131625155461120,
-        15216761380747533568318384373760,
-        31163927307770948747916051197460480,
-        14860118535886263250310922240,
-        4954181550555612510179819520,
-        10146163815537894420848270376960,
-        20779343494221607773897257732014080,
-        10389671747110803886948628866007040,
-        8666184737907469238881222656,
-        17332369475814938477762445312,
-        34664738951629876955524890624,
-        70993385372937988004914975997952,
-        2543966780731456464917700280320,
-        5087933561462912929835400560640,
-        10175867122925825859670801121280,
-        4968685118616125908042383360,
-        4954179779668181434062864384,
-        10146160188760435576960746258432,
-        20779336066581372061615608337268736,
-        41558672133162744123231216674537472,
-        8667998126636891182643281920,
-        17335996253273782365286563840,
-        34671992506547564730573127680,
-        17752060163352353142053441372160,
-        7428849751827706637275103232,
-        14857699503655413274550206464,
-        30428568583486286386278822838272,
-        62317708458979914519099029172781056,
-        7431267013171125536918863872,
-        14862534026342251073837727744,
-        15219234842974465099609833209856,
-        30438469685948930199219666419712,
-        7613331241605088690629613977600,
-        15226662483210177381259227955200,
-        7434893790629969424442982400,
-        14869787581259938848885964800,
-        4955387524896175345826267136,
-        10148633650987367108252195094528,
-        20297267301974734216504390189056,
-        41568803434444255675400991107186688,
-        4959014892650829592056037376,
-        10156062500148899004530764546048,
-        5078031250074449502265382273024,
-        20799616000304945161279005790306304,
-        5079267981187915267911106691072,
-        10158535962375830535822213382144,
-        4960222637878823503819440128,
-        20317071924751661071644426764288,
-        8666789200817276553468575744,
-        17333578401634553106937151488,
-        34667156803269106213874302976,
-        35499168566547564763007286247424,
-        4955388115191985704531918848,
-        10148634859913186722881369800704,
-        20297269719826373445762739601408,
-        20784404193102206408461045351841792,
-        7429453624441703593156804608,
-        14858907248883407186313609216,
-        30431042045713217917570271674368,
-        60862084091426435835140543348736,
-        4959016073242450309467340800,
-        10156064918000538233789113958400,
-        5078032459000269116894556979200,
-        10399810476032551151400052693401600,
-    ],
-    2475880078570760549798248448: [
-        4642275147320176030871715840,
-        9284550294640352061743431680,
-        18569100589280704123486863360,
-        37138201178561408246973726720,
-        2477089594974415913830318080,
-        5073079490507603791524491427840,
-        10389666796559572565042158444216320,
-        10389666795350646745427529269510152,
-        5074935191050416436948959756288,
-        10149870382100832873897919512576,
-        20299740764201665747795839025152,
-        2477995698755086150853984256,
-        3715029633971565812577730560,
-        7608380690373766784159192186880,
-        15581963653885474373958025598730240,
-        7430059267943131625155461120,
-        2477090775277806255089909760,
-        5073081907768947210424135188480,
-        10389671747110803886948628866007040,
-        5194835873555401943474314433003520,
-        4333092368953734619440611328,
-        8666184737907469238881222656,
-        17332369475814938477762445312,
-        35496692686468994002457487998976,
-        1271983390365728232458850140160,
-        2543966780731456464917700280320,
-        5087933561462912929835400560640,
-        2484342559308062954021191680,
-        2477089889834090717031432192,
-        5073080094380217788480373129216,
-        10389668033290686030807804168634368,
-        20779336066581372061615608337268736,
-        4333999063318445591321640960,
-        8667998126636891182643281920,
-        17335996253273782365286563840,
-        8876030081676176571026720686080,
-        3714424875913853318637551616,
-        7428849751827706637275103232,
-        15214284291743143193139411419136,
-        31158854229489957259549514586390528,
-        3715633506585562768459431936,
-        7431267013171125536918863872,
-        7609617421487232549804916604928,
-        15219234842974465099609833209856,
-        3806665620802544345314806988800,
-        7613331241605088690629613977600,
-        3717446895314984712221491200,
-        7434893790629969424442982400,
-        2477693762448087672913133568,
-        5074316825493683554126097547264,
-        10148633650987367108252195094528,
-        20784401717222127837700495553593344,
-        2479507446325414796028018688,
-        5078031250074449502265382273024,
-        2539015625037224751132691136512,
-        10399808000152472580639502895153152,
-        2539633990593957633955553345536,
-        5079267981187915267911106691072,
-        2480111318939411751909720064,
-        10158535962375830535822213382144,
-        4333394600408638276734287872,
-        8666789200817276553468575744,
-        17333578401634553106937151488,
-        17749584283273782381503643123712,
-        2477694057595992852265959424,
-        5074317429956593361440684900352,
-        10148634859913186722881369800704,
-        10392202096551103204230522675920896,
-        3714726812220851796578402304,
-        7429453624441703593156804608,
-        15215521022856608958785135837184,
-        30431042045713217917570271674368,
-        2479508036621225154733670400,
-        5078032459000269116894556979200,
-        2539016229500134558447278489600,
-        5199905238016275575700026346700800,
-    ],
-    1237940039285380274899124224: [
-        319079045125806765855249268736,
-        4642275147320176030871715840,
-        9284550294640352061743431680,
-        18569100589280704123486863360,
-        1238544797487207956915159040,
-        2536539745253801895762245713920,
-        5194833398279786282521079222108160,
-        5194833397675323372713764634755076,
-        2537467595525208218474479878144,
-        5074935191050416436948959756288,
-        10149870382100832873897919512576,
-        1238997849377543075426992128,
-        1857514816985782906288865280,
-        3804190345186883392079596093440,
-        7790981826942737186979012799365120,
-        3715029633971565812577730560,
-        1238545387638903127544954880,
-        2536540953884473605212067594240,
-        5194835873555401943474314433003520,
-        2597417936777700971737157216501760,
-        2166546184476867309720305664,
-        4333092368953734619440611328,
-        8666184737907469238881222656,
-        17748346343234497001228743999488,
-        635991695182864116229425070080,
-        1271983390365728232458850140160,
-        2543966780731456464917700280320,
-        1242171279654031477010595840,
-        1238544944917045358515716096,
-        2536540047190108894240186564608,
-        5194834016645343015403902084317184,
-        10389668033290686030807804168634368,
-        2166999531659222795660820480,
-        4333999063318445591321640960,
-        8667998126636891182643281920,
-        4438015040838088285513360343040,
-        1857212437956926659318775808,
-        3714424875913853318637551616,
-        7607142145871571596569705709568,
-        15579427114744978629774757293195264,
-        1857816753292781384229715968,
-        3715633506585562768459431936,
-        3804808710743616274902458302464,
-        7609617421487232549804916604928,
-        1903332810401272172657403494400,
-        3806665620802544345314806988800,
-        1858723447657492356110745600,
-        3717446895314984712221491200,
-        1238846881224043836456566784,
-        2537158412746841777063048773632,
-        5074316825493683554126097547264,
-        10392200858611063918850247776796672,
-        1239753723162707398014009344,
-        2539015625037224751132691136512,
-        1269507812518612375566345568256,
-        5199904000076236290319751447576576,
-        1269816995296978816977776672768,
-        2539633990593957633955553345536,
-        1240055659469705875954860032,
-        5079267981187915267911106691072,
-        2166697300204319138367143936,
-        4333394600408638276734287872,
-        8666789200817276553468575744,
-        8874792141636891190751821561856,
-        1238847028797996426132979712,
-        2537158714978296680720342450176,
-        5074317429956593361440684900352,
-        5196101048275551602115261337960448,
-        1857363406110425898289201152,
-        3714726812220851796578402304,
-        7607760511428304479392567918592,
-        15215521022856608958785135837184,
-        1239754018310612577366835200,
-        2539016229500134558447278489600,
-        1269508114750067279223639244800,
-        2599952619008137787850013173350400,
-    ],
-    618970019642690137449562112: [
-        476297430115050060767438045184,
-        319079045125806765855249268736,
-        4642275147320176030871715840,
-        9284550294640352061743431680,
-        619272398743603978457579520,
-        1268269872626900947881122856960,
-        2597416699139893141260539611054080,
-        2597416698837661686356882317377538,
-        1585491705314750787077053349888,
-        2537467595525208218474479878144,
-        5074935191050416436948959756288,
-        774165871735718157752467456,
-        928757408492891453144432640,
-        1902095172593441696039798046720,
-        3895490913471368593489506399682560,
-        1857514816985782906288865280,
-        619272693819451563772477440,
-        1268270476942236802606033797120,
-        2597417936777700971737157216501760,
-        1298708968388850485868578608250880,
-        317995847591432058114712535040,
-        2166546184476867309720305664,
-        4333092368953734619440611328,
-        8874173171617248500614371999744,
-        649354948421939974951892391297024,
-        635991695182864116229425070080,
-        1271983390365728232458850140160,
-        621085639827015738505297920,
-        619272472458522679257858048,
-        1268270023595054447120093282304,
-        2597417008322671507701951042158592,
-        5194834016645343015403902084317184,
-        317841407317976289237643821056,
-        2166999531659222795660820480,
-        4333999063318445591321640960,
-        650939202187215440358694545522688,
-        928606218978463329659387904,
-        1857212437956926659318775808,
-        3803571072935785798284852854784,
-        7789713557372489314887378646597632,
-        928908376646390692114857984,
-        1857816753292781384229715968,
-        1902404355371808137451229151232,
-        3804808710743616274902458302464,
-        649671861071997032302266567098368,
-        1903332810401272172657403494400,
-        929361723828746178055372800,
-        1858723447657492356110745600,
-        619423440612021918228283392,
-        1268579206373420888531524386816,
-        2537158412746841777063048773632,
-        5196100429305531959425123888398336,
-        619876861581353699007004672,
-        1269507812518612375566345568256,
-        634753906259306187783172784128,
-        2599952000038118145159875723788288,
-        951666405200636086328701747200,
-        1269816995296978816977776672768,
-        620027829734852937977430016,
-        2539633990593957633955553345536,
-        317841256202248837408996982784,
-        2166697300204319138367143936,
-        4333394600408638276734287872,
-        4437396070818445595375910780928,
-        619423514398998213066489856,
-        1268579357489148340360171225088,
-        2537158714978296680720342450176,
-        2598050524137775801057630668980224,
-        1083348650102159569183571968,
-        1857363406110425898289201152,
-        3803880255714152239696283959296,
-        7607760511428304479392567918592,
-        619877009155306288683417600,
-        1269508114750067279223639244800,
-        634754057375033639611819622400,
-        1299976309504068893925006586675200,
-    ],
-    309485009821345068724781056: [
-        554906622609671708223532433408,
-        476297430115050060767438045184,
-        319079045125806765855249268736,
-        4642275147320176030871715840,
-        309636199371801989228789760,
-        634134936313450473940561428480,
-        1298708349569946570630269805527040,
-        1298708349418830843178441158688769,
-        1109503760209522071378340085760,
-        1585491705314750787077053349888,
-        2537467595525208218474479878144,
-        541749882914805698915205120,
-        317222286256393123566385627136,
-        649671242253093117063957764374528,
-        1330526704134334703746985501439033344,
-        928757408492891453144432640,
-        309636346909725781886238720,
-        634135238471118401303016898560,
-        1298708968388850485868578608250880,
-        1329877350114367793236068815222079488,
-        475755831347862706897169678336,
-        317995847591432058114712535040,
-        2166546184476867309720305664,
-        4437086585808624250307185999872,
-        324994232118522134153786009059328,
-        649354948421939974951892391297024,
-        635991695182864116229425070080,
-        310542819913507869252648960,
-        309711757199499106533244928,
-        634289678744574170180085612544,
-        1299025262068887900528815334490112,
-        2597417008322671507701951042158592,
-        475678611211134822458635321344,
-        317841407317976289237643821056,
-        2166999531659222795660820480,
-        974189795760404116395285138112512,
-        317376953129653093891586392064,
-        928606218978463329659387904,
-        1901785536467892899142426427392,
-        3894856778686244657443689323298816,
-        317377028687516819805909811200,
-        928908376646390692114857984,
-        649988154752034446962503293337600,
-        1902404355371808137451229151232,
-        973872883110347059044910962311168,
-        649671861071997032302266567098368,
-        317222588414061050928841097216,
-        929361723828746178055372800,
-        464454188323195346057428992,
-        951202177685904068725614575616,
-        1268579206373420888531524386816,
-        2598050214652765979712561944199168,
-        309938430790676849503502336,
-        634753906259306187783172784128,
-        649354484194425242934289304125440,
-        1299976000019059072579937861894144,
-        649512785776948860936942029635584,
-        951666405200636086328701747200,
-        464680861914373089027686400,
-        1269816995296978816977776672768,
-        475833202600318043164350873600,
-        317841256202248837408996982784,
-        2166697300204319138367143936,
-        650938892702205619013625820741632,
-        464378704246445726572216320,
-        951047586296720848019899023360,
-        1268579357489148340360171225088,
-        1947745456735684296744753199841280,
-        317454248824244704244444168192,
-        1083348650102159569183571968,
-        2218698035409222797687955390464,
-        3803880255714152239696283959296,
-        309938504577653144341708800,
-        634754057375033639611819622400,
-        649354329603036059713583588573184,
-        1329877667027017850293419189397880832,
-    ],
-    154742504910672534362390528: [
-        290142196707511001929482240,
-        270950499321128763781021696,
-        232567104548364287484100608,
-        155800315002835334890258432,
-        154818099685900994614394880,
-        317067468156725236970280714240,
-        649354174784973285315134902763520,
-        1329877349959625288325396280859688960,
-        317183449440651027309309984768,
-        541749882914805698915205120,
-        774165871735718157752467456,
-        154874731172192884428374016,
-        232189352123222863286108160,
-        475523793148360424009949511680,
-        973872728367842148372376599920640,
-        154893694461129454866399232,
-        154818099703915393123876864,
-        317067468193618725117699817472,
-        649354174860531149041049226182656,
-        324677242097212621467144652062720,
-        270818273059608413715038208,
-        232302652025323587352133632,
-        155271409956753934626324480,
-        317995847591432058114712535040,
-        79498961897858014528678133760,
-        158688589901622135817278324736,
-        317067845909150378394478706688,
-        154818284135327333200429056,
-        154818118114630669814464512,
-        317067505898763611780023320576,
-        649354252080667876925487760539648,
-        634289678744574170180085612544,
-        270874941457402849457602560,
-        232264946880436925028630528,
-        155195999666980609979318272,
-        554751880104761035689170042880,
-        232151554744615832414846976,
-        154969215395338424751751168,
-        317376953129653093891586392064,
-        649988000009529536289968930947072,
-        232227094161597673028714496,
-        154969252288826572170854400,
-        475601088842952034362807287808,
-        317377028687516819805909811200,
-        237916601300159021582175436800,
-        475523868706224149924272930816,
-        232189389016711010705211392,
-        154893841999053247523848192,
-        154855860153005479557070848,
-        317144801593355222132881096704,
-        464454188323195346057428992,
-        951202177685904068725614575616,
-        154818173454862890943119360,
-        317067619235559200651508449280,
-        158688476564826546945793196032,
-        649354484194425242934289304125440,
-        158727124412122352122222084096,
-        317144914930150811004366225408,
-        154855915493237700685725696,
-        464680861914373089027686400,
-        270837162525539892295892992,
-        232340430957186544513843200,
-        155195925880004315141111808,
-        475833202600318043164350873600,
-        154855878599749553266622464,
-        317144839372287085090042806272,
-        464378704246445726572216320,
-        649512631034443950264407667245056,
-        232170425763803237286150144,
-        155006957433713234494357504,
-        317454248824244704244444168192,
-        1083348650102159569183571968,
-        154818136597403540542980096,
-        317067543751482451032023236608,
-        158688514343758409902954905600,
-        324994077376017223481251646668800,
-    ],
-    77371252455336267181195264: [
-        145071098353755500964741120,
-        290142196707511001929482240,
-        270950499321128763781021696,
-        232567104548364287484100608,
-        77409049842950497307197440,
-        158533734078362618485140357120,
-        324677087392486642657567451381760,
-        664938674979812644162698140429844480,
-        158591724720325513654654992384,
-        317183449440651027309309984768,
-        541749882914805698915205120,
-        77437365586096442214187008,
-        116094676061611431643054080,
-        237761896574180212004974755840,
-        486936364183921074186188299960320,
-        232189352123222863286108160,
-        77409086727431445471559680,
-        158533809617779600325754224640,
-        324677242097212621467144652062720,
-        162338621048606310733572326031360,
-        135409136529804206857519104,
-        270818273059608413715038208,
-        232302652025323587352133632,
-        475755831347862706897169678336,
-        39749480948929007264339066880,
-        79498961897858014528678133760,
-        158688589901622135817278324736,
-        77484663037901433504530432,
-        77409059057315334907232256,
-        158533752949381805890011660288,
-        324677126040333938462743880269824,
-        649354252080667876925487760539648,
-        135437470728701424728801280,
-        270874941457402849457602560,
-        232264946880436925028630528,
-        277375940052380517844585021440,
-        116075777372307916207423488,
-        232151554744615832414846976,
-        475446384116973224785606606848,
-        973714194671561164360922330824704,
-        116113547080798836514357248,
-        232227094161597673028714496,
-        237800544421476017181403643904,
-        475601088842952034362807287808,
-        118958300650079510791087718400,
-        237916601300159021582175436800,
-        116170215478593272256921600,
-        232189389016711010705211392,
-        77427930076502739778535424,
-        158572400796677611066440548352,
-        317144801593355222132881096704,
-        649512553663191494928140486049792,
-        77484607697669212375875584,
-        158688476564826546945793196032,
-        79344238282413273472896598016,
-        324994000004764768144984465473536,
-        79363562206061176061111042048,
-        158727124412122352122222084096,
-        77503478716856617247178752,
-        317144914930150811004366225408,
-        135418581262769946147946496,
-        270837162525539892295892992,
-        232340430957186544513843200,
-        554674508852305699421988847616,
-        77427939299874776633311232,
-        158572419686143542545021403136,
-        317144839372287085090042806272,
-        324756315517221975132203833622528,
-        116085212881901618643075072,
-        232170425763803237286150144,
-        475485031964269029962035494912,
-        317454248824244704244444168192,
-        77484626144413286085427200,
-        158688514343758409902954905600,
-        79344257171879204951477452800,
-        162497038688008611740625823334400,
-    ],
-    38685626227668133590597632: [
-        72535549176877750482370560,
-        145071098353755500964741120,
-        290142196707511001929482240,
-        270950499321128763781021696,
-        38704524921475248653598720,
-        79266867039181309242570178560,
-        162338543696243321328783725690880,
-        332469337489906322081349070214922240,
-        79295862360162756827327496192,
-        158591724720325513654654992384,
-        317183449440651027309309984768,
-        38718682793048221107093504,
-        58047338030805715821527040,
-        118880948287090106002487377920,
-        243468182091960537093094149980160,
-        116094676061611431643054080,
-        38704543363715722735779840,
-        79266904808889800162877112320,
-        162338621048606310733572326031360,
-        81169310524303155366786163015680,
-        67704568264902103428759552,
-        135409136529804206857519104,
-        270818273059608413715038208,
-        554635823226078031288398249984,
-        19874740474464503632169533440,
-        39749480948929007264339066880,
-        79498961897858014528678133760,
-        38817852489188483656581120,
-        38704529528657667453616128,
-        79266876474690902945005830144,
-        162338563020166969231371940134912,
-        324677126040333938462743880269824,
-        67718735364350712364400640,
-        135437470728701424728801280,
-        270874941457402849457602560,
-        138687970026190258922292510720,
-        58037888686153958103711744,
-        116075777372307916207423488,
-        237723192058486612392803303424,
-        486857097335780582180461165412352,
-        58056773540399418257178624,
-        116113547080798836514357248,
-        118900272210738008590701821952,
-        237800544421476017181403643904,
-        59479150325039755395543859200,
-        118958300650079510791087718400,
-        58085107739296636128460800,
-        116170215478593272256921600,
-        38713965038251369889267712,
-        79286200398338805533220274176,
-        158572400796677611066440548352,
-        324756276831595747464070243024896,
-        38742303848834606187937792,
-        79344238282413273472896598016,
-        39672119141206636736448299008,
-        162497000002382384072492232736768,
-        39681781103030588030555521024,
-        79363562206061176061111042048,
-        38751739358428308623589376,
-        158727124412122352122222084096,
-        67709290631384973073973248,
-        135418581262769946147946496,
-        270837162525539892295892992,
-        277337254426152849710994423808,
-        38713969649937388316655616,
-        79286209843071771272510701568,
-        158572419686143542545021403136,
-        162378157758610987566101916811264,
-        58042606440950809321537536,
-        116085212881901618643075072,
-        237742515982134514981017747456,
-        475485031964269029962035494912,
-        38742313072206643042713600,
-        79344257171879204951477452800,
-        39672128585939602475738726400,
-        81248519344004305870312911667200,
-    ],
-    19342813113834066795298816: [
-        36267774588438875241185280,
-        72535549176877750482370560,
-        145071098353755500964741120,
-        290142196707511001929482240,
-        19352262460737624326799360,
-        39633433519590654621285089280,
-        81169271848121660664391862845440,
-        166234668744953161040674535107461120,
-        39647931180081378413663748096,
-        79295862360162756827327496192,
-        158591724720325513654654992384,
-        19359341396524110553546752,
-        29023669015402857910763520,
-        59440474143545053001243688960,
-        121734091045980268546547074990080,
-        58047338030805715821527040,
-        19352271681857861367889920,
-        39633452404444900081438556160,
-        81169310524303155366786163015680,
-        40584655262151577683393081507840,
-        33852284132451051714379776,
-        67704568264902103428759552,
-        135409136529804206857519104,
-        277317911613039015644199124992,
-        9937370237232251816084766720,
-        19874740474464503632169533440,
-        39749480948929007264339066880,
-        19408926244594241828290560,
-        19352264764328833726808064,
-        39633438237345451472502915072,
-        81169281510083484615685970067456,
-        162338563020166969231371940134912,
-        33859367682175356182200320,
-        67718735364350712364400640,
-        135437470728701424728801280,
-        69343985013095129461146255360,
-        29018944343076979051855872,
-        58037888686153958103711744,
-        118861596029243306196401651712,
-        243428548667890291090230582706176,
-        29028386770199709128589312,
-        58056773540399418257178624,
-        59450136105369004295350910976,
-        118900272210738008590701821952,
-        29739575162519877697771929600,
-        59479150325039755395543859200,
-        29042553869648318064230400,
-        58085107739296636128460800,
-        19356982519125684944633856,
-        39643100199169402766610137088,
-        79286200398338805533220274176,
-        162378138415797873732035121512448,
-        19371151924417303093968896,
-        39672119141206636736448299008,
-        19836059570603318368224149504,
-        81248500001191192036246116368384,
-        19840890551515294015277760512,
-        39681781103030588030555521024,
-        19375869679214154311794688,
-        79363562206061176061111042048,
-        33854645315692486536986624,
-        67709290631384973073973248,
-        135418581262769946147946496,
-        138668627213076424855497211904,
-        19356984824968694158327808,
-        39643104921535885636255350784,
-        79286209843071771272510701568,
-        81189078879305493783050958405632,
-        29021303220475404660768768,
-        58042606440950809321537536,
-        118871257991067257490508873728,
-        237742515982134514981017747456,
-        19371156536103321521356800,
-        39672128585939602475738726400,
-        19836064292969801237869363200,
-        40624259672002152935156455833600,
-    ],
-    9671406556917033397649408: [
-        18133887294219437620592640,
-        36267774588438875241185280,
-        72535549176877750482370560,
-        145071098353755500964741120,
-        9676131230368812163399680,
-        19816716759795327310642544640,
-        40584635924060830332195931422720,
-        83117334372476580520337267553730560,
-        19823965590040689206831874048,
-        39647931180081378413663748096,
-        79295862360162756827327496192,
-        9679670698262055276773376,
-        14511834507701428955381760,
-        29720237071772526500621844480,
-        60867045522990134273273537495040,
-        29023669015402857910763520,
-        9676135840928930683944960,
-        19816726202222450040719278080,
-        40584655262151577683393081507840,
-        20292327631075788841696540753920,
-        16926142066225525857189888,
-        33852284132451051714379776,
-        67704568264902103428759552,
-        138658955806519507822099562496,
-        4968685118616125908042383360,
-        9937370237232251816084766720,
-        19874740474464503632169533440,
-        9704463122297120914145280,
-        9676132382164416863404032,
-        19816719118672725736251457536,
-        40584640755041742307842985033728,
-        81169281510083484615685970067456,
-        16929683841087678091100160,
-        33859367682175356182200320,
-        67718735364350712364400640,
-        34671992506547564730573127680,
-        14509472171538489525927936,
-        29018944343076979051855872,
-        59430798014621653098200825856,
-        121714274333945145545115291353088,
-        14514193385099854564294656,
-        29028386770199709128589312,
-        29725068052684502147675455488,
-        59450136105369004295350910976,
-        14869787581259938848885964800,
-        29739575162519877697771929600,
-        14521276934824159032115200,
-        29042553869648318064230400,
-        9678491259562842472316928,
-        19821550099584701383305068544,
-        39643100199169402766610137088,
-        81189069207898936866017560756224,
-        9685575962208651546984448,
-        19836059570603318368224149504,
-        9918029785301659184112074752,
-        40624250000595596018123058184192,
-        9920445275757647007638880256,
-        19840890551515294015277760512,
-        9687934839607077155897344,
-        39681781103030588030555521024,
-        16927322657846243268493312,
-        33854645315692486536986624,
-        67709290631384973073973248,
-        69334313606538212427748605952,
-        9678492412484347079163904,
-        19821552460767942818127675392,
-        39643104921535885636255350784,
-        40594539439652746891525479202816,
-        14510651610237702330384384,
-        29021303220475404660768768,
-        59435628995533628745254436864,
-        118871257991067257490508873728,
-        9685578268051660760678400,
-        19836064292969801237869363200,
-        9918032146484900618934681600,
-        20312129836001076467578227916800,
-    ],
-    4835703278458516698824704: [
-        9066943647109718810296320,
-        18133887294219437620592640,
-        36267774588438875241185280,
-        72535549176877750482370560,
-        4838065615184406081699840,
-        9908358379897663655321272320,
-        20292317962030415166097965711360,
-        41558667186238290260168633776865280,
-        9911982795020344603415937024,
-        19823965590040689206831874048,
-        39647931180081378413663748096,
-        4839835349131027638386688,
-        7255917253850714477690880,
-        14860118535886263250310922240,
-        30433522761495067136636768747520,
-        14511834507701428955381760,
-        4838067920464465341972480,
-        9908363101111225020359639040,
-        20292327631075788841696540753920,
-        10146163815537894420848270376960,
-        8463071033112762928594944,
-        16926142066225525857189888,
-        33852284132451051714379776,
-        69329477903259753911049781248,
-        2484342559308062954021191680,
-        4968685118616125908042383360,
-        9937370237232251816084766720,
-        4852231561148560457072640,
-        4838066191082208431702016,
-        9908359559336362868125728768,
-        20292320377520871153921492516864,
-        40584640755041742307842985033728,
-        8464841920543839045550080,
-        16929683841087678091100160,
-        33859367682175356182200320,
-        17335996253273782365286563840,
-        7254736085769244762963968,
-        14509472171538489525927936,
-        29715399007310826549100412928,
-        60857137166972572772557645676544,
-        7257096692549927282147328,
-        14514193385099854564294656,
-        14862534026342251073837727744,
-        29725068052684502147675455488,
-        7434893790629969424442982400,
-        14869787581259938848885964800,
-        7260638467412079516057600,
-        14521276934824159032115200,
-        4839245629781421236158464,
-        9910775049792350691652534272,
-        19821550099584701383305068544,
-        40594534603949468433008780378112,
-        4842787981104325773492224,
-        9918029785301659184112074752,
-        4959014892650829592056037376,
-        20312125000297798009061529092096,
-        4960222637878823503819440128,
-        9920445275757647007638880256,
-        4843967419803538577948672,
-        19840890551515294015277760512,
-        8463661328923121634246656,
-        16927322657846243268493312,
-        33854645315692486536986624,
-        34667156803269106213874302976,
-        4839246206242173539581952,
-        9910776230383971409063837696,
-        19821552460767942818127675392,
-        20297269719826373445762739601408,
-        7255325805118851165192192,
-        14510651610237702330384384,
-        29717814497766814372627218432,
-        59435628995533628745254436864,
-        4842789134025830380339200,
-        9918032146484900618934681600,
-        4959016073242450309467340800,
-        10156064918000538233789113958400,
-    ],
-    2417851639229258349412352: [
-        4533471823554859405148160,
-        9066943647109718810296320,
-        18133887294219437620592640,
-        36267774588438875241185280,
-        2419032807592203040849920,
-        4954179189948831827660636160,
-        10146158981015207583048982855680,
-        20779333593119145130084316888432640,
-        4955991397510172301707968512,
-        9911982795020344603415937024,
-        19823965590040689206831874048,
-        2419917674565513819193344,
-        3627958626925357238845440,
-        7430059267943131625155461120,
-        15216761380747533568318384373760,
-        7255917253850714477690880,
-        2419033960232232670986240,
-        4954181550555612510179819520,
-        10146163815537894420848270376960,
-        5073081907768947210424135188480,
-        4231535516556381464297472,
-        8463071033112762928594944,
-        16926142066225525857189888,
-        34664738951629876955524890624,
-        1242171279654031477010595840,
-        2484342559308062954021191680,
-        4968685118616125908042383360,
-        2426115780574280228536320,
-        2419033095541104215851008,
-        4954179779668181434062864384,
-        10146160188760435576960746258432,
-        20292320377520871153921492516864,
-        4232420960271919522775040,
-        8464841920543839045550080,
-        16929683841087678091100160,
-        8667998126636891182643281920,
-        3627368042884622381481984,
-        7254736085769244762963968,
-        14857699503655413274550206464,
-        30428568583486286386278822838272,
-        3628548346274963641073664,
-        7257096692549927282147328,
-        7431267013171125536918863872,
-        14862534026342251073837727744,
-        3717446895314984712221491200,
-        7434893790629969424442982400,
-        3630319233706039758028800,
-        7260638467412079516057600,
-        2419622814890710618079232,
-        4955387524896175345826267136,
-        9910775049792350691652534272,
-        20297267301974734216504390189056,
-        2421393990552162886746112,
-        4959014892650829592056037376,
-        2479507446325414796028018688,
-        10156062500148899004530764546048,
-        2480111318939411751909720064,
-        4960222637878823503819440128,
-        2421983709901769288974336,
-        9920445275757647007638880256,
-        4231830664461560817123328,
-        8463661328923121634246656,
-        16927322657846243268493312,
-        17333578401634553106937151488,
-        2419623103121086769790976,
-        4955388115191985704531918848,
-        9910776230383971409063837696,
-        10148634859913186722881369800704,
-        3627662902559425582596096,
-        7255325805118851165192192,
-        14858907248883407186313609216,
-        29717814497766814372627218432,
-        2421394567012915190169600,
-        4959016073242450309467340800,
-        2479508036621225154733670400,
-        5078032459000269116894556979200,
-    ],
-    1208925819614629174706176: [
-        2266735911777429702574080,
-        4533471823554859405148160,
-        9066943647109718810296320,
-        18133887294219437620592640,
-        1209516403796101520424960,
-        2477089594974415913830318080,
-        5073079490507603791524491427840,
-        10389666796559572565042158444216320,
-        2477995698755086150853984256,
-        4955991397510172301707968512,
-        9911982795020344603415937024,
-        1209958837282756909596672,
-        1813979313462678619422720,
-        3715029633971565812577730560,
-        7608380690373766784159192186880,
-        3627958626925357238845440,
-        1209516980116116335493120,
-        2477090775277806255089909760,
-        5073081907768947210424135188480,
-        2536540953884473605212067594240,
-        2115767758278190732148736,
-        4231535516556381464297472,
-        8463071033112762928594944,
-        17332369475814938477762445312,
-        621085639827015738505297920,
-        1242171279654031477010595840,
-        2484342559308062954021191680,
-        1213057890287140114268160,
-        1209516547770552107925504,
-        2477089889834090717031432192,
-        5073080094380217788480373129216,
-        10146160188760435576960746258432,
-        2116210480135959761387520,
-        4232420960271919522775040,
-        8464841920543839045550080,
-        4333999063318445591321640960,
-        1813684021442311190740992,
-        3627368042884622381481984,
-        7428849751827706637275103232,
-        15214284291743143193139411419136,
-        1814274173137481820536832,
-        3628548346274963641073664,
-        3715633506585562768459431936,
-        7431267013171125536918863872,
-        1858723447657492356110745600,
-        3717446895314984712221491200,
-        1815159616853019879014400,
-        3630319233706039758028800,
-        1209811407445355309039616,
-        2477693762448087672913133568,
-        4955387524896175345826267136,
-        10148633650987367108252195094528,
-        1210696995276081443373056,
-        2479507446325414796028018688,
-        1239753723162707398014009344,
-        5078031250074449502265382273024,
-        1240055659469705875954860032,
-        2480111318939411751909720064,
-        1210991854950884644487168,
-        4960222637878823503819440128,
-        2115915332230780408561664,
-        4231830664461560817123328,
-        8463661328923121634246656,
-        8666789200817276553468575744,
-        1209811551560543384895488,
-        2477694057595992852265959424,
-        4955388115191985704531918848,
-        5074317429956593361440684900352,
-        1813831451279712791298048,
-        3627662902559425582596096,
-        7429453624441703593156804608,
-        14858907248883407186313609216,
-        1210697283506457595084800,
-        2479508036621225154733670400,
-        1239754018310612577366835200,
-        2539016229500134558447278489600,
-    ],
-    604462909807314587353088: [
-        155800315002835334890258432,
-        2266735911777429702574080,
-        4533471823554859405148160,
-        9066943647109718810296320,
-        604758201898050760212480,
-        1238544797487207956915159040,
-        2536539745253801895762245713920,
-        5194833398279786282521079222108160,
-        1238997849377543075426992128,
-        2477995698755086150853984256,
-        4955991397510172301707968512,
-        604979418641378454798336,
-        906989656731339309711360,
-        1857514816985782906288865280,
-        3804190345186883392079596093440,
-        1813979313462678619422720,
-        604758490058058167746560,
-        1238545387638903127544954880,
-        2536540953884473605212067594240,
-        1268270476942236802606033797120,
-        1057883879139095366074368,
-        2115767758278190732148736,
-        4231535516556381464297472,
-        8666184737907469238881222656,
-        310542819913507869252648960,
-        621085639827015738505297920,
-        1242171279654031477010595840,
-        606528945143570057134080,
-        604758273885276053962752,
-        1238544944917045358515716096,
-        2536540047190108894240186564608,
-        5073080094380217788480373129216,
-        1058105240067979880693760,
-        2116210480135959761387520,
-        4232420960271919522775040,
-        2166999531659222795660820480,
-        906842010721155595370496,
-        1813684021442311190740992,
-        3714424875913853318637551616,
-        7607142145871571596569705709568,
-        907137086568740910268416,
-        1814274173137481820536832,
-        1857816753292781384229715968,
-        3715633506585562768459431936,
-        929361723828746178055372800,
-        1858723447657492356110745600,
-        907579808426509939507200,
-        1815159616853019879014400,
-        604905703722677654519808,
-        1238846881224043836456566784,
-        2477693762448087672913133568,
-        5074316825493683554126097547264,
-        605348497638040721686528,
-        1239753723162707398014009344,
-        619876861581353699007004672,
-        2539015625037224751132691136512,
-        620027829734852937977430016,
-        1240055659469705875954860032,
-        605495927475442322243584,
-        2480111318939411751909720064,
-        1057957666115390204280832,
-        2115915332230780408561664,
-        4231830664461560817123328,
-        4333394600408638276734287872,
-        604905775780271692447744,
-        1238847028797996426132979712,
-        2477694057595992852265959424,
-        2537158714978296680720342450176,
-        906915725639856395649024,
-        1813831451279712791298048,
-        3714726812220851796578402304,
-        7429453624441703593156804608,
-        605348641753228797542400,
-        1239754018310612577366835200,
-        619877009155306288683417600,
-        1269508114750067279223639244800,
-    ],
-    302231454903657293676544: [
-        232567104548364287484100608,
-        155800315002835334890258432,
-        2266735911777429702574080,
-        4533471823554859405148160,
-        302379100949025380106240,
-        619272398743603978457579520,
-        1268269872626900947881122856960,
-        2597416699139893141260539611054080,
-        774165871735718157752467456,
-        1238997849377543075426992128,
-        2477995698755086150853984256,
-        378010679558456131715072,
-        453494828365669654855680,
-        928757408492891453144432640,
-        1902095172593441696039798046720,
-        906989656731339309711360,
-        302379245029029083873280,
-        619272693819451563772477440,
-        1268270476942236802606033797120,
-        634135238471118401303016898560,
-        155271409956753934626324480,
-        1057883879139095366074368,
-        2115767758278190732148736,
-        4333092368953734619440611328,
-        317067845909150378394478706688,
-        310542819913507869252648960,
-        621085639827015738505297920,
-        303264472571785028567040,
-        302379136942638026981376,
-        619272472458522679257858048,
-        1268270023595054447120093282304,
-        2536540047190108894240186564608,
-        155195999666980609979318272,
-        1058105240067979880693760,
-        2116210480135959761387520,
-        317841407317976289237643821056,
-        453421005360577797685248,
-        906842010721155595370496,
-        1857212437956926659318775808,
-        3803571072935785798284852854784,
-        453568543284370455134208,
-        907137086568740910268416,
-        928908376646390692114857984,
-        1857816753292781384229715968,
-        317222588414061050928841097216,
-        929361723828746178055372800,
-        453789904213254969753600,
-        907579808426509939507200,
-        302452851861338827259904,
-        619423440612021918228283392,
-        1238846881224043836456566784,
-        2537158412746841777063048773632,
-        302674248819020360843264,
-        619876861581353699007004672,
-        309938430790676849503502336,
-        1269507812518612375566345568256,
-        464680861914373089027686400,
-        620027829734852937977430016,
-        302747963737721161121792,
-        1240055659469705875954860032,
-        155195925880004315141111808,
-        1057957666115390204280832,
-        2115915332230780408561664,
-        2166697300204319138367143936,
-        302452887890135846223872,
-        619423514398998213066489856,
-        1238847028797996426132979712,
-        1268579357489148340360171225088,
-        528978833057695102140416,
-        906915725639856395649024,
-        1857363406110425898289201152,
-        3714726812220851796578402304,
-        302674320876614398771200,
-        619877009155306288683417600,
-        309938504577653144341708800,
-        634754057375033639611819622400,
-    ],
-    151115727451828646838272: [
-        270950499321128763781021696,
-        232567104548364287484100608,
-        155800315002835334890258432,
-        2266735911777429702574080,
-        151189550474512690053120,
-        309636199371801989228789760,
-        634134936313450473940561428480,
-        1298708349569946570630269805527040,
-        541749882914805698915205120,
-        774165871735718157752467456,
-        1238997849377543075426992128,
-        264526310016994970173440,
-        154893694461129454866399232,
-        317222286256393123566385627136,
-        649671242253093117063957764374528,
-        453494828365669654855680,
-        151189622514514541936640,
-        309636346909725781886238720,
-        634135238471118401303016898560,
-        649354174860531149041049226182656,
-        232302652025323587352133632,
-        155271409956753934626324480,
-        1057883879139095366074368,
-        2166546184476867309720305664,
-        158688589901622135817278324736,
-        317067845909150378394478706688,
-        310542819913507869252648960,
-        151632236285892514283520,
-        151226443945067923111936,
-        309711757199499106533244928,
-        634289678744574170180085612544,
-        1268270023595054447120093282304,
-        232264946880436925028630528,
-        155195999666980609979318272,
-        1058105240067979880693760,
-        475678611211134822458635321344,
-        154969215395338424751751168,
-        453421005360577797685248,
-        928606218978463329659387904,
-        1901785536467892899142426427392,
-        154969252288826572170854400,
-        453568543284370455134208,
-        317377028687516819805909811200,
-        928908376646390692114857984,
-        475523868706224149924272930816,
-        317222588414061050928841097216,
-        154893841999053247523848192,
-        453789904213254969753600,
-        226784271642185227567104,
-        464454188323195346057428992,
-        619423440612021918228283392,
-        1268579206373420888531524386816,
-        151337124409510180421632,
-        309938430790676849503502336,
-        317067619235559200651508449280,
-        634753906259306187783172784128,
-        317144914930150811004366225408,
-        464680861914373089027686400,
-        226894952106627484876800,
-        620027829734852937977430016,
-        232340430957186544513843200,
-        155195925880004315141111808,
-        1057957666115390204280832,
-        317841256202248837408996982784,
-        226747414182834827427840,
-        464378704246445726572216320,
-        619423514398998213066489856,
-        951047586296720848019899023360,
-        155006957433713234494357504,
-        528978833057695102140416,
-        1083348650102159569183571968,
-        1857363406110425898289201152,
-        151337160438307199385600,
-        309938504577653144341708800,
-        317067543751482451032023236608,
-        649354329603036059713583588573184,
-    ],
-    75557863725914323419136: [
-        141670994486089356410880,
-        132300048496644904189952,
-        113558156517755999748096,
-        76074372559978190864384,
-        75594775237256345026560,
-        154818099685900994614394880,
-        317067468156725236970280714240,
-        649354174784973285315134902763520,
-        154874731172192884428374016,
-        264526310016994970173440,
-        378010679558456131715072,
-        75622427330172306849792,
-        113373707091417413713920,
-        232189352123222863286108160,
-        475523793148360424009949511680,
-        75631686748598366633984,
-        75594775246052438048768,
-        154818099703915393123876864,
-        317067468193618725117699817472,
-        158533809617779600325754224640,
-        132235484892386920759296,
-        113429029309240032886784,
-        75816118142946257141760,
-        155271409956753934626324480,
-        38817852489188483656581120,
-        77484663037901433504530432,
-        154818284135327333200429056,
-        75594865300452799414272,
-        75594784235659506745344,
-        154818118114630669814464512,
-        317067505898763611780023320576,
-        309711757199499106533244928,
-        132263155008497485086720,
-        113410618593963342299136,
-        75779296712392875966464,
-        270874941457402849457602560,
-        113355251340144449421312,
-        75668562204755090210816,
-        154969215395338424751751168,
-        317376953129653093891586392064,
-        113392135821092613783552,
-        75668580219153599692800,
-        232227094161597673028714496,
-        154969252288826572170854400,
-        116170215478593272256921600,
-        232189389016711010705211392,
-        113373725105815923195904,
-        75631758788600218517504,
-        75613212965334706814976,
-        154855860153005479557070848,
-        226784271642185227567104,
-        464454188323195346057428992,
-        75594811257257270968320,
-        154818173454862890943119360,
-        77484607697669212375875584,
-        317067619235559200651508449280,
-        77503478716856617247178752,
-        154855915493237700685725696,
-        75613239986932471037952,
-        226894952106627484876800,
-        132244708264423775535104,
-        113447476053313742438400,
-        75779260683595857002496,
-        232340430957186544513843200,
-        75613221972533961555968,
-        154855878599749553266622464,
-        226747414182834827427840,
-        317144839372287085090042806272,
-        113364465704982049456128,
-        75686990934430290280448,
-        155006957433713234494357504,
-        528978833057695102140416,
-        75594793260450947530752,
-        154818136597403540542980096,
-        77484626144413286085427200,
-        158688514343758409902954905600,
-    ],
-    37778931862957161709568: [
-        70835497243044678205440,
-        141670994486089356410880,
-        132300048496644904189952,
-        113558156517755999748096,
-        37797387618628172513280,
-        77409049842950497307197440,
-        158533734078362618485140357120,
-        324677087392486642657567451381760,
-        77437365586096442214187008,
-        154874731172192884428374016,
-        264526310016994970173440,
-        37811213665086153424896,
-        56686853545708706856960,
-        116094676061611431643054080,
-        237761896574180212004974755840,
-        113373707091417413713920,
-        37797405628628635484160,
-        77409086727431445471559680,
-        158533809617779600325754224640,
-        79266904808889800162877112320,
-        66117742446193460379648,
-        132235484892386920759296,
-        113429029309240032886784,
-        232302652025323587352133632,
-        19408926244594241828290560,
-        38817852489188483656581120,
-        77484663037901433504530432,
-        37834308123975309328384,
-        37797392117829753372672,
-        77409059057315334907232256,
-        158533752949381805890011660288,
-        317067505898763611780023320576,
-        66131577504248742543360,
-        132263155008497485086720,
-        113410618593963342299136,
-        135437470728701424728801280,
-        56677625670072224710656,
-        113355251340144449421312,
-        232151554744615832414846976,
-        475446384116973224785606606848,
-        56696067910546306891776,
-        113392135821092613783552,
-        116113547080798836514357248,
-        232227094161597673028714496,
-        58085107739296636128460800,
-        116170215478593272256921600,
-        56723738026656871219200,
-        113373725105815923195904,
-        37806606482667353407488,
-        77427930076502739778535424,
-        154855860153005479557070848,
-        317144801593355222132881096704,
-        37834281102377545105408,
-        77484607697669212375875584,
-        38742303848834606187937792,
-        158688476564826546945793196032,
-        38751739358428308623589376,
-        77503478716856617247178752,
-        37843495467215145140224,
-        154855915493237700685725696,
-        66122354132211887767552,
-        132244708264423775535104,
-        113447476053313742438400,
-        270837162525539892295892992,
-        37806610986266980777984,
-        77427939299874776633311232,
-        154855878599749553266622464,
-        158572419686143542545021403136,
-        56682232852491024728064,
-        113364465704982049456128,
-        232170425763803237286150144,
-        155006957433713234494357504,
-        37834290109576799846400,
-        77484626144413286085427200,
-        38742313072206643042713600,
-        79344257171879204951477452800,
-    ],
-    18889465931478580854784: [
-        35417748621522339102720,
-        70835497243044678205440,
-        141670994486089356410880,
-        132300048496644904189952,
-        18898693809314086256640,
-        38704524921475248653598720,
-        79266867039181309242570178560,
-        162338543696243321328783725690880,
-        38718682793048221107093504,
-        77437365586096442214187008,
-        154874731172192884428374016,
-        18905606832543076712448,
-        28343426772854353428480,
-        58047338030805715821527040,
-        118880948287090106002487377920,
-        56686853545708706856960,
-        18898702814314317742080,
-        38704543363715722735779840,
-        79266904808889800162877112320,
-        39633452404444900081438556160,
-        33058871223096730189824,
-        66117742446193460379648,
-        132235484892386920759296,
-        270818273059608413715038208,
-        9704463122297120914145280,
-        19408926244594241828290560,
-        38817852489188483656581120,
-        18954029535736564285440,
-        18898696058914876686336,
-        38704529528657667453616128,
-        79266876474690902945005830144,
-        158533752949381805890011660288,
-        33065788752124371271680,
-        66131577504248742543360,
-        132263155008497485086720,
-        67718735364350712364400640,
-        28338812835036112355328,
-        56677625670072224710656,
-        116075777372307916207423488,
-        237723192058486612392803303424,
-        28348033955273153445888,
-        56696067910546306891776,
-        58056773540399418257178624,
-        116113547080798836514357248,
-        29042553869648318064230400,
-        58085107739296636128460800,
-        28361869013328435609600,
-        56723738026656871219200,
-        18903303241333676703744,
-        38713965038251369889267712,
-        77427930076502739778535424,
-        158572400796677611066440548352,
-        18917140551188772552704,
-        38742303848834606187937792,
-        19371151924417303093968896,
-        79344238282413273472896598016,
-        19375869679214154311794688,
-        38751739358428308623589376,
-        18921747733607572570112,
-        77503478716856617247178752,
-        33061177066105943883776,
-        66122354132211887767552,
-        132244708264423775535104,
-        135418581262769946147946496,
-        18903305493133490388992,
-        38713969649937388316655616,
-        77427939299874776633311232,
-        79286209843071771272510701568,
-        28341116426245512364032,
-        56682232852491024728064,
-        116085212881901618643075072,
-        232170425763803237286150144,
-        18917145054788399923200,
-        38742313072206643042713600,
-        19371156536103321521356800,
-        39672128585939602475738726400,
-    ],
-    9444732965739290427392: [
-        17708874310761169551360,
-        35417748621522339102720,
-        70835497243044678205440,
-        141670994486089356410880,
-        9449346904657043128320,
-        19352262460737624326799360,
-        39633433519590654621285089280,
-        81169271848121660664391862845440,
-        19359341396524110553546752,
-        38718682793048221107093504,
-        77437365586096442214187008,
-        9452803416271538356224,
-        14171713386427176714240,
-        29023669015402857910763520,
-        59440474143545053001243688960,
-        28343426772854353428480,
-        9449351407157158871040,
-        19352271681857861367889920,
-        39633452404444900081438556160,
-        19816726202222450040719278080,
-        16529435611548365094912,
-        33058871223096730189824,
-        66117742446193460379648,
-        135409136529804206857519104,
-        4852231561148560457072640,
-        9704463122297120914145280,
-        19408926244594241828290560,
-        9477014767868282142720,
-        9449348029457438343168,
-        19352264764328833726808064,
-        39633438237345451472502915072,
-        79266876474690902945005830144,
-        16532894376062185635840,
-        33065788752124371271680,
-        66131577504248742543360,
-        33859367682175356182200320,
-        14169406417518056177664,
-        28338812835036112355328,
-        58037888686153958103711744,
-        118861596029243306196401651712,
-        14174016977636576722944,
-        28348033955273153445888,
-        29028386770199709128589312,
-        58056773540399418257178624,
-        14521276934824159032115200,
-        29042553869648318064230400,
-        14180934506664217804800,
-        28361869013328435609600,
-        9451651620666838351872,
-        19356982519125684944633856,
-        38713965038251369889267712,
-        79286200398338805533220274176,
-        9458570275594386276352,
-        19371151924417303093968896,
-        9685575962208651546984448,
-        39672119141206636736448299008,
-        9687934839607077155897344,
-        19375869679214154311794688,
-        9460873866803786285056,
-        38751739358428308623589376,
-        16530588533052971941888,
-        33061177066105943883776,
-        66122354132211887767552,
-        67709290631384973073973248,
-        9451652746566745194496,
-        19356984824968694158327808,
-        38713969649937388316655616,
-        39643104921535885636255350784,
-        14170558213122756182016,
-        28341116426245512364032,
-        58042606440950809321537536,
-        116085212881901618643075072,
-        9458572527394199961600,
-        19371156536103321521356800,
-        9685578268051660760678400,
-        19836064292969801237869363200,
-    ],
-    4722366482869645213696: [
-        8854437155380584775680,
-        17708874310761169551360,
-        35417748621522339102720,
-        70835497243044678205440,
-        4724673452328521564160,
-        9676131230368812163399680,
-        19816716759795327310642544640,
-        40584635924060830332195931422720,
-        9679670698262055276773376,
-        19359341396524110553546752,
-        38718682793048221107093504,
-        4726401708135769178112,
-        7085856693213588357120,
-        14511834507701428955381760,
-        29720237071772526500621844480,
-        14171713386427176714240,
-        4724675703578579435520,
-        9676135840928930683944960,
-        19816726202222450040719278080,
-        9908363101111225020359639040,
-        8264717805774182547456,
-        16529435611548365094912,
-        33058871223096730189824,
-        67704568264902103428759552,
-        2426115780574280228536320,
-        4852231561148560457072640,
-        9704463122297120914145280,
-        4738507383934141071360,
-        4724674014728719171584,
-        9676132382164416863404032,
-        19816719118672725736251457536,
-        39633438237345451472502915072,
-        8266447188031092817920,
-        16532894376062185635840,
-        33065788752124371271680,
-        16929683841087678091100160,
-        7084703208759028088832,
-        14169406417518056177664,
-        29018944343076979051855872,
-        59430798014621653098200825856,
-        7087008488818288361472,
-        14174016977636576722944,
-        14514193385099854564294656,
-        29028386770199709128589312,
-        7260638467412079516057600,
-        14521276934824159032115200,
-        7090467253332108902400,
-        14180934506664217804800,
-        4725825810333419175936,
-        9678491259562842472316928,
-        19356982519125684944633856,
-        39643100199169402766610137088,
-        4729285137797193138176,
-        9685575962208651546984448,
-        4842787981104325773492224,
-        19836059570603318368224149504,
-        4843967419803538577948672,
-        9687934839607077155897344,
-        4730436933401893142528,
-        19375869679214154311794688,
-        8265294266526485970944,
-        16530588533052971941888,
-        33061177066105943883776,
-        33854645315692486536986624,
-        4725826373283372597248,
-        9678492412484347079163904,
-        19356984824968694158327808,
-        19821552460767942818127675392,
-        7085279106561378091008,
-        14170558213122756182016,
-        29021303220475404660768768,
-        58042606440950809321537536,
-        4729286263697099980800,
-        9685578268051660760678400,
-        4842789134025830380339200,
-        9918032146484900618934681600,
-    ],
-    2361183241434822606848: [
-        4427218577690292387840,
-        8854437155380584775680,
-        17708874310761169551360,
-        35417748621522339102720,
-        2362336726164260782080,
-        4838065615184406081699840,
-        9908358379897663655321272320,
-        20292317962030415166097965711360,
-        4839835349131027638386688,
-        9679670698262055276773376,
-        19359341396524110553546752,
-        2363200854067884589056,
-        3542928346606794178560,
-        7255917253850714477690880,
-        14860118535886263250310922240,
-        7085856693213588357120,
-        2362337851789289717760,
-        4838067920464465341972480,
-        9908363101111225020359639040,
-        4954181550555612510179819520,
-        4132358902887091273728,
-        8264717805774182547456,
-        16529435611548365094912,
-        33852284132451051714379776,
-        1213057890287140114268160,
-        2426115780574280228536320,
-        4852231561148560457072640,
-        2369253691967070535680,
-        2362337007364359585792,
-        4838066191082208431702016,
-        9908359559336362868125728768,
-        19816719118672725736251457536,
-        4133223594015546408960,
-        8266447188031092817920,
-        16532894376062185635840,
-        8464841920543839045550080,
-        3542351604379514044416,
-        7084703208759028088832,
-        14509472171538489525927936,
-        29715399007310826549100412928,
-        3543504244409144180736,
-        7087008488818288361472,
-        7257096692549927282147328,
-        14514193385099854564294656,
-        3630319233706039758028800,
-        7260638467412079516057600,
-        3545233626666054451200,
-        7090467253332108902400,
-        2362912905166709587968,
-        4839245629781421236158464,
-        9678491259562842472316928,
-        19821550099584701383305068544,
-        2364642568898596569088,
-        4842787981104325773492224,
-        2421393990552162886746112,
-        9918029785301659184112074752,
-        2421983709901769288974336,
-        4843967419803538577948672,
-        2365218466700946571264,
-        9687934839607077155897344,
-        4132647133263242985472,
-        8265294266526485970944,
-        16530588533052971941888,
-        16927322657846243268493312,
-        2362913186641686298624,
-        4839246206242173539581952,
-        9678492412484347079163904,
-        9910776230383971409063837696,
-        3542639553280689045504,
-        7085279106561378091008,
-        14510651610237702330384384,
-        29021303220475404660768768,
-        2364643131848549990400,
-        4842789134025830380339200,
-        2421394567012915190169600,
-        4959016073242450309467340800,
-    ],
-    1180591620717411303424: [
-        2213609288845146193920,
-        4427218577690292387840,
-        8854437155380584775680,
-        17708874310761169551360,
-        1181168363082130391040,
-        2419032807592203040849920,
-        4954179189948831827660636160,
-        10146158981015207583048982855680,
-        2419917674565513819193344,
-        4839835349131027638386688,
-        9679670698262055276773376,
-        1181600427033942294528,
-        1771464173303397089280,
-        3627958626925357238845440,
-        7430059267943131625155461120,
-        3542928346606794178560,
-        1181168925894644858880,
-        2419033960232232670986240,
-        4954181550555612510179819520,
-        2477090775277806255089909760,
-        2066179451443545636864,
-        4132358902887091273728,
-        8264717805774182547456,
-        16926142066225525857189888,
-        606528945143570057134080,
-        1213057890287140114268160,
-        2426115780574280228536320,
-        1184626845983535267840,
-        1181168503682179792896,
-        2419033095541104215851008,
-        4954179779668181434062864384,
-        9908359559336362868125728768,
-        2066611797007773204480,
-        4133223594015546408960,
-        8266447188031092817920,
-        4232420960271919522775040,
-        1771175802189757022208,
-        3542351604379514044416,
-        7254736085769244762963968,
-        14857699503655413274550206464,
-        1771752122204572090368,
-        3543504244409144180736,
-        3628548346274963641073664,
-        7257096692549927282147328,
-        1815159616853019879014400,
-        3630319233706039758028800,
-        1772616813333027225600,
-        3545233626666054451200,
-        1181456452583354793984,
-        2419622814890710618079232,
-        4839245629781421236158464,
-        9910775049792350691652534272,
-        1182321284449298284544,
-        2421393990552162886746112,
-        1210696995276081443373056,
-        4959014892650829592056037376,
-        1210991854950884644487168,
-        2421983709901769288974336,
-        1182609233350473285632,
-        4843967419803538577948672,
-        2066323566631621492736,
-        4132647133263242985472,
-        8265294266526485970944,
-        8463661328923121634246656,
-        1181456593320843149312,
-        2419623103121086769790976,
-        4839246206242173539581952,
-        4955388115191985704531918848,
-        1771319776640344522752,
-        3542639553280689045504,
-        7255325805118851165192192,
-        14510651610237702330384384,
-        1182321565924274995200,
-        2421394567012915190169600,
-        1210697283506457595084800,
-        2479508036621225154733670400,
-    ],
-    590295810358705651712: [
-        1106804644422573096960,
-        2213609288845146193920,
-        4427218577690292387840,
-        8854437155380584775680,
-        590584181541065195520,
-        1209516403796101520424960,
-        2477089594974415913830318080,
-        5073079490507603791524491427840,
-        1209958837282756909596672,
-        2419917674565513819193344,
-        4839835349131027638386688,
-        590800213516971147264,
-        885732086651698544640,
-        1813979313462678619422720,
-        3715029633971565812577730560,
-        1771464173303397089280,
-        590584462947322429440,
-        1209516980116116335493120,
-        2477090775277806255089909760,
-        1238545387638903127544954880,
-        1033089725721772818432,
-        2066179451443545636864,
-        4132358902887091273728,
-        8463071033112762928594944,
-        303264472571785028567040,
-        606528945143570057134080,
-        1213057890287140114268160,
-        592313422991767633920,
-        590584251841089896448,
-        1209516547770552107925504,
-        2477089889834090717031432192,
-        4954179779668181434062864384,
-        1033305898503886602240,
-        2066611797007773204480,
-        4133223594015546408960,
-        2116210480135959761387520,
-        885587901094878511104,
-        1771175802189757022208,
-        3627368042884622381481984,
-        7428849751827706637275103232,
-        885876061102286045184,
-        1771752122204572090368,
-        1814274173137481820536832,
-        3628548346274963641073664,
-        907579808426509939507200,
-        1815159616853019879014400,
-        886308406666513612800,
-        1772616813333027225600,
-        590728226291677396992,
-        1209811407445355309039616,
-        2419622814890710618079232,
-        4955387524896175345826267136,
-        591160642224649142272,
-        1210696995276081443373056,
-        605348497638040721686528,
-        2479507446325414796028018688,
-        605495927475442322243584,
-        1210991854950884644487168,
-        591304616675236642816,
-        2421983709901769288974336,
-        1033161783315810746368,
-        2066323566631621492736,
-        4132647133263242985472,
-        4231830664461560817123328,
-        590728296660421574656,
-        1209811551560543384895488,
-        2419623103121086769790976,
-        2477694057595992852265959424,
-        885659888320172261376,
-        1771319776640344522752,
-        3627662902559425582596096,
-        7255325805118851165192192,
-        591160782962137497600,
-        1210697283506457595084800,
-        605348641753228797542400,
-        1239754018310612577366835200,
-    ],
-    295147905179352825856: [
-        76074372559978190864384,
-        1106804644422573096960,
-        2213609288845146193920,
-        4427218577690292387840,
-        295292090770532597760,
-        604758201898050760212480,
-        1238544797487207956915159040,
-        2536539745253801895762245713920,
-        604979418641378454798336,
-        1209958837282756909596672,
-        2419917674565513819193344,
-        295400106758485573632,
-        442866043325849272320,
-        906989656731339309711360,
-        1857514816985782906288865280,
-        885732086651698544640,
-        295292231473661214720,
-        604758490058058167746560,
-        1238545387638903127544954880,
-        619272693819451563772477440,
-        516544862860886409216,
-        1033089725721772818432,
-        2066179451443545636864,
-        4231535516556381464297472,
-        151632236285892514283520,
-        303264472571785028567040,
-        606528945143570057134080,
-        296156711495883816960,
-        295292125920544948224,
-        604758273885276053962752,
-        1238544944917045358515716096,
-        2477089889834090717031432192,
-        516652949251943301120,
-        1033305898503886602240,
-        2066611797007773204480,
-        1058105240067979880693760,
-        442793950547439255552,
-        885587901094878511104,
-        1813684021442311190740992,
-        3714424875913853318637551616,
-        442938030551143022592,
-        885876061102286045184,
-        907137086568740910268416,
-        1814274173137481820536832,
-        453789904213254969753600,
-        907579808426509939507200,
-        443154203333256806400,
-        886308406666513612800,
-        295364113145838698496,
-        604905703722677654519808,
-        1209811407445355309039616,
-        2477693762448087672913133568,
-        295580321112324571136,
-        605348497638040721686528,
-        302674248819020360843264,
-        1239753723162707398014009344,
-        302747963737721161121792,
-        605495927475442322243584,
-        295652308337618321408,
-        1210991854950884644487168,
-        516580891657905373184,
-        1033161783315810746368,
-        2066323566631621492736,
-        2115915332230780408561664,
-        295364148330210787328,
-        604905775780271692447744,
-        1209811551560543384895488,
-        1238847028797996426132979712,
-        442829944160086130688,
-        885659888320172261376,
-        1813831451279712791298048,
-        3627662902559425582596096,
-        295580391481068748800,
-        605348641753228797542400,
-        302674320876614398771200,
-        619877009155306288683417600,
-    ],
-    147573952589676412928: [
-        113558156517755999748096,
-        76074372559978190864384,
-        1106804644422573096960,
-        2213609288845146193920,
-        147646045385266298880,
-        302379100949025380106240,
-        619272398743603978457579520,
-        1268269872626900947881122856960,
-        378010679558456131715072,
-        604979418641378454798336,
-        1209958837282756909596672,
-        184575527128152408064,
-        221433021662924636160,
-        453494828365669654855680,
-        928757408492891453144432640,
-        442866043325849272320,
-        147646115736830607360,
-        302379245029029083873280,
-        619272693819451563772477440,
-        309636346909725781886238720,
-        75816118142946257141760,
-        516544862860886409216,
-        1033089725721772818432,
-        2115767758278190732148736,
-        154818284135327333200429056,
-        151632236285892514283520,
-        303264472571785028567040,
-        148078355747941908480,
-        147646062960272474112,
-        302379136942638026981376,
-        619272472458522679257858048,
-        1238544944917045358515716096,
-        75779296712392875966464,
-        516652949251943301120,
-        1033305898503886602240,
-        155195999666980609979318272,
-        221396975273719627776,
-        442793950547439255552,
-        906842010721155595370496,
-        1857212437956926659318775808,
-        221469015275571511296,
-        442938030551143022592,
-        453568543284370455134208,
-        907137086568740910268416,
-        154893841999053247523848192,
-        453789904213254969753600,
-        221577101666628403200,
-        443154203333256806400,
-        147682056572919349248,
-        302452851861338827259904,
-        604905703722677654519808,
-        1238846881224043836456566784,
-        147790160556162285568,
-        302674248819020360843264,
-        151337124409510180421632,
-        619876861581353699007004672,
-        226894952106627484876800,
-        302747963737721161121792,
-        147826154168809160704,
-        605495927475442322243584,
-        75779260683595857002496,
-        516580891657905373184,
-        1033161783315810746368,
-        1057957666115390204280832,
-        147682074165105393664,
-        302452887890135846223872,
-        604905775780271692447744,
-        619423514398998213066489856,
-        258290445828952686592,
-        442829944160086130688,
-        906915725639856395649024,
-        1813831451279712791298048,
-        147790195740534374400,
-        302674320876614398771200,
-        151337160438307199385600,
-        309938504577653144341708800,
-    ],
-    73786976294838206464: [
-        132300048496644904189952,
-        113558156517755999748096,
-        76074372559978190864384,
-        1106804644422573096960,
-        73823022692633149440,
-        151189550474512690053120,
-        309636199371801989228789760,
-        634134936313450473940561428480,
-        264526310016994970173440,
-        378010679558456131715072,
-        604979418641378454798336,
-        129163237312985825280,
-        75631686748598366633984,
-        154893694461129454866399232,
-        317222286256393123566385627136,
-        221433021662924636160,
-        73823057868415303680,
-        151189622514514541936640,
-        309636346909725781886238720,
-        317067468193618725117699817472,
-        113429029309240032886784,
-        75816118142946257141760,
-        516544862860886409216,
-        1057883879139095366074368,
-        77484663037901433504530432,
-        154818284135327333200429056,
-        151632236285892514283520,
-        74039177873970954240,
-        73841037082552696832,
-        151226443945067923111936,
-        309711757199499106533244928,
-        619272472458522679257858048,
-        113410618593963342299136,
-        75779296712392875966464,
-        516652949251943301120,
-        232264946880436925028630528,
-        75668562204755090210816,
-        221396975273719627776,
-        453421005360577797685248,
-        928606218978463329659387904,
-        75668580219153599692800,
-        221469015275571511296,
-        154969252288826572170854400,
-        453568543284370455134208,
-        232189389016711010705211392,
-        154893841999053247523848192,
-        75631758788600218517504,
-        221577101666628403200,
-        110734507637785755648,
-        226784271642185227567104,
-        302452851861338827259904,
-        619423440612021918228283392,
-        73895080278081142784,
-        151337124409510180421632,
-        154818173454862890943119360,
-        309938430790676849503502336,
-        154855915493237700685725696,
-        226894952106627484876800,
-        110788550833314201600,
-        302747963737721161121792,
-        113447476053313742438400,
-        75779260683595857002496,
-        516580891657905373184,
-        155195925880004315141111808,
-        110716510831462318080,
-        226747414182834827427840,
-        302452887890135846223872,
-        464378704246445726572216320,
-        75686990934430290280448,
-        258290445828952686592,
-        528978833057695102140416,
-        906915725639856395649024,
-        73895097870267187200,
-        151337160438307199385600,
-        154818136597403540542980096,
-        317067543751482451032023236608,
-    ],
-    36893488147419103232: [
-        69175290276410818560,
-        64599633055002394624,
-        55448318612185546752,
-        37145689726551851008,
-        36911511346316574720,
-        75594775237256345026560,
-        154818099685900994614394880,
-        317067468156725236970280714240,
-        75622427330172306849792,
-        129163237312985825280,
-        184575527128152408064,
-        36925013344810696704,
-        55358255415731159040,
-        113373707091417413713920,
-        232189352123222863286108160,
-        36929534545214046208,
-        36911511350611542016,
-        75594775246052438048768,
-        154818099703915393123876864,
-        77409086727431445471559680,
-        64568107857610801152,
-        55385268217402359808,
-        37019588936985477120,
-        75816118142946257141760,
-        18954029535736564285440,
-        37834308123975309328384,
-        75594865300452799414272,
-        36911555322486718464,
-        36911515740068118528,
-        75594784235659506745344,
-        154818118114630669814464512,
-        151226443945067923111936,
-        64581618656492912640,
-        55376278610333663232,
-        37001609722848083968,
-        132263155008497485086720,
-        55349243818429906944,
-        36947540139040571392,
-        75668562204755090210816,
-        154969215395338424751751168,
-        55367253818892877824,
-        36947548935133593600,
-        113392135821092613783552,
-        75668580219153599692800,
-        56723738026656871219200,
-        113373725105815923195904,
-        55358264211824181248,
-        36929569720996200448,
-        36920514143229837312,
-        75613212965334706814976,
-        110734507637785755648,
-        226784271642185227567104,
-        36911528934207651840,
-        75594811257257270968320,
-        37834281102377545105408,
-        154818173454862890943119360,
-        37843495467215145140224,
-        75613239986932471037952,
-        36920527337369370624,
-        110788550833314201600,
-        64572611457238171648,
-        55394275416657100800,
-        37001592130662039552,
-        113447476053313742438400,
-        36920518541276348416,
-        75613221972533961555968,
-        110716510831462318080,
-        154855878599749553266622464,
-        55353743020010766336,
-        36956538542202290176,
-        75686990934430290280448,
-        258290445828952686592,
-        36911520146704564224,
-        75594793260450947530752,
-        37834290109576799846400,
-        77484626144413286085427200,
-    ],
-    18446744073709551616: [
-        34587645138205409280,
-        69175290276410818560,
-        64599633055002394624,
-        55448318612185546752,
-        18455755673158287360,
-        37797387618628172513280,
-        77409049842950497307197440,
-        158533734078362618485140357120,
-        37811213665086153424896,
-        75622427330172306849792,
-        129163237312985825280,
-        18462506672405348352,
-        27679127707865579520,
-        56686853545708706856960,
-        116094676061611431643054080,
-        55358255415731159040,
-        18455764467103825920,
-        37797405628628635484160,
-        77409086727431445471559680,
-        38704543363715722735779840,
-        32284053928805400576,
-        64568107857610801152,
-        55385268217402359808,
-        113429029309240032886784,
-        9477014767868282142720,
-        18954029535736564285440,
-        37834308123975309328384,
-        18473783263659819008,
-        18455757870034059264,
-        37797392117829753372672,
-        77409059057315334907232256,
-        154818118114630669814464512,
-        32290809328246456320,
-        64581618656492912640,
-        55376278610333663232,
-        66131577504248742543360,
-        27674621909214953472,
-        55349243818429906944,
-        113355251340144449421312,
-        232151554744615832414846976,
-        27683626909446438912,
-        55367253818892877824,
-        56696067910546306891776,
-        113392135821092613783552,
-        28361869013328435609600,
-        56723738026656871219200,
-        27697137708328550400,
-        55358264211824181248,
-        18460257071614918656,
-        37806606482667353407488,
-        75613212965334706814976,
-        154855860153005479557070848,
-        18473770069520285696,
-        37834281102377545105408,
-        18917140551188772552704,
-        77484607697669212375875584,
-        18921747733607572570112,
-        37843495467215145140224,
-        18478269271101145088,
-        75613239986932471037952,
-        32286305728619085824,
-        64572611457238171648,
-        55394275416657100800,
-        132244708264423775535104,
-        18460259270638174208,
-        37806610986266980777984,
-        75613221972533961555968,
-        77427939299874776633311232,
-        27676871510005383168,
-        55353743020010766336,
-        113364465704982049456128,
-        75686990934430290280448,
-        18473774467566796800,
-        37834290109576799846400,
-        18917145054788399923200,
-        38742313072206643042713600,
-    ],
-    9223372036854775808: [
-        17293822569102704640,
-        34587645138205409280,
-        69175290276410818560,
-        64599633055002394624,
-        9227877836579143680,
-        18898693809314086256640,
-        38704524921475248653598720,
-        79266867039181309242570178560,
-        18905606832543076712448,
-        37811213665086153424896,
-        75622427330172306849792,
-        9231253336202674176,
-        13839563853932789760,
-        28343426772854353428480,
-        58047338030805715821527040,
-        27679127707865579520,
-        9227882233551912960,
-        18898702814314317742080,
-        38704543363715722735779840,
-        19352271681857861367889920,
-        16142026964402700288,
-        32284053928805400576,
-        64568107857610801152,
-        132235484892386920759296,
-        4738507383934141071360,
-        9477014767868282142720,
-        18954029535736564285440,
-        9254897234246369280,
-        9227878935017029632,
-        18898696058914876686336,
-        38704529528657667453616128,
-        77409059057315334907232256,
-        16145404664123228160,
-        32290809328246456320,
-        64581618656492912640,
-        33065788752124371271680,
-        13837310954607476736,
-        27674621909214953472,
-        56677625670072224710656,
-        116075777372307916207423488,
-        13841813454723219456,
-        27683626909446438912,
-        28348033955273153445888,
-        56696067910546306891776,
-        14180934506664217804800,
-        28361869013328435609600,
-        13848568854164275200,
-        27697137708328550400,
-        9230128535807459328,
-        18903303241333676703744,
-        37806606482667353407488,
-        77427930076502739778535424,
-        9236885034760142848,
-        18917140551188772552704,
-        9458570275594386276352,
-        38742303848834606187937792,
-        9460873866803786285056,
-        18921747733607572570112,
-        9239134635550572544,
-        37843495467215145140224,
-        16143152864309542912,
-        32286305728619085824,
-        64572611457238171648,
-        66122354132211887767552,
-        9230129635319087104,
-        18903305493133490388992,
-        37806610986266980777984,
-        38713969649937388316655616,
-        13838435755002691584,
-        27676871510005383168,
-        56682232852491024728064,
-        113364465704982049456128,
-        9236887233783398400,
-        18917145054788399923200,
-        9458572527394199961600,
-        19371156536103321521356800,
-    ],
-    4611686018427387904: [
-        8646911284551352320,
-        17293822569102704640,
-        34587645138205409280,
-        69175290276410818560,
-        4613938918289571840,
-        9449346904657043128320,
-        19352262460737624326799360,
-        39633433519590654621285089280,
-        9452803416271538356224,
-        18905606832543076712448,
-        37811213665086153424896,
-        4615626668101337088,
-        6919781926966394880,
-        14171713386427176714240,
-        29023669015402857910763520,
-        13839563853932789760,
-        4613941116775956480,
-        9449351407157158871040,
-        19352271681857861367889920,
-        9676135840928930683944960,
-        8071013482201350144,
-        16142026964402700288,
-        32284053928805400576,
-        66117742446193460379648,
-        2369253691967070535680,
-        4738507383934141071360,
-        9477014767868282142720,
-        4627448617123184640,
-        4613939467508514816,
-        9449348029457438343168,
-        19352264764328833726808064,
-        38704529528657667453616128,
-        8072702332061614080,
-        16145404664123228160,
-        32290809328246456320,
-        16532894376062185635840,
-        6918655477303738368,
-        13837310954607476736,
-        28338812835036112355328,
-        58037888686153958103711744,
-        6920906727361609728,
-        13841813454723219456,
-        14174016977636576722944,
-        28348033955273153445888,
-        7090467253332108902400,
-        14180934506664217804800,
-        6924284427082137600,
-        13848568854164275200,
-        4615064267903729664,
-        9451651620666838351872,
-        18903303241333676703744,
-        38713965038251369889267712,
-        4618442517380071424,
-        9458570275594386276352,
-        4729285137797193138176,
-        19371151924417303093968896,
-        4730436933401893142528,
-        9460873866803786285056,
-        4619567317775286272,
-        18921747733607572570112,
-        8071576432154771456,
-        16143152864309542912,
-        32286305728619085824,
-        33061177066105943883776,
-        4615064817659543552,
-        9451652746566745194496,
-        18903305493133490388992,
-        19356984824968694158327808,
-        6919217877501345792,
-        13838435755002691584,
-        28341116426245512364032,
-        56682232852491024728064,
-        4618443616891699200,
-        9458572527394199961600,
-        4729286263697099980800,
-        9685578268051660760678400,
-    ],
-    2305843009213693952: [
-        4323455642275676160,
-        8646911284551352320,
-        17293822569102704640,
-        34587645138205409280,
-        2306969459144785920,
-        4724673452328521564160,
-        9676131230368812163399680,
-        19816716759795327310642544640,
-        4726401708135769178112,
-        9452803416271538356224,
-        18905606832543076712448,
-        2307813334050668544,
-        3459890963483197440,
-        7085856693213588357120,
-        14511834507701428955381760,
-        6919781926966394880,
-        2306970558387978240,
-        4724675703578579435520,
-        9676135840928930683944960,
-        4838067920464465341972480,
-        4035506741100675072,
-        8071013482201350144,
-        16142026964402700288,
-        33058871223096730189824,
-        1184626845983535267840,
-        2369253691967070535680,
-        4738507383934141071360,
-        2313724308561592320,
-        2306969733754257408,
-        4724674014728719171584,
-        9676132382164416863404032,
-        19352264764328833726808064,
-        4036351166030807040,
-        8072702332061614080,
-        16145404664123228160,
-        8266447188031092817920,
-        3459327738651869184,
-        6918655477303738368,
-        14169406417518056177664,
-        29018944343076979051855872,
-        3460453363680804864,
-        6920906727361609728,
-        7087008488818288361472,
-        14174016977636576722944,
-        3545233626666054451200,
-        7090467253332108902400,
-        3462142213541068800,
-        6924284427082137600,
-        2307532133951864832,
-        4725825810333419175936,
-        9451651620666838351872,
-        19356982519125684944633856,
-        2309221258690035712,
-        4729285137797193138176,
-        2364642568898596569088,
-        9685575962208651546984448,
-        2365218466700946571264,
-        4730436933401893142528,
-        2309783658887643136,
-        9460873866803786285056,
-        4035788216077385728,
-        8071576432154771456,
-        16143152864309542912,
-        16530588533052971941888,
-        2307532408829771776,
-        4725826373283372597248,
-        9451652746566745194496,
-        9678492412484347079163904,
-        3459608938750672896,
-        6919217877501345792,
-        14170558213122756182016,
-        28341116426245512364032,
-        2309221808445849600,
-        4729286263697099980800,
-        2364643131848549990400,
-        4842789134025830380339200,
-    ],
-    1152921504606846976: [
-        2161727821137838080,
-        4323455642275676160,
-        8646911284551352320,
-        17293822569102704640,
-        1153484729572392960,
-        2362336726164260782080,
-        4838065615184406081699840,
-        9908358379897663655321272320,
-        2363200854067884589056,
-        4726401708135769178112,
-        9452803416271538356224,
-        1153906667025334272,
-        1729945481741598720,
-        3542928346606794178560,
-        7255917253850714477690880,
-        3459890963483197440,
-        1153485279193989120,
-        2362337851789289717760,
-        4838067920464465341972480,
-        2419033960232232670986240,
-        2017753370550337536,
-        4035506741100675072,
-        8071013482201350144,
-        16529435611548365094912,
-        592313422991767633920,
-        1184626845983535267840,
-        2369253691967070535680,
-        1156862154280796160,
-        1153484866877128704,
-        2362337007364359585792,
-        4838066191082208431702016,
-        9676132382164416863404032,
-        2018175583015403520,
-        4036351166030807040,
-        8072702332061614080,
-        4133223594015546408960,
-        1729663869325934592,
-        3459327738651869184,
-        7084703208759028088832,
-        14509472171538489525927936,
-        1730226681840402432,
-        3460453363680804864,
-        3543504244409144180736,
-        7087008488818288361472,
-        1772616813333027225600,
-        3545233626666054451200,
-        1731071106770534400,
-        3462142213541068800,
-        1153766066975932416,
-        2362912905166709587968,
-        4725825810333419175936,
-        9678491259562842472316928,
-        1154610629345017856,
-        2364642568898596569088,
-        1182321284449298284544,
-        4842787981104325773492224,
-        1182609233350473285632,
-        2365218466700946571264,
-        1154891829443821568,
-        4730436933401893142528,
-        2017894108038692864,
-        4035788216077385728,
-        8071576432154771456,
-        8265294266526485970944,
-        1153766204414885888,
-        2362913186641686298624,
-        4725826373283372597248,
-        4839246206242173539581952,
-        1729804469375336448,
-        3459608938750672896,
-        7085279106561378091008,
-        14170558213122756182016,
-        1154610904222924800,
-        2364643131848549990400,
-        1182321565924274995200,
-        2421394567012915190169600,
-    ],
-    576460752303423488: [
-        1080863910568919040,
-        2161727821137838080,
-        4323455642275676160,
-        8646911284551352320,
-        576742364786196480,
-        1181168363082130391040,
-        2419032807592203040849920,
-        4954179189948831827660636160,
-        1181600427033942294528,
-        2363200854067884589056,
-        4726401708135769178112,
-        576953333512667136,
-        864972740870799360,
-        1771464173303397089280,
-        3627958626925357238845440,
-        1729945481741598720,
-        576742639596994560,
-        1181168925894644858880,
-        2419033960232232670986240,
-        1209516980116116335493120,
-        1008876685275168768,
-        2017753370550337536,
-        4035506741100675072,
-        8264717805774182547456,
-        296156711495883816960,
-        592313422991767633920,
-        1184626845983535267840,
-        578431077140398080,
-        576742433438564352,
-        1181168503682179792896,
-        2419033095541104215851008,
-        4838066191082208431702016,
-        1009087791507701760,
-        2018175583015403520,
-        4036351166030807040,
-        2066611797007773204480,
-        864831934662967296,
-        1729663869325934592,
-        3542351604379514044416,
-        7254736085769244762963968,
-        865113340920201216,
-        1730226681840402432,
-        1771752122204572090368,
-        3543504244409144180736,
-        886308406666513612800,
-        1772616813333027225600,
-        865535553385267200,
-        1731071106770534400,
-        576883033487966208,
-        1181456452583354793984,
-        2362912905166709587968,
-        4839245629781421236158464,
-        577305314672508928,
-        1182321284449298284544,
-        591160642224649142272,
-        2421393990552162886746112,
-        591304616675236642816,
-        1182609233350473285632,
-        577445914721910784,
-        2365218466700946571264,
-        1008947054019346432,
-        2017894108038692864,
-        4035788216077385728,
-        4132647133263242985472,
-        576883102207442944,
-        1181456593320843149312,
-        2362913186641686298624,
-        2419623103121086769790976,
-        864902234687668224,
-        1729804469375336448,
-        3542639553280689045504,
-        7085279106561378091008,
-        577305452111462400,
-        1182321565924274995200,
-        591160782962137497600,
-        1210697283506457595084800,
-    ],
-    288230376151711744: [
-        540431955284459520,
-        1080863910568919040,
-        2161727821137838080,
-        4323455642275676160,
-        288371182393098240,
-        590584181541065195520,
-        1209516403796101520424960,
-        2477089594974415913830318080,
-        590800213516971147264,
-        1181600427033942294528,
-        2363200854067884589056,
-        288476666756333568,
-        432486370435399680,
-        885732086651698544640,
-        1813979313462678619422720,
-        864972740870799360,
-        288371319798497280,
-        590584462947322429440,
-        1209516980116116335493120,
-        604758490058058167746560,
-        504438342637584384,
-        1008876685275168768,
-        2017753370550337536,
-        4132358902887091273728,
-        148078355747941908480,
-        296156711495883816960,
-        592313422991767633920,
-        289215538570199040,
-        288371216719282176,
-        590584251841089896448,
-        1209516547770552107925504,
-        2419033095541104215851008,
-        504543895753850880,
-        1009087791507701760,
-        2018175583015403520,
-        1033305898503886602240,
-        432415967331483648,
-        864831934662967296,
-        1771175802189757022208,
-        3627368042884622381481984,
-        432556670460100608,
-        865113340920201216,
-        885876061102286045184,
-        1771752122204572090368,
-        443154203333256806400,
-        886308406666513612800,
-        432767776692633600,
-        865535553385267200,
-        288441516743983104,
-        590728226291677396992,
-        1181456452583354793984,
-        2419622814890710618079232,
-        288652657336254464,
-        591160642224649142272,
-        295580321112324571136,
-        1210696995276081443373056,
-        295652308337618321408,
-        591304616675236642816,
-        288722957360955392,
-        1182609233350473285632,
-        504473527009673216,
-        1008947054019346432,
-        2017894108038692864,
-        2066323566631621492736,
-        288441551103721472,
-        590728296660421574656,
-        1181456593320843149312,
-        1209811551560543384895488,
-        432451117343834112,
-        864902234687668224,
-        1771319776640344522752,
-        3542639553280689045504,
-        288652726055731200,
-        591160782962137497600,
-        295580391481068748800,
-        605348641753228797542400,
-    ],
-    144115188075855872: [
-        37145689726551851008,
-        540431955284459520,
-        1080863910568919040,
-        2161727821137838080,
-        144185591196549120,
-        295292090770532597760,
-        604758201898050760212480,
-        1238544797487207956915159040,
-        295400106758485573632,
-        590800213516971147264,
-        1181600427033942294528,
-        144238333378166784,
-        216243185217699840,
-        442866043325849272320,
-        906989656731339309711360,
-        432486370435399680,
-        144185659899248640,
-        295292231473661214720,
-        604758490058058167746560,
-        302379245029029083873280,
-        252219171318792192,
-        504438342637584384,
-        1008876685275168768,
-        2066179451443545636864,
-        74039177873970954240,
-        148078355747941908480,
-        296156711495883816960,
-        144607769285099520,
-        144185608359641088,
-        295292125920544948224,
-        604758273885276053962752,
-        1209516547770552107925504,
-        252271947876925440,
-        504543895753850880,
-        1009087791507701760,
-        516652949251943301120,
-        216207983665741824,
-        432415967331483648,
-        885587901094878511104,
-        1813684021442311190740992,
-        216278335230050304,
-        432556670460100608,
-        442938030551143022592,
-        885876061102286045184,
-        221577101666628403200,
-        443154203333256806400,
-        216383888346316800,
-        432767776692633600,
-        144220758371991552,
-        295364113145838698496,
-        590728226291677396992,
-        1209811407445355309039616,
-        144326328668127232,
-        295580321112324571136,
-        147790160556162285568,
-        605348497638040721686528,
-        147826154168809160704,
-        295652308337618321408,
-        144361478680477696,
-        591304616675236642816,
-        252236763504836608,
-        504473527009673216,
-        1008947054019346432,
-        1033161783315810746368,
-        144220775551860736,
-        295364148330210787328,
-        590728296660421574656,
-        604905775780271692447744,
-        216225558671917056,
-        432451117343834112,
-        885659888320172261376,
-        1771319776640344522752,
-        144326363027865600,
-        295580391481068748800,
-        147790195740534374400,
-        302674320876614398771200,
-    ],
-    72057594037927936: [
-        55448318612185546752,
-        37145689726551851008,
-        540431955284459520,
-        1080863910568919040,
-        72092795598274560,
-        147646045385266298880,
-        302379100949025380106240,
-        619272398743603978457579520,
-        184575527128152408064,
-        295400106758485573632,
-        590800213516971147264,
-        90124769105543168,
-        108121592608849920,
-        221433021662924636160,
-        453494828365669654855680,
-        216243185217699840,
-        72092829949624320,
-        147646115736830607360,
-        302379245029029083873280,
-        151189622514514541936640,
-        37019588936985477120,
-        252219171318792192,
-        504438342637584384,
-        1033089725721772818432,
-        75594865300452799414272,
-        74039177873970954240,
-        148078355747941908480,
-        72303884642549760,
-        72092804179820544,
-        147646062960272474112,
-        302379136942638026981376,
-        604758273885276053962752,
-        37001609722848083968,
-        252271947876925440,
-        504543895753850880,
-        75779296712392875966464,
-        108103991832870912,
-        216207983665741824,
-        442793950547439255552,
-        906842010721155595370496,
-        108139167615025152,
-        216278335230050304,
-        221469015275571511296,
-        442938030551143022592,
-        75631758788600218517504,
-        221577101666628403200,
-        108191944173158400,
-        216383888346316800,
-        72110379185995776,
-        147682056572919349248,
-        295364113145838698496,
-        604905703722677654519808,
-        72163164334063616,
-        147790160556162285568,
-        73895080278081142784,
-        302674248819020360843264,
-        110788550833314201600,
-        147826154168809160704,
-        72180739340238848,
-        295652308337618321408,
-        37001592130662039552,
-        252236763504836608,
-        504473527009673216,
-        516580891657905373184,
-        72110387775930368,
-        147682074165105393664,
-        295364148330210787328,
-        302452887890135846223872,
-        126118381752418304,
-        216225558671917056,
-        442829944160086130688,
-        885659888320172261376,
-        72163181513932800,
-        147790195740534374400,
-        73895097870267187200,
-        151337160438307199385600,
-    ],
-    36028797018963968: [
-        64599633055002394624,
-        55448318612185546752,
-        37145689726551851008,
-        540431955284459520,
-        36046397799137280,
-        73823022692633149440,
-        151189550474512690053120,
-        309636199371801989228789760,
-        129163237312985825280,
-        184575527128152408064,
-        295400106758485573632,
-        63067986969231360,
-        36929534545214046208,
-        75631686748598366633984,
-        154893694461129454866399232,
-        108121592608849920,
-        36046414974812160,
-        73823057868415303680,
-        151189622514514541936640,
-        154818099703915393123876864,
-        55385268217402359808,
-        37019588936985477120,
-        252219171318792192,
-        516544862860886409216,
-        37834308123975309328384,
-        75594865300452799414272,
-        74039177873970954240,
-        36151942321274880,
-        36055193887965184,
-        73841037082552696832,
-        151226443945067923111936,
-        302379136942638026981376,
-        55376278610333663232,
-        37001609722848083968,
-        252271947876925440,
-        113410618593963342299136,
-        36947540139040571392,
-        108103991832870912,
-        221396975273719627776,
-        453421005360577797685248,
-        36947548935133593600,
-        108139167615025152,
-        75668580219153599692800,
-        221469015275571511296,
-        113373725105815923195904,
-        75631758788600218517504,
-        36929569720996200448,
-        108191944173158400,
-        54069583807512576,
-        110734507637785755648,
-        147682056572919349248,
-        302452851861338827259904,
-        36081582167031808,
-        73895080278081142784,
-        75594811257257270968320,
-        151337124409510180421632,
-        75613239986932471037952,
-        110788550833314201600,
-        54095972086579200,
-        147826154168809160704,
-        55394275416657100800,
-        37001592130662039552,
-        252236763504836608,
-        75779260683595857002496,
-        54060796304424960,
-        110716510831462318080,
-        147682074165105393664,
-        226747414182834827427840,
-        36956538542202290176,
-        126118381752418304,
-        258290445828952686592,
-        442829944160086130688,
-        36081590756966400,
-        73895097870267187200,
-        75594793260450947530752,
-        154818136597403540542980096,
-    ],
-    18014398509481984: [
-        33776997205278720,
-        31542789577637888,
-        27074374322356224,
-        18137543811792896,
-        18023198899568640,
-        36911511346316574720,
-        75594775237256345026560,
-        154818099685900994614394880,
-        36925013344810696704,
-        63067986969231360,
-        90124769105543168,
-        18029791672270848,
-        27030398152212480,
-        55358255415731159040,
-        113373707091417413713920,
-        18031999289655296,
-        18023198901665792,
-        36911511350611542016,
-        75594775246052438048768,
-        37797405628628635484160,
-        31527396414849024,
-        27043587996778496,
-        18075971160637440,
-        37019588936985477120,
-        9254897234246369280,
-        18473783263659819008,
-        36911555322486718464,
-        18023220372307968,
-        18023201044955136,
-        36911515740068118528,
-        75594784235659506745344,
-        73841037082552696832,
-        31533993484615680,
-        27039198540201984,
-        18067192247484416,
-        64581618656492912640,
-        27025997958217728,
-        18040791083515904,
-        36947540139040571392,
-        75668562204755090210816,
-        27034791903756288,
-        18040795378483200,
-        55367253818892877824,
-        36947548935133593600,
-        27697137708328550400,
-        55358264211824181248,
-        27030402447179776,
-        18032016465330176,
-        18027594796498944,
-        36920514143229837312,
-        54069583807512576,
-        110734507637785755648,
-        18023207487406080,
-        36911528934207651840,
-        18473770069520285696,
-        75594811257257270968320,
-        18478269271101145088,
-        36920527337369370624,
-        18027601238949888,
-        54095972086579200,
-        31529595438104576,
-        27047986043289600,
-        18067183657549824,
-        55394275416657100800,
-        18027596943982592,
-        36920518541276348416,
-        54060796304424960,
-        75613221972533961555968,
-        27028194833989632,
-        18045184835059712,
-        36956538542202290176,
-        126118381752418304,
-        18023203196633088,
-        36911520146704564224,
-        18473774467566796800,
-        37834290109576799846400,
-    ],
-    9007199254740992: [
-        16888498602639360,
-        33776997205278720,
-        31542789577637888,
-        27074374322356224,
-        9011599449784320,
-        18455755673158287360,
-        37797387618628172513280,
-        77409049842950497307197440,
-        18462506672405348352,
-        36925013344810696704,
-        63067986969231360,
-        9014895836135424,
-        13515199076106240,
-        27679127707865579520,
-        56686853545708706856960,
-        27030398152212480,
-        9011603743703040,
-        18455764467103825920,
-        37797405628628635484160,
-        18898702814314317742080,
-        15763698207424512,
-        31527396414849024,
-        27043587996778496,
-        55385268217402359808,
-        4627448617123184640,
-        9254897234246369280,
-        18473783263659819008,
-        9020401984208896,
-        9011600522477568,
-        18455757870034059264,
-        37797392117829753372672,
-        75594784235659506745344,
-        15766996742307840,
-        31533993484615680,
-        27039198540201984,
-        32290809328246456320,
-        13512998979108864,
-        27025997958217728,
-        55349243818429906944,
-        113355251340144449421312,
-        13517395951878144,
-        27034791903756288,
-        27683626909446438912,
-        55367253818892877824,
-        13848568854164275200,
-        27697137708328550400,
-        13523993021644800,
-        27030402447179776,
-        9013797398249472,
-        18460257071614918656,
-        36920514143229837312,
-        75613212965334706814976,
-        9020395541757952,
-        18473770069520285696,
-        9236885034760142848,
-        37834281102377545105408,
-        9239134635550572544,
-        18478269271101145088,
-        9022592417529856,
-        36920527337369370624,
-        15764797719052288,
-        31529595438104576,
-        27047986043289600,
-        64572611457238171648,
-        9013798471991296,
-        18460259270638174208,
-        36920518541276348416,
-        37806610986266980777984,
-        13514097416994816,
-        27028194833989632,
-        55353743020010766336,
-        36956538542202290176,
-        9020397689241600,
-        18473774467566796800,
-        9236887233783398400,
-        18917145054788399923200,
-    ],
-    4503599627370496: [
-        8444249301319680,
-        16888498602639360,
-        33776997205278720,
-        31542789577637888,
-        4505799724892160,
-        9227877836579143680,
-        18898693809314086256640,
-        38704524921475248653598720,
-        9231253336202674176,
-        18462506672405348352,
-        36925013344810696704,
-        4507447918067712,
-        6757599538053120,
-        13839563853932789760,
-        28343426772854353428480,
-        13515199076106240,
-        4505801871851520,
-        9227882233551912960,
-        18898702814314317742080,
-        9449351407157158871040,
-        7881849103712256,
-        15763698207424512,
-        31527396414849024,
-        64568107857610801152,
-        2313724308561592320,
-        4627448617123184640,
-        9254897234246369280,
-        4518992790159360,
-        4505800261238784,
-        9227878935017029632,
-        18898696058914876686336,
-        37797392117829753372672,
-        7883498371153920,
-        15766996742307840,
-        31533993484615680,
-        16145404664123228160,
-        6756499489554432,
-        13512998979108864,
-        27674621909214953472,
-        56677625670072224710656,
-        6758697975939072,
-        13517395951878144,
-        13841813454723219456,
-        27683626909446438912,
-        6924284427082137600,
-        13848568854164275200,
-        6761996510822400,
-        13523993021644800,
-        4506898699124736,
-        9230128535807459328,
-        18460257071614918656,
-        37806606482667353407488,
-        4510197770878976,
-        9236885034760142848,
-        4618442517380071424,
-        18917140551188772552704,
-        4619567317775286272,
-        9239134635550572544,
-        4511296208764928,
-        18478269271101145088,
-        7882398859526144,
-        15764797719052288,
-        31529595438104576,
-        32286305728619085824,
-        4506899235995648,
-        9230129635319087104,
-        18460259270638174208,
-        18903305493133490388992,
-        6757048708497408,
-        13514097416994816,
-        27676871510005383168,
-        55353743020010766336,
-        4510198844620800,
-        9236887233783398400,
-        4618443616891699200,
-        9458572527394199961600,
-    ],
-    2251799813685248: [
-        4222124650659840,
-        8444249301319680,
-        16888498602639360,
-        33776997205278720,
-        2252899862446080,
-        4613938918289571840,
-        9449346904657043128320,
-        19352262460737624326799360,
-        4615626668101337088,
-        9231253336202674176,
-        18462506672405348352,
-        2253723959033856,
-        3378799769026560,
-        6919781926966394880,
-        14171713386427176714240,
-        6757599538053120,
-        2252900935925760,
-        4613941116775956480,
-        9449351407157158871040,
-        4724675703578579435520,
-        3940924551856128,
-        7881849103712256,
-        15763698207424512,
-        32284053928805400576,
-        1156862154280796160,
-        2313724308561592320,
-        4627448617123184640,
-        2259496395079680,
-        2252900130619392,
-        4613939467508514816,
-        9449348029457438343168,
-        18898696058914876686336,
-        3941749185576960,
-        7883498371153920,
-        15766996742307840,
-        8072702332061614080,
-        3378249744777216,
-        6756499489554432,
-        13837310954607476736,
-        28338812835036112355328,
-        3379348987969536,
-        6758697975939072,
-        6920906727361609728,
-        13841813454723219456,
-        3462142213541068800,
-        6924284427082137600,
-        3380998255411200,
-        6761996510822400,
-        2253449349562368,
-        4615064267903729664,
-        9230128535807459328,
-        18903303241333676703744,
-        2255098885439488,
-        4618442517380071424,
-        2309221258690035712,
-        9458570275594386276352,
-        2309783658887643136,
-        4619567317775286272,
-        2255648104382464,
-        9239134635550572544,
-        3941199429763072,
-        7882398859526144,
-        15764797719052288,
-        16143152864309542912,
-        2253449617997824,
-        4615064817659543552,
-        9230129635319087104,
-        9451652746566745194496,
-        3378524354248704,
-        6757048708497408,
-        13838435755002691584,
-        27676871510005383168,
-        2255099422310400,
-        4618443616891699200,
-        2309221808445849600,
-        4729286263697099980800,
-    ],
-    1125899906842624: [
-        2111062325329920,
-        4222124650659840,
-        8444249301319680,
-        16888498602639360,
-        1126449931223040,
-        2306969459144785920,
-        4724673452328521564160,
-        9676131230368812163399680,
-        2307813334050668544,
-        4615626668101337088,
-        9231253336202674176,
-        1126861979516928,
-        1689399884513280,
-        3459890963483197440,
-        7085856693213588357120,
-        3378799769026560,
-        1126450467962880,
-        2306970558387978240,
-        4724675703578579435520,
-        2362337851789289717760,
-        1970462275928064,
-        3940924551856128,
-        7881849103712256,
-        16142026964402700288,
-        578431077140398080,
-        1156862154280796160,
-        2313724308561592320,
-        1129748197539840,
-        1126450065309696,
-        2306969733754257408,
-        4724674014728719171584,
-        9449348029457438343168,
-        1970874592788480,
-        3941749185576960,
-        7883498371153920,
-        4036351166030807040,
-        1689124872388608,
-        3378249744777216,
-        6918655477303738368,
-        14169406417518056177664,
-        1689674493984768,
-        3379348987969536,
-        3460453363680804864,
-        6920906727361609728,
-        1731071106770534400,
-        3462142213541068800,
-        1690499127705600,
-        3380998255411200,
-        1126724674781184,
-        2307532133951864832,
-        4615064267903729664,
-        9451651620666838351872,
-        1127549442719744,
-        2309221258690035712,
-        1154610629345017856,
-        4729285137797193138176,
-        1154891829443821568,
-        2309783658887643136,
-        1127824052191232,
-        4619567317775286272,
-        1970599714881536,
-        3941199429763072,
-        7882398859526144,
-        8071576432154771456,
-        1126724808998912,
-        2307532408829771776,
-        4615064817659543552,
-        4725826373283372597248,
-        1689262177124352,
-        3378524354248704,
-        6919217877501345792,
-        13838435755002691584,
-        1127549711155200,
-        2309221808445849600,
-        1154610904222924800,
-        2364643131848549990400,
-    ],
-    562949953421312: [
-        1055531162664960,
-        2111062325329920,
-        4222124650659840,
-        8444249301319680,
-        563224965611520,
-        1153484729572392960,
-        2362336726164260782080,
-        4838065615184406081699840,
-        1153906667025334272,
-        2307813334050668544,
-        4615626668101337088,
-        563430989758464,
-        844699942256640,
-        1729945481741598720,
-        3542928346606794178560,
-        1689399884513280,
-        563225233981440,
-        1153485279193989120,
-        2362337851789289717760,
-        1181168925894644858880,
-        985231137964032,
-        1970462275928064,
-        3940924551856128,
-        8071013482201350144,
-        289215538570199040,
-        578431077140398080,
-        1156862154280796160,
-        564874098769920,
-        563225032654848,
-        1153484866877128704,
-        2362337007364359585792,
-        4724674014728719171584,
-        985437296394240,
-        1970874592788480,
-        3941749185576960,
-        2018175583015403520,
-        844562436194304,
-        1689124872388608,
-        3459327738651869184,
-        7084703208759028088832,
-        844837246992384,
-        1689674493984768,
-        1730226681840402432,
-        3460453363680804864,
-        865535553385267200,
-        1731071106770534400,
-        845249563852800,
-        1690499127705600,
-        563362337390592,
-        1153766066975932416,
-        2307532133951864832,
-        4725825810333419175936,
-        563774721359872,
-        1154610629345017856,
-        577305314672508928,
-        2364642568898596569088,
-        577445914721910784,
-        1154891829443821568,
-        563912026095616,
-        2309783658887643136,
-        985299857440768,
-        1970599714881536,
-        3941199429763072,
-        4035788216077385728,
-        563362404499456,
-        1153766204414885888,
-        2307532408829771776,
-        2362913186641686298624,
-        844631088562176,
-        1689262177124352,
-        3459608938750672896,
-        6919217877501345792,
-        563774855577600,
-        1154610904222924800,
-        577305452111462400,
-        1182321565924274995200,
-    ],
-    281474976710656: [
-        527765581332480,
-        1055531162664960,
-        2111062325329920,
-        4222124650659840,
-        281612482805760,
-        576742364786196480,
-        1181168363082130391040,
-        2419032807592203040849920,
-        576953333512667136,
-        1153906667025334272,
-        2307813334050668544,
-        281715494879232,
-        422349971128320,
-        864972740870799360,
-        1771464173303397089280,
-        844699942256640,
-        281612616990720,
-        576742639596994560,
-        1181168925894644858880,
-        590584462947322429440,
-        492615568982016,
-        985231137964032,
-        1970462275928064,
-        4035506741100675072,
-        144607769285099520,
-        289215538570199040,
-        578431077140398080,
-        282437049384960,
-        281612516327424,
-        576742433438564352,
-        1181168503682179792896,
-        2362337007364359585792,
-        492718648197120,
-        985437296394240,
-        1970874592788480,
-        1009087791507701760,
-        422281218097152,
-        844562436194304,
-        1729663869325934592,
-        3542351604379514044416,
-        422418623496192,
-        844837246992384,
-        865113340920201216,
-        1730226681840402432,
-        432767776692633600,
-        865535553385267200,
-        422624781926400,
-        845249563852800,
-        281681168695296,
-        576883033487966208,
-        1153766066975932416,
-        2362912905166709587968,
-        281887360679936,
-        577305314672508928,
-        288652657336254464,
-        1182321284449298284544,
-        288722957360955392,
-        577445914721910784,
-        281956013047808,
-        1154891829443821568,
-        492649928720384,
-        985299857440768,
-        1970599714881536,
-        2017894108038692864,
-        281681202249728,
-        576883102207442944,
-        1153766204414885888,
-        1181456593320843149312,
-        422315544281088,
-        844631088562176,
-        1729804469375336448,
-        3459608938750672896,
-        281887427788800,
-        577305452111462400,
-        288652726055731200,
-        591160782962137497600,
-    ],
-    140737488355328: [
-        263882790666240,
-        527765581332480,
-        1055531162664960,
-        2111062325329920,
-        140806241402880,
-        288371182393098240,
-        590584181541065195520,
-        1209516403796101520424960,
-        288476666756333568,
-        576953333512667136,
-        1153906667025334272,
-        140857747439616,
-        211174985564160,
-        432486370435399680,
-        885732086651698544640,
-        422349971128320,
-        140806308495360,
-        288371319798497280,
-        590584462947322429440,
-        295292231473661214720,
-        246307784491008,
-        492615568982016,
-        985231137964032,
-        2017753370550337536,
-        72303884642549760,
-        144607769285099520,
-        289215538570199040,
-        141218524692480,
-        140806258163712,
-        288371216719282176,
-        590584251841089896448,
-        1181168503682179792896,
-        246359324098560,
-        492718648197120,
-        985437296394240,
-        504543895753850880,
-        211140609048576,
-        422281218097152,
-        864831934662967296,
-        1771175802189757022208,
-        211209311748096,
-        422418623496192,
-        432556670460100608,
-        865113340920201216,
-        216383888346316800,
-        432767776692633600,
-        211312390963200,
-        422624781926400,
-        140840584347648,
-        288441516743983104,
-        576883033487966208,
-        1181456452583354793984,
-        140943680339968,
-        288652657336254464,
-        144326328668127232,
-        591160642224649142272,
-        144361478680477696,
-        288722957360955392,
-        140978006523904,
-        577445914721910784,
-        246324964360192,
-        492649928720384,
-        985299857440768,
-        1008947054019346432,
-        140840601124864,
-        288441551103721472,
-        576883102207442944,
-        590728296660421574656,
-        211157772140544,
-        422315544281088,
-        864902234687668224,
-        1729804469375336448,
-        140943713894400,
-        288652726055731200,
-        144326363027865600,
-        295580391481068748800,
-    ],
-    70368744177664: [
-        18137543811792896,
-        263882790666240,
-        527765581332480,
-        1055531162664960,
-        70403120701440,
-        144185591196549120,
-        295292090770532597760,
-        604758201898050760212480,
-        144238333378166784,
-        288476666756333568,
-        576953333512667136,
-        70428873719808,
-        105587492782080,
-        216243185217699840,
-        442866043325849272320,
-        211174985564160,
-        70403154247680,
-        144185659899248640,
-        295292231473661214720,
-        147646115736830607360,
-        123153892245504,
-        246307784491008,
-        492615568982016,
-        1008876685275168768,
-        36151942321274880,
-        72303884642549760,
-        144607769285099520,
-        70609262346240,
-        70403129081856,
-        144185608359641088,
-        295292125920544948224,
-        590584251841089896448,
-        123179662049280,
-        246359324098560,
-        492718648197120,
-        252271947876925440,
-        105570304524288,
-        211140609048576,
-        432415967331483648,
-        885587901094878511104,
-        105604655874048,
-        211209311748096,
-        216278335230050304,
-        432556670460100608,
-        108191944173158400,
-        216383888346316800,
-        105656195481600,
-        211312390963200,
-        70420292173824,
-        144220758371991552,
-        288441516743983104,
-        590728226291677396992,
-        70471840169984,
-        144326328668127232,
-        72163164334063616,
-        295580321112324571136,
-        72180739340238848,
-        144361478680477696,
-        70489003261952,
-        288722957360955392,
-        123162482180096,
-        246324964360192,
-        492649928720384,
-        504473527009673216,
-        70420300562432,
-        144220775551860736,
-        288441551103721472,
-        295364148330210787328,
-        105578886070272,
-        211157772140544,
-        432451117343834112,
-        864902234687668224,
-        70471856947200,
-        144326363027865600,
-        72163181513932800,
-        147790195740534374400,
-    ],
-    35184372088832: [
-        27074374322356224,
-        18137543811792896,
-        263882790666240,
-        527765581332480,
-        35201560350720,
-        72092795598274560,
-        147646045385266298880,
-        302379100949025380106240,
-        90124769105543168,
-        144238333378166784,
-        288476666756333568,
-        44006234914816,
-        52793746391040,
-        108121592608849920,
-        221433021662924636160,
-        105587492782080,
-        35201577123840,
-        72092829949624320,
-        147646115736830607360,
-        73823057868415303680,
-        18075971160637440,
-        123153892245504,
-        246307784491008,
-        504438342637584384,
-        36911555322486718464,
-        36151942321274880,
-        72303884642549760,
-        35304631173120,
-        35201564540928,
-        72092804179820544,
-        147646062960272474112,
-        295292125920544948224,
-        18067192247484416,
-        123179662049280,
-        246359324098560,
-        37001609722848083968,
-        52785152262144,
-        105570304524288,
-        216207983665741824,
-        442793950547439255552,
-        52802327937024,
-        105604655874048,
-        108139167615025152,
-        216278335230050304,
-        36929569720996200448,
-        108191944173158400,
-        52828097740800,
-        105656195481600,
-        35210146086912,
-        72110379185995776,
-        144220758371991552,
-        295364113145838698496,
-        35235920084992,
-        72163164334063616,
-        36081582167031808,
-        147790160556162285568,
-        54095972086579200,
-        72180739340238848,
-        35244501630976,
-        144361478680477696,
-        18067183657549824,
-        123162482180096,
-        246324964360192,
-        252236763504836608,
-        35210150281216,
-        72110387775930368,
-        144220775551860736,
-        147682074165105393664,
-        61581241090048,
-        105578886070272,
-        216225558671917056,
-        432451117343834112,
-        35235928473600,
-        72163181513932800,
-        36081590756966400,
-        73895097870267187200,
-    ],
-    17592186044416: [
-        31542789577637888,
-        27074374322356224,
-        18137543811792896,
-        263882790666240,
-        17600780175360,
-        36046397799137280,
-        73823022692633149440,
-        151189550474512690053120,
-        63067986969231360,
-        90124769105543168,
-        144238333378166784,
-        30794915512320,
-        18031999289655296,
-        36929534545214046208,
-        75631686748598366633984,
-        52793746391040,
-        17600788561920,
-        36046414974812160,
-        73823057868415303680,
-        75594775246052438048768,
-        27043587996778496,
-        18075971160637440,
-        123153892245504,
-        252219171318792192,
-        18473783263659819008,
-        36911555322486718464,
-        36151942321274880,
-        17652315586560,
-        17605075140608,
-        36055193887965184,
-        73841037082552696832,
-        147646062960272474112,
-        27039198540201984,
-        18067192247484416,
-        123179662049280,
-        55376278610333663232,
-        18040791083515904,
-        52785152262144,
-        108103991832870912,
-        221396975273719627776,
-        18040795378483200,
-        52802327937024,
-        36947548935133593600,
-        108139167615025152,
-        55358264211824181248,
-        36929569720996200448,
-        18032016465330176,
-        52828097740800,
-        26401163968512,
-        54069583807512576,
-        72110379185995776,
-        147682056572919349248,
-        17617960042496,
-        36081582167031808,
-        36911528934207651840,
-        73895080278081142784,
-        36920527337369370624,
-        54095972086579200,
-        26414048870400,
-        72180739340238848,
-        27047986043289600,
-        18067183657549824,
-        123162482180096,
-        37001592130662039552,
-        26396873195520,
-        54060796304424960,
-        72110387775930368,
-        110716510831462318080,
-        18045184835059712,
-        61581241090048,
-        126118381752418304,
-        216225558671917056,
-        17617964236800,
-        36081590756966400,
-        36911520146704564224,
-        75594793260450947530752,
-    ],
-    8796093022208: [
-        16492674416640,
-        15401752723456,
-        13219909337088,
-        8856222564352,
-        8800390087680,
-        18023198899568640,
-        36911511346316574720,
-        75594775237256345026560,
-        18029791672270848,
-        30794915512320,
-        44006234914816,
-        8803609214976,
-        13198436597760,
-        27030398152212480,
-        55358255415731159040,
-        8804687153152,
-        8800390088704,
-        18023198901665792,
-        36911511350611542016,
-        18455764467103825920,
-        15394236530688,
-        13204876951552,
-        8826157793280,
-        18075971160637440,
-        4518992790159360,
-        9020401984208896,
-        18023220372307968,
-        8800400572416,
-        8800391135232,
-        18023201044955136,
-        36911515740068118528,
-        36055193887965184,
-        15397457756160,
-        13202733662208,
-        8821871214592,
-        31533993484615680,
-        13196288065536,
-        8808980021248,
-        18040791083515904,
-        36947540139040571392,
-        13200581984256,
-        8808982118400,
-        27034791903756288,
-        18040795378483200,
-        13523993021644800,
-        27030402447179776,
-        13198438694912,
-        8804695539712,
-        8802536521728,
-        18027594796498944,
-        26401163968512,
-        54069583807512576,
-        8800394280960,
-        18023207487406080,
-        9020395541757952,
-        36911528934207651840,
-        9022592417529856,
-        18027601238949888,
-        8802539667456,
-        26414048870400,
-        15395310272512,
-        13207024435200,
-        8821867020288,
-        27047986043289600,
-        8802537570304,
-        18027596943982592,
-        26396873195520,
-        36920518541276348416,
-        13197360758784,
-        8811125407744,
-        18045184835059712,
-        61581241090048,
-        8800392185856,
-        18023203196633088,
-        9020397689241600,
-        18473774467566796800,
-    ],
-    4398046511104: [
-        8246337208320,
-        16492674416640,
-        15401752723456,
-        13219909337088,
-        4400195043840,
-        9011599449784320,
-        18455755673158287360,
-        37797387618628172513280,
-        9014895836135424,
-        18029791672270848,
-        30794915512320,
-        4401804607488,
-        6599218298880,
-        13515199076106240,
-        27679127707865579520,
-        13198436597760,
-        4400197140480,
-        9011603743703040,
-        18455764467103825920,
-        9227882233551912960,
-        7697118265344,
-        15394236530688,
-        13204876951552,
-        27043587996778496,
-        2259496395079680,
-        4518992790159360,
-        9020401984208896,
-        4404493156352,
-        4400195567616,
-        9011600522477568,
-        18455757870034059264,
-        36911515740068118528,
-        7698728878080,
-        15397457756160,
-        13202733662208,
-        15766996742307840,
-        6598144032768,
-        13196288065536,
-        27025997958217728,
-        55349243818429906944,
-        6600290992128,
-        13200581984256,
-        13517395951878144,
-        27034791903756288,
-        6761996510822400,
-        13523993021644800,
-        6603512217600,
-        13198438694912,
-        4401268260864,
-        9013797398249472,
-        18027594796498944,
-        36920514143229837312,
-        4404490010624,
-        9020395541757952,
-        4510197770878976,
-        18473770069520285696,
-        4511296208764928,
-        9022592417529856,
-        4405562703872,
-        18027601238949888,
-        7697655136256,
-        15395310272512,
-        13207024435200,
-        31529595438104576,
-        4401268785152,
-        9013798471991296,
-        18027596943982592,
-        18460259270638174208,
-        6598680379392,
-        13197360758784,
-        27028194833989632,
-        18045184835059712,
-        4404491059200,
-        9020397689241600,
-        4510198844620800,
-        9236887233783398400,
-    ],
-    2199023255552: [
-        4123168604160,
-        8246337208320,
-        16492674416640,
-        15401752723456,
-        2200097521920,
-        4505799724892160,
-        9227877836579143680,
-        18898693809314086256640,
-        4507447918067712,
-        9014895836135424,
-        18029791672270848,
-        2200902303744,
-        3299609149440,
-        6757599538053120,
-        13839563853932789760,
-        6599218298880,
-        2200098570240,
-        4505801871851520,
-        9227882233551912960,
-        4613941116775956480,
-        3848559132672,
-        7697118265344,
-        15394236530688,
-        31527396414849024,
-        1129748197539840,
-        2259496395079680,
-        4518992790159360,
-        2206539448320,
-        2200097783808,
-        4505800261238784,
-        9227878935017029632,
-        18455757870034059264,
-        3849364439040,
-        7698728878080,
-        15397457756160,
-        7883498371153920,
-        3299072016384,
-        6598144032768,
-        13512998979108864,
-        27674621909214953472,
-        3300145496064,
-        6600290992128,
-        6758697975939072,
-        13517395951878144,
-        3380998255411200,
-        6761996510822400,
-        3301756108800,
-        6603512217600,
-        2200634130432,
-        4506898699124736,
-        9013797398249472,
-        18460257071614918656,
-        2202245005312,
-        4510197770878976,
-        2255098885439488,
-        9236885034760142848,
-        2255648104382464,
-        4511296208764928,
-        2202781351936,
-        9022592417529856,
-        3848827568128,
-        7697655136256,
-        15395310272512,
-        15764797719052288,
-        2200634392576,
-        4506899235995648,
-        9013798471991296,
-        9230129635319087104,
-        3299340189696,
-        6598680379392,
-        13514097416994816,
-        27028194833989632,
-        2202245529600,
-        4510198844620800,
-        2255099422310400,
-        4618443616891699200,
-    ],
-    1099511627776: [
-        2061584302080,
-        4123168604160,
-        8246337208320,
-        16492674416640,
-        1100048760960,
-        2252899862446080,
-        4613938918289571840,
-        9449346904657043128320,
-        2253723959033856,
-        4507447918067712,
-        9014895836135424,
-        1100451151872,
-        1649804574720,
-        3378799769026560,
-        6919781926966394880,
-        3299609149440,
-        1100049285120,
-        2252900935925760,
-        4613941116775956480,
-        2306970558387978240,
-        1924279566336,
-        3848559132672,
-        7697118265344,
-        15763698207424512,
-        564874098769920,
-        1129748197539840,
-        2259496395079680,
-        1103269724160,
-        1100048891904,
-        2252900130619392,
-        4613939467508514816,
-        9227878935017029632,
-        1924682219520,
-        3849364439040,
-        7698728878080,
-        3941749185576960,
-        1649536008192,
-        3299072016384,
-        6756499489554432,
-        13837310954607476736,
-        1650072748032,
-        3300145496064,
-        3379348987969536,
-        6758697975939072,
-        1690499127705600,
-        3380998255411200,
-        1650878054400,
-        3301756108800,
-        1100317065216,
-        2253449349562368,
-        4506898699124736,
-        9230128535807459328,
-        1101122502656,
-        2255098885439488,
-        1127549442719744,
-        4618442517380071424,
-        1127824052191232,
-        2255648104382464,
-        1101390675968,
-        4511296208764928,
-        1924413784064,
-        3848827568128,
-        7697655136256,
-        7882398859526144,
-        1100317196288,
-        2253449617997824,
-        4506899235995648,
-        4615064817659543552,
-        1649670094848,
-        3299340189696,
-        6757048708497408,
-        13514097416994816,
-        1101122764800,
-        2255099422310400,
-        1127549711155200,
-        2309221808445849600,
-    ],
-    549755813888: [
-        1030792151040,
-        2061584302080,
-        4123168604160,
-        8246337208320,
-        550024380480,
-        1126449931223040,
-        2306969459144785920,
-        4724673452328521564160,
-        1126861979516928,
-        2253723959033856,
-        4507447918067712,
-        550225575936,
-        824902287360,
-        1689399884513280,
-        3459890963483197440,
-        1649804574720,
-        550024642560,
-        1126450467962880,
-        2306970558387978240,
-        1153485279193989120,
-        962139783168,
-        1924279566336,
-        3848559132672,
-        7881849103712256,
-        282437049384960,
-        564874098769920,
-        1129748197539840,
-        551634862080,
-        550024445952,
-        1126450065309696,
-        2306969733754257408,
-        4613939467508514816,
-        962341109760,
-        1924682219520,
-        3849364439040,
-        1970874592788480,
-        824768004096,
-        1649536008192,
-        3378249744777216,
-        6918655477303738368,
-        825036374016,
-        1650072748032,
-        1689674493984768,
-        3379348987969536,
-        845249563852800,
-        1690499127705600,
-        825439027200,
-        1650878054400,
-        550158532608,
-        1126724674781184,
-        2253449349562368,
-        4615064267903729664,
-        550561251328,
-        1127549442719744,
-        563774721359872,
-        2309221258690035712,
-        563912026095616,
-        1127824052191232,
-        550695337984,
-        2255648104382464,
-        962206892032,
-        1924413784064,
-        3848827568128,
-        3941199429763072,
-        550158598144,
-        1126724808998912,
-        2253449617997824,
-        2307532408829771776,
-        824835047424,
-        1649670094848,
-        3378524354248704,
-        6757048708497408,
-        550561382400,
-        1127549711155200,
-        563774855577600,
-        1154610904222924800,
-    ],
-    274877906944: [
-        515396075520,
-        1030792151040,
-        2061584302080,
-        4123168604160,
-        275012190240,
-        563224965611520,
-        1153484729572392960,
-        2362336726164260782080,
-        563430989758464,
-        1126861979516928,
-        2253723959033856,
-        275112787968,
-        412451143680,
-        844699942256640,
-        1729945481741598720,
-        824902287360,
-        275012321280,
-        563225233981440,
-        1153485279193989120,
-        576742639596994560,
-        481069891584,
-        962139783168,
-        1924279566336,
-        3940924551856128,
-        141218524692480,
-        282437049384960,
-        564874098769920,
-        275817431040,
-        275012222976,
-        563225032654848,
-        1153484866877128704,
-        2306969733754257408,
-        481170554880,
-        962341109760,
-        1924682219520,
-        985437296394240,
-        412384002048,
-        824768004096,
-        1689124872388608,
-        3459327738651869184,
-        412518187008,
-        825036374016,
-        844837246992384,
-        1689674493984768,
-        422624781926400,
-        845249563852800,
-        412719513600,
-        825439027200,
-        275079266304,
-        563362337390592,
-        1126724674781184,
-        2307532133951864832,
-        275280625664,
-        563774721359872,
-        281887360679936,
-        1154610629345017856,
-        281956013047808,
-        563912026095616,
-        275347668992,
-        1127824052191232,
-        481103446016,
-        962206892032,
-        1924413784064,
-        1970599714881536,
-        275079299072,
-        563362404499456,
-        1126724808998912,
-        1153766204414885888,
-        412417523712,
-        824835047424,
-        1689262177124352,
-        3378524354248704,
-        275280691200,
-        563774855577600,
-        281887427788800,
-        577305452111462400,
-    ],
-    137438953472: [
-        257698037760,
-        515396075520,
-        1030792151040,
-        2061584302080,
-        137506095120,
-        281612482805760,
-        576742364786196480,
-        1181168363082130391040,
-        281715494879232,
-        563430989758464,
-        1126861979516928,
-        137556393984,
-        206225571840,
-        422349971128320,
-        864972740870799360,
-        412451143680,
-        137506160640,
-        281612616990720,
-        576742639596994560,
-        288371319798497280,
-        240534945792,
-        481069891584,
-        962139783168,
-        1970462275928064,
-        70609262346240,
-        141218524692480,
-        282437049384960,
-        137908715520,
-        137506111488,
-        281612516327424,
-        576742433438564352,
-        1153484866877128704,
-        240585277440,
-        481170554880,
-        962341109760,
-        492718648197120,
-        206192001024,
-        412384002048,
-        844562436194304,
-        1729663869325934592,
-        206259093504,
-        412518187008,
-        422418623496192,
-        844837246992384,
-        211312390963200,
-        422624781926400,
-        206359756800,
-        412719513600,
-        137539633152,
-        281681168695296,
-        563362337390592,
-        1153766066975932416,
-        137640312832,
-        281887360679936,
-        140943680339968,
-        577305314672508928,
-        140978006523904,
-        281956013047808,
-        137673834496,
-        563912026095616,
-        240551723008,
-        481103446016,
-        962206892032,
-        985299857440768,
-        137539649536,
-        281681202249728,
-        563362404499456,
-        576883102207442944,
-        206208761856,
-        412417523712,
-        844631088562176,
-        1689262177124352,
-        137640345600,
-        281887427788800,
-        140943713894400,
-        288652726055731200,
-    ],
-    68719476736: [
-        128849018880,
-        257698037760,
-        515396075520,
-        1030792151040,
-        68753047560,
-        140806241402880,
-        288371182393098240,
-        590584181541065195520,
-        140857747439616,
-        281715494879232,
-        563430989758464,
-        68778196992,
-        103112785920,
-        211174985564160,
-        432486370435399680,
-        206225571840,
-        68753080320,
-        140806308495360,
-        288371319798497280,
-        144185659899248640,
-        120267472896,
-        240534945792,
-        481069891584,
-        985231137964032,
-        35304631173120,
-        70609262346240,
-        141218524692480,
-        68954357760,
-        68753055744,
-        140806258163712,
-        288371216719282176,
-        576742433438564352,
-        120292638720,
-        240585277440,
-        481170554880,
-        246359324098560,
-        103096000512,
-        206192001024,
-        422281218097152,
-        864831934662967296,
-        103129546752,
-        206259093504,
-        211209311748096,
-        422418623496192,
-        105656195481600,
-        211312390963200,
-        103179878400,
-        206359756800,
-        68769816576,
-        140840584347648,
-        281681168695296,
-        576883033487966208,
-        68820156416,
-        140943680339968,
-        70471840169984,
-        288652657336254464,
-        70489003261952,
-        140978006523904,
-        68836917248,
-        281956013047808,
-        120275861504,
-        240551723008,
-        481103446016,
-        492649928720384,
-        68769824768,
-        140840601124864,
-        281681202249728,
-        288441551103721472,
-        103104380928,
-        206208761856,
-        422315544281088,
-        844631088562176,
-        68820172800,
-        140943713894400,
-        70471856947200,
-        144326363027865600,
-    ],
-    34359738368: [
-        8856222564352,
-        128849018880,
-        257698037760,
-        515396075520,
-        34376523780,
-        70403120701440,
-        144185591196549120,
-        295292090770532597760,
-        70428873719808,
-        140857747439616,
-        281715494879232,
-        34389098496,
-        51556392960,
-        105587492782080,
-        216243185217699840,
-        103112785920,
-        34376540160,
-        70403154247680,
-        144185659899248640,
-        72092829949624320,
-        60133736448,
-        120267472896,
-        240534945792,
-        492615568982016,
-        17652315586560,
-        35304631173120,
-        70609262346240,
-        34477178880,
-        34376527872,
-        70403129081856,
-        144185608359641088,
-        288371216719282176,
-        60146319360,
-        120292638720,
-        240585277440,
-        123179662049280,
-        51548000256,
-        103096000512,
-        211140609048576,
-        432415967331483648,
-        51564773376,
-        103129546752,
-        105604655874048,
-        211209311748096,
-        52828097740800,
-        105656195481600,
-        51589939200,
-        103179878400,
-        34384908288,
-        70420292173824,
-        140840584347648,
-        288441516743983104,
-        34410078208,
-        70471840169984,
-        35235920084992,
-        144326328668127232,
-        35244501630976,
-        70489003261952,
-        34418458624,
-        140978006523904,
-        60137930752,
-        120275861504,
-        240551723008,
-        246324964360192,
-        34384912384,
-        70420300562432,
-        140840601124864,
-        144220775551860736,
-        51552190464,
-        103104380928,
-        211157772140544,
-        422315544281088,
-        34410086400,
-        70471856947200,
-        35235928473600,
-        72163181513932800,
-    ],
-    17179869184: [
-        13219909337088,
-        8856222564352,
-        128849018880,
-        257698037760,
-        17188261890,
-        35201560350720,
-        72092795598274560,
-        147646045385266298880,
-        44006234914816,
-        70428873719808,
-        140857747439616,
-        21487419392,
-        25778196480,
-        52793746391040,
-        108121592608849920,
-        51556392960,
-        17188270080,
-        35201577123840,
-        72092829949624320,
-        36046414974812160,
-        8826157793280,
-        60133736448,
-        120267472896,
-        246307784491008,
-        18023220372307968,
-        17652315586560,
-        35304631173120,
-        17238589440,
-        17188263936,
-        35201564540928,
-        72092804179820544,
-        144185608359641088,
-        8821871214592,
-        60146319360,
-        120292638720,
-        18067192247484416,
-        25774000128,
-        51548000256,
-        105570304524288,
-        216207983665741824,
-        25782386688,
-        51564773376,
-        52802327937024,
-        105604655874048,
-        18032016465330176,
-        52828097740800,
-        25794969600,
-        51589939200,
-        17192454144,
-        35210146086912,
-        70420292173824,
-        144220758371991552,
-        17205039104,
-        35235920084992,
-        17617960042496,
-        72163164334063616,
-        26414048870400,
-        35244501630976,
-        17209229312,
-        70489003261952,
-        8821867020288,
-        60137930752,
-        120275861504,
-        123162482180096,
-        17192456192,
-        35210150281216,
-        70420300562432,
-        72110387775930368,
-        30068965376,
-        51552190464,
-        105578886070272,
-        211157772140544,
-        17205043200,
-        35235928473600,
-        17617964236800,
-        36081590756966400,
-    ],
-    8589934592: [
-        15401752723456,
-        13219909337088,
-        8856222564352,
-        128849018880,
-        8594130945,
-        17600780175360,
-        36046397799137280,
-        73823022692633149440,
-        30794915512320,
-        44006234914816,
-        70428873719808,
-        15036579840,
-        8804687153152,
-        18031999289655296,
-        36929534545214046208,
-        25778196480,
-        8594135040,
-        17600788561920,
-        36046414974812160,
-        36911511350611542016,
-        13204876951552,
-        8826157793280,
-        60133736448,
-        123153892245504,
-        9020401984208896,
-        18023220372307968,
-        17652315586560,
-        8619294720,
-        8596228096,
-        17605075140608,
-        36055193887965184,
-        72092804179820544,
-        13202733662208,
-        8821871214592,
-        60146319360,
-        27039198540201984,
-        8808980021248,
-        25774000128,
-        52785152262144,
-        108103991832870912,
-        8808982118400,
-        25782386688,
-        18040795378483200,
-        52802327937024,
-        27030402447179776,
-        18032016465330176,
-        8804695539712,
-        25794969600,
-        12891193344,
-        26401163968512,
-        35210146086912,
-        72110379185995776,
-        8602519552,
-        17617960042496,
-        18023207487406080,
-        36081582167031808,
-        18027601238949888,
-        26414048870400,
-        12897484800,
-        35244501630976,
-        13207024435200,
-        8821867020288,
-        60137930752,
-        18067183657549824,
-        12889098240,
-        26396873195520,
-        35210150281216,
-        54060796304424960,
-        8811125407744,
-        30068965376,
-        61581241090048,
-        105578886070272,
-        8602521600,
-        17617964236800,
-        18023203196633088,
-        36911520146704564224,
-    ],
-    4294967296: [
-        8053063680,
-        7520387072,
-        6455033856,
-        4324327424,
-        1329227995784915872903807064577410048,
-        8800390087680,
-        18023198899568640,
-        36911511346316574720,
-        8803609214976,
-        15036579840,
-        21487419392,
-        4298637312,
-        6444549120,
-        13198436597760,
-        27030398152212480,
-        4299163649,
-        4297065473,
-        8800390088704,
-        18023198901665792,
-        9011603743703040,
-        7516717056,
-        6447693824,
-        4309647360,
-        8826157793280,
-        2206539448320,
-        4404493156352,
-        8800400572416,
-        4297070592,
-        4297065984,
-        8800391135232,
-        18023201044955136,
-        17605075140608,
-        7518289920,
-        6446647296,
-        4307554304,
-        15397457756160,
-        6443500032,
-        4301259776,
-        8808980021248,
-        18040791083515904,
-        6445596672,
-        4301260800,
-        13200581984256,
-        8808982118400,
-        6603512217600,
-        13198438694912,
-        6444550144,
-        4299167744,
-        4298113536,
-        8802536521728,
-        12891193344,
-        26401163968512,
-        4297067520,
-        8800394280960,
-        4404490010624,
-        18023207487406080,
-        4405562703872,
-        8802539667456,
-        4298115072,
-        12897484800,
-        7517241344,
-        6448742400,
-        4307552256,
-        13207024435200,
-        4298114048,
-        8802537570304,
-        12889098240,
-        18027596943982592,
-        6444023808,
-        4302307328,
-        8811125407744,
-        30068965376,
-        4297066497,
-        8800392185856,
-        4404491059200,
-        9020397689241600,
-    ],
-    2147483648: [
-        4026531840,
-        8053063680,
-        7520387072,
-        6455033856,
-        664613997892457936451903532288705024,
-        4400195043840,
-        9011599449784320,
-        18455755673158287360,
-        4401804607488,
-        8803609214976,
-        15036579840,
-        2149318656,
-        3222274560,
-        6599218298880,
-        13515199076106240,
-        6444549120,
-        2148533760,
-        4400197140480,
-        9011603743703040,
-        4505801871851520,
-        3758358528,
-        7516717056,
-        6447693824,
-        13204876951552,
-        1103269724160,
-        2206539448320,
-        4404493156352,
-        2150631424,
-        2148532992,
-        4400195567616,
-        9011600522477568,
-        18023201044955136,
-        3759144960,
-        7518289920,
-        6446647296,
-        7698728878080,
-        3221750016,
-        6443500032,
-        13196288065536,
-        27025997958217728,
-        3222798336,
-        6445596672,
-        6600290992128,
-        13200581984256,
-        3301756108800,
-        6603512217600,
-        3224371200,
-        6444550144,
-        2149056768,
-        4401268260864,
-        8802536521728,
-        18027594796498944,
-        2150629888,
-        4404490010624,
-        2202245005312,
-        9020395541757952,
-        2202781351936,
-        4405562703872,
-        2151153664,
-        8802539667456,
-        3758620672,
-        7517241344,
-        6448742400,
-        15395310272512,
-        2149057024,
-        4401268785152,
-        8802537570304,
-        9013798471991296,
-        3222011904,
-        6444023808,
-        13197360758784,
-        8811125407744,
-        2150630400,
-        4404491059200,
-        2202245529600,
-        4510198844620800,
-    ],
-    1073741824: [
-        2013265920,
-        4026531840,
-        8053063680,
-        7520387072,
-        332306998946228968225951766144352512,
-        2200097521920,
-        4505799724892160,
-        9227877836579143680,
-        2200902303744,
-        4401804607488,
-        8803609214976,
-        1074659328,
-        1611137280,
-        3299609149440,
-        6757599538053120,
-        3222274560,
-        1074266880,
-        2200098570240,
-        4505801871851520,
-        2252900935925760,
-        1879179264,
-        3758358528,
-        7516717056,
-        15394236530688,
-        551634862080,
-        1103269724160,
-        2206539448320,
-        1077411840,
-        1074266496,
-        2200097783808,
-        4505800261238784,
-        9011600522477568,
-        1879572480,
-        3759144960,
-        7518289920,
-        3849364439040,
-        1610875008,
-        3221750016,
-        6598144032768,
-        13512998979108864,
-        1611399168,
-        3222798336,
-        3300145496064,
-        6600290992128,
-        1650878054400,
-        3301756108800,
-        1612185600,
-        3224371200,
-        1074528384,
-        2200634130432,
-        4401268260864,
-        9013797398249472,
-        1075314944,
-        2202245005312,
-        1101122502656,
-        4510197770878976,
-        1101390675968,
-        2202781351936,
-        1075576832,
-        4405562703872,
-        1879310336,
-        3758620672,
-        7517241344,
-        7697655136256,
-        1074528512,
-        2200634392576,
-        4401268785152,
-        4506899235995648,
-        1611005952,
-        3222011904,
-        6598680379392,
-        13197360758784,
-        1075315200,
-        2202245529600,
-        1101122764800,
-        2255099422310400,
-    ],
-    536870912: [
-        1006632960,
-        2013265920,
-        4026531840,
-        8053063680,
-        166153499473114484112975883072176256,
-        1100048760960,
-        2252899862446080,
-        4613938918289571840,
-        1100451151872,
-        2200902303744,
-        4401804607488,
-        537329664,
-        805568640,
-        1649804574720,
-        3378799769026560,
-        1611137280,
-        537133440,
-        1100049285120,
-        2252900935925760,
-        1126450467962880,
-        939589632,
-        1879179264,
-        3758358528,
-        7697118265344,
-        275817431040,
-        551634862080,
-        1103269724160,
-        538705920,
-        537133248,
-        1100048891904,
-        2252900130619392,
-        4505800261238784,
-        939786240,
-        1879572480,
-        3759144960,
-        1924682219520,
-        805437504,
-        1610875008,
-        3299072016384,
-        6756499489554432,
-        805699584,
-        1611399168,
-        1650072748032,
-        3300145496064,
-        825439027200,
-        1650878054400,
-        806092800,
-        1612185600,
-        537264192,
-        1100317065216,
-        2200634130432,
-        4506898699124736,
-        537657472,
-        1101122502656,
-        550561251328,
-        2255098885439488,
-        550695337984,
-        1101390675968,
-        537788416,
-        2202781351936,
-        939655168,
-        1879310336,
-        3758620672,
-        3848827568128,
-        537264256,
-        1100317196288,
-        2200634392576,
-        2253449617997824,
-        805502976,
-        1611005952,
-        3299340189696,
-        6598680379392,
-        537657600,
-        1101122764800,
-        550561382400,
-        1127549711155200,
-    ],
-    268435456: [
-        503316480,
-        1006632960,
-        2013265920,
-        4026531840,
-        83076749736557242056487941536088128,
-        550024380480,
-        1126449931223040,
-        2306969459144785920,
-        550225575936,
-        1100451151872,
-        2200902303744,
-        268664832,
-        402784320,
-        824902287360,
-        1689399884513280,
-        805568640,
-        268566720,
-        550024642560,
-        1126450467962880,
-        563225233981440,
-        469794816,
-        939589632,
-        1879179264,
-        3848559132672,
-        137908715520,
-        275817431040,
-        551634862080,
-        269352960,
-        268566624,
-        550024445952,
-        1126450065309696,
-        2252900130619392,
-        469893120,
-        939786240,
-        1879572480,
-        962341109760,
-        402718752,
-        805437504,
-        1649536008192,
-        3378249744777216,
-        402849792,
-        805699584,
-        825036374016,
-        1650072748032,
-        412719513600,
-        825439027200,
-        403046400,
-        806092800,
-        268632096,
-        550158532608,
-        1100317065216,
-        2253449349562368,
-        268828736,
-        550561251328,
-        275280625664,
-        1127549442719744,
-        275347668992,
-        550695337984,
-        268894208,
-        1101390675968,
-        469827584,
-        939655168,
-        1879310336,
-        1924413784064,
-        268632128,
-        550158598144,
-        1100317196288,
-        1126724808998912,
-        402751488,
-        805502976,
-        1649670094848,
-        3299340189696,
-        268828800,
-        550561382400,
-        275280691200,
-        563774855577600,
-    ],
-    134217728: [
-        251658240,
-        503316480,
-        1006632960,
-        2013265920,
-        41538374868278621028243970768044064,
-        275012190240,
-        563224965611520,
-        1153484729572392960,
-        275112787968,
-        550225575936,
-        1100451151872,
-        134332416,
-        201392160,
-        412451143680,
-        844699942256640,
-        402784320,
-        134283360,
-        275012321280,
-        563225233981440,
-        281612616990720,
-        234897408,
-        469794816,
-        939589632,
-        1924279566336,
-        68954357760,
-        137908715520,
-        275817431040,
-        134676480,
-        134283312,
-        275012222976,
-        563225032654848,
-        1126450065309696,
-        234946560,
-        469893120,
-        939786240,
-        481170554880,
-        201359376,
-        402718752,
-        824768004096,
-        1689124872388608,
-        201424896,
-        402849792,
-        412518187008,
-        825036374016,
-        206359756800,
-        412719513600,
-        201523200,
-        403046400,
-        134316048,
-        275079266304,
-        550158532608,
-        1126724674781184,
-        134414368,
-        275280625664,
-        137640312832,
-        563774721359872,
-        137673834496,
-        275347668992,
-        134447104,
-        550695337984,
-        234913792,
-        469827584,
-        939655168,
-        962206892032,
-        134316064,
-        275079299072,
-        550158598144,
-        563362404499456,
-        201375744,
-        402751488,
-        824835047424,
-        1649670094848,
-        134414400,
-        275280691200,
-        137640345600,
-        281887427788800,
-    ],
-    67108864: [
-        125829120,
-        251658240,
-        503316480,
-        1006632960,
-        20769187434139310514121985384022032,
-        137506095120,
-        281612482805760,
-        576742364786196480,
-        137556393984,
-        275112787968,
-        550225575936,
-        67166208,
-        100696080,
-        206225571840,
-        422349971128320,
-        201392160,
-        67141680,
-        137506160640,
-        281612616990720,
-        140806308495360,
-        117448704,
-        234897408,
-        469794816,
-        962139783168,
-        34477178880,
-        68954357760,
-        137908715520,
-        67338240,
-        67141656,
-        137506111488,
-        281612516327424,
-        563225032654848,
-        117473280,
-        234946560,
-        469893120,
-        240585277440,
-        100679688,
-        201359376,
-        412384002048,
-        844562436194304,
-        100712448,
-        201424896,
-        206259093504,
-        412518187008,
-        103179878400,
-        206359756800,
-        100761600,
-        201523200,
-        67158024,
-        137539633152,
-        275079266304,
-        563362337390592,
-        67207184,
-        137640312832,
-        68820156416,
-        281887360679936,
-        68836917248,
-        137673834496,
-        67223552,
-        275347668992,
-        117456896,
-        234913792,
-        469827584,
-        481103446016,
-        67158032,
-        137539649536,
-        275079299072,
-        281681202249728,
-        100687872,
-        201375744,
-        412417523712,
-        824835047424,
-        67207200,
-        137640345600,
-        68820172800,
-        140943713894400,
-    ],
-    33554432: [
-        62914560,
-        125829120,
-        251658240,
-        503316480,
-        10384593717069655257060992692011016,
-        68753047560,
-        140806241402880,
-        288371182393098240,
-        68778196992,
-        137556393984,
-        275112787968,
-        33583104,
-        50348040,
-        103112785920,
-        211174985564160,
-        100696080,
-        33570840,
-        68753080320,
-        140806308495360,
-        70403154247680,
-        58724352,
-        117448704,
-        234897408,
-        481069891584,
-        17238589440,
-        34477178880,
-        68954357760,
-        33669120,
-        33570828,
-        68753055744,
-        140806258163712,
-        281612516327424,
-        58736640,
-        117473280,
-        234946560,
-        120292638720,
-        50339844,
-        100679688,
-        206192001024,
-        422281218097152,
-        50356224,
-        100712448,
-        103129546752,
-        206259093504,
-        51589939200,
-        103179878400,
-        50380800,
-        100761600,
-        33579012,
-        68769816576,
-        137539633152,
-        281681168695296,
-        33603592,
-        68820156416,
-        34410078208,
-        140943680339968,
-        34418458624,
-        68836917248,
-        33611776,
-        137673834496,
-        58728448,
-        117456896,
-        234913792,
-        240551723008,
-        33579016,
-        68769824768,
-        137539649536,
-        140840601124864,
-        50343936,
-        100687872,
-        206208761856,
-        412417523712,
-        33603600,
-        68820172800,
-        34410086400,
-        70471856947200,
-    ],
-    16777216: [
-        4324327424,
-        62914560,
-        125829120,
-        251658240,
-        5192296858534827628530496346005508,
-        34376523780,
-        70403120701440,
-        144185591196549120,
-        34389098496,
-        68778196992,
-        137556393984,
-        16791552,
-        25174020,
-        51556392960,
-        105587492782080,
-        50348040,
-        16785420,
-        34376540160,
-        70403154247680,
-        35201577123840,
-        29362176,
-        58724352,
-        117448704,
-        240534945792,
-        8619294720,
-        17238589440,
-        34477178880,
-        16834560,
-        16785414,
-        34376527872,
-        70403129081856,
-        140806258163712,
-        29368320,
-        58736640,
-        117473280,
-        60146319360,
-        25169922,
-        50339844,
-        103096000512,
-        211140609048576,
-        25178112,
-        50356224,
-        51564773376,
-        103129546752,
-        25794969600,
-        51589939200,
-        25190400,
-        50380800,
-        16789506,
-        34384908288,
-        68769816576,
-        140840584347648,
-        16801796,
-        34410078208,
-        17205039104,
-        70471840169984,
-        17209229312,
-        34418458624,
-        16805888,
-        68836917248,
-        29364224,
-        58728448,
-        117456896,
-        120275861504,
-        16789508,
-        34384912384,
-        68769824768,
-        70420300562432,
-        25171968,
-        50343936,
-        103104380928,
-        206208761856,
-        16801800,
-        34410086400,
-        17205043200,
-        35235928473600,
-    ],
-    8388608: [
-        6455033856,
-        4324327424,
-        62914560,
-        125829120,
-        2596148429267413814265248173002754,
-        17188261890,
-        35201560350720,
-        72092795598274560,
-        21487419392,
-        34389098496,
-        68778196992,
-        10491904,
-        12587010,
-        25778196480,
-        52793746391040,
-        25174020,
-        8392710,
-        17188270080,
-        35201577123840,
-        17600788561920,
-        4309647360,
-        29362176,
-        58724352,
-        120267472896,
-        8800400572416,
-        8619294720,
-        17238589440,
-        8417280,
-        8392707,
-        17188263936,
-        35201564540928,
-        70403129081856,
-        4307554304,
-        29368320,
-        58736640,
-        8821871214592,
-        12584961,
-        25169922,
-        51548000256,
-        105570304524288,
-        12589056,
-        25178112,
-        25782386688,
-        51564773376,
-        8804695539712,
-        25794969600,
-        12595200,
-        25190400,
-        8394753,
-        17192454144,
-        34384908288,
-        70420292173824,
-        8400898,
-        17205039104,
-        8602519552,
-        35235920084992,
-        12897484800,
-        17209229312,
-        8402944,
-        34418458624,
-        4307552256,
-        29364224,
-        58728448,
-        60137930752,
-        8394754,
-        17192456192,
-        34384912384,
-        35210150281216,
-        14682112,
-        25171968,
-        51552190464,
-        103104380928,
-        8400900,
-        17205043200,
-        8602521600,
-        17617964236800,
-    ],
-    4194304: [
-        7520387072,
-        6455033856,
-        4324327424,
-        62914560,
-        1298074214633706907132624086501377,
-        8594130945,
-        17600780175360,
-        36046397799137280,
-        15036579840,
-        21487419392,
-        34389098496,
-        7342080,
-        4299163649,
-        8804687153152,
-        18031999289655296,
-        12587010,
-        4196355,
-        8594135040,
-        17600788561920,
-        18023198901665792,
-        6447693824,
-        4309647360,
-        29362176,
-        60133736448,
-        4404493156352,
-        8800400572416,
-        8619294720,
-        4208640,
-        4197377,
-        8596228096,
-        17605075140608,
-        35201564540928,
-        6446647296,
-        4307554304,
-        29368320,
-        13202733662208,
-        4301259776,
-        12584961,
-        25774000128,
-        52785152262144,
-        4301260800,
-        12589056,
-        8808982118400,
-        25782386688,
-        13198438694912,
-        8804695539712,
-        4299167744,
-        12595200,
-        6294528,
-        12891193344,
-        17192454144,
-        35210146086912,
-        4200449,
-        8602519552,
-        8800394280960,
-        17617960042496,
-        8802539667456,
-        12897484800,
-        6297600,
-        17209229312,
-        6448742400,
-        4307552256,
-        29364224,
-        8821867020288,
-        6293505,
-        12889098240,
-        17192456192,
-        26396873195520,
-        4302307328,
-        14682112,
-        30068965376,
-        51552190464,
-        4200450,
-        8602521600,
-        8800392185856,
-        18023203196633088,
-    ],
-    2097152: [
-        3932160,
-        3672064,
-        3151872,
-        2111488,
-        1329877032892232726357373372323595264,
-        1329227995784915872903807064577410048,
-        8800390087680,
-        18023198899568640,
-        4298637312,
-        7342080,
-        10491904,
-        2098944,
-        1329227995784915872903807060283491328,
-        6444549120,
-        13198436597760,
-        1298074214633706907132624084404225,
-        1330526069999549579810939684364747776,
-        4297065473,
-        8800390088704,
-        4400197140480,
-        3670272,
-        3148288,
-        2104320,
-        4309647360,
-        1077411840,
-        2150631424,
-        4297070592,
-        2098179,
-        1993841993677373809355710590422615040,
-        4297065984,
-        8800391135232,
-        8596228096,
-        3671040,
-        3147777,
-        2103298,
-        7518289920,
-        664613997892457936451903530143318528,
-        1329227995784915872903807060282444800,
-        4301259776,
-        8808980021248,
-        3147264,
-        2100225,
-        6445596672,
-        4301260800,
-        3224371200,
-        6444550144,
-        3146753,
-        2099203,
-        664613997892457936451903530142270976,
-        4298113536,
-        6294528,
-        12891193344,
-        1329227995784915872903807060282442753,
-        4297067520,
-        2150629888,
-        8800394280960,
-        2151153664,
-        4298115072,
-        2098689,
-        6297600,
-        3670528,
-        3148800,
-        2103297,
-        6448742400,
-        1329227995784915872903807060282443264,
-        4298114048,
-        6293505,
-        8802537570304,
-        3146496,
-        2100736,
-        4302307328,
-        14682112,
-        1298074214633706907132624084403201,
-        4297066497,
-        2150630400,
-        4404491059200,
-    ],
-    1048576: [
-        1966080,
-        3932160,
-        3672064,
-        3151872,
-        664938516446116363178686686161797632,
-        664613997892457936451903532288705024,
-        4400195043840,
-        9011599449784320,
-        2149318656,
-        4298637312,
-        7342080,
-        1049472,
-        664613997892457936451903530141745664,
-        3222274560,
-        6599218298880,
-        1329227995784915872903807060283491328,
-        1993841993677373809355710590421565952,
-        2148533760,
-        4400197140480,
-        2200098570240,
-        1835136,
-        3670272,
-        3148288,
-        6447693824,
-        538705920,
-        1077411840,
-        2150631424,
-        1050113,
-        996920996838686904677855295211307520,
-        2148532992,
-        4400195567616,
-        8800391135232,
-        1835520,
-        3671040,
-        3147777,
-        3759144960,
-        332306998946228968225951765071659264,
-        664613997892457936451903530143318528,
-        6443500032,
-        13196288065536,
-        1573632,
-        3147264,
-        3222798336,
-        6445596672,
-        1612185600,
-        3224371200,
-        1574400,
-        3146753,
-        332306998946228968225951765071135488,
-        2149056768,
-        4298113536,
-        8802536521728,
-        664613997892457936451903530141222400,
-        2150629888,
-        1075314944,
-        4404490010624,
-        1075576832,
-        2151153664,
-        1050368,
-        4298115072,
-        1835264,
-        3670528,
-        3148800,
-        7517241344,
-        664613997892457936451903530141221632,
-        2149057024,
-        4298114048,
-        4401268785152,
-        1573248,
-        3146496,
-        6444023808,
-        4302307328,
-        1329227995784915872903807060281394688,
-        2150630400,
-        1075315200,
-        2202245529600,
-    ],
-    524288: [
-        983040,
-        1966080,
-        3932160,
-        3672064,
-        332469258223058181589343343080898816,
-        332306998946228968225951766144352512,
-        2200097521920,
-        4505799724892160,
-        1074659328,
-        2149318656,
-        4298637312,
-        524736,
-        332306998946228968225951765070872832,
-        1611137280,
-        3299609149440,
-        664613997892457936451903530141745664,
-        996920996838686904677855295210782976,
-        1074266880,
-        2200098570240,
-        1100049285120,
-        917568,
-        1835136,
-        3670272,
-        7516717056,
-        269352960,
-        538705920,
-        1077411840,
-        526080,
-        498460498419343452338927647605653760,
-        1074266496,
-        2200097783808,
-        4400195567616,
-        917760,
-        1835520,
-        3671040,
-        1879572480,
-        166153499473114484112975882535829632,
-        332306998946228968225951765071659264,
-        3221750016,
-        6598144032768,
-        786816,
-        1573632,
-        1611399168,
-        3222798336,
-        806092800,
-        1612185600,
-        787200,
-        1574400,
-        166153499473114484112975882535567744,
-        1074528384,
-        2149056768,
-        4401268260864,
-        332306998946228968225951765070611200,
-        1075314944,
-        537657472,
-        2202245005312,
-        537788416,
-        1075576832,
-        525184,
-        2151153664,
-        917632,
-        1835264,
-        3670528,
-        3758620672,
-        332306998946228968225951765070610816,
-        1074528512,
-        2149057024,
-        2200634392576,
-        786624,
-        1573248,
-        3222011904,
-        6444023808,
-        664613997892457936451903530140697344,
-        1075315200,
-        537657600,
-        1101122764800,
-    ],
-    262144: [
-        491520,
-        983040,
-        1966080,
-        3932160,
-        166234629111529090794671671540449408,
-        166153499473114484112975883072176256,
-        1100048760960,
-        2252899862446080,
-        537329664,
-        1074659328,
-        2149318656,
-        262368,
-        166153499473114484112975882535436416,
-        805568640,
-        1649804574720,
-        332306998946228968225951765070872832,
-        498460498419343452338927647605391488,
-        537133440,
-        1100049285120,
-        550024642560,
-        458784,
-        917568,
-        1835136,
-        3758358528,
-        134676480,
-        269352960,
-        538705920,
-        263040,
-        249230249209671726169463823802826880,
-        537133248,
-        1100048891904,
-        2200097783808,
-        458880,
-        917760,
-        1835520,
-        939786240,
-        83076749736557242056487941267914816,
-        166153499473114484112975882535829632,
-        1610875008,
-        3299072016384,
-        393408,
-        786816,
-        805699584,
-        1611399168,
-        403046400,
-        806092800,
-        393600,
-        787200,
-        83076749736557242056487941267783872,
-        537264192,
-        1074528384,
-        2200634130432,
-        166153499473114484112975882535305600,
-        537657472,
-        268828736,
-        1101122502656,
-        268894208,
-        537788416,
-        262592,
-        1075576832,
-        458816,
-        917632,
-        1835264,
-        1879310336,
-        166153499473114484112975882535305408,
-        537264256,
-        1074528512,
-        1100317196288,
-        393312,
-        786624,
-        1611005952,
-        3222011904,
-        332306998946228968225951765070348672,
-        537657600,
-        268828800,
-        550561382400,
-    ],
-    131072: [
-        245760,
-        491520,
-        983040,
-        1966080,
-        83117314555764545397335835770224704,
-        83076749736557242056487941536088128,
-        550024380480,
-        1126449931223040,
-        268664832,
-        537329664,
-        1074659328,
-        131184,
-        83076749736557242056487941267718208,
-        402784320,
-        824902287360,
-        166153499473114484112975882535436416,
-        249230249209671726169463823802695744,
-        268566720,
-        550024642560,
-        275012321280,
-        229392,
-        458784,
-        917568,
-        1879179264,
-        67338240,
-        134676480,
-        269352960,
-        131520,
-        124615124604835863084731911901413440,
-        268566624,
-        550024445952,
-        1100048891904,
-        229440,
-        458880,
-        917760,
-        469893120,
-        41538374868278621028243970633957408,
-        83076749736557242056487941267914816,
-        805437504,
-        1649536008192,
-        196704,
-        393408,
-        402849792,
-        805699584,
-        201523200,
-        403046400,
-        196800,
-        393600,
-        41538374868278621028243970633891936,
-        268632096,
-        537264192,
-        1100317065216,
-        83076749736557242056487941267652800,
-        268828736,
-        134414368,
-        550561251328,
-        134447104,
-        268894208,
-        131296,
-        537788416,
-        229408,
-        458816,
-        917632,
-        939655168,
-        83076749736557242056487941267652704,
-        268632128,
-        537264256,
-        550158598144,
-        196656,
-        393312,
-        805502976,
-        1611005952,
-        166153499473114484112975882535174336,
-        268828800,
-        134414400,
-        275280691200,
-    ],
-    65536: [
-        122880,
-        245760,
-        491520,
-        983040,
-        41558657277882272698667917885112352,
-        41538374868278621028243970768044064,
-        275012190240,
-        563224965611520,
-        134332416,
-        268664832,
-        537329664,
-        65592,
-        41538374868278621028243970633859104,
-        201392160,
-        412451143680,
-        83076749736557242056487941267718208,
-        124615124604835863084731911901347872,
-        134283360,
-        275012321280,
-        137506160640,
-        114696,
-        229392,
-        458784,
-        939589632,
-        33669120,
-        67338240,
-        134676480,
-        65760,
-        62307562302417931542365955950706720,
-        134283312,
-        275012222976,
-        550024445952,
-        114720,
-        229440,
-        458880,
-        234946560,
-        20769187434139310514121985316978704,
-        41538374868278621028243970633957408,
-        402718752,
-        824768004096,
-        98352,
-        196704,
-        201424896,
-        402849792,
-        100761600,
-        201523200,
-        98400,
-        196800,
-        20769187434139310514121985316945968,
-        134316048,
-        268632096,
-        550158532608,
-        41538374868278621028243970633826400,
-        134414368,
-        67207184,
-        275280625664,
-        67223552,
-        134447104,
-        65648,
-        268894208,
-        114704,
-        229408,
-        458816,
-        469827584,
-        41538374868278621028243970633826352,
-        134316064,
-        268632128,
-        275079299072,
-        98328,
-        196656,
-        402751488,
-        805502976,
-        83076749736557242056487941267587168,
-        134414400,
-        67207200,
-        137640345600,
-    ],
-    32768: [
-        61440,
-        122880,
-        245760,
-        491520,
-        20779328638941136349333958942556176,
-        20769187434139310514121985384022032,
-        137506095120,
-        281612482805760,
-        67166208,
-        134332416,
-        268664832,
-        32796,
-        20769187434139310514121985316929552,
-        100696080,
-        206225571840,
-        41538374868278621028243970633859104,
-        62307562302417931542365955950673936,
-        67141680,
-        137506160640,
-        68753080320,
-        57348,
-        114696,
-        229392,
-        469794816,
-        16834560,
-        33669120,
-        67338240,
-        32880,
-        31153781151208965771182977975353360,
-        67141656,
-        137506111488,
-        275012222976,
-        57360,
-        114720,
-        229440,
-        117473280,
-        10384593717069655257060992658489352,
-        20769187434139310514121985316978704,
-        201359376,
-        412384002048,
-        49176,
-        98352,
-        100712448,
-        201424896,
-        50380800,
-        100761600,
-        49200,
-        98400,
-        10384593717069655257060992658472984,
-        67158024,
-        134316048,
-        275079266304,
-        20769187434139310514121985316913200,
-        67207184,
-        33603592,
-        137640312832,
-        33611776,
-        67223552,
-        32824,
-        134447104,
-        57352,
-        114704,
-        229408,
-        234913792,
-        20769187434139310514121985316913176,
-        67158032,
-        134316064,
-        137539649536,
-        49164,
-        98328,
-        201375744,
-        402751488,
-        41538374868278621028243970633793584,
-        67207200,
-        33603600,
-        68820172800,
-    ],
-    16384: [
-        30720,
-        61440,
-        122880,
-        245760,
-        10389664319470568174666979471278088,
-        10384593717069655257060992692011016,
-        68753047560,
-        140806241402880,
-        33583104,
-        67166208,
-        134332416,
-        16398,
-        10384593717069655257060992658464776,
-        50348040,
-        103112785920,
-        20769187434139310514121985316929552,
-        31153781151208965771182977975336968,
-        33570840,
-        68753080320,
-        34376540160,
-        28674,
-        57348,
-        114696,
-        234897408,
-        8417280,
-        16834560,
-        33669120,
-        16440,
-        15576890575604482885591488987676680,
-        33570828,
-        68753055744,
-        137506111488,
-        28680,
-        57360,
-        114720,
-        58736640,
-        5192296858534827628530496329244676,
-        10384593717069655257060992658489352,
-        100679688,
-        206192001024,
-        24588,
-        49176,
-        50356224,
-        100712448,
-        25190400,
-        50380800,
-        24600,
-        49200,
-        5192296858534827628530496329236492,
-        33579012,
-        67158024,
-        137539633152,
-        10384593717069655257060992658456600,
-        33603592,
-        16801796,
-        68820156416,
-        16805888,
-        33611776,
-        16412,
-        67223552,
-        28676,
-        57352,
-        114704,
-        117456896,
-        10384593717069655257060992658456588,
-        33579016,
-        67158032,
-        68769824768,
-        24582,
-        49164,
-        100687872,
-        201375744,
-        20769187434139310514121985316896792,
-        33603600,
-        16801800,
-        34410086400,
-    ],
-    8192: [
-        2111488,
-        30720,
-        61440,
-        122880,
-        5194832159735284087333489735639044,
-        5192296858534827628530496346005508,
-        34376523780,
-        70403120701440,
-        16791552,
-        33583104,
-        67166208,
-        8199,
-        5192296858534827628530496329232388,
-        25174020,
-        51556392960,
-        10384593717069655257060992658464776,
-        15576890575604482885591488987668484,
-        16785420,
-        34376540160,
-        17188270080,
-        14337,
-        28674,
-        57348,
-        117448704,
-        4208640,
-        8417280,
-        16834560,
-        8220,
-        7788445287802241442795744493838340,
-        16785414,
-        34376527872,
-        68753055744,
-        14340,
-        28680,
-        57360,
-        29368320,
-        2596148429267413814265248164622338,
-        5192296858534827628530496329244676,
-        50339844,
-        103096000512,
-        12294,
-        24588,
-        25178112,
-        50356224,
-        12595200,
-        25190400,
-        12300,
-        24600,
-        2596148429267413814265248164618246,
-        16789506,
-        33579012,
-        68769816576,
-        5192296858534827628530496329228300,
-        16801796,
-        8400898,
-        34410078208,
-        8402944,
-        16805888,
-        8206,
-        33611776,
-        14338,
-        28676,
-        57352,
-        58728448,
-        5192296858534827628530496329228294,
-        16789508,
-        33579016,
-        34384912384,
-        12291,
-        24582,
-        50343936,
-        100687872,
-        10384593717069655257060992658448396,
-        16801800,
-        8400900,
-        17205043200,
-    ],
-    4096: [
-        3151872,
-        2111488,
-        30720,
-        61440,
-        2597416079867642043666744867819522,
-        2596148429267413814265248173002754,
-        17188261890,
-        35201560350720,
-        10491904,
-        16791552,
-        33583104,
-        5123,
-        2596148429267413814265248164616194,
-        12587010,
-        25778196480,
-        5192296858534827628530496329232388,
-        7788445287802241442795744493834242,
-        8392710,
-        17188270080,
-        8594135040,
-        2104320,
-        14337,
-        28674,
-        58724352,
-        4297070592,
-        4208640,
-        8417280,
-        4110,
-        3894222643901120721397872246919170,
-        8392707,
-        17188263936,
-        34376527872,
-        2103298,
-        14340,
-        28680,
-        4307554304,
-        1298074214633706907132624082311169,
-        2596148429267413814265248164622338,
-        25169922,
-        51548000256,
-        6147,
-        12294,
-        12589056,
-        25178112,
-        4299167744,
-        12595200,
-        6150,
-        12300,
-        1298074214633706907132624082309123,
-        8394753,
-        16789506,
-        34384908288,
-        2596148429267413814265248164614150,
-        8400898,
-        4200449,
-        17205039104,
-        6297600,
-        8402944,
-        4103,
-        16805888,
-        2103297,
-        14338,
-        28676,
-        29364224,
-        2596148429267413814265248164614147,
-        8394754,
-        16789508,
-        17192456192,
-        7169,
-        12291,
-        25171968,
-        50343936,
-        5192296858534827628530496329224198,
-        8400900,
-        4200450,
-        8602521600,
-    ],
-    2048: [
-        3672064,
-        3151872,
-        2111488,
-        30720,
-        1298708039933821021833372433909761,
-        1298074214633706907132624086501377,
-        8594130945,
-        17600780175360,
-        7342080,
-        10491904,
-        16791552,
-        3585,
-        1298074214633706907132624084404225,
-        4299163649,
-        8804687153152,
-        2596148429267413814265248164616194,
-        3894222643901120721397872246917121,
-        4196355,
-        8594135040,
-        8800390088704,
-        3148288,
-        2104320,
-        14337,
-        29362176,
-        2150631424,
-        4297070592,
-        4208640,
-        2055,
-        1330526069999549579810939684362651649,
-        4197377,
-        8596228096,
-        17188263936,
-        3147777,
-        2103298,
-        14340,
-        6446647296,
-        1329227995784915872903807060282444800,
-        1298074214633706907132624082311169,
-        12584961,
-        25774000128,
-        2100225,
-        6147,
-        4301260800,
-        12589056,
-        6444550144,
-        4299167744,
-        2099203,
-        6150,
-        1329227995784915872903807060280347649,
-        6294528,
-        8394753,
-        17192454144,
-        1298074214633706907132624082307075,
-        4200449,
-        4297067520,
-        8602519552,
-        4298115072,
-        6297600,
-        3075,
-        8402944,
-        3148800,
-        2103297,
-        14338,
-        4307552256,
-        1298074214633706907132624082308097,
-        6293505,
-        8394754,
-        12889098240,
-        2100736,
-        7169,
-        14682112,
-        25171968,
-        2596148429267413814265248164612099,
-        4200450,
-        4297066497,
-        8800392185856,
-    ],
-    1024: [
-        1920,
-        1793,
-        1539,
-        1031,
-        1329877349804882783414723746497299456,
-        1329877032892232726357373372323595264,
-        1329227995784915872903807064577410048,
-        8800390087680,
-        2098944,
-        3585,
-        5123,
-        2326148992623602777581662355490604032,
-        1329877032892232726357373372321498624,
-        1329227995784915872903807060283491328,
-        6444549120,
-        1298708039933821021833372433908737,
-        1329877666717532840472074120673100800,
-        1330526069999549579810939684364747776,
-        4297065473,
-        2148533760,
-        332306998946228968225951765070087936,
-        664613997892457936451903530140173825,
-        1329227995784915872903807060280345603,
-        2104320,
-        526080,
-        1050113,
-        2098179,
-        1333122218428816993625204932527260672,
-        1330201551445891153084156528342074368,
-        1993841993677373809355710590422615040,
-        4297065984,
-        4197377,
-        1329227995784915872903807060280346368,
-        1298074214633706907132624082306561,
-        2596148429267413814265248164611075,
-        3671040,
-        664938516446116363178686686160750080,
-        1329877032892232726357373372321498113,
-        1329227995784915872903807060282444800,
-        4301259776,
-        1993841993677373809355710590420518400,
-        1330526069999549579810939684362650625,
-        3147264,
-        2100225,
-        1574400,
-        3146753,
-        1330526069999549579810939684362651136,
-        3894222643901120721397872246916097,
-        1994166512231032236082493746441094144,
-        664613997892457936451903530142270976,
-        1329227995784915872903807060280347649,
-        6294528,
-        1331175107106866433264505996403803136,
-        1329227995784915872903807060282442753,
-        664613997892457936451903530141222400,
-        4297067520,
-        1050368,
-        2098689,
-        1995140067892007516262843214502822912,
-        3075,
-        664613997892457936451903530140174080,
-        1329227995784915872903807060280346113,
-        1298074214633706907132624082306051,
-        3148800,
-        1994491030784690662809276902461670400,
-        1329227995784915872903807060282443264,
-        1298074214633706907132624082308097,
-        4298114048,
-        996920996838686904677855295210259968,
-        1993841993677373809355710590420517889,
-        2100736,
-        7169,
-        1330526703824849693925640432714253312,
-        1298074214633706907132624084403201,
-        1329227995784915872903807060281394688,
-        2150630400,
-    ],
-    512: [
-        960,
-        1920,
-        1793,
-        1539,
-        664938674902441391707361873248649728,
-        664938516446116363178686686161797632,
-        664613997892457936451903532288705024,
-        4400195043840,
-        1049472,
-        2098944,
-        3585,
-        1163074496311801388790831177745302016,
-        664938516446116363178686686160749312,
-        664613997892457936451903530141745664,
-        3222274560,
-        1329877032892232726357373372321498624,
-        665587553553433216632252998201901568,
-        1993841993677373809355710590421565952,
-        2148533760,
-        1074266880,
-        166153499473114484112975882535043968,
-        332306998946228968225951765070087936,
-        664613997892457936451903530140173825,
-        3148288,
-        263040,
-        526080,
-        1050113,
-        1995140067892007516262843214502822400,
-        665100775722945576542078264171037184,
-        996920996838686904677855295211307520,
-        2148532992,
-        4297065984,
-        664613997892457936451903530140173184,
-        1329227995784915872903807060280346368,
-        1298074214633706907132624082306561,
-        1835520,
-        332469258223058181589343343080375040,
-        664938516446116363178686686160750080,
-        664613997892457936451903530143318528,
-        6443500032,
-        996920996838686904677855295210259200,
-        1993841993677373809355710590420518400,
-        1573632,
-        3147264,
-        787200,
-        1574400,
-        1993841993677373809355710590420517632,
-        1330526069999549579810939684362651136,
-        997083256115516118041246873220547072,
-        332306998946228968225951765071135488,
-        664613997892457936451903530142270976,
-        4298113536,
-        1994166512231032236082493746441093632,
-        664613997892457936451903530141222400,
-        332306998946228968225951765070611200,
-        2150629888,
-        525184,
-        1050368,
-        2326148992623602777581662355490603520,
-        2098689,
-        332306998946228968225951765070087040,
-        664613997892457936451903530140174080,
-        1329227995784915872903807060280346113,
-        3670528,
-        997245515392345331404638451230835200,
-        664613997892457936451903530141221632,
-        1329227995784915872903807060282443264,
-        2149057024,
-        498460498419343452338927647605129984,
-        996920996838686904677855295210259968,
-        3146496,
-        2100736,
-        1994491030784690662809276902461669888,
-        1329227995784915872903807060281394688,
-        664613997892457936451903530140697344,
-        1075315200,
-    ],
-    256: [
-        480,
-        960,
-        1920,
-        1793,
-        332469337451220695853680936624324864,
-        332469258223058181589343343080898816,
-        332306998946228968225951766144352512,
-        2200097521920,
-        524736,
-        1049472,
-        2098944,
-        581537248155900694395415588872651008,
-        332469258223058181589343343080374656,
-        332306998946228968225951765070872832,
-        1611137280,
-        664938516446116363178686686160749312,
-        332793776776716608316126499100950784,
-        996920996838686904677855295210782976,
-        1074266880,
-        537133440,
-        83076749736557242056487941267521984,
-        166153499473114484112975882535043968,
-        332306998946228968225951765070087936,
-        3670272,
-        131520,
-        263040,
-        526080,
-        2326148992623602777581662355490603264,
-        332550387861472788271039132085518592,
-        498460498419343452338927647605653760,
-        1074266496,
-        2148532992,
-        332306998946228968225951765070086592,
-        664613997892457936451903530140173184,
-        1329227995784915872903807060280346368,
-        917760,
-        166234629111529090794671671540187520,
-        332469258223058181589343343080375040,
-        332306998946228968225951765071659264,
-        3221750016,
-        498460498419343452338927647605129600,
-        996920996838686904677855295210259200,
-        786816,
-        1573632,
-        393600,
-        787200,
-        996920996838686904677855295210258816,
-        1993841993677373809355710590420517632,
-        498541628057758059020623436610273536,
-        166153499473114484112975882535567744,
-        332306998946228968225951765071135488,
-        2149056768,
-        997083256115516118041246873220546816,
-        332306998946228968225951765070611200,
-        166153499473114484112975882535305600,
-        1075314944,
-        262592,
-        525184,
-        1163074496311801388790831177745301760,
-        1050368,
-        166153499473114484112975882535043520,
-        332306998946228968225951765070087040,
-        664613997892457936451903530140174080,
-        1835264,
-        498622757696172665702319225615417600,
-        332306998946228968225951765070610816,
-        664613997892457936451903530141221632,
-        1074528512,
-        249230249209671726169463823802564992,
-        498460498419343452338927647605129984,
-        1573248,
-        3146496,
-        997245515392345331404638451230834944,
-        664613997892457936451903530140697344,
-        332306998946228968225951765070348672,
-        537657600,
-    ],
-    128: [
-        240,
-        480,
-        960,
-        1920,
-        166234668725610347926840468312162432,
-        166234629111529090794671671540449408,
-        166153499473114484112975883072176256,
-        1100048760960,
-        262368,
-        524736,
-        1049472,
-        290768624077950347197707794436325504,
-        166234629111529090794671671540187328,
-        166153499473114484112975882535436416,
-        805568640,
-        332469258223058181589343343080374656,
-        166396888388358304158063249550475392,
-        498460498419343452338927647605391488,
-        537133440,
-        268566720,
-        41538374868278621028243970633760992,
-        83076749736557242056487941267521984,
-        166153499473114484112975882535043968,
-        1835136,
-        65760,
-        131520,
-        263040,
-        1163074496311801388790831177745301632,
-        166275193930736394135519566042759296,
-        249230249209671726169463823802826880,
-        537133248,
-        1074266496,
-        166153499473114484112975882535043296,
-        332306998946228968225951765070086592,
-        664613997892457936451903530140173184,
-        458880,
-        83117314555764545397335835770093760,
-        166234629111529090794671671540187520,
-        166153499473114484112975882535829632,
-        1610875008,
-        249230249209671726169463823802564800,
-        498460498419343452338927647605129600,
-        393408,
-        786816,
-        196800,
-        393600,
-        498460498419343452338927647605129408,
-        996920996838686904677855295210258816,
-        249270814028879029510311718305136768,
-        83076749736557242056487941267783872,
-        166153499473114484112975882535567744,
-        1074528384,
-        498541628057758059020623436610273408,
-        166153499473114484112975882535305600,
-        83076749736557242056487941267652800,
-        537657472,
-        131296,
-        262592,
-        581537248155900694395415588872650880,
-        525184,
-        83076749736557242056487941267521760,
-        166153499473114484112975882535043520,
-        332306998946228968225951765070087040,
-        917632,
-        249311378848086332851159612807708800,
-        166153499473114484112975882535305408,
-        332306998946228968225951765070610816,
-        537264256,
-        124615124604835863084731911901282496,
-        249230249209671726169463823802564992,
-        786624,
-        1573248,
-        498622757696172665702319225615417472,
-        332306998946228968225951765070348672,
-        166153499473114484112975882535174336,
-        268828800,
-    ],
-    64: [
-        120,
-        240,
-        480,
-        960,
-        83117334362805173963420234156081216,
-        83117314555764545397335835770224704,
-        83076749736557242056487941536088128,
-        550024380480,
-        131184,
-        262368,
-        524736,
-        145384312038975173598853897218162752,
-        83117314555764545397335835770093664,
-        83076749736557242056487941267718208,
-        402784320,
-        166234629111529090794671671540187328,
-        83198444194179152079031624775237696,
-        249230249209671726169463823802695744,
-        268566720,
-        134283360,
-        20769187434139310514121985316880496,
-        41538374868278621028243970633760992,
-        83076749736557242056487941267521984,
-        917568,
-        32880,
-        65760,
-        131520,
-        581537248155900694395415588872650816,
-        83137596965368197067759783021379648,
-        124615124604835863084731911901413440,
-        268566624,
-        537133248,
-        83076749736557242056487941267521648,
-        166153499473114484112975882535043296,
-        332306998946228968225951765070086592,
-        229440,
-        41558657277882272698667917885046880,
-        83117314555764545397335835770093760,
-        83076749736557242056487941267914816,
-        805437504,
-        124615124604835863084731911901282400,
-        249230249209671726169463823802564800,
-        196704,
-        393408,
-        98400,
-        196800,
-        249230249209671726169463823802564704,
-        498460498419343452338927647605129408,
-        124635407014439514755155859152568384,
-        41538374868278621028243970633891936,
-        83076749736557242056487941267783872,
-        537264192,
-        249270814028879029510311718305136704,
-        83076749736557242056487941267652800,
-        41538374868278621028243970633826400,
-        268828736,
-        65648,
-        131296,
-        290768624077950347197707794436325440,
-        262592,
-        41538374868278621028243970633760880,
-        83076749736557242056487941267521760,
-        166153499473114484112975882535043520,
-        458816,
-        124655689424043166425579806403854400,
-        83076749736557242056487941267652704,
-        166153499473114484112975882535305408,
-        268632128,
-        62307562302417931542365955950641248,
-        124615124604835863084731911901282496,
-        393312,
-        786624,
-        249311378848086332851159612807708736,
-        166153499473114484112975882535174336,
-        83076749736557242056487941267587168,
-        134414400,
-    ],
-    32: [
-        60,
-        120,
-        240,
-        480,
-        41558667181402586981710117078040608,
-        41558657277882272698667917885112352,
-        41538374868278621028243970768044064,
-        275012190240,
-        65592,
-        131184,
-        262368,
-        72692156019487586799426948609081376,
-        41558657277882272698667917885046832,
-        41538374868278621028243970633859104,
-        201392160,
-        83117314555764545397335835770093664,
-        41599222097089576039515812387618848,
-        124615124604835863084731911901347872,
-        134283360,
-        67141680,
-        10384593717069655257060992658440248,
-        20769187434139310514121985316880496,
-        41538374868278621028243970633760992,
-        458784,
-        16440,
-        32880,
-        65760,
-        290768624077950347197707794436325408,
-        41568798482684098533879891510689824,
-        62307562302417931542365955950706720,
-        134283312,
-        268566624,
-        41538374868278621028243970633760824,
-        83076749736557242056487941267521648,
-        166153499473114484112975882535043296,
-        114720,
-        20779328638941136349333958942523440,
-        41558657277882272698667917885046880,
-        41538374868278621028243970633957408,
-        402718752,
-        62307562302417931542365955950641200,
-        124615124604835863084731911901282400,
-        98352,
-        196704,
-        49200,
-        98400,
-        124615124604835863084731911901282352,
-        249230249209671726169463823802564704,
-        62317703507219757377577929576284192,
-        20769187434139310514121985316945968,
-        41538374868278621028243970633891936,
-        268632096,
-        124635407014439514755155859152568352,
-        41538374868278621028243970633826400,
-        20769187434139310514121985316913200,
-        134414368,
-        32824,
-        65648,
-        145384312038975173598853897218162720,
-        131296,
-        20769187434139310514121985316880440,
-        41538374868278621028243970633760880,
-        83076749736557242056487941267521760,
-        229408,
-        62327844712021583212789903201927200,
-        41538374868278621028243970633826352,
-        83076749736557242056487941267652704,
-        134316064,
-        31153781151208965771182977975320624,
-        62307562302417931542365955950641248,
-        196656,
-        393312,
-        124655689424043166425579806403854368,
-        83076749736557242056487941267587168,
-        41538374868278621028243970633793584,
-        67207200,
-    ],
-    16: [
-        30,
-        60,
-        120,
-        240,
-        20779333590701293490855058539020304,
-        20779328638941136349333958942556176,
-        20769187434139310514121985384022032,
-        137506095120,
-        32796,
-        65592,
-        131184,
-        36346078009743793399713474304540688,
-        20779328638941136349333958942523416,
-        20769187434139310514121985316929552,
-        100696080,
-        41558657277882272698667917885046832,
-        20799611048544788019757906193809424,
-        62307562302417931542365955950673936,
-        67141680,
-        33570840,
-        5192296858534827628530496329220124,
-        10384593717069655257060992658440248,
-        20769187434139310514121985316880496,
-        229392,
-        8220,
-        16440,
-        32880,
-        145384312038975173598853897218162704,
-        20784399241342049266939945755344912,
-        31153781151208965771182977975353360,
-        67141656,
-        134283312,
-        20769187434139310514121985316880412,
-        41538374868278621028243970633760824,
-        83076749736557242056487941267521648,
-        57360,
-        10389664319470568174666979471261720,
-        20779328638941136349333958942523440,
-        20769187434139310514121985316978704,
-        201359376,
-        31153781151208965771182977975320600,
-        62307562302417931542365955950641200,
-        49176,
-        98352,
-        24600,
-        49200,
-        62307562302417931542365955950641176,
-        124615124604835863084731911901282352,
-        31158851753609878688788964788142096,
-        10384593717069655257060992658472984,
-        20769187434139310514121985316945968,
-        134316048,
-        62317703507219757377577929576284176,
-        20769187434139310514121985316913200,
-        10384593717069655257060992658456600,
-        67207184,
-        16412,
-        32824,
-        72692156019487586799426948609081360,
-        65648,
-        10384593717069655257060992658440220,
-        20769187434139310514121985316880440,
-        41538374868278621028243970633760880,
-        114704,
-        31163922356010791606394951600963600,
-        20769187434139310514121985316913176,
-        41538374868278621028243970633826352,
-        67158032,
-        15576890575604482885591488987660312,
-        31153781151208965771182977975320624,
-        98328,
-        196656,
-        62327844712021583212789903201927184,
-        41538374868278621028243970633793584,
-        20769187434139310514121985316896792,
-        33603600,
-    ],
-    8: [
-        15,
-        30,
-        60,
-        120,
-        10389666795350646745427529269510152,
-        10389664319470568174666979471278088,
-        10384593717069655257060992692011016,
-        68753047560,
-        16398,
-        32796,
-        65592,
-        18173039004871896699856737152270344,
-        10389664319470568174666979471261708,
-        10384593717069655257060992658464776,
-        50348040,
-        20779328638941136349333958942523416,
-        10399805524272394009878953096904712,
-        31153781151208965771182977975336968,
-        33570840,
-        16785420,
-        2596148429267413814265248164610062,
-        5192296858534827628530496329220124,
-        10384593717069655257060992658440248,
-        114696,
-        4110,
-        8220,
-        16440,
-        72692156019487586799426948609081352,
-        10392199620671024633469972877672456,
-        15576890575604482885591488987676680,
-        33570828,
-        67141656,
-        10384593717069655257060992658440206,
-        20769187434139310514121985316880412,
-        41538374868278621028243970633760824,
-        28680,
-        5194832159735284087333489735630860,
-        10389664319470568174666979471261720,
-        10384593717069655257060992658489352,
-        100679688,
-        15576890575604482885591488987660300,
-        31153781151208965771182977975320600,
-        24588,
-        49176,
-        12300,
-        24600,
-        31153781151208965771182977975320588,
-        62307562302417931542365955950641176,
-        15579425876804939344394482394071048,
-        5192296858534827628530496329236492,
-        10384593717069655257060992658472984,
-        67158024,
-        31158851753609878688788964788142088,
-        10384593717069655257060992658456600,
-        5192296858534827628530496329228300,
-        33603592,
-        8206,
-        16412,
-        36346078009743793399713474304540680,
-        32824,
-        5192296858534827628530496329220110,
-        10384593717069655257060992658440220,
-        20769187434139310514121985316880440,
-        57352,
-        15581961178005395803197475800481800,
-        10384593717069655257060992658456588,
-        20769187434139310514121985316913176,
-        33579016,
-        7788445287802241442795744493830156,
-        15576890575604482885591488987660312,
-        49164,
-        98328,
-        31163922356010791606394951600963592,
-        20769187434139310514121985316896792,
-        10384593717069655257060992658448396,
-        16801800,
-    ],
-    4: [
-        1031,
-        15,
-        30,
-        60,
-        5194833397675323372713764634755076,
-        5194832159735284087333489735639044,
-        5192296858534827628530496346005508,
-        34376523780,
-        8199,
-        16398,
-        32796,
-        9086519502435948349928368576135172,
-        5194832159735284087333489735630854,
-        5192296858534827628530496329232388,
-        25174020,
-        10389664319470568174666979471261708,
-        5199902762136197004939476548452356,
-        15576890575604482885591488987668484,
-        16785420,
-        8392710,
-        1298074214633706907132624082305031,
-        2596148429267413814265248164610062,
-        5192296858534827628530496329220124,
-        57348,
-        2055,
-        4110,
-        8220,
-        36346078009743793399713474304540676,
-        5196099810335512316734986438836228,
-        7788445287802241442795744493838340,
-        16785414,
-        33570828,
-        5192296858534827628530496329220103,
-        10384593717069655257060992658440206,
-        20769187434139310514121985316880412,
-        14340,
-        2597416079867642043666744867815430,
-        5194832159735284087333489735630860,
-        5192296858534827628530496329244676,
-        50339844,
-        7788445287802241442795744493830150,
-        15576890575604482885591488987660300,
-        12294,
-        24588,
-        6150,
-        12300,
-        15576890575604482885591488987660294,
-        31153781151208965771182977975320588,
-        7789712938402469672197241197035524,
-        2596148429267413814265248164618246,
-        5192296858534827628530496329236492,
-        33579012,
-        15579425876804939344394482394071044,
-        5192296858534827628530496329228300,
-        2596148429267413814265248164614150,
-        16801796,
-        4103,
-        8206,
-        18173039004871896699856737152270340,
-        16412,
-        2596148429267413814265248164610055,
-        5192296858534827628530496329220110,
-        10384593717069655257060992658440220,
-        28676,
-        7790980589002697901598737900240900,
-        5192296858534827628530496329228294,
-        10384593717069655257060992658456588,
-        16789508,
-        3894222643901120721397872246915078,
-        7788445287802241442795744493830156,
-        24582,
-        49164,
-        15581961178005395803197475800481796,
-        10384593717069655257060992658448396,
-        5192296858534827628530496329224198,
-        8400900,
-    ],
-    2: [
-        1539,
-        1031,
-        15,
-        30,
-        2597416698837661686356882317377538,
-        2597416079867642043666744867819522,
-        2596148429267413814265248173002754,
-        17188261890,
-        5123,
-        8199,
-        16398,
-        1333122218428816993625204932527259650,
-        2597416079867642043666744867815427,
-        2596148429267413814265248164616194,
-        12587010,
-        5194832159735284087333489735630854,
-        2599951381068098502469738274226178,
-        7788445287802241442795744493834242,
-        8392710,
-        4196355,
-        1329227995784915872903807060280345603,
-        1298074214633706907132624082305031,
-        2596148429267413814265248164610062,
-        28674,
-        2098179,
-        2055,
-        4110,
-        18173039004871896699856737152270338,
-        2598049905167756158367493219418114,
-        3894222643901120721397872246919170,
-        8392707,
-        16785414,
-        2596148429267413814265248164611075,
-        5192296858534827628530496329220103,
-        10384593717069655257060992658440206,
-        2103298,
-        1298708039933821021833372433907715,
-        2597416079867642043666744867815430,
-        2596148429267413814265248164622338,
-        25169922,
-        3894222643901120721397872246915075,
-        7788445287802241442795744493830150,
-        6147,
-        12294,
-        2099203,
-        6150,
-        7788445287802241442795744493830147,
-        15576890575604482885591488987660294,
-        3894856469201234836098620598517762,
-        1298074214633706907132624082309123,
-        2596148429267413814265248164618246,
-        16789506,
-        7789712938402469672197241197035522,
-        2596148429267413814265248164614150,
-        1298074214633706907132624082307075,
-        8400898,
-        3075,
-        4103,
-        9086519502435948349928368576135170,
-        8206,
-        1298074214633706907132624082306051,
-        2596148429267413814265248164610055,
-        5192296858534827628530496329220110,
-        14338,
-        3895490294501348950799368950120450,
-        2596148429267413814265248164614147,
-        5192296858534827628530496329228294,
-        8394754,
-        1330526069999549579810939684362649603,
-        3894222643901120721397872246915078,
-        12291,
-        24582,
-        7790980589002697901598737900240898,
-        5192296858534827628530496329224198,
-        2596148429267413814265248164612099,
-        4200450,
-    ],
-    1: [
-        1793,
-        1539,
-        1031,
-        15,
-        1298708349418830843178441158688769,
-        1298708039933821021833372433909761,
-        1298074214633706907132624086501377,
-        8594130945,
-        3585,
-        5123,
-        8199,
-        1995140067892007516262843214502821889,
-        1298708039933821021833372433908737,
-        1298074214633706907132624084404225,
-        4299163649,
-        2597416079867642043666744867815427,
-        1299975690534049251234869137113089,
-        3894222643901120721397872246917121,
-        4196355,
-        4297065473,
-        664613997892457936451903530140173825,
-        1329227995784915872903807060280345603,
-        1298074214633706907132624082305031,
-        14337,
-        1050113,
-        2098179,
-        2055,
-        9086519502435948349928368576135169,
-        1947745147250674475399684475060225,
-        1330526069999549579810939684362651649,
-        4197377,
-        8392707,
-        1298074214633706907132624082306561,
-        2596148429267413814265248164611075,
-        5192296858534827628530496329220103,
-        3147777,
-        1329877032892232726357373372321498113,
-        1298708039933821021833372433907715,
-        1298074214633706907132624082311169,
-        12584961,
-        1330526069999549579810939684362650625,
-        3894222643901120721397872246915075,
-        2100225,
-        6147,
-        3146753,
-        2099203,
-        3894222643901120721397872246916097,
-        7788445287802241442795744493830147,
-        1331175107106866433264505996403802113,
-        1329227995784915872903807060280347649,
-        1298074214633706907132624082309123,
-        8394753,
-        3894856469201234836098620598517761,
-        1298074214633706907132624082307075,
-        1329227995784915872903807060282442753,
-        4200449,
-        2098689,
-        3075,
-        1333122218428816993625204932527259649,
-        4103,
-        1329227995784915872903807060280346113,
-        1298074214633706907132624082306051,
-        2596148429267413814265248164610055,
-        2103297,
-        1330526703824849693925640432714252289,
-        1298074214633706907132624082308097,
-        2596148429267413814265248164614147,
-        6293505,
-        1993841993677373809355710590420517889,
-        1330526069999549579810939684362649603,
-        7169,
-        12291,
-        3895490294501348950799368950120449,
-        2596148429267413814265248164612099,
-        1298074214633706907132624084403201,
-        4297066497,
-    ],
-}
+"""
+lookup_table[1 << cell] lists the 76 placements covering that cell, one per
+template in generate_possible_moves, as 121-bit masks.
+
+The table used to be a 9,440-line literal. It is now assembled at import time
+from the placement IDs of each cell, which movegen reads from the shared
+table file, so it costs well under a millisecond and shares its mask objects
+with PLACEMENT_MASKS.
+"""
+
+from .bitmasks import NUM_CELLS
+from .movegen import PLACEMENT_MASKS, TABLES
+
+
+def generate_lookup_table():
+    ids = TABLES.view("lookup_placements")
+    per_cell = len(ids) // NUM_CELLS
+    table = {}
+    for cell in reversed(range(NUM_CELLS)):  # Same key order as the literal
+        start = cell * per_cell
+        table[1 << cell] = [PLACEMENT_MASKS[i] for i in ids[start : start + per_cell]]
+    return table
+
+
+lookup_table = generate_lookup_table()
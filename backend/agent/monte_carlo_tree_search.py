@@ -1,83 +1,300 @@
 from collections import defaultdict
 import math
+import time
+
+from .evaluation import evaluate
+from .movegen import PLACEMENT_IDS
+from .symmetry import unique_up_to_symmetry, worth_folding
+
+# RAVE selection looks at this many of a node's untried moves, the next ones
+# in the order they would be tried, so the root's move ordering still counts
+RAVE_WINDOW = 8
+# Weight of the UCT exploration term in RAVE selection; the AMAF values do
+# most of the exploring, and the full exploration_weight would have every
+# rollout try a new move
+RAVE_EXPLORATION = 0.1
+
+
+def rave_blend(visits, reward, amaf_visits, amaf_reward, k):
+    """Mean of a move's own `reward` over `visits` blended with its AMAF mean,
+    which is trusted less as visits grow (k visits count equally)"""
+    if not amaf_visits:
+        return reward / visits
+    amaf = amaf_reward / amaf_visits
+    if not visits:
+        return amaf
+    beta = math.sqrt(k / (3 * visits + k))
+    return (1 - beta) * reward / visits + beta * amaf
 
 
 class MonteCarloTreeSearch:
     "Monte Carlo tree searcher. First rollout the tree then choose a move."
 
-    def __init__(self, exploration_weight=1.4):
+    def __init__(
+        self,
+        exploration_weight=1.4,
+        leaf_batch=1,
+        simulate_batch=None,
+        rollout_policy="uniform",
+        rollout_depth=None,
+        rave_equivalence=None,
+    ):
         self.Q = defaultdict(int)  # total reward of each node
         self.N = defaultdict(int)  # total visit count for each node
         self.children = dict()  # children of each node
+        # Moves from each expanded node whose child boards have not been made
+        # yet, in the order they are to be tried (last first)
+        self.untried = dict()
         self.exploration_weight = exploration_weight
         self.estimated_max_turns = 0
+        # Playouts run from each new leaf, and optionally a function playing
+        # a list of boards out at once (e.g. batch.simulate) that returns
+        # their rewards as _simulate would; it is also passed rollout_depth
+        # and rollout_policy
+        self.leaf_batch = leaf_batch
+        self.simulate_batch = simulate_batch
+        # "uniform" random playouts, or "frontier" for the cheaper
+        # BitBoard.random_frontier_move
+        self.rollout_policy = rollout_policy
+        # Plies after which a playout stops and the position is scored by
+        # evaluation.evaluate instead (None plays every game to the end)
+        self.rollout_depth = rollout_depth
+        # RAVE: All-Moves-As-First reward and visit totals of each node, as
+        # dicts keyed by placement ID, blended into a move's own mean with
+        # weight sqrt(k / (3 N + k)) for k = rave_equivalence (None turns
+        # RAVE off). They also rank the moves not tried yet (see _rave_select)
+        self.AQ = defaultdict(dict)
+        self.AN = defaultdict(dict)
+        self.rave_equivalence = rave_equivalence
 
     def choose(self, node):
         "Choose the best successor of node. (Choose a move in the game)"
         if node.is_terminal():
             raise RuntimeError(f"choose called on terminal node {node}")
 
-        if node not in self.children:
+        if not self.children.get(node):
             return node.find_random_child()
 
         def score(n):
             if self.N[n] == 0:
                 return float("-inf")  # avoid unseen moves
+            if self.rave_equivalence:
+                # The AMAF statistics count here as they do in selection
+                return self._rave_value(node, n.last_placement_id, self.N[n], self.Q[n])
             return self.Q[n] / self.N[n]  # average reward
 
         return max(self.children[node], key=score)
 
+    def root_stats(self, node):
+        """Visit count, total reward and AMAF visit count and total reward of
+        each child of `node`, keyed by move"""
+        amaf_n = self.AN.get(node, {})
+        amaf_q = self.AQ.get(node, {})
+        stats = {}
+        for child in self.children.get(node, ()):
+            move = child.last_placement_id
+            stats[child.last_move] = (
+                self.N[child],
+                self.Q[child],
+                amaf_n.get(move, 0),
+                amaf_q.get(move, 0),
+            )
+        return stats
+
+    def search(self, node, num_simulations=200, time_budget=None):
+        """Roll out from `node` num_simulations times or, given a time_budget in
+        seconds, until it expires (at least once). Returns the playouts run."""
+        simulations = 0
+        if time_budget is None:
+            while simulations < num_simulations:
+                simulations += self.do_rollout(node)
+            return simulations
+        deadline = time.perf_counter() + time_budget
+        while simulations == 0 or time.perf_counter() < deadline:
+            simulations += self.do_rollout(node)
+        return simulations
+
+    def reroot(self, node):
+        "Keep only `node` and its descendants, dropping unreachable subtrees"
+        reachable = set()
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if n not in reachable:
+                reachable.add(n)
+                stack.extend(self.children.get(n, ()))
+        self.children = {n: c for n, c in self.children.items() if n in reachable}
+        self.untried = {n: m for n, m in self.untried.items() if n in reachable}
+        self.Q = defaultdict(int, {n: q for n, q in self.Q.items() if n in reachable})
+        self.N = defaultdict(int, {n: v for n, v in self.N.items() if n in reachable})
+        self.AQ = defaultdict(dict, {n: q for n, q in self.AQ.items() if n in reachable})
+        self.AN = defaultdict(dict, {n: v for n, v in self.AN.items() if n in reachable})
+
     def do_rollout(self, node):
-        "Make the tree one layer better. (Train for one iteration.)"
+        """Make the tree one layer better. (Train for one iteration.)
+        Returns the number of playouts run."""
         path = self._select(node)
         leaf = path[-1]
         self._expand(leaf, path[0])
-        reward = self._simulate(leaf)
-        self._backpropagate(path, reward)
+        moves = None
+        try:
+            if self.leaf_batch == 1:
+                moves = [] if self.rave_equivalence else None
+                rewards = [self._simulate(leaf, moves)]
+            else:
+                # Leaf parallelism: several playouts from the same leaf, backed
+                # up together so one selection is shared between all of them
+                rewards = self._simulate_leaf(leaf, self.leaf_batch)
+        except BaseException:
+            self._discard_leaf(path)
+            raise
+        self._backpropagate(path, sum(rewards), len(rewards), moves)
+        return len(rewards)
 
     def _select(self, node):
         "Find an unexplored descendent of `node`"
         path = []
         while True:
             path.append(node)
-            if node not in self.children or not self.children[node]:
-                # node is either unexplored or terminal
-                return path
-            unexplored_set = self.children[node] - self.children.keys()
-            unexplored_list = [x for x in self.children[node] if x in unexplored_set]
-            if unexplored_list:
-                n = unexplored_list[0]
+            if node not in self.children:
+                return path  # node is unexplored
+            if self.rave_equivalence and (self.children[node] or node in self.untried):
+                node, made = self._rave_select(node)
+                if made:
+                    path.append(node)
+                    return path
+                continue
+            untried = self.untried.get(node)
+            if untried:
+                # Only now make the board for the next untried move
+                n = node.make_move(untried.pop())
+                if not untried:
+                    del self.untried[node]
+                self.children[node].append(n)
                 path.append(n)
                 return path
+            if not self.children[node]:
+                return path  # node is terminal
             node = self._uct_select(node)  # descend a layer deeper
 
     def _expand(self, node, root):
-        "Update the `children` dict with the children of `node`"
+        "List the moves from `node`; children are made as they are selected"
         if node in self.children:
             return  # already expanded
+        self.children[node] = []
+        if node.terminal:
+            return
         if node == root:
-            self.children[node] = node.find_ordered_children()
+            children = node.find_ordered_children()
+            if worth_folding(node):
+                # Equivalent moves lead to equivalent positions; search one of
+                # each so the simulation budget is not split between them
+                children = unique_up_to_symmetry(children)
+            moves = [child.last_move for child in children]
         else:
-            self.children[node] = node.find_children()
+            moves = list(node.legal_moves())
+        moves.reverse()  # Moves are popped from the end
+        self.untried[node] = moves
+
+    def _discard_leaf(self, path):
+        """Undo the expansion of the leaf of `path` when its playout failed, so
+        no node is left in the tree with no visits (UCT divides by them)"""
+        leaf = path[-1]
+        if self.N.get(leaf):
+            return  # Visited before, or by a playout still running
+        self.children.pop(leaf, None)
+        self.untried.pop(leaf, None)
+        self.N.pop(leaf, None)
+        self.Q.pop(leaf, None)
+        if len(path) > 1:
+            # Make the move again later instead of keeping the unvisited child
+            parent = path[-2]
+            self.children[parent].remove(leaf)
+            self.untried.setdefault(parent, []).append(leaf.last_move)
 
-    def _simulate(self, node):
-        "Returns the reward for a random simulation (to completion) of `node`"
+    def _simulate(self, node, moves=None):
+        """Returns the reward for a random simulation (to completion) of `node`,
+        or its evaluation after rollout_depth plies. If a `moves` list is
+        given, the (player, placement ID) of each move played is appended"""
         invert_reward = True
+        # Play the simulation out on one scratch board instead of allocating
+        # a new board for every move
+        board = node.copy()
+        if self.rollout_policy == "frontier":
+            # Cheap, slightly biased moves; no move means the game is over
+            next_move = board.random_frontier_move
+        else:
+            # Uniform moves, with the legal moves kept up to date
+            # incrementally rather than regenerated at every ply
+            board.track_placements()
+
+            def next_move():
+                return None if board.terminal else board.random_move()
+
+        plies = 0
         while True:
-            if node.terminal:
-                reward = node.reward()
-                if node.turn_count > self.estimated_max_turns:
-                    self.estimated_max_turns = node.turn_count
-                return 1 - reward if invert_reward else reward
-            node = node.find_random_child()
+            if plies == self.rollout_depth and not board.terminal:
+                reward = evaluate(board)
+                break
+            move = next_move()
+            if move is None:
+                reward = board.reward()
+                if board.turn_count > self.estimated_max_turns:
+                    self.estimated_max_turns = board.turn_count
+                break
+            board.push(move)
+            plies += 1
             invert_reward = not invert_reward
 
-    def _backpropagate(self, path, reward):
-        "Send the reward back up to the ancestors of the leaf"
+        if moves is not None and plies:
+            # The scratch board's undo records hold every move of the playout
+            moves.extend(
+                ("r" if record[1] else "b", PLACEMENT_IDS[record[0]])
+                for record in board._history
+            )
+        return 1 - reward if invert_reward else reward
+
+    def _simulate_leaf(self, node, count):
+        "Rewards of `count` random simulations of `node`"
+        if node.terminal:
+            return [self._simulate(node)] * count  # Nothing random left to play
+        if self.simulate_batch is None:
+            return [self._simulate(node) for _ in range(count)]
+        return self.simulate_batch([node] * count, self.rollout_depth, self.rollout_policy)
+
+    def _backpropagate(self, path, reward, visits=1, moves=None):
+        "Send the total reward of `visits` simulations back up to the ancestors"
+        if moves is not None:
+            self._update_amaf(path, reward, visits, moves)
         for node in reversed(path):
-            self.N[node] += 1
+            self.N[node] += visits
             self.Q[node] += reward
-            reward = 1 - reward  # 1 for me is 0 for my enemy, and vice versa
+            reward = visits - reward  # 1 for me is 0 for my enemy, and vice versa
+
+    def _update_amaf(self, path, reward, visits, moves):
+        "Credit every move a player made after each node as if made first there"
+        # The moves into each node of the path, then those of the playout
+        sequence = [
+            ("b" if n.current_player == "r" else "r", n.last_placement_id)
+            for n in path[1:]
+        ]
+        sequence.extend(moves)
+        for i, node in enumerate(path):
+            # Reward of the player to move at this node; `reward` belongs to
+            # the player who moved into the leaf
+            if (len(path) - i) % 2 == 0:
+                node_reward = reward
+            else:
+                node_reward = visits - reward
+            player = node.current_player
+            amaf_q = self.AQ[node]
+            amaf_n = self.AN[node]
+            seen = set()
+            for mover, move in sequence[i:]:
+                if mover == player and move not in seen:
+                    seen.add(move)
+                    amaf_n[move] = amaf_n.get(move, 0) + visits
+                    amaf_q[move] = amaf_q.get(move, 0) + node_reward
 
     def _uct_select(self, node):
         "Select a child of node, balancing exploration & exploitation"
@@ -94,3 +311,50 @@ class MonteCarloTreeSearch:
             )
 
         return max(self.children[node], key=uct)
+
+    def _rave_value(self, node, move, visits, reward, default=None):
+        """Mean reward of placement ID `move` from `node`, blending its own
+        `reward` over `visits` with its AMAF mean, which is trusted less as
+        visits grow. Without visits it is the AMAF mean alone, or `default`
+        if the move has no AMAF statistics either"""
+        amaf_visits = self.AN[node].get(move)
+        if not amaf_visits and not visits:
+            return default
+        amaf_reward = self.AQ[node].get(move, 0)
+        return rave_blend(visits, reward, amaf_visits, amaf_reward, self.rave_equivalence)
+
+    def _rave_select(self, node):
+        """Select a move from node by RAVE value plus a small exploration term,
+        among its children and its next RAVE_WINDOW untried moves alike, so
+        the AMAF statistics decide which moves are tried at all and which are
+        searched again. Returns the child and whether its board was only now
+        made"""
+        log_N_vertex = math.log(max(self.N[node], 1))
+        # A move with no statistics at all gets the mover's mean at node
+        default = 1 - self.Q[node] / self.N[node] if self.N[node] else 0.5
+
+        def score(move, visits, reward):
+            value = self._rave_value(node, move, visits, reward, default)
+            return value + RAVE_EXPLORATION * math.sqrt(log_N_vertex / (visits + 1))
+
+        best = None
+        best_score = float("-inf")
+        for child in self.children[node]:
+            child_score = score(child.last_placement_id, self.N[child], self.Q[child])
+            if child_score > best_score:
+                best, best_score = child, child_score
+        untried = self.untried.get(node, [])
+        best_untried = None
+        for i in reversed(range(max(0, len(untried) - RAVE_WINDOW), len(untried))):
+            move_score = score(PLACEMENT_IDS[untried[i]], 0, 0)
+            if move_score > best_score:
+                best_untried, best_score = i, move_score
+        if best_untried is None:
+            return best, False
+        # Only now make the board for the chosen move
+        move = untried.pop(best_untried)
+        if not untried:
+            del self.untried[node]
+        child = node.make_move(move)
+        self.children[node].append(child)
+        return child, True
@@ -0,0 +1,259 @@
+"""
+Bit-parallel legal move generation.
+
+The 76 templates in generate_possible_moves describe the 19 fixed tetromino
+shapes once for every cell of the shape that could be the "placed" cell. Here
+each shape is kept exactly once, anchored at its first cell, so a placement is
+identified by (shape, anchor cell) and is generated exactly once.
+
+For a shape with cell offsets o1..o4, the anchors at which it fits on the
+empty cells are the AND over i of the empty mask translated by -oi, and the
+anchors at which it touches the player are the OR over i of the player's
+neighbour mask translated by -oi. Both are a handful of whole-board shifts.
+"""
+
+import struct
+
+from .bitmasks import (
+    BOARD_SIZE,
+    NUM_CELLS,
+    FULL_MASK,
+    LINE_MASKS,
+    iter_bits,
+    neighbours,
+)
+from .generate_possible_moves import generate_tetrimino_positions
+from .shared_tables import load_tables
+
+
+def normalise_shape(offsets):
+    # Anchor a shape at its smallest (row, col) cell
+    offsets = sorted(offsets)
+    anchor_r, anchor_c = offsets[0]
+    return tuple((dr - anchor_r, dc - anchor_c) for dr, dc in offsets)
+
+
+def _distinct_shapes():
+    shapes = []
+    for template in generate_tetrimino_positions():
+        shape = normalise_shape(template)
+        if shape not in shapes:
+            shapes.append(shape)
+    return tuple(shapes)
+
+
+SHAPES = _distinct_shapes()  # The 19 fixed tetromino shapes
+NUM_PLACEMENTS = len(SHAPES) * NUM_CELLS
+
+# _COL_LOW[d] holds the columns that stay on the board when shifted d columns
+# east; the remaining columns wrap around to the west edge
+_COL_LOW = [
+    sum(((1 << (BOARD_SIZE - d)) - 1) << (r * BOARD_SIZE) for r in range(BOARD_SIZE))
+    for d in range(BOARD_SIZE)
+]
+
+
+def translate(mask, dr, dc):
+    # Move every cell (r, c) of the mask to (r + dr, c + dc) on the torus
+    dc %= BOARD_SIZE
+    if dc:
+        mask = ((mask & _COL_LOW[dc]) << dc) | (
+            (mask & ~_COL_LOW[dc]) >> (BOARD_SIZE - dc)
+        )
+    shift = (dr % BOARD_SIZE) * BOARD_SIZE
+    if shift:
+        mask = ((mask << shift) & FULL_MASK) | (mask >> (NUM_CELLS - shift))
+    return mask
+
+
+def _placement_masks():
+    masks = []
+    for shape in SHAPES:
+        shape_mask = 0
+        for dr, dc in shape:
+            shape_mask |= 1 << ((dr % BOARD_SIZE) * BOARD_SIZE + dc % BOARD_SIZE)
+        for anchor in range(NUM_CELLS):
+            r, c = divmod(anchor, BOARD_SIZE)
+            masks.append(translate(shape_mask, r, c))
+    return masks
+
+
+def _cell_placements(placement_cells):
+    index = [[] for _ in range(NUM_CELLS)]
+    for i, cells in enumerate(placement_cells):
+        for cell in cells:
+            index[cell].append(i)
+    return index
+
+
+def _lookup_placements():
+    # For each cell, the IDs of lookup_table[1 << cell] in template order. The
+    # templates number cells from the most significant bit, which in
+    # BitBoard's numbering turns each template by 180 degrees
+    templates = []
+    for template in generate_tetrimino_positions():
+        offsets = [(-dx, -dy) for dx, dy in template]
+        shape = SHAPES.index(normalise_shape(offsets))
+        anchor_dr, anchor_dc = min(offsets)
+        templates.append((shape, anchor_dr, anchor_dc))
+    rows = []
+    for cell in range(NUM_CELLS):
+        r, c = divmod(cell, BOARD_SIZE)
+        rows.append(
+            [
+                shape * NUM_CELLS
+                + ((r + dr) % BOARD_SIZE) * BOARD_SIZE
+                + (c + dc) % BOARD_SIZE
+                for shape, dr, dc in templates
+            ]
+        )
+    return rows
+
+
+_LANE = (1 << 64) - 1
+_BITSET_BYTES = (NUM_PLACEMENTS + 7) // 8  # Bytes of a bitset over placement IDs
+
+
+def _lanes(masks):
+    return [mask & _LANE for mask in masks], [mask >> 64 for mask in masks]
+
+
+def compute_tables():
+    # Every table kept in the shared table file, computed from scratch; only
+    # needed when the file has not been written yet
+    masks = _placement_masks()
+    cells = [[bit.bit_length() - 1 for bit in iter_bits(mask)] for mask in masks]
+    cell_ids = _cell_placements(cells)
+    tables = {}
+    tables["placement_lo"], tables["placement_hi"] = _lanes(masks)
+    tables["touch_lo"], tables["touch_hi"] = _lanes([neighbours(mask) for mask in masks])
+    tables["line_lo"], tables["line_hi"] = _lanes(LINE_MASKS)
+    tables["placement_cells"] = [cell for four in cells for cell in four]
+    tables["cell_placements"] = [i for ids in cell_ids for i in ids]
+    tables["cell_placement_bits"] = b"".join(
+        sum(1 << i for i in ids).to_bytes(_BITSET_BYTES, "little")
+        for ids in cell_ids
+    )
+    tables["lookup_placements"] = [i for ids in _lookup_placements() for i in ids]
+    return tables
+
+
+# The tables below are read from the file mapped by shared_tables, which
+# every process shares, rather than rebuilt by each one
+TABLES = load_tables(compute_tables)
+
+# Every distinct placement on the torus has an integer ID, shape * 121 + anchor.
+# PLACEMENT_MASKS[id] is its 4-cell mask and PLACEMENT_CELLS[id] its cells
+PLACEMENT_MASKS = tuple(
+    lo | hi << 64
+    for lo, hi in zip(TABLES.view("placement_lo"), TABLES.view("placement_hi"))
+)
+PLACEMENT_CELLS = tuple(struct.iter_unpack("4B", TABLES.view("placement_cells")))
+PLACEMENT_IDS = {mask: i for i, mask in enumerate(PLACEMENT_MASKS)}
+
+# Inverted index: CELL_PLACEMENTS[cell] lists the IDs of the 76 placements
+# covering that cell, the ID form of lookup_table[1 << cell]
+_cell_ids = TABLES.view("cell_placements")
+CELL_PLACEMENTS = tuple(
+    struct.iter_unpack(f"<{len(_cell_ids) // NUM_CELLS}H", _cell_ids.cast("B"))
+)
+
+# CELL_PLACEMENT_BITS[cell] is CELL_PLACEMENTS[cell] as a bitset over IDs
+_cell_bits = TABLES.view("cell_placement_bits")
+CELL_PLACEMENT_BITS = tuple(
+    int.from_bytes(_cell_bits[i : i + _BITSET_BYTES], "little")
+    for i in range(0, len(_cell_bits), _BITSET_BYTES)
+)
+
+
+def placement_id(mask):
+    # ID of a placement mask, or None if it is not a single tetromino
+    return PLACEMENT_IDS.get(mask)
+
+
+# Every offset used by some shape, and for each shape the indices of its
+# non-anchor offsets into that list, so shifted masks can be shared
+_OFFSETS = tuple(sorted({offset for shape in SHAPES for offset in shape[1:]}))
+_SHAPE_OFFSETS = tuple(
+    tuple(_OFFSETS.index(offset) for offset in shape[1:]) for shape in SHAPES
+)
+
+
+def legal_anchor_masks(occupied, player_board, anywhere=False):
+    # For each shape, the mask of anchors at which it is a legal placement.
+    # With `anywhere` set the adjacency requirement is dropped (opening moves)
+    empty = FULL_MASK & ~occupied
+    empty_at = [translate(empty, -dr, -dc) for dr, dc in _OFFSETS]
+    if anywhere:
+        return [
+            empty & empty_at[i] & empty_at[j] & empty_at[k]
+            for i, j, k in _SHAPE_OFFSETS
+        ]
+    touch = neighbours(player_board)
+    touch_at = [translate(touch, -dr, -dc) for dr, dc in _OFFSETS]
+    return [
+        empty
+        & empty_at[i]
+        & empty_at[j]
+        & empty_at[k]
+        & (touch | touch_at[i] | touch_at[j] | touch_at[k])
+        for i, j, k in _SHAPE_OFFSETS
+    ]
+
+
+def legal_placement_ids(occupied, player_board, anywhere=False):
+    # Placement IDs (shape * 121 + anchor) of every legal move, each once
+    ids = []
+    base = 0
+    for anchors in legal_anchor_masks(occupied, player_board, anywhere):
+        while anchors:
+            low = anchors & -anchors
+            ids.append(base + low.bit_length() - 1)
+            anchors ^= low
+        base += NUM_CELLS
+    return ids
+
+
+def count_legal_placements(occupied, player_board, anywhere=False):
+    # Number of legal moves, a popcount per shape with no enumeration
+    return sum(
+        anchors.bit_count()
+        for anchors in legal_anchor_masks(occupied, player_board, anywhere)
+    )
+
+
+# The functions below work on bitsets over placement IDs, where bit
+# shape * 121 + anchor stands for that placement. BitBoard can keep these up
+# to date move by move instead of regenerating its legal moves each time.
+
+
+def _join_shapes(anchor_masks):
+    # Lay the 19 per-shape anchor masks end to end as one placement bitset
+    bits = 0
+    for shift, anchors in zip(range(0, NUM_PLACEMENTS, NUM_CELLS), anchor_masks):
+        bits |= anchors << shift
+    return bits
+
+
+def free_placements(occupied):
+    # Placements whose four cells are all empty
+    return _join_shapes(legal_anchor_masks(occupied, 0, anywhere=True))
+
+
+def touching_placements(player_board):
+    # Placements with at least one cell next to one of the player's tokens
+    touch = neighbours(player_board)
+    touch_at = [translate(touch, -dr, -dc) for dr, dc in _OFFSETS]
+    return _join_shapes(
+        touch | touch_at[i] | touch_at[j] | touch_at[k] for i, j, k in _SHAPE_OFFSETS
+    )
+
+
+def covering_placements(mask):
+    # Placements with at least one cell in the mask
+    bits = 0
+    while mask:
+        low = mask & -mask
+        bits |= CELL_PLACEMENT_BITS[low.bit_length() - 1]
+        mask ^= low
+    return bits
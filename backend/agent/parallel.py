@@ -0,0 +1,179 @@
+"""
+Process-parallel Monte Carlo tree search.
+
+For root parallelism each worker process builds its own tree from the same
+root with its own random seed, so the searches share nothing while they run.
+The workers' trees are built by new_tree with the agent's tree options, so
+they search exactly as the agent would in a single process.
+Afterwards the visit counts and total rewards of the root's children are
+summed across workers and the move is chosen from the merged statistics, as
+MonteCarloTreeSearch.choose would choose from a single tree.
+
+The same pool can also run the playouts of leaf-parallel search, where many
+simulations start from one leaf (see simulate_batch_for).
+"""
+
+import multiprocessing
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .monte_carlo_tree_search import MonteCarloTreeSearch, rave_blend
+from .tree_parallel import ThreadedMonteCarloTreeSearch
+
+# One pool per process, created on first use and kept for later moves so the
+# workers only import the agent (and map the shared tables) once
+_pool = None
+_pool_workers = 0
+# Guards _pool: the API server searches several games at once in threads,
+# and two of them must not both create (and one leak) a pool
+_pool_lock = threading.Lock()
+
+
+def get_pool(workers):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            _shutdown_pool()
+            # Spawn rather than fork: the API server runs threads, and forking
+            # a threaded process can leave locks held in the child
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool():
+    with _pool_lock:
+        _shutdown_pool()
+
+
+def _shutdown_pool():
+    # shutdown_pool, with _pool_lock already held
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+        _pool_workers = 0
+
+
+def new_tree(compact_tree=False, threads=1, **options):
+    """
+    An empty search tree: array-backed (see array_tree) if compact_tree is
+    set, otherwise shared between `threads` threads if threads > 1. The other
+    options are passed on to MonteCarloTreeSearch.
+    """
+    if compact_tree:
+        # Imported here so NumPy is only needed when the option is used
+        from .array_tree import ArrayTreeSearch
+
+        return ArrayTreeSearch(**options)
+    if threads > 1:
+        return ThreadedMonteCarloTreeSearch(threads=threads, **options)
+    return MonteCarloTreeSearch(**options)
+
+
+def _search_root(board, num_simulations, time_budget, seed, tree_options):
+    # Worker process: search from the root and report, for every child, the
+    # move leading to it with its visit count and total reward
+    random.seed(seed)
+    tree = new_tree(**tree_options)
+    simulations = tree.search(board, num_simulations, time_budget)
+    return tree.root_stats(board), simulations
+
+
+def merge_root_stats(results):
+    # Sum each move's visits, rewards and AMAF totals over the workers'
+    # results
+    merged = {}
+    for stats, _ in results:
+        for move, totals in stats.items():
+            if move in merged:
+                totals = tuple(a + b for a, b in zip(merged[move], totals))
+            merged[move] = totals
+    return merged
+
+
+def root_parallel_search(
+    board, workers, num_simulations=200, time_budget=None, seed=None, tree_options=None
+):
+    """
+    Search `board` in `workers` processes at once and merge their root
+    statistics. Every worker runs num_simulations rollouts, or searches for
+    time_budget seconds, in a tree made by new_tree(**tree_options); the
+    options must pickle. Returns the chosen child board and the total number
+    of rollouts run across all workers.
+    """
+    if seed is None:
+        seed = random.getrandbits(32)
+    tree_options = tree_options or {}
+    pool = get_pool(workers)
+    futures = [
+        pool.submit(
+            _search_root, board, num_simulations, time_budget, seed + i, tree_options
+        )
+        for i in range(workers)
+    ]
+    results = [future.result() for future in futures]
+    merged = merge_root_stats(results)
+    simulations = sum(count for _, count in results)
+    choice = choose_from_stats(board, merged, tree_options.get("rave_equivalence"))
+    return choice, simulations
+
+
+def choose_from_stats(board, stats, rave_equivalence=None):
+    # The child of board that MonteCarloTreeSearch.choose would pick from
+    # these root statistics: the highest average reward, blended with the
+    # AMAF mean when RAVE is on
+    visited = {move: totals for move, totals in stats.items() if totals[0]}
+    if not visited:
+        return board.find_random_child()
+    if rave_equivalence:
+        best = max(
+            visited, key=lambda move: rave_blend(*visited[move], rave_equivalence)
+        )
+    else:
+        best = max(visited, key=lambda move: visited[move][1] / visited[move][0])
+    return board.make_move(best)
+
+
+def _simulate_boards(boards, rollout_depth, rollout_policy):
+    # Worker process: one random playout of each board, played as the tree
+    # that asked for them would
+    tree = MonteCarloTreeSearch(rollout_policy=rollout_policy, rollout_depth=rollout_depth)
+    return [tree._simulate(board) for board in boards]
+
+
+def process_simulate(boards, rollout_depth=None, rollout_policy="uniform", workers=1):
+    # Play the boards out across the worker pool, one chunk per worker, and
+    # return their rewards in order
+    pool = get_pool(workers)
+    chunks = [boards[i::workers] for i in range(workers)]
+    results = [
+        pool.submit(_simulate_boards, chunk, rollout_depth, rollout_policy)
+        for chunk in chunks
+        if chunk
+    ]
+    rewards = [None] * len(boards)
+    for i, future in enumerate(results):
+        rewards[i::workers] = future.result()
+    return rewards
+
+
+def simulate_batch_for(name, workers=1):
+    """
+    The simulate_batch function for MonteCarloTreeSearch named by `name`:
+    "serial" (None, playouts run one by one in this process), "numpy" (the
+    vectorised engine in batch.py) or "process" (the worker pool).
+    """
+    if name == "serial":
+        return None
+    if name == "numpy":
+        from .batch import simulate
+
+        return simulate
+    if name == "process":
+        return partial(process_simulate, workers=workers)
+    raise ValueError(f"unknown rollout backend {name!r}")
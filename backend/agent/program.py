@@ -2,6 +2,8 @@
 # Project Part B: Game Playing Agent
 # Updated to work without referee
 
+from typing import Optional
+
 from agent_wrapper import PlayerColor, Action, PlaceAction, Coord
 
 # Import your existing components
@@ -9,10 +11,12 @@ from agent_wrapper import PlayerColor, Action, PlaceAction, Coord
 try:
     from .monte_carlo_tree_search import MonteCarloTreeSearch
     from .board import BitBoard
+    from .parallel import new_tree, root_parallel_search, simulate_batch_for
 except ImportError:
     # If running as standalone
     from monte_carlo_tree_search import MonteCarloTreeSearch
     from board import BitBoard
+    from parallel import new_tree, root_parallel_search, simulate_batch_for
 
 class Agent:
     """
@@ -20,28 +24,115 @@ class Agent:
     respond to various Tetress game events.
     """
 
-    def __init__(self, color: PlayerColor):
+    def __init__(
+        self,
+        color: PlayerColor,
+        num_simulations: int = 200,
+        time_budget: Optional[float] = None,
+        workers: int = 1,
+        leaf_batch: int = 1,
+        rollout_backend: str = "serial",
+        threads: int = 1,
+        compact_tree: bool = False,
+        rollout_policy: str = "uniform",
+        rollout_depth: Optional[int] = None,
+        rave_equivalence: Optional[int] = None,
+    ):
         """
         This constructor method runs when the agent is instantiated.
         Any setup and/or precomputation should be done here.
         
         Note: No longer takes **referee parameter
+        
+        Args:
+            color: The colour the agent plays
+            num_simulations: Rollouts per move when searching to a fixed count
+            time_budget: Default wall-clock seconds per move; when set, search
+                runs until it expires instead of for num_simulations rollouts
+            workers: Processes searching each move in parallel (root
+                parallelism, each with a tree built from the options below),
+                or running the leaf playouts when rollout_backend is
+                "process"; with 1 the search runs in this process and reuses
+                the tree
+            leaf_batch: Playouts run from each new leaf and backed up together
+                (leaf parallelism)
+            rollout_backend: How those playouts run: "serial", "numpy"
+                (vectorised) or "process" (across `workers` processes); the
+                last two need leaf_batch > 1
+            threads: Threads sharing one search tree (tree parallelism); only
+                faster than 1 on free-threaded Python builds
+            compact_tree: Store the search tree in flat arrays (see
+                array_tree), which is smaller but not reused across turns;
+                not with threads > 1
+            rollout_policy: "uniform" random playouts, or "frontier" for
+                cheaper, slightly biased ones; only "uniform" with the
+                "numpy" backend
+            rollout_depth: Plies after which a playout is stopped and scored
+                with a static evaluation; None plays every game to the end
+            rave_equivalence: Visits at which a move's own statistics and its
+                All-Moves-As-First (RAVE) statistics count equally in
+                selection, where they also pick which moves are tried; None
+                turns RAVE off. Not with compact_tree or leaf_batch > 1
+        
+        Raises:
+            ValueError: If the options name an unknown backend or policy, or
+                combine settings that cannot work together
         """
+        if leaf_batch < 1:
+            raise ValueError("leaf_batch must be at least 1")
+        if rollout_depth is not None and rollout_depth < 0:
+            raise ValueError("rollout_depth must not be negative")
+        if rollout_backend != "serial" and leaf_batch <= 1:
+            raise ValueError(
+                f"rollout_backend {rollout_backend!r} only runs leaf batches; "
+                "set leaf_batch > 1"
+            )
+        if compact_tree and threads > 1:
+            raise ValueError("compact_tree cannot be shared between threads")
+        if rave_equivalence and (compact_tree or leaf_batch > 1):
+            raise ValueError(
+                "rave_equivalence needs the default tree and leaf_batch=1"
+            )
+        if rollout_policy not in ("uniform", "frontier"):
+            raise ValueError(f"unknown rollout policy {rollout_policy!r}")
+        if rollout_backend == "numpy" and rollout_policy != "uniform":
+            raise ValueError("the numpy backend only plays uniform playouts")
         self._color = color
+        self.num_simulations = num_simulations
+        self.time_budget = time_budget
+        self.workers = workers
+        self.leaf_batch = leaf_batch
+        self.rollout_backend = rollout_backend
+        self.threads = threads
+        self.compact_tree = compact_tree
+        self.rollout_policy = rollout_policy
+        self.rollout_depth = rollout_depth
+        self.rave_equivalence = rave_equivalence
+        self.simulate_batch = simulate_batch_for(rollout_backend, workers)
+        # Rollouts run for the most recent move (0 when no search was needed)
+        self.last_simulations = 0
+        # Search tree kept between moves, so the work done on earlier turns
+        # carries over to the position reached after the opponent's reply
+        self._tree = None
         print(f"Testing: I am playing as {color}")
 
-    def action(self, board: BitBoard) -> Action:
+    def action(self, board: BitBoard, time_budget: Optional[float] = None) -> Action:
         """
         This method is called each time it is the agent's turn to take an action.
         It must always return an action object.
         
         Args:
             board: The current BitBoard state
+            time_budget: Wall-clock seconds to search for this move, overriding
+                the agent's default; the best move found when it expires is
+                returned
         
         Returns:
             PlaceAction with 4 coordinates
         """
         
+        self.last_simulations = 0
+        
         # For first two moves, use hardcoded openings
         if board.turn_count <= 2:
             if self._color == PlayerColor("blue"):
@@ -66,20 +157,71 @@ class Agent:
                     Coord(4, 3), 
                     Coord(4, 4)
                 )
-        elif board.turn_count <= 7:
-            new_board = board.find_random_child()
-            return new_board.last_move_to_coordinates()
         
-        # Use MCTS for subsequent moves
-        tree = MonteCarloTreeSearch()
+        # Every later move, including the early ones where symmetric moves
+        # are folded together at the root, is searched
+        if time_budget is None:
+            time_budget = self.time_budget
         
-        # Run MCTS algorithm
-        num_simulations = 200
-        for _ in range(num_simulations):
-            tree.do_rollout(board)
+        if self.workers > 1 and self.rollout_backend != "process":
+            # Root-parallel search: independent trees in worker processes,
+            # merged at the root
+            selected_node, self.last_simulations = root_parallel_search(
+                board,
+                self.workers,
+                self.num_simulations,
+                time_budget,
+                tree_options=self._tree_options(),
+            )
+            return selected_node.last_move_to_coordinates()
+        
+        # Use MCTS for subsequent moves. The caller goes on to mutate its
+        # board, so search from a private copy
+        board = board.copy()
+        tree = self._tree
+        if tree is not None and board in tree.children:
+            # Reuse last turn's search, re-rooted at the position reached
+            tree.reroot(board)
+        else:
+            tree = self._new_tree()
+        self._tree = tree
+        
+        # Run MCTS algorithm, either for a fixed number of rollouts or until
+        # the time budget runs out
+        self.last_simulations = tree.search(
+            board, self.num_simulations, time_budget
+        )
         
         # Choose best move
         selected_node = tree.choose(board)
         action = selected_node.last_move_to_coordinates()
         
-        return action
\ No newline at end of file
+        return action
+
+    def _tree_options(self) -> dict:
+        """
+        The agent's search settings, as keyword arguments for new_tree.
+        
+        Returns:
+            A dict of options, which pickles so root-parallel workers can
+            build the same kind of tree
+        """
+        return dict(
+            compact_tree=self.compact_tree,
+            threads=self.threads,
+            leaf_batch=self.leaf_batch,
+            simulate_batch=self.simulate_batch,
+            rollout_policy=self.rollout_policy,
+            rollout_depth=self.rollout_depth,
+            rave_equivalence=self.rave_equivalence,
+        )
+
+    def _new_tree(self) -> MonteCarloTreeSearch:
+        """
+        Create an empty search tree with the agent's search settings.
+        
+        Returns:
+            A MonteCarloTreeSearch, array-backed if compact_tree is set,
+            otherwise shared between threads if threads > 1
+        """
+        return new_tree(**self._tree_options())
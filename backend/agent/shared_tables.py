@@ -0,0 +1,169 @@
+"""
+Precomputed tables in a read-only memory-mapped file.
+
+The numeric tables are written once to a flat file of little-endian words
+and every process maps that same file read-only, so uvicorn workers and
+search worker processes share one physical copy through the page cache. A
+new process reads movegen's and lookup_table's tables from the mapping (and
+batch uses it in place through NumPy) instead of computing them. The file is
+written atomically the first time any process needs it, into a directory
+private to the user (see table_path). The checksum only catches accidental
+damage, so a file owned by anyone else is never mapped.
+
+Layout: a header (magic, a CRC-32 of everything after the header, then the
+element count of each table, all uint32), followed by these arrays in order:
+
+    placement_lo, placement_hi   uint64[placements]   placement cells
+    touch_lo, touch_hi           uint64[placements]   cells around each placement
+    line_lo, line_hi             uint64[lines]        the 22 rows and columns
+    placement_cells              uint8[placements * 4]  cells of each placement
+    cell_placements              uint16[cells * 76]   placement IDs per cell
+    cell_placement_bits          uint8[cells * 288]   the same as ID bitsets
+    lookup_placements            uint16[cells * 76]   lookup_table's IDs per cell
+
+121-bit masks are split into a low lane (bits 0-63) and a high lane (64-120);
+the bitsets are little-endian byte strings. A file whose header, size or
+checksum does not match is rebuilt.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+
+# The tables, in file order, and the struct format of their elements
+_LAYOUT = (
+    ("placement_lo", "Q"),
+    ("placement_hi", "Q"),
+    ("touch_lo", "Q"),
+    ("touch_hi", "Q"),
+    ("line_lo", "Q"),
+    ("line_hi", "Q"),
+    ("placement_cells", "B"),
+    ("cell_placements", "H"),
+    ("cell_placement_bits", "B"),
+    ("lookup_placements", "H"),
+)
+
+# Bump the version byte (and TABLE_FILE) whenever the tables change meaning
+_MAGIC = b"TETRESS\x02"
+_HEADER = struct.Struct(f"<8sI{len(_LAYOUT)}I")
+
+TABLE_FILE = "tetress-tables-v2.bin"
+
+
+def table_path():
+    # Where the shared table file lives: TETRESS_TABLE_DIR if set, otherwise
+    # the user's cache directory ($XDG_CACHE_HOME, or ~/.cache), never a
+    # shared one like /tmp where another user could plant the file first
+    directory = os.environ.get("TETRESS_TABLE_DIR")
+    if not directory:
+        cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        directory = os.path.join(cache, "tetress")
+    return os.path.join(directory, TABLE_FILE)
+
+
+def encode(tables):
+    # The file contents for `tables`, a dict of name -> sequence of numbers
+    body = b"".join(
+        struct.pack(f"<{len(tables[name])}{fmt}", *tables[name])
+        for name, fmt in _LAYOUT
+    )
+    counts = [len(tables[name]) for name, _ in _LAYOUT]
+    return _HEADER.pack(_MAGIC, zlib.crc32(body), *counts) + body
+
+
+def build_tables(tables, path=None):
+    # Write the table file, replacing it atomically so readers never see a
+    # partially written file
+    path = table_path() if path is None else path
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    # mkstemp creates the file readable and writable by this user only
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tetress-tables-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encode(tables))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+class SharedTables:
+    "Read-only views of the precomputed tables, backed by one shared buffer."
+
+    def __init__(self, buffer):
+        self.buffer = memoryview(buffer)
+        if len(self.buffer) < _HEADER.size:
+            raise ValueError("table buffer is too short")
+        magic, checksum, *counts = _HEADER.unpack_from(self.buffer)
+        if magic != _MAGIC:
+            raise ValueError("buffer does not hold this version of the tables")
+
+        self._layout = {}
+        offset = _HEADER.size
+        for (name, fmt), count in zip(_LAYOUT, counts):
+            self._layout[name] = (offset, count, fmt)
+            offset += count * struct.calcsize(fmt)
+        if len(self.buffer) != offset:
+            raise ValueError("table buffer has the wrong size")
+        if zlib.crc32(self.buffer[_HEADER.size :]) != checksum:
+            raise ValueError("table buffer does not match its checksum")
+
+    @classmethod
+    def open(cls, path):
+        # Map a table file, refusing (with PermissionError) one that belongs
+        # to another user
+        with open(path, "rb") as f:
+            if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                raise PermissionError(f"{path} is not owned by this user")
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def view(self, name):
+        # Zero-copy memoryview of one table (the file is little-endian, as
+        # are the hosts this runs on)
+        offset, count, fmt = self._layout[name]
+        end = offset + count * struct.calcsize(fmt)
+        return self.buffer[offset:end].cast(fmt)
+
+    def array(self, name):
+        # Zero-copy read-only NumPy view of one table
+        import numpy as np
+
+        offset, count, fmt = self._layout[name]
+        dtype = {"B": "u1", "H": "<u2", "Q": "<u8"}[fmt]
+        return np.frombuffer(self.buffer, dtype=dtype, count=count, offset=offset)
+
+
+_shared = None
+
+
+def load_tables(compute):
+    """
+    Map the shared table file, building it first if it does not exist yet.
+
+    `compute` returns the tables as a dict of name -> sequence of numbers; it
+    is only called when the file is missing or does not match. The mapping is
+    cached per process. If the file cannot be written or read, or belongs to
+    another user, the tables are built in private memory instead, so callers
+    always get working tables.
+    """
+    global _shared
+    if _shared is None:
+        path = table_path()
+        try:
+            if not os.path.exists(path):
+                build_tables(compute(), path)
+            try:
+                _shared = SharedTables.open(path)
+            except ValueError:
+                # Stale or corrupt file: replace it
+                _shared = SharedTables.open(build_tables(compute(), path))
+        except OSError:
+            _shared = SharedTables(encode(compute()))
+    return _shared
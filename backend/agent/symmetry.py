@@ -0,0 +1,135 @@
+"""
+Symmetries of the 11x11 toroidal board.
+
+The rules do not change if the whole board is translated (121 ways, since it
+wraps), rotated by a multiple of 90 degrees or reflected (8 ways), so a
+position is equivalent to any of its 968 images. canonical_form picks one
+representative per class so equivalent positions can be recognised.
+"""
+
+from .bitmasks import BOARD_SIZE, NUM_CELLS
+from .movegen import translate
+
+_n = BOARD_SIZE
+
+# The 8 rotations and reflections of the square, as maps of (row, col)
+_DIHEDRAL = (
+    lambda r, c: (r, c),
+    lambda r, c: (c, -r),
+    lambda r, c: (-r, -c),
+    lambda r, c: (-c, r),
+    lambda r, c: (c, r),
+    lambda r, c: (-r, c),
+    lambda r, c: (r, -c),
+    lambda r, c: (-c, -r),
+)
+
+
+def _cell(r, c):
+    return (r % _n) * _n + c % _n
+
+
+# _CELL_MAPS[g][i] is the cell that cell i is sent to by transform g
+_CELL_MAPS = tuple(
+    tuple(_cell(*transform(*divmod(i, _n))) for i in range(NUM_CELLS))
+    for transform in _DIHEDRAL
+)
+
+
+def _apply(cell_map, mask):
+    # Send every cell of the mask through one of the dihedral transforms
+    out = 0
+    while mask:
+        low = mask & -mask
+        out |= 1 << cell_map[low.bit_length() - 1]
+        mask ^= low
+    return out
+
+
+def canonical_key(red_board, blue_board):
+    """
+    The smallest (red, blue) pair among all images of the position.
+
+    Rather than trying all 121 translations of each dihedral image, only the
+    translations taking one of the occupied cells to the origin are tried.
+    That set of candidates moves with the position, so the minimum is still
+    the same for every member of an equivalence class.
+    """
+    if not red_board | blue_board:
+        return (0, 0)
+    best = None
+    for cell_map in _CELL_MAPS:
+        red = _apply(cell_map, red_board)
+        blue = _apply(cell_map, blue_board)
+        occupied = red | blue
+        while occupied:
+            low = occupied & -occupied
+            r, c = divmod(low.bit_length() - 1, _n)
+            key = (translate(red, -r, -c), translate(blue, -r, -c))
+            if best is None or key < best:
+                best = key
+            occupied ^= low
+    return best
+
+
+# After this many turns a position mapping onto itself is vanishingly rare, so
+# folding is not worth testing for (1 in 4 random positions up to turn 7 is
+# symmetric, nearly all of them on turns 1 and 2)
+FOLD_TURNS = 7
+
+
+def worth_folding(board):
+    # Whether root expansion should look for equivalent moves to fold
+    return board.turn_count <= FOLD_TURNS and has_symmetry(
+        board.red_board, board.blue_board
+    )
+
+
+def has_symmetry(red_board, blue_board):
+    # Whether any transform other than the identity maps the position onto
+    # itself. Without one, two different moves can only lead to equivalent
+    # boards in contrived cases, so folding their children is not worth it
+    occupied = red_board | blue_board
+    if not occupied:
+        return True
+    # Any symmetry must send some cell of the right colour onto the lowest
+    # occupied cell, which pins down the translation
+    origin = occupied & -occupied
+    origin_r, origin_c = divmod(origin.bit_length() - 1, _n)
+    origin_is_red = bool(red_board & origin)
+    matches = 0
+    for cell_map in _CELL_MAPS:
+        red = _apply(cell_map, red_board)
+        blue = _apply(cell_map, blue_board)
+        candidates = red if origin_is_red else blue
+        while candidates:
+            low = candidates & -candidates
+            r, c = divmod(low.bit_length() - 1, _n)
+            dr, dc = origin_r - r, origin_c - c
+            if (
+                translate(red, dr, dc) == red_board
+                and translate(blue, dr, dc) == blue_board
+            ):
+                matches += 1
+                if matches > 1:
+                    return True
+            candidates ^= low
+    return False
+
+
+def canonical_form(board):
+    # Representative of the board's symmetry class; equal for equivalent boards
+    red, blue = canonical_key(board.red_board, board.blue_board)
+    return (red, blue, board.current_player, board.turn_count)
+
+
+def unique_up_to_symmetry(boards):
+    # Keep the first board of each symmetry class, preserving order
+    seen = set()
+    unique = []
+    for board in boards:
+        form = canonical_form(board)
+        if form not in seen:
+            seen.add(form)
+            unique.append(board)
+    return unique
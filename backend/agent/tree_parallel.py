@@ -0,0 +1,106 @@
+"""
+Tree-parallel Monte Carlo tree search.
+
+Several threads run rollouts on one shared tree. Selection, expansion and
+the statistics updates happen under a lock; the random playouts, which take
+most of the time, run outside it. While a thread is playing out from a leaf,
+every node on its path carries a "virtual loss": extra visits with no reward,
+which make the path look worse to the other threads so they spread out over
+the tree instead of all descending the same line.
+
+On free-threaded CPython builds (3.13t) the playouts run in parallel across
+cores. With the GIL the threads take turns, so the search still works but is
+no faster than a single thread; asking for several threads then warns.
+
+If a playout raises, the leaf it started from is taken out of the tree again
+so the tree, which the agent keeps between turns, holds no unvisited nodes.
+"""
+
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from .monte_carlo_tree_search import MonteCarloTreeSearch
+
+# Whether this interpreter runs Python code in several threads at once
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class ThreadedMonteCarloTreeSearch(MonteCarloTreeSearch):
+    "Monte Carlo tree searcher whose rollouts run in several threads at once."
+
+    def __init__(self, threads=4, virtual_loss=1, **kwargs):
+        super().__init__(**kwargs)
+        if threads > 1 and not FREE_THREADED:
+            warnings.warn(
+                "this Python build has a GIL, so tree-parallel search threads "
+                "take turns and are no faster than one",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        self.threads = threads
+        self.virtual_loss = virtual_loss  # Visits added per in-flight playout
+        self._lock = threading.Lock()  # Guards the tree and its statistics
+
+    def search(self, node, num_simulations=200, time_budget=None):
+        """Like MonteCarloTreeSearch.search, with `threads` threads sharing the
+        work. Returns the playouts run."""
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        counter_lock = threading.Lock()
+        started = 0
+        simulations = 0
+
+        def worker():
+            nonlocal started, simulations
+            while True:
+                with counter_lock:
+                    if deadline is None:
+                        if started >= num_simulations:
+                            return
+                    elif started and time.perf_counter() >= deadline:
+                        return
+                    started += self.leaf_batch
+                count = self.do_rollout(node)
+                with counter_lock:
+                    simulations += count
+
+        with ThreadPoolExecutor(max_workers=self.threads) as pool:
+            for future in [pool.submit(worker) for _ in range(self.threads)]:
+                future.result()
+        return simulations
+
+    def do_rollout(self, node):
+        """Make the tree one layer better. (Train for one iteration.)
+        Returns the number of playouts run."""
+        with self._lock:
+            path = self._select(node)
+            leaf = path[-1]
+            self._expand(leaf, path[0])
+            self._add_virtual_loss(path, self.virtual_loss)
+        moves = None
+        try:
+            if self.leaf_batch == 1:
+                moves = [] if self.rave_equivalence else None
+                rewards = [self._simulate(leaf, moves)]
+            else:
+                rewards = self._simulate_leaf(leaf, self.leaf_batch)
+        except BaseException:
+            with self._lock:
+                self._add_virtual_loss(path, -self.virtual_loss)
+                self._discard_leaf(path)
+            raise
+        with self._lock:
+            self._add_virtual_loss(path, -self.virtual_loss)
+            self._backpropagate(path, sum(rewards), len(rewards), moves)
+        return len(rewards)
+
+    def _add_virtual_loss(self, path, visits):
+        "Count `visits` reward-free visits (negative to undo) along the path"
+        for node in path:
+            self.N[node] += visits
+
+    def reroot(self, node):
+        with self._lock:
+            super().reroot(node)
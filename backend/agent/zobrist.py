@@ -0,0 +1,38 @@
+from random import Random
+
+# Zobrist keys for incrementally hashing BitBoard positions. The generator is
+# seeded so that every process (and every uvicorn worker) agrees on the hash
+# of a position.
+_rng = Random(30024)
+
+RED_KEYS = [_rng.getrandbits(64) for _ in range(121)]  # One key per red cell
+BLUE_KEYS = [_rng.getrandbits(64) for _ in range(121)]  # One key per blue cell
+BLUE_TO_MOVE = _rng.getrandbits(64)  # Toggled whenever the player changes
+
+_MASK_64 = (1 << 64) - 1
+_TURN_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def turn_key(turn_count):
+    # Turn counts are unbounded in principle, so derive the key arithmetically
+    # rather than from a fixed-size table
+    return (turn_count * _TURN_MULTIPLIER) & _MASK_64
+
+
+def cells_key(keys, mask):
+    # XOR together the keys of every cell set in the mask
+    h = 0
+    while mask:
+        low = mask & -mask
+        h ^= keys[low.bit_length() - 1]
+        mask ^= low
+    return h
+
+
+def position_key(red_board, blue_board, current_player, turn_count):
+    # Hash a position from scratch; BitBoard keeps this value up to date
+    # incrementally as moves are made
+    h = cells_key(RED_KEYS, red_board) ^ cells_key(BLUE_KEYS, blue_board)
+    if current_player == "b":
+        h ^= BLUE_TO_MOVE
+    return h ^ turn_key(turn_count)
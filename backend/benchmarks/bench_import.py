@@ -0,0 +1,75 @@
+"""
+Import-time benchmark for the agent package and its precomputed tables.
+
+Each measurement runs in a fresh interpreter. "cold" imports start from an
+empty bytecode cache and no shared table file, as on the first start of a new
+container image; "warm" imports reuse the cache and table file written by a
+previous run. Resident memory is the
+growth in peak RSS caused by the import.
+
+Usage (from the backend directory):
+    python benchmarks/bench_import.py [module ...] [--repeat N]
+
+The default modules are agent.lookup_table and agent.program; the agent
+package itself is loaded lazily, so importing plain "agent" measures almost
+nothing.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, resource, time
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"seconds": elapsed, "rss_kib": after - before}}))
+"""
+
+
+def measure(module, cache_dir):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache_dir, TETRESS_TABLE_DIR=cache_dir)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def bench(module, repeat):
+    cold, warm = [], []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(measure(module, cache_dir))
+            warm.append(measure(module, cache_dir))
+    for label, runs in (("cold", cold), ("warm", warm)):
+        seconds = statistics.median(run["seconds"] for run in runs)
+        rss = statistics.median(run["rss_kib"] for run in runs)
+        print(f"{module:28} {label}: {seconds * 1000:8.1f} ms  {rss / 1024:6.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=["agent.lookup_table", "agent.program"])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for module in args.modules:
+        bench(module, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Search latency and playing strength of truncated rollouts by cutoff depth.
+
+For each cutoff depth, the time of a fixed-size search is measured over
+positions sampled from random games (mean and worst case, since full
+playouts make latency vary with how far the game has left to run), and an
+agent using that depth plays a match against one playing every rollout to
+the end with the same number of simulations.
+
+Usage (from the backend directory):
+    python benchmarks/bench_rollout_depth.py [--depths 0,5,10,20,full] [--games G]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from common import match, sample_positions  # Also puts backend on sys.path
+
+from agent.monte_carlo_tree_search import MonteCarloTreeSearch
+from agent.program import Agent
+
+
+def parse_depth(text):
+    return None if text == "full" else int(text)
+
+
+def latency(positions, depth, simulations):
+    # Seconds per search of each position
+    times = []
+    for board in positions:
+        tree = MonteCarloTreeSearch(rollout_depth=depth)
+        start = time.perf_counter()
+        tree.search(board, simulations)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--depths", default="0,5,10,20,40,full")
+    parser.add_argument("--simulations", type=int, default=100)
+    parser.add_argument("--positions", type=int, default=8)
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    depths = [parse_depth(text) for text in args.depths.split(",")]
+    positions = sample_positions(args.positions, args.seed)
+    print("depth   mean ms    max ms   score vs full")
+    for depth in depths:
+        random.seed(args.seed)
+        times = latency(positions, depth, args.simulations)
+        if depth is None or not args.games:
+            score = ""
+        else:
+            points = match(
+                lambda color: Agent(
+                    color, num_simulations=args.simulations, rollout_depth=depth
+                ),
+                lambda color: Agent(color, num_simulations=args.simulations),
+                args.games,
+            )
+            score = f"{points:g}/{args.games} ({points / args.games:.0%})"
+        label = "full" if depth is None else depth
+        print(
+            f"{label:>5}  {statistics.mean(times) * 1000:8.1f}  "
+            f"{max(times) * 1000:8.1f}   {score}"
+        )
+
+
+if __name__ == "__main__":
+    main()
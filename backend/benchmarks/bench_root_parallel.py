@@ -0,0 +1,65 @@
+"""
+Throughput and move quality of root-parallel MCTS for 1 to N worker processes.
+
+Throughput is the number of rollouts completed per second of wall-clock time
+when searching positions from a few sample games under a fixed time budget.
+Move quality is the match score of the N-worker agent against the
+single-process agent when both get the same time per move.
+
+Usage (from the backend directory):
+    python benchmarks/bench_root_parallel.py [--workers N] [--budget S] [--games G]
+"""
+
+import argparse
+import os
+import time
+
+from common import match, sample_positions  # Also puts backend on sys.path
+
+from agent.parallel import root_parallel_search, shutdown_pool
+from agent.program import Agent
+
+
+def throughput(positions, workers, budget):
+    # Warm the pool up first so the timings exclude starting the processes
+    root_parallel_search(positions[0], workers, time_budget=0.01)
+    simulations = 0
+    start = time.perf_counter()
+    for board in positions:
+        _, count = root_parallel_search(board, workers, time_budget=budget)
+        simulations += count
+    return simulations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--budget", type=float, default=0.5)
+    parser.add_argument("--positions", type=int, default=8)
+    parser.add_argument("--games", type=int, default=10)
+    args = parser.parse_args()
+
+    positions = sample_positions(args.positions)
+    baseline = None
+    print("workers  rollouts/s  speed-up")
+    for workers in range(1, args.workers + 1):
+        rate = throughput(positions, workers, args.budget)
+        baseline = baseline or rate
+        print(f"{workers:7}  {rate:10.1f}  {rate / baseline:7.2f}x")
+    shutdown_pool()
+
+    if args.workers > 1 and args.games:
+        score = match(
+            lambda color: Agent(color, time_budget=args.budget, workers=args.workers),
+            lambda color: Agent(color, time_budget=args.budget),
+            args.games,
+        )
+        print(
+            f"{args.workers} workers vs 1 worker at {args.budget}s per move: "
+            f"{score:g}/{args.games} ({score / args.games:.0%})"
+        )
+        shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
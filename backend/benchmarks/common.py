@@ -0,0 +1,64 @@
+"""
+Helpers shared by the search benchmarks: sample positions and play agents
+against each other.
+"""
+
+import os
+import random
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from agent.board import BitBoard  # noqa: E402
+from agent_wrapper import PlayerColor  # noqa: E402
+
+
+def sample_positions(count, seed=0):
+    # Positions from random games, past the random opening of the agent
+    rng = random.Random(seed)
+    random.seed(seed)
+    positions = []
+    while len(positions) < count:
+        board = BitBoard()
+        target = rng.randrange(8, 40)
+        while board.turn_count < target and not board.terminal:
+            board = board.find_random_child()
+        if not board.terminal:
+            positions.append(board)
+    return positions
+
+
+def play_game(red_agent, blue_agent, time_budget=None):
+    # Play one game to the end; returns "r", "b" or None for a draw
+    board = BitBoard()
+    agents = {"r": red_agent, "b": blue_agent}
+    while not board.terminal:
+        action = agents[board.current_player].action(board, time_budget=time_budget)
+        board.move_coordinates(action)
+    return board._find_winner
+
+
+def match(make_candidate, make_baseline, games, time_budget=None):
+    """
+    Play `games` games between two agents, swapping colours every game.
+    make_candidate and make_baseline build a fresh agent for a colour.
+    Returns the candidate's score: 1 per win and 0.5 per draw.
+    """
+    score = 0.0
+    for game in range(games):
+        if game % 2 == 0:
+            red = make_candidate(PlayerColor("red"))
+            blue = make_baseline(PlayerColor("blue"))
+            candidate = "r"
+        else:
+            red = make_baseline(PlayerColor("red"))
+            blue = make_candidate(PlayerColor("blue"))
+            candidate = "b"
+        winner = play_game(red, blue, time_budget)
+        if winner is None:
+            score += 0.5
+        elif winner == candidate:
+            score += 1
+    return score
@@ -1,15 +1,22 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, TYPE_CHECKING
 import uvicorn
 from collections import defaultdict
+import threading
+import os
+from starlette.concurrency import run_in_threadpool
 
-# Import your agent and board
-from agent.program import Agent
-from agent.board import BitBoard
+# The agent and board are imported lazily (see load_agent) so the API can
+# answer health checks while the move tables are still being built
+from agent.bitmasks import neighbours
 from agent_wrapper import PlayerColor, Coord, PlaceAction
 
+if TYPE_CHECKING:
+    from agent.program import Agent
+    from agent.board import BitBoard
+
 app = FastAPI(title="Tetress Agent API")
 
 # Enable CORS
@@ -42,6 +49,7 @@ class GameStateResponse(BaseModel):
     turn_count: int
     valid: bool
     message: Optional[str]
+    simulations: Optional[int] = None  # MCTS rollouts behind the AI's move
 
 class NewGameResponse(BaseModel):
     game_id: str
@@ -49,8 +57,31 @@ class NewGameResponse(BaseModel):
     current_player: str
 
 # Store active games in memory (use Redis/database in production)
-games: Dict[str, BitBoard] = {}
-agents: Dict[str, Agent] = {}
+games: Dict[str, "BitBoard"] = {}
+agents: Dict[str, "Agent"] = {}
+# Held while a game's board is being changed, so a move cannot interleave with
+# an AI search still running on that game in a worker thread
+game_locks: Dict[str, threading.Lock] = {}
+
+# Set once the agent package has been imported and its tables built
+agent_ready = threading.Event()
+_agent_lock = threading.Lock()
+_agent_classes = None
+
+# Processes each AI move is searched in (root-parallel MCTS); 1 searches in the
+# request's own thread
+SEARCH_WORKERS = max(1, int(os.environ.get("TETRESS_SEARCH_WORKERS", "1")))
+
+def load_agent():
+    """Import the agent package once and return the (Agent, BitBoard) classes."""
+    global _agent_classes
+    with _agent_lock:
+        if _agent_classes is None:
+            from agent.program import Agent
+            from agent.board import BitBoard
+            _agent_classes = (Agent, BitBoard)
+            agent_ready.set()
+    return _agent_classes
 
 # Tetromino shapes
 TETROMINOES = {
@@ -93,7 +124,7 @@ def wrap(coord: int) -> int:
     """Wrap coordinate for toroidal board."""
     return ((coord % 11) + 11) % 11
 
-def bitboard_to_web_board(bitboard: BitBoard) -> Dict[str, Optional[str]]:
+def bitboard_to_web_board(bitboard: "BitBoard") -> Dict[str, Optional[str]]:
     """Convert BitBoard to web format."""
     board = {}
     for r in range(11):
@@ -127,7 +158,7 @@ def piece_to_place_action(piece: str, r: int, c: int, rotation: int) -> PlaceAct
     
     return PlaceAction(*coords)
 
-def is_valid_move(bitboard: BitBoard, action: PlaceAction) -> bool:
+def is_valid_move(bitboard: "BitBoard", action: PlaceAction) -> bool:
     """Check if a move is valid on the current board."""
     # Convert PlaceAction coords to binary
     move_binary = 0
@@ -146,23 +177,12 @@ def is_valid_move(bitboard: BitBoard, action: PlaceAction) -> bool:
         player_board = bitboard.red_board if bitboard.current_player == "r" else bitboard.blue_board
         
         # Check if at least one coord is adjacent to player's existing piece
-        has_adjacent = False
-        for coord in action.coords:
-            position = coord.r * 11 + coord.c
-            bit = 1 << position
-            
-            # Check adjacency using your adjacency table
-            from agent.adjacency_table import adjacency_table
-            if player_board & adjacency_table[bit]:
-                has_adjacent = True
-                break
-        
-        if not has_adjacent:
+        if not player_board & neighbours(move_binary):
             return False
     
     return True
 
-def get_game_state(bitboard: BitBoard) -> GameStateResponse:
+def get_game_state(bitboard: "BitBoard") -> GameStateResponse:
     """Convert BitBoard to GameStateResponse."""
     board = bitboard_to_web_board(bitboard)
     
@@ -196,9 +216,13 @@ async def new_game():
     import uuid
     game_id = str(uuid.uuid4())
     
+    # Waits (off the event loop) if the agent is still loading
+    Agent, BitBoard = await run_in_threadpool(load_agent)
+    
     # Initialize new board and agent
     games[game_id] = BitBoard()
-    agents[game_id] = Agent(PlayerColor("blue"))
+    agents[game_id] = Agent(PlayerColor("blue"), workers=SEARCH_WORKERS)
+    game_locks[game_id] = threading.Lock()
     game_last_activity[game_id] = datetime.now()
     
     board = bitboard_to_web_board(games[game_id])
@@ -221,6 +245,7 @@ async def player_move(move_request: MoveRequest):
         raise HTTPException(status_code=404, detail="Game not found")
     game_last_activity[game_id] = datetime.now()
     bitboard = games[game_id]
+    lock = game_locks[game_id]
     try:
         player_action = piece_to_place_action(
             move_request.piece,
@@ -228,6 +253,17 @@ async def player_move(move_request: MoveRequest):
             move_request.c,
             move_request.rotation
         )
+        # Waits (off the event loop) for an AI move in progress to finish
+        return await run_in_threadpool(play_player_move, bitboard, lock, player_action)
+    except Exception as e:
+        print(f"Error in player_move: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+def play_player_move(bitboard: "BitBoard", lock: threading.Lock, player_action: PlaceAction) -> GameStateResponse:
+    """Apply a player's move under the game's lock; runs in a worker thread."""
+    with lock:
         if not is_valid_move(bitboard, player_action):
             return GameStateResponse(
                 board=bitboard_to_web_board(bitboard),
@@ -242,45 +278,74 @@ async def player_move(move_request: MoveRequest):
             )
         bitboard.move_coordinates(player_action)
         return get_game_state(bitboard)
-    except Exception as e:
-        print(f"Error in player_move: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
 
 # --- New endpoint: ai-move ---
 from fastapi import Body
+
+# Upper bound on the per-request search time, in milliseconds
+MAX_TIME_BUDGET_MS = 5000
+
 @app.post("/api/ai-move", response_model=GameStateResponse)
 async def ai_move(data: dict = Body(...)):
     """
     Make the AI move for the current game. Assumes player move already made.
+    
+    An optional "time_budget_ms" searches for that long (up to
+    MAX_TIME_BUDGET_MS) instead of a fixed number of rollouts.
     """
     game_id = data.get("game_id")
     if not game_id or game_id not in games:
         raise HTTPException(status_code=404, detail="Game not found")
+    time_budget_ms = data.get("time_budget_ms")
+    if time_budget_ms is not None:
+        is_number = isinstance(time_budget_ms, (int, float)) and not isinstance(time_budget_ms, bool)
+        if not is_number or time_budget_ms <= 0:
+            raise HTTPException(
+                status_code=422, detail="time_budget_ms must be a positive number"
+            )
+        time_budget_ms = min(time_budget_ms, MAX_TIME_BUDGET_MS)
     game_last_activity[game_id] = datetime.now()
     bitboard = games[game_id]
     agent = agents[game_id]
+    lock = game_locks[game_id]
     try:
-        # If game is already over, just return state
-        if bitboard.terminal:
-            return get_game_state(bitboard)
-        ai_action = agent.action(bitboard)
-        bitboard.move_coordinates(ai_action)
-        return get_game_state(bitboard)
+        time_budget = None if time_budget_ms is None else time_budget_ms / 1000
+        # The search takes up to MAX_TIME_BUDGET_MS, so it runs in a worker
+        # thread and the event loop keeps answering other requests (including
+        # the health checks) meanwhile
+        return await run_in_threadpool(play_ai_move, bitboard, agent, lock, time_budget)
     except Exception as e:
         print(f"Error in ai_move: {e}")
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+def play_ai_move(bitboard: "BitBoard", agent: "Agent", lock: threading.Lock, time_budget: Optional[float]) -> GameStateResponse:
+    """Search for and apply the AI's move under the game's lock; runs in a worker thread."""
+    with lock:
+        # If game is already over, just return state
+        if bitboard.terminal:
+            return get_game_state(bitboard)
+        ai_action = agent.action(bitboard, time_budget=time_budget)
+        bitboard.move_coordinates(ai_action)
+        state = get_game_state(bitboard)
+        state.simulations = agent.last_simulations
+        return state
+
 @app.get("/api/game/{game_id}", response_model=GameStateResponse)
 async def get_game(game_id: str):
     """Get current game state."""
     if game_id not in games:
         raise HTTPException(status_code=404, detail="Game not found")
     
-    return get_game_state(games[game_id])
+    # Reading the state fills the board's caches, so wait (off the event
+    # loop) for any move being made on it
+    return await run_in_threadpool(locked_game_state, games[game_id], game_locks[game_id])
+
+def locked_game_state(bitboard: "BitBoard", lock: threading.Lock) -> GameStateResponse:
+    """get_game_state under the game's lock; runs in a worker thread."""
+    with lock:
+        return get_game_state(bitboard)
 
 @app.delete("/api/game/{game_id}")
 async def delete_game(game_id: str):
@@ -288,16 +353,25 @@ async def delete_game(game_id: str):
     if game_id in games:
         del games[game_id]
         del agents[game_id]
+        game_locks.pop(game_id, None)
     return {"message": "Game deleted"}
 
 @app.get("/api/health")
 async def health_check():
-    """Health check endpoint."""
+    """Liveness check; answers immediately, even while the agent is loading."""
     return {
         "status": "healthy",
-        "active_games": len(games)
+        "active_games": len(games),
+        "agent_ready": agent_ready.is_set()
     }
 
+@app.get("/api/ready")
+async def readiness_check():
+    """Readiness check; 503 until the agent and its tables are loaded."""
+    if not agent_ready.is_set():
+        raise HTTPException(status_code=503, detail="Agent is loading")
+    return {"status": "ready"}
+
 # Auto-cleanup old games (optional - runs periodically)
 import asyncio
 from datetime import datetime, timedelta
@@ -319,6 +393,7 @@ async def cleanup_old_games():
             if game_id in games:
                 del games[game_id]
                 del agents[game_id]
+                game_locks.pop(game_id, None)
                 del game_last_activity[game_id]
                 print(f"Cleaned up inactive game: {game_id}")
 
@@ -326,6 +401,15 @@ async def cleanup_old_games():
 async def startup_event():
     """Start background tasks on server startup."""
     asyncio.create_task(cleanup_old_games())
+    # Warm the agent in a worker thread so startup does not wait for it
+    asyncio.get_running_loop().run_in_executor(None, load_agent)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the search worker processes, if any were started."""
+    if agent_ready.is_set():
+        from agent.parallel import shutdown_pool
+        shutdown_pool()
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
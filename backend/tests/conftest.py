@@ -0,0 +1,29 @@
+import os
+import random
+import sys
+
+import pytest
+
+# The agent imports agent_wrapper as a top-level module, as it does when the
+# server runs from the backend directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent.board import BitBoard  # noqa: E402
+
+
+def random_game(seed, incremental=False):
+    # Every position of one uniformly random game, starting from the empty
+    # board, as independent copies
+    rng = random.Random(seed)
+    board = BitBoard(incremental=incremental)
+    positions = [board.copy()]
+    while not board.terminal:
+        board.move_binary(rng.choice(board.legal_moves()))
+        positions.append(board.copy())
+    return positions
+
+
+@pytest.fixture(scope="session")
+def positions():
+    # Positions from a handful of complete random games
+    return [board for seed in range(6) for board in random_game(seed)]
@@ -0,0 +1,92 @@
+import pytest
+
+main = pytest.importorskip("main")
+pytest.importorskip("httpx")  # Needed by the test client
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def game_id(client):
+    game_id = client.post("/api/new-game").json()["game_id"]
+    yield game_id
+    client.delete(f"/api/game/{game_id}")
+
+
+@pytest.mark.parametrize("time_budget_ms", [0, -100, 0.0, True, "250", [250], {}])
+def test_time_budget_must_be_a_positive_number(client, game_id, time_budget_ms):
+    turn_count = main.games[game_id].turn_count
+    response = client.post(
+        "/api/ai-move", json={"game_id": game_id, "time_budget_ms": time_budget_ms}
+    )
+    assert response.status_code == 422
+    assert main.games[game_id].turn_count == turn_count
+
+
+@pytest.mark.parametrize(
+    "time_budget_ms, time_budget",
+    [
+        (None, None),
+        (250, 0.25),
+        (12.5, 0.0125),
+        (10**9, main.MAX_TIME_BUDGET_MS / 1000),
+    ],
+)
+def test_time_budget_is_passed_on_capped(
+    client, game_id, monkeypatch, time_budget_ms, time_budget
+):
+    agent = main.agents[game_id]
+    budgets = []
+
+    def action(board, time_budget=None):
+        budgets.append(time_budget)
+        return type(agent).action(agent, board, time_budget)
+
+    monkeypatch.setattr(agent, "action", action)
+    data = {"game_id": game_id}
+    if time_budget_ms is not None:
+        data["time_budget_ms"] = time_budget_ms
+    response = client.post("/api/ai-move", json=data)
+    assert response.status_code == 200
+    assert budgets == [time_budget]
+
+
+def test_ai_move_reports_its_simulations(client, game_id, positions):
+    # An opening move is played from memory, without searching
+    response = client.post("/api/ai-move", json={"game_id": game_id})
+    assert response.json()["simulations"] == 0
+
+    board = next(board for board in positions if board.turn_count == 12)
+    main.games[game_id] = board.copy()
+    main.agents[game_id].num_simulations = 20
+    response = client.post("/api/ai-move", json={"game_id": game_id})
+    assert response.json()["simulations"] == 20
+    assert response.json()["turn_count"] == board.turn_count + 1
+
+    response = client.post(
+        "/api/ai-move", json={"game_id": game_id, "time_budget_ms": 50}
+    )
+    assert response.json()["simulations"] >= 1
+    assert response.json()["simulations"] == main.agents[game_id].last_simulations
+    state = client.get(f"/api/game/{game_id}").json()
+    assert state["turn_count"] == board.turn_count + 2
+
+
+def test_ready_only_once_the_agent_is_loaded(client, monkeypatch):
+    import threading
+
+    monkeypatch.setattr(main, "agent_ready", threading.Event())
+    monkeypatch.setattr(main, "_agent_classes", None)
+    health = client.get("/api/health")
+    assert health.status_code == 200
+    assert health.json()["agent_ready"] is False
+    assert client.get("/api/ready").status_code == 503
+
+    main.load_agent()
+    assert client.get("/api/health").json()["agent_ready"] is True
+    assert client.get("/api/ready").status_code == 200
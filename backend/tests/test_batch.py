@@ -0,0 +1,65 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from agent.batch import BLUE, DRAW, RED, BatchBoard, join_lanes  # noqa: E402
+from agent.movegen import PLACEMENT_MASKS  # noqa: E402
+
+
+def test_legal_matrix_matches_bitboard(positions):
+    sample = [board for board in positions[::3] if board.turn_count < 150]
+    legal = BatchBoard.from_boards(sample).legal()
+    for row, board in zip(legal, sample):
+        assert set(np.flatnonzero(row).tolist()) == set(board.legal_placement_ids())
+
+
+def test_apply_and_winners_match_bitboard(positions):
+    sample = [board for board in positions[::3] if not board.terminal]
+    batch = BatchBoard.from_boards(sample)
+    ids = np.array([board.legal_placement_ids()[0] for board in sample])
+    batch.apply(np.arange(len(sample)), ids)
+    for i, board in enumerate(sample):
+        child = board.make_move(PLACEMENT_MASKS[ids[i]])
+        assert join_lanes(batch.red_lo[i], batch.red_hi[i]) == child.red_board
+        assert join_lanes(batch.blue_lo[i], batch.blue_hi[i]) == child.blue_board
+        assert batch.player[i] == (RED if child.current_player == "r" else BLUE)
+        assert batch.turn_count[i] == child.turn_count
+
+    ended = [board for board in positions if board.terminal]
+    winners = BatchBoard.from_boards(ended).winners()
+    expected = {"r": RED, "b": BLUE, None: DRAW}
+    assert winners.tolist() == [expected[board._find_winner] for board in ended]
+
+
+def test_simulate_rewards_are_in_range(positions):
+    sample = [board for board in positions[::4] if not board.terminal]
+    rewards = BatchBoard.from_boards(sample).simulate(np.random.default_rng(0))
+    assert set(rewards.tolist()) <= {0.0, 0.5, 1.0}
+
+
+def test_simulate_cuts_off_at_depth(positions, monkeypatch):
+    from agent import batch
+
+    sample = [board for board in positions[::4] if board.turn_count < 100]
+    sample = [board for board in sample if not board.terminal]
+    evaluated = []
+    evaluate_sides = batch.evaluate_sides
+
+    def counting(own, other):
+        evaluated.append((own, other))
+        return evaluate_sides(own, other)
+
+    monkeypatch.setattr(batch, "evaluate_sides", counting)
+    rewards = batch.simulate(sample, rollout_depth=0)
+    # With no plies played every position is scored, for its player to move
+    assert len(evaluated) == len(sample)
+    for board, reward in zip(sample, rewards):
+        own, other = evaluated.pop(0)
+        if board.current_player == "r":
+            assert (own, other) == (board.red_board, board.blue_board)
+        else:
+            assert (own, other) == (board.blue_board, board.red_board)
+        assert reward == pytest.approx(1 - evaluate_sides(own, other))
+
+    with pytest.raises(ValueError):
+        batch.simulate(sample, rollout_policy="frontier")
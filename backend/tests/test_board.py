@@ -0,0 +1,85 @@
+import copy
+import pickle
+import random
+
+from agent.board import BitBoard
+from agent.zobrist import position_key
+from agent_wrapper import Coord, PlaceAction
+
+
+def snapshot(board):
+    return (
+        board.red_board,
+        board.blue_board,
+        board.current_player,
+        board.turn_count,
+        board.last_move,
+        board._hash,
+        board.legal_moves(),
+    )
+
+
+def test_incremental_hash_matches_position_key(positions):
+    for board in positions:
+        assert board._hash == position_key(
+            board.red_board, board.blue_board, board.current_player, board.turn_count
+        )
+
+
+def test_move_coordinates_matches_move_binary():
+    rng = random.Random(2)
+    by_mask = BitBoard()
+    by_coords = BitBoard()
+    while not by_mask.terminal:
+        move = rng.choice(by_mask.legal_moves())
+        by_mask.move_binary(move)
+        cells = [i for i in range(121) if move >> i & 1]
+        by_coords.move_coordinates(PlaceAction(*(Coord(i // 11, i % 11) for i in cells)))
+        assert by_coords == by_mask
+        assert by_coords._hash == by_mask._hash
+
+
+def test_equal_positions_hash_alike(positions):
+    for board in positions[::7]:
+        same = BitBoard()
+        same.red_board = board.red_board
+        same.blue_board = board.blue_board
+        same.current_player = board.current_player
+        same.turn_count = board.turn_count
+        same._hash = position_key(
+            board.red_board, board.blue_board, board.current_player, board.turn_count
+        )
+        assert same == board and hash(same) == hash(board)
+        assert len({same, board}) == 1
+
+
+def test_push_pop_round_trip_with_line_clears():
+    cleared_lines = 0
+    for seed in range(8):
+        rng = random.Random(seed)
+        for incremental in (False, True):
+            board = BitBoard(incremental=incremental)
+            before = []
+            while not board.terminal:
+                before.append(snapshot(board))
+                tokens = (board.red_board | board.blue_board).bit_count()
+                board.push(rng.choice(board.legal_moves()))
+                if (board.red_board | board.blue_board).bit_count() < tokens + 4:
+                    cleared_lines += 1
+            while before:
+                board.pop()
+                assert snapshot(board) == before.pop()
+    assert cleared_lines  # The games must have exercised line clears
+
+
+def test_copies_and_pickles_are_equal_and_independent(positions):
+    for board in positions[::7]:
+        copies = (board.copy(), copy.deepcopy(board), pickle.loads(pickle.dumps(board)))
+        for other in copies:
+            assert other == board and hash(other) == hash(board)
+            assert other.legal_moves() == board.legal_moves()
+            assert other.terminal == board.terminal
+        if not board.terminal:
+            child = board.make_move(board.legal_moves()[0])
+            assert child != board
+            assert board.red_board | board.blue_board != child.red_board | child.blue_board
@@ -0,0 +1,45 @@
+import pytest
+
+from agent.evaluation import evaluate, evaluate_sides, features, side_features
+from agent.monte_carlo_tree_search import MonteCarloTreeSearch
+from agent.movegen import PLACEMENT_MASKS
+
+
+def test_scores_are_for_the_player_to_move(positions):
+    for board in positions:
+        if board.current_player == "r":
+            own, other = board.red_board, board.blue_board
+        else:
+            own, other = board.blue_board, board.red_board
+        tokens, frontier_cells, at_risk = features(board)
+        assert (tokens, frontier_cells, at_risk) == side_features(own, other)
+        assert tokens == own.bit_count() - other.bit_count()
+        assert side_features(other, own) == (-tokens, -frontier_cells, -at_risk)
+
+        value = evaluate(board)
+        assert 0 < value < 1
+        assert value == evaluate_sides(own, other)
+        assert evaluate_sides(other, own) == pytest.approx(1 - value)
+
+
+@pytest.mark.parametrize("rollout_policy", ["uniform", "frontier"])
+@pytest.mark.parametrize("rollout_depth", [0, 1, 4])
+def test_playouts_stop_after_rollout_depth(positions, rollout_policy, rollout_depth):
+    tree = MonteCarloTreeSearch(
+        rollout_policy=rollout_policy, rollout_depth=rollout_depth
+    )
+    for board in positions[::5]:
+        moves = []
+        reward = tree._simulate(board, moves)
+        end = board.copy()
+        for _, move in moves:
+            end.push(PLACEMENT_MASKS[move])
+        assert len(moves) <= rollout_depth
+        if end.terminal:
+            continue  # The game ended first, and is scored by its winner
+        assert len(moves) == rollout_depth
+        # The reward belongs to the player who moved into `board`
+        if len(moves) % 2:
+            assert reward == evaluate(end)
+        else:
+            assert reward == 1 - evaluate(end)
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from agent.board import BitBoard
+from agent.lookup_table import lookup_table
+from agent.movegen import (
+    NUM_PLACEMENTS,
+    PLACEMENT_MASKS,
+    count_legal_placements,
+    legal_placement_ids,
+    placement_id,
+)
+from agent_wrapper import Coord, PlaceAction
+
+from conftest import random_game
+
+
+def adjacent_cells(i):
+    # The four cells next to cell i on the torus, as one mask
+    r, c = divmod(i, 11)
+    cells = [((r + 1) % 11, c), ((r - 1) % 11, c), (r, (c + 1) % 11), (r, (c - 1) % 11)]
+    return sum(1 << (11 * r + c) for r, c in cells)
+
+
+def reference_moves(board):
+    # The original move generation: every lookup_table template over an
+    # empty cell next to the player (anywhere for the first two moves) that
+    # does not overlap an occupied cell
+    occupied = board.red_board | board.blue_board
+    player_board = board.red_board if board.current_player == "r" else board.blue_board
+    moves = set()
+    for i in range(121):
+        cell = 1 << i
+        if occupied & cell:
+            continue
+        if board.turn_count > 2 and not player_board & adjacent_cells(i):
+            continue
+        moves.update(move for move in lookup_table[cell] if not move & occupied)
+    return moves
+
+
+def test_placements_are_the_lookup_table_templates():
+    templates = {move for moves in lookup_table.values() for move in moves}
+    assert len(PLACEMENT_MASKS) == NUM_PLACEMENTS
+    assert set(PLACEMENT_MASKS) == templates
+    assert all(placement_id(mask) == i for i, mask in enumerate(PLACEMENT_MASKS))
+
+
+def test_legal_moves_match_reference(positions):
+    for board in positions:
+        if board.turn_count == 150:
+            continue
+        expected = reference_moves(board)
+        moves = board.legal_moves()
+        assert len(moves) == len(set(moves))  # Each placement generated once
+        assert set(moves) == expected
+        player_board = (
+            board.red_board if board.current_player == "r" else board.blue_board
+        )
+        occupied = board.red_board | board.blue_board
+        anywhere = board.turn_count <= 2
+        assert count_legal_placements(occupied, player_board, anywhere) == len(
+            expected
+        )
+        ids = legal_placement_ids(occupied, player_board, anywhere)
+        assert {PLACEMENT_MASKS[i] for i in ids} == expected
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_incremental_moves_match_reference(seed):
+    for board in random_game(100 + seed, incremental=True):
+        if board.turn_count == 150:
+            continue
+        assert set(board.legal_moves()) == reference_moves(board)
+        assert board.get_num_moves() == len(board.legal_moves())
+        assert board.terminal == (board.turn_count > 2 and not board.legal_moves())
+
+
+def test_is_valid_move_matches_reference(positions):
+    main = pytest.importorskip("main")
+    rng = random.Random(0)
+    for board in positions[::5]:
+        if board.terminal:
+            continue
+        expected = reference_moves(board)
+        candidates = list(expected) + rng.sample(PLACEMENT_MASKS, 50)
+        for move in candidates:
+            coords = [Coord(i // 11, i % 11) for i in range(121) if move >> i & 1]
+            action = PlaceAction(*coords)
+            assert main.is_valid_move(board, action) == (move in expected)
+
+
+def test_random_moves_are_legal():
+    rng = random.Random(1)
+    board = BitBoard(incremental=True)
+    while not board.terminal:
+        legal = set(board.legal_moves())
+        assert board.random_move() in legal
+        assert board.random_frontier_move() in legal
+        board.push(rng.choice(board.legal_moves()))
+    assert board.random_frontier_move() is None
@@ -0,0 +1,128 @@
+import pytest
+
+from agent.monte_carlo_tree_search import MonteCarloTreeSearch
+from agent.parallel import _search_root, choose_from_stats, merge_root_stats, new_tree
+from agent.program import Agent
+from agent.tree_parallel import ThreadedMonteCarloTreeSearch
+from agent_wrapper import PlayerColor
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        dict(leaf_batch=0),
+        dict(rollout_depth=-1),
+        dict(rollout_backend="numpy"),
+        dict(workers=4, rollout_backend="process"),
+        dict(compact_tree=True, threads=2),
+        dict(compact_tree=True, rave_equivalence=100),
+        dict(leaf_batch=8, rave_equivalence=100),
+        dict(rollout_policy="greedy"),
+    ],
+)
+def test_incompatible_options_are_rejected(options):
+    with pytest.raises(ValueError):
+        Agent(PlayerColor("blue"), **options)
+
+
+@pytest.mark.filterwarnings("ignore:this Python build has a GIL")
+def test_workers_build_the_agents_tree(positions):
+    board = next(board for board in positions if board.turn_count == 12)
+    agent = Agent(PlayerColor("blue"), workers=2, threads=2, rollout_depth=4)
+    assert isinstance(new_tree(**agent._tree_options()), ThreadedMonteCarloTreeSearch)
+
+    pytest.importorskip("numpy")
+    from agent.array_tree import ArrayTreeSearch
+
+    agent = Agent(PlayerColor("blue"), workers=2, compact_tree=True)
+    options = agent._tree_options()
+    assert isinstance(new_tree(**options), ArrayTreeSearch)
+    stats, simulations = _search_root(board, 20, None, 0, options)
+    assert simulations == 20
+    # Every rollout but the first, which only expands the root, visits a child
+    assert sum(totals[0] for totals in stats.values()) == 19
+    assert all(move in board.legal_moves() for move in stats)
+
+
+def test_process_playouts_follow_the_tree_options(positions):
+    from agent.evaluation import evaluate
+    from agent.parallel import _simulate_boards
+
+    boards = [board for board in positions if board.turn_count == 12]
+    rewards = _simulate_boards(boards, 0, "frontier")
+    assert rewards == [1 - evaluate(board) for board in boards]
+
+
+@pytest.mark.parametrize("rave_equivalence", [None, 50])
+def test_merged_root_stats_choose_as_one_tree(positions, rave_equivalence):
+    board = next(board for board in positions if board.turn_count == 12)
+    tree = MonteCarloTreeSearch(rave_equivalence=rave_equivalence)
+    tree.search(board, 150)
+    stats = tree.root_stats(board)
+    assert merge_root_stats([(stats, 150)]) == stats
+    chosen = choose_from_stats(board, stats, rave_equivalence)
+    assert chosen == tree.choose(board)
+
+
+def test_concurrent_callers_share_one_pool(monkeypatch):
+    import threading
+
+    from agent import parallel
+
+    created = []
+
+    class FakePool:
+        def __init__(self, **kwargs):
+            created.append(self)
+            threading.Event().wait(0.05)  # Widen the window for a race
+
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", FakePool)
+    monkeypatch.setattr(parallel, "_pool", None)
+    monkeypatch.setattr(parallel, "_pool_workers", 0)
+    pools = []
+    threads = [
+        threading.Thread(target=lambda: pools.append(parallel.get_pool(2)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1
+    assert all(pool is created[0] for pool in pools)
+
+
+@pytest.mark.filterwarnings("ignore:this Python build has a GIL")
+@pytest.mark.parametrize("threads", [1, 2])
+def test_action_reuses_the_tree_for_an_expanded_position(positions, threads):
+    board = next(board for board in positions if board.turn_count == 12)
+    agent = Agent(
+        PlayerColor("red"), num_simulations=150, threads=threads, rave_equivalence=300
+    )
+    tree_class = ThreadedMonteCarloTreeSearch if threads > 1 else MonteCarloTreeSearch
+    agent.action(board)
+    tree = agent._tree
+    assert type(tree) is tree_class
+
+    # Two plies on, at a position the search already expanded
+    replies = [
+        reply for child in tree.children[board] for reply in tree.children.get(child, ())
+    ]
+    reply = max(replies, key=lambda reply: tree.N[reply])
+    assert reply in tree.children
+    visits = tree.N[reply]
+    agent.action(reply)
+    assert agent._tree is tree
+    assert tree.N[reply] == visits + agent.last_simulations
+    assert board not in tree.children
+
+    # A position the tree never reached starts a fresh one
+    unseen = next(board for board in positions if board.turn_count == 20)
+    assert unseen not in tree.children
+    agent.action(unseen)
+    assert agent._tree is not tree
+    assert type(agent._tree) is tree_class
+    assert agent._tree.N[unseen] == agent.last_simulations
@@ -0,0 +1,113 @@
+import pytest
+
+from agent.monte_carlo_tree_search import MonteCarloTreeSearch
+from agent.tree_parallel import ThreadedMonteCarloTreeSearch
+
+
+class FailingPlayout(Exception):
+    pass
+
+
+@pytest.mark.filterwarnings("ignore:this Python build has a GIL")
+@pytest.mark.parametrize("cls", [MonteCarloTreeSearch, ThreadedMonteCarloTreeSearch])
+def test_failed_playout_leaves_no_unvisited_children(cls, positions):
+    board = next(board for board in positions if board.turn_count == 12)
+    tree = cls() if cls is MonteCarloTreeSearch else cls(threads=2)
+    tree.search(board, 30)
+
+    simulate = tree._simulate
+    calls = 0
+
+    def flaky(node, moves=None):
+        nonlocal calls
+        calls += 1
+        if calls % 7 == 0:
+            raise FailingPlayout
+        return simulate(node, moves)
+
+    tree._simulate = flaky
+    for _ in range(20):
+        with pytest.raises(FailingPlayout):
+            tree.search(board, 100)
+    for children in tree.children.values():
+        assert all(tree.N[child] > 0 for child in children)
+
+    tree._simulate = simulate
+    tree.search(board, 50)  # Still searchable: UCT sees no zero visit counts
+
+
+def test_rave_revisits_moves_before_trying_every_move(positions):
+    later = [board for board in positions if board.turn_count >= 10]
+    board = max(later, key=lambda board: len(board.legal_moves()))
+    assert len(board.legal_moves()) > 200
+    tree = MonteCarloTreeSearch(rave_equivalence=300)
+    tree.search(board, 200)
+    visits = [tree.N[child] for child in tree.children[board]]
+    # Without RAVE every rollout would try a new root move instead
+    assert len(visits) < 199
+    assert max(visits) > 1
+    assert tree.choose(board) in tree.children[board]
+
+
+def descendants(tree, node):
+    # node and every position below it in the tree
+    found, stack = set(), [node]
+    while stack:
+        node = stack.pop()
+        if node not in found:
+            found.add(node)
+            stack.extend(tree.children.get(node, ()))
+    return found
+
+
+@pytest.mark.filterwarnings("ignore:this Python build has a GIL")
+@pytest.mark.parametrize("cls", [MonteCarloTreeSearch, ThreadedMonteCarloTreeSearch])
+def test_reroot_keeps_the_subtree_and_drops_the_rest(cls, positions):
+    board = next(board for board in positions if board.turn_count == 12)
+    options = dict(rave_equivalence=300)
+    tree = cls(**options) if cls is MonteCarloTreeSearch else cls(threads=2, **options)
+    tree.search(board, 300)
+    # The opponent's reply to the most visited move, as reached next turn
+    child = max(tree.children[board], key=lambda child: tree.N[child])
+    reply = max(tree.children[child], key=lambda reply: tree.N[reply])
+    assert reply in tree.children
+    kept = descendants(tree, reply)
+    before = (
+        tree.N[reply],
+        tree.Q[reply],
+        list(tree.untried.get(reply, ())),
+        dict(tree.AQ[reply]),
+        dict(tree.AN[reply]),
+    )
+
+    tree.reroot(reply)
+    after = (
+        tree.N[reply],
+        tree.Q[reply],
+        list(tree.untried.get(reply, ())),
+        tree.AQ[reply],
+        tree.AN[reply],
+    )
+    assert after == before
+    assert before[0] > 1 and before[3]
+    for table in (tree.children, tree.untried, tree.N, tree.Q, tree.AQ, tree.AN):
+        assert set(table) <= kept
+    assert board not in tree.N and child not in tree.children
+    tree.search(reply, 20)
+
+
+def test_time_budget_runs_until_the_deadline(positions):
+    import time
+
+    board = next(board for board in positions if board.turn_count == 12)
+    tree = MonteCarloTreeSearch()
+    # Even an expired budget runs one rollout, so there is a move to choose
+    assert tree.search(board, time_budget=0) == 1
+    assert tree.N[board] == 1
+
+    start = time.perf_counter()
+    simulations = tree.search(board, time_budget=0.1)
+    elapsed = time.perf_counter() - start
+    assert 0.1 <= elapsed < 0.5
+    assert simulations > 1
+    assert tree.N[board] == 1 + simulations
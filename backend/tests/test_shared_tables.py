@@ -0,0 +1,62 @@
+import mmap
+import os
+
+import pytest
+
+from agent import shared_tables
+from agent.movegen import TABLES, compute_tables
+from agent.shared_tables import SharedTables, build_tables, load_tables
+
+
+def test_mapped_tables_match_a_fresh_build():
+    for name, values in compute_tables().items():
+        assert list(TABLES.view(name)) == list(values)
+
+
+def test_corrupt_file_is_rejected(tmp_path):
+    path = build_tables(compute_tables(), str(tmp_path / "tables.bin"))
+    data = bytearray(open(path, "rb").read())
+    SharedTables(bytes(data))
+    data[-1] ^= 1
+    with pytest.raises(ValueError):
+        SharedTables(bytes(data))
+
+
+def test_corrupt_file_is_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.setenv("TETRESS_TABLE_DIR", str(tmp_path))
+    monkeypatch.setattr(shared_tables, "_shared", None)
+    path = build_tables(compute_tables())
+    with open(path, "r+b") as f:
+        f.seek(-1, 2)
+        last = f.read(1)
+        f.seek(-1, 2)
+        f.write(bytes([last[0] ^ 1]))
+    tables = load_tables(compute_tables)
+    assert list(tables.view("cell_placements")) == list(TABLES.view("cell_placements"))
+    SharedTables.open(path)
+
+
+def test_default_file_is_in_a_private_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv("TETRESS_TABLE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    directory = tmp_path / "tetress"
+    assert shared_tables.table_path() == str(directory / shared_tables.TABLE_FILE)
+    build_tables(compute_tables())
+    # Neither the directory nor the file is open to other users
+    assert directory.stat().st_mode & 0o077 == 0
+    assert (directory / shared_tables.TABLE_FILE).stat().st_mode & 0o077 == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="no file owners")
+def test_another_users_file_is_not_mapped(tmp_path, monkeypatch):
+    monkeypatch.setenv("TETRESS_TABLE_DIR", str(tmp_path))
+    monkeypatch.setattr(shared_tables, "_shared", None)
+    path = build_tables(compute_tables())
+    owner = os.stat(path).st_uid
+    monkeypatch.setattr(os, "getuid", lambda: owner + 1)
+    with pytest.raises(PermissionError):
+        SharedTables.open(path)
+    # Built in private memory instead
+    tables = load_tables(compute_tables)
+    assert not isinstance(tables.buffer.obj, mmap.mmap)
+    assert list(tables.view("cell_placements")) == list(TABLES.view("cell_placements"))
@@ -0,0 +1,44 @@
+import random
+
+from agent.movegen import translate
+from agent.symmetry import (
+    FOLD_TURNS,
+    _CELL_MAPS,
+    _apply,
+    canonical_key,
+    has_symmetry,
+    worth_folding,
+)
+
+
+def test_canonical_key_is_the_same_for_every_image(positions):
+    rng = random.Random(3)
+    for board in positions[::9]:
+        key = canonical_key(board.red_board, board.blue_board)
+        for cell_map in _CELL_MAPS:
+            dr, dc = rng.randrange(11), rng.randrange(11)
+            red = translate(_apply(cell_map, board.red_board), dr, dc)
+            blue = translate(_apply(cell_map, board.blue_board), dr, dc)
+            assert canonical_key(red, blue) == key
+
+
+def test_has_symmetry():
+    assert has_symmetry(0, 0)
+    square = 0b11 | 0b11 << 11  # An O piece maps onto itself when mirrored
+    assert has_symmetry(square, 0)
+    el = 0b111 | 0b1 << 11  # An L piece does not
+    assert not has_symmetry(el, 0)
+    # Mirroring the rows maps both squares onto themselves, until a stray
+    # token breaks it
+    assert has_symmetry(square, square << 2)
+    assert not has_symmetry(square, square << 2 | 1 << 60)
+
+
+def test_folding_is_only_tried_early(positions):
+    for board in positions:
+        if board.turn_count > FOLD_TURNS:
+            assert not worth_folding(board)
+        else:
+            assert worth_folding(board) == has_symmetry(
+                board.red_board, board.blue_board
+            )